@@ -31,6 +31,7 @@ DEFINES += QT_DEPRECATED_WARNINGS
 #DEFINES += DEBUG_VEC
 #DEFINES += TESTING
 #DEFINES += TEST_NMEA
+#DEFINES += BENCH_SETTINGS
 #DEFINES += LOCAL_QML
 
 INCLUDEPATH += $$PWD/classes
@@ -78,6 +79,9 @@ SOURCES += main.cpp\
     classes/cboundary.cpp \
     formgps_ui.cpp \
     aogsettings.cpp \
+    aogsettingsstore.cpp \
+    aogsettingsstore_fields.cpp \
+    benchsettings.cpp \
     formgps_udpcomm.cpp \
     formgps_position.cpp \
     formgps_sim.cpp \
@@ -123,10 +127,25 @@ HEADERS  += formgps.h \
     formheadland.h \
     interfaceproperty.h \
     properties.h \
+    properties_abline.h \
+    properties_autosteer.h \
+    properties_dialogs.h \
+    properties_display.h \
+    properties_displayfeatures.h \
+    properties_gps.h \
+    properties_sim.h \
+    properties_todo.h \
+    properties_tool.h \
+    properties_tram.h \
+    properties_uturn.h \
+    properties_vehicle.h \
+    properties_yturn.h \
     qmlsectionbuttons.h \
     qmlsettings.h \
     qmlutil.h \
     aogsettings.h \
+    aogsettingsstore.h \
+    aogsettingsvalues.h \
     common.h \
     glutils.h \
     aogrenderer.h \
@@ -1,5 +1,6 @@
 #include "aogsettings.h"
 #include "aogproperty.h"
+#include "aogsettingsstore.h"
 
 //AOGSettings settings;
 
@@ -7,12 +8,12 @@ AOGProperty test_property("test/test", false);
 //QtAOG-specific setting properties
 AOGProperty property_environment_last_name("environment/name",QString(""));
 
-AOGProperty::AOGProperty(const QString key, const QVariant &defaultvalue): key(key), default_value(defaultvalue)
+AOGProperty::AOGProperty(const QString key, const QVariant &defaultvalue): key(key), default_value(defaultvalue), id(AOGSettingsStore::indexOf(key))
 {
     AOGProperty::add_default_map(key, default_value);
 }
 
-AOGProperty::AOGProperty(const QString key, const QVector<int> &defaultvalue): key(key), default_list(defaultvalue)
+AOGProperty::AOGProperty(const QString key, const QVector<int> &defaultvalue): key(key), default_list(defaultvalue), id(AOGSettingsStore::indexOf(key))
 {
     AOGProperty::add_default_map(key,toVariant(defaultvalue));
 }
@@ -28,18 +29,38 @@ void AOGProperty::init_defaults()
     }
 }
 
-AOGProperty::operator int() { return settings->value(key,default_value).toInt(); }
-AOGProperty::operator char() { return (char)(settings->value(key,default_value).toInt()); }
-AOGProperty::operator double() { return settings->value(key,default_value).toDouble(); }
-AOGProperty::operator QString() { return settings->value(key,default_value).toString(); }
-AOGProperty::operator bool() { return settings->value(key,default_value).toBool(); }
-AOGProperty::operator float() { return settings->value(key,default_value).toFloat(); }
-AOGProperty::operator QColor() { return settings->value(key,default_value).value<QColor>(); }
+//Generated properties read the typed copy in settings_store once it is
+//loaded; before that, and for the few hand written properties, they look
+//the key up in QSettings.
+static inline bool cached(int id) { return id >= 0 && settings_store.isLoaded(); }
+
+AOGProperty::operator int() {
+    if (cached(id)) return settings_store.toInt(AOGSetting(id));
+    return settings->value(key,default_value).toInt();
+}
+AOGProperty::operator char() { return (char)(operator int()); }
+AOGProperty::operator double() {
+    if (cached(id)) return settings_store.toDouble(AOGSetting(id));
+    return settings->value(key,default_value).toDouble();
+}
+AOGProperty::operator QString() { return value().toString(); }
+AOGProperty::operator bool() {
+    if (cached(id)) return settings_store.toBool(AOGSetting(id));
+    return settings->value(key,default_value).toBool();
+}
+AOGProperty::operator float() { return (float)(operator double()); }
+AOGProperty::operator QColor() { return value().value<QColor>(); }
 //special case for QVector<int>.  In AOGSettings, this type is marshalled as
 //a QVariantList so that the ini file has human-readable text in it.
-AOGProperty::operator QVector<int>() { return settings->value(key,default_list); }
+AOGProperty::operator QVector<int>() {
+    if (cached(id)) return toVector<int>(settings_store.value(AOGSetting(id)));
+    return settings->value(key,default_list);
+}
 
-QVariant AOGProperty::value(void) { return settings->value(key,default_value); }
+QVariant AOGProperty::value(void) {
+    if (cached(id)) return settings_store.value(AOGSetting(id));
+    return settings->value(key,default_value);
+}
 
 AOGProperty &AOGProperty::operator=(QVariant newvalue) { settings->setValue(key, newvalue); return *this;}
 AOGProperty &AOGProperty::operator=(QVector<int> newvalue) { settings->setValue(key, newvalue); return *this;}
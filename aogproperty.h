@@ -21,6 +21,8 @@ protected:
     const QString key;
     const QVariant default_value;
     const QVector<int> default_list;
+    //index into settings_store, or -1 for properties that are not generated
+    const int id;
 
 public:
     inline static QMap<QString, QVariant> default_map;
@@ -48,6 +50,10 @@ public:
 };
 
 extern AOGProperty property_environment_last_name;
-#include "properties.h"
+
+// The generated settings are declared in properties_<group>.h (one header
+// per ini path prefix); include only the groups a source uses, so adding a
+// setting does not recompile everything. properties.h includes them all.
+#include "aogsettings.h"
 
 #endif // AOGPROPERTY_H
@@ -10,11 +10,14 @@
 #include <QDataStream>
 #include <QFile>
 #include "qmlsettings.h"
+#include "aogsettingsstore.h"
 
 extern QMLSettings qml_settings;
 
 QVariant unset("UNSET"); //sentinal used to identify missing values in settings
 
+AOGSettings *settings;
+
 AOGSettings::AOGSettings(QObject *parent) : QSettings(parent)
 {
 
@@ -48,6 +51,7 @@ QVector<int> AOGSettings::value(const QString &key, const QVector<int> &defaultv
 void AOGSettings::setValue(const QString &key, const QVector<int> &value_list)
 {
     QSettings::setValue(key,toVariant(value_list));
+    settings_store.update(key, toVariant(value_list));
     qml_settings.updateSetting(key);
     //emit updateFromSettings();
 }
@@ -55,6 +59,7 @@ void AOGSettings::setValue(const QString &key, const QVector<int> &value_list)
 void AOGSettings::setValue(const QString &key, const QVariant &value)
 {
     QSettings::setValue(key,value);
+    settings_store.update(key, value);
     qml_settings.updateSetting(key);
     //emit updateFromSettings();
 }
@@ -62,6 +67,7 @@ void AOGSettings::setValue(const QString &key, const QVariant &value)
 void AOGSettings::setValue_noqml(const QString &key, const QVariant &value)
 {
     QSettings::setValue(key,value);
+    settings_store.update(key, value);
     //emit updateFromSettings();
 }
 
@@ -160,6 +166,7 @@ bool AOGSettings::loadJson(QString filename)
             raw_data = new_value.toLatin1().mid(9);
             ds >> v;
             QSettings::setValue(key, v);
+            settings_store.update(key, v);
         } else if(new_value.startsWith("@List:")) {
             new_value = new_value.mid(6);
             QStringList parts = new_value.split(",");
@@ -174,6 +181,7 @@ bool AOGSettings::loadJson(QString filename)
             //    qDebug() << "isMetric is a problem child.";
             v = j[key].toVariant();
             QSettings::setValue(key, v);
+            settings_store.update(key, v);
         }
 
         qml_settings.updateSetting(key);
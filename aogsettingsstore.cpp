@@ -0,0 +1,59 @@
+#include "aogsettingsstore.h"
+#include "aogsettings.h"
+#include "aogproperty.h"
+#include <QHash>
+
+AOGSettingsStore settings_store;
+
+AOGSettingsStore::AOGSettingsStore(QObject *parent) : QObject(parent)
+{
+
+}
+
+int AOGSettingsStore::indexOf(const QString &key)
+{
+    //built on first use; AOGProperty constructors call this during static
+    //initialization, and keys[] is constant initialized so it is ready
+    static const QHash<QString, int> index = [] {
+        QHash<QString, int> h;
+        for (int i = 0; i < AOGSettingCount; i++)
+            h.insert(QString::fromLatin1(keys[i]), i);
+        return h;
+    }();
+
+    return index.value(key, -1);
+}
+
+void AOGSettingsStore::load()
+{
+    QWriteLocker locker(&lock);
+    for (int i = 0; i < AOGSettingCount; i++) {
+        QString key = QString::fromLatin1(keys[i]);
+        assign(AOGSetting(i), settings->value(key, AOGProperty::default_map.value(key, unset)));
+    }
+    loaded = true;
+}
+
+QVariant AOGSettingsStore::value(AOGSetting id) const
+{
+    QReadLocker locker(&lock);
+    return variant(id);
+}
+
+void AOGSettingsStore::set(AOGSetting id, const QVariant &value)
+{
+    //AOGSettings::setValue() calls update() with the new value
+    settings->setValue(QString::fromLatin1(keys[(int)id]), value);
+}
+
+void AOGSettingsStore::update(const QString &key, const QVariant &value)
+{
+    int id = indexOf(key);
+    if (id < 0) return;
+
+    lock.lockForWrite();
+    assign(AOGSetting(id), value);
+    lock.unlock();
+
+    emit valueChanged(AOGSetting(id));
+}
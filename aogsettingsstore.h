@@ -0,0 +1,73 @@
+// Copyright (C) 2024 Michael Torrie and the QtAgOpenGPS Dev Team
+// SPDX-License-Identifier: GNU General Public License v3.0 or later
+//
+// Typed cache of the generated settings.  Every generated AOGProperty has an
+// AOGSetting index; its value is read from QSettings once by load() and kept
+// in a native field of AOGSettingsValues, so reading a setting on the hot
+// path is a switch on the index instead of a QString keyed QSettings lookup
+// and a QVariant conversion.
+//
+// Writes still go to AOGSettings (which is the ini file); AOGSettings calls
+// update() after every write, so the cache never goes stale.  The enum, the
+// struct and the per-field code in aogsettingsstore_fields.cpp are generated
+// by parse_properties.py.
+#ifndef AOGSETTINGSSTORE_H
+#define AOGSETTINGSSTORE_H
+
+#include <QObject>
+#include <QVariant>
+#include <QReadWriteLock>
+#include "aogsettingsvalues.h"
+
+class AOGSettingsStore : public QObject
+{
+    Q_OBJECT
+protected:
+    AOGSettingsValues v;
+    bool loaded = false;
+
+    //the fields are shared with the render thread and the async curve
+    //builder while update() writes them, so every read and write of v is
+    //locked; uncontended, a read lock is one atomic operation
+    mutable QReadWriteLock lock;
+
+    void assign(AOGSetting id, const QVariant &value);
+    QVariant variant(AOGSetting id) const;
+
+public:
+    //ini path of each setting, indexed by AOGSetting
+    static const char *const keys[AOGSettingCount];
+
+    //AOGSetting index of an ini path, or -1 if it is not a generated setting
+    static int indexOf(const QString &key);
+
+    AOGSettingsStore(QObject *parent = 0);
+
+    //read every setting from QSettings; call after AOGProperty::init_defaults()
+    void load();
+    bool isLoaded() const { return loaded; }
+
+    //direct access to the typed fields, for hot code that wants to skip
+    //AOGProperty altogether.  Unlocked, so only from the GUI thread, which
+    //is the one that writes settings; other threads use toDouble() and
+    //friends or value(), which take the read lock.
+    const AOGSettingsValues &values() const { return v; }
+
+    QVariant value(AOGSetting id) const;
+    double toDouble(AOGSetting id) const;
+    int toInt(AOGSetting id) const;
+    bool toBool(AOGSetting id) const;
+
+    //write-through setter: saves to QSettings, which updates the cache
+    void set(AOGSetting id, const QVariant &value);
+
+    //called by AOGSettings after key was written
+    void update(const QString &key, const QVariant &value);
+
+signals:
+    void valueChanged(AOGSetting id);
+};
+
+extern AOGSettingsStore settings_store;
+
+#endif // AOGSETTINGSSTORE_H
@@ -0,0 +1,1490 @@
+#include "aogsettingsstore.h"
+#include "aogsettings.h"
+
+//Generated by parse_properties.py
+
+const char *const AOGSettingsStore::keys[AOGSettingCount] = {
+    "display/windowLocation",
+    "display/windowSize",
+    "display/maximized",
+    "display/minimized",
+    "display/triangleResolution",
+    "display/isMetric",
+    "display/showGrid",
+    "display/isLightBarOn",
+    "display/currentDir",
+    "tool/isWorkSwitchEnabled",
+    "gps/IMUPitchZeroX16",
+    "gps/IMURollZeroX16",
+    "gps/minHeadingStepDistance",
+    "autosteer/lowSteerPWM",
+    "autosteer/wasOffset",
+    "display/userTotalArea",
+    "autosteer/minSteerPWM",
+    "autosteer/boundaryTriggerDistance",
+    "autosteer/highSteerPWM",
+    "display/isSideGuideLines",
+    "autosteer/countsPerDegree",
+    "display/isPureOn",
+    "sim/on",
+    "display/isSkyOn",
+    "display/culture",
+    "display/workingDir",
+    "display/lightbarCMPerPixel",
+    "gps/fixFromWhichSentence",
+    "gps/headingFromWhichSource",
+    "sim/latitude",
+    "sim/longitude",
+    "autosteer/snapDistance",
+    "tool/isWorkSwitchManual",
+    "autosteer/autoOn",
+    "display/lineWidth",
+    "display/simLocation",
+    "tram/width",
+    "tram/swapAdj",
+    "tram/passes",
+    "tram/offset",
+    "display/oglZoom",
+    "display/isCompassOn",
+    "display/isSpeedOn",
+    "display/colorDayFrame",
+    "display/colorNightFrame",
+    "display/colorSectionsDay",
+    "display/colorFieldDay",
+    "display/dayMode",
+    "display/colorSectionsNight",
+    "display/colorFieldNight",
+    "display/autoDayNight",
+    "display/customColors",
+    "display/terms",
+    "gps/isRTK",
+    "display/startFullscreen",
+    "display/keyboard",
+    "gps/IMURollFilter",
+    "autosteer/uTurnSmoothing",
+    "gps/IMUInvertRoll",
+    "autosteer/ackerman",
+    "tool/isWorkSwitchActiveLow",
+    "autosteer/Kp",
+    "display/soundUturn",
+    "display/soundHydLift",
+    "display/colorTextNight",
+    "display/colorTextDay",
+    "tram/tramOnBackBuffer",
+    "display/camZoom",
+    "display/vehicleColor",
+    "display/vehicleOpacity",
+    "display/isVehicleImage",
+    "gps/isHeadingCorrectionFromAutoSteer",
+    "display/texture",
+    "ABLine/lineLength",
+    "gps/udpWatchMS",
+    "tool/isWorkSwitchManualSections",
+    "autosteer/constantContourOn",
+    "autosteer/guidanceLookAheadTime",
+    "display/features",
+    "gps/dualAsIMU",
+    "gps/sideHillCompensation",
+    "gps/revereOn",
+    "gps/forwardComp",
+    "gps/reverseComp",
+    "gps/ageAlarm",
+    "gps/RTKKillAutoSteer",
+    "display/section1Color",
+    "display/section2Color",
+    "display/section3Color",
+    "display/section4Color",
+    "display/section5Color",
+    "display/section6Color",
+    "display/section7Color",
+    "display/section8Color",
+    "display/section9Color",
+    "display/section10Color",
+    "display/section11Color",
+    "display/section12Color",
+    "display/section13Color",
+    "display/section14Color",
+    "display/section15Color",
+    "display/section16Color",
+    "display/multiColorSections",
+    "display/customSectionColors",
+    "display/TBrand",
+    "todo/headlandIsSectionControlled",
+    "display/autoSteerSound",
+    "todo/relayPinConfig",
+    "display/camSmooth",
+    "gps/dualHeadingOffset",
+    "tool/isSteerWorkSwitchEnabled",
+    "tool/isRemoteWorkSystemOn",
+    "display/autoStartAgIO",
+    "autosteer/modeXTE",
+    "autosteer/modeTime",
+    "tool/width",
+    "tool/overlap",
+    "tool/trailingHitchLength",
+    "tool/numSections",
+    "tool/sectionposition1",
+    "tool/sectionposition2",
+    "tool/sectionposition3",
+    "tool/sectionposition4",
+    "tool/sectionposition5",
+    "tool/sectionposition6",
+    "tool/sectionposition7",
+    "tool/sectionposition8",
+    "tool/sectionposition9",
+    "tool/sectionposition10",
+    "tool/sectionposition11",
+    "tool/sectionposition12",
+    "tool/sectionposition13",
+    "tool/sectionposition14",
+    "tool/sectionposition15",
+    "tool/sectionposition16",
+    "tool/sectionposition17",
+    "vehicle/purePursuitIntegralGainAB",
+    "todo/youMoveDistance",
+    "vehicle/antennaHeight",
+    "tool/lookAheadOn",
+    "tool/isTrailing",
+    "tool/offset",
+    "tool/rearFixed",
+    "vehicle/antennaPivot",
+    "vehicle/wheelbase",
+    "vehicle/hitchLength",
+    "tool/lookAheadOff",
+    "vehicle/isPivotBehindAntenna",
+    "vehicle/isSteerAxleAhead",
+    "vehicle/name",
+    "vehicle/slowSpeedCutoff",
+    "tool/tankTrailingHitchLength",
+    "vehicle/minCoverage",
+    "vehicle/goalPointLookAhead",
+    "vehicle/maxAngularVelocity",
+    "vehicle/maxSteerAngle",
+    "uturn/extensionLength",
+    "yturn/toolWidths",
+    "vehicle/minTurningRadius",
+    "vehicle/antennaOffset",
+    "uturn/distanceFromBoundary",
+    "vehicle/lookAheadMinimum",
+    "vehicle/goalPointLookAheadMult",
+    "vehicle/stanleyDistanceErrorGain",
+    "vehicle/stanleyHeadingErrorGain",
+    "vehicle/isStanlyUsed",
+    "tram/basedOn",
+    "tram/skips",
+    "tool/isTBT",
+    "vehicle/type",
+    "uturn/skipWidth",
+    "autosteer/ardSteerSetting1",
+    "autosteer/ardSteerMinSpeed",
+    "autosteer/ardSteerMaxSpeed",
+    "autosteer/ardSteerSetting0",
+    "vehicle/hydraulicLiftLookAhead",
+    "vehicle/isMachineControlToAutoSteer",
+    "autosteer/ardSteerMaxPulseCounts",
+    "todo/ardMacHydRaiseTime",
+    "todo/ardMacHydLowerTime",
+    "todo/ardMacIsHydEnabled",
+    "tool/defaultSectionWidth",
+    "tool/offDelay",
+    "todo/ardMacSetting0",
+    "todo/ArdSteerSetting2",
+    "vehicle/stanleyIntegralDistanceAwayTriggerAB",
+    "tool/isFront",
+    "vehicle/trackWidth",
+    "todo/ardMacIsDanFoss",
+    "vehicle/stanleyIntegralGainAB",
+    "tool/sectionIsFast",
+    "todo/ardMacUser1",
+    "todo/ardMacUser2",
+    "todo/ardMacUser3",
+    "todo/ardMacUser4",
+    "vehicle/panicStopSpeed",
+    "autosteer/modeMultiplierStanley",
+    "display/brightness",
+    "uturn/radius",
+    "display/brightnessSystem",
+    "tool/sectionsNotZones",
+    "tool/numSectionsMulti",
+    "tool/zones",
+    "tool/sectionWidthMulti",
+    "display/brightnessOn",
+    "display/hotKeys",
+    "vehicle/goalPointLookAheadHold",
+    "tool/isSectionOffWhenOut",
+    "uturn/style",
+    "gps/minimumStepLimit",
+    "autosteer/isSteerInReverse",
+    "autosteer/functionSpeedLimit",
+    "autosteer/maxSteerSpeed",
+    "autosteer/minSteerSpeed",
+    "display/HBrand",
+    "display/WDBrand",
+    "gps/IMUFusionWeight2",
+    "display/svennArrow",
+    "tool/isTramOuterInverted",
+    "display/jobMenuLocation",
+    "display/jobMenuSize",
+    "display/steerSettingsLocation",
+    "dialogs/tracksLocation",
+    "tool/trailingToPivotLength",
+    "dialogs/nudgeLocation",
+    "autosteer/nudgeSize",
+    "autosteer/snapDistanceRef",
+    "display/buttonOrder",
+    "display/camPitch",
+    "dialogs/abDrawSize",
+    "dialogs/headlineSize",
+    "dialogs/headAcheSize",
+    "dialogs/mapBndSize",
+    "dialogs/bingMapSize",
+    "dialogs/bingZoom",
+    "dialogs/rateMapSize",
+    "dialogs/rateMapZoom",
+    "dialogs/quickABLocation",
+    "display/isLogElevation",
+    "display/soundIsSectionOn",
+    "gps/dualReverseDetectionDistance",
+    "display/showTramControl",
+    "autosteer/uTurnCompensation",
+    "displayFeatures/isHeadlandOn",
+    "displayFeatures/isTramOn",
+    "displayFeatures/isBoundaryOn",
+    "displayFeatures/isBndContourOn",
+    "displayFeatures/isRecPathOn",
+    "displayFeatures/isABSmoothOn",
+    "displayFeatures/isHideContourOn",
+    "displayFeatures/isWebCamOn",
+    "displayFeatures/isOffsetFixOn",
+    "displayFeatures/isAgIOOn",
+    "displayFeatures/isContourOn",
+    "displayFeatures/isYouTurnOn",
+    "displayFeatures/isSteerModeOn",
+    "displayFeatures/isManualSectionOn",
+    "displayFeatures/isAutoSectionOn",
+    "displayFeatures/isCycleLinesOn",
+    "displayFeatures/isABLineOn",
+    "displayFeatures/isCurveOn",
+    "displayFeatures/isAutoSteerOn",
+    "displayFeatures/isUTurnOn",
+    "displayFeatures/isLateralOn",
+    "display/showBack",
+    "display/antiAliasSamples",
+    "display/useTrackZero",
+    "display/topTrackNum",
+    "display/colorDayBackground",
+    "display/colorNightBackground",
+    "display/colorDayBorder",
+    "display/colorNightBorder",
+};
+
+void AOGSettingsStore::assign(AOGSetting id, const QVariant &value)
+{
+    switch (id) {
+    case AOGSetting::setWindow_Location: v.setWindow_Location = value.toPoint(); break;
+    case AOGSetting::setWindow_Size: v.setWindow_Size = value.toString(); break;
+    case AOGSetting::setWindow_Maximized: v.setWindow_Maximized = value.toBool(); break;
+    case AOGSetting::setWindow_Minimized: v.setWindow_Minimized = value.toBool(); break;
+    case AOGSetting::setDisplay_triangleResolution: v.setDisplay_triangleResolution = value.toDouble(); break;
+    case AOGSetting::setMenu_isMetric: v.setMenu_isMetric = value.toBool(); break;
+    case AOGSetting::setMenu_isGridOn: v.setMenu_isGridOn = value.toBool(); break;
+    case AOGSetting::setMenu_isLightbarOn: v.setMenu_isLightbarOn = value.toBool(); break;
+    case AOGSetting::setF_CurrentDir: v.setF_CurrentDir = value.toString(); break;
+    case AOGSetting::setF_isWorkSwitchEnabled: v.setF_isWorkSwitchEnabled = value.toBool(); break;
+    case AOGSetting::setIMU_pitchZeroX16: v.setIMU_pitchZeroX16 = value.toInt(); break;
+    case AOGSetting::setIMU_rollZero: v.setIMU_rollZero = value.toDouble(); break;
+    case AOGSetting::setF_minHeadingStepDistance: v.setF_minHeadingStepDistance = value.toDouble(); break;
+    case AOGSetting::setAS_lowSteerPWM: v.setAS_lowSteerPWM = value.toDouble(); break;
+    case AOGSetting::setAS_wasOffset: v.setAS_wasOffset = value.toInt(); break;
+    case AOGSetting::setF_UserTotalArea: v.setF_UserTotalArea = value.toDouble(); break;
+    case AOGSetting::setAS_minSteerPWM: v.setAS_minSteerPWM = value.toDouble(); break;
+    case AOGSetting::setF_boundaryTriggerDistance: v.setF_boundaryTriggerDistance = value.toDouble(); break;
+    case AOGSetting::setAS_highSteerPWM: v.setAS_highSteerPWM = value.toDouble(); break;
+    case AOGSetting::setMenu_isSideGuideLines: v.setMenu_isSideGuideLines = value.toBool(); break;
+    case AOGSetting::setAS_countsPerDegree: v.setAS_countsPerDegree = value.toDouble(); break;
+    case AOGSetting::setMenu_isPureOn: v.setMenu_isPureOn = value.toBool(); break;
+    case AOGSetting::setMenu_isSimulatorOn: v.setMenu_isSimulatorOn = value.toBool(); break;
+    case AOGSetting::setMenu_isSkyOn: v.setMenu_isSkyOn = value.toBool(); break;
+    case AOGSetting::setF_culture: v.setF_culture = value.toString(); break;
+    case AOGSetting::setF_workingDirectory: v.setF_workingDirectory = value.toString(); break;
+    case AOGSetting::setDisplay_lightbarCmPerPixel: v.setDisplay_lightbarCmPerPixel = value.toInt(); break;
+    case AOGSetting::setGPS_fixFromWhichSentence: v.setGPS_fixFromWhichSentence = value.toString(); break;
+    case AOGSetting::setGPS_headingFromWhichSource: v.setGPS_headingFromWhichSource = value.toString(); break;
+    case AOGSetting::setGPS_SimLatitude: v.setGPS_SimLatitude = value.toDouble(); break;
+    case AOGSetting::setGPS_SimLongitude: v.setGPS_SimLongitude = value.toDouble(); break;
+    case AOGSetting::setAS_snapDistance: v.setAS_snapDistance = value.toDouble(); break;
+    case AOGSetting::setF_isWorkSwitchManualSections: v.setF_isWorkSwitchManualSections = value.toBool(); break;
+    case AOGSetting::setAS_isAutoSteerAutoOn: v.setAS_isAutoSteerAutoOn = value.toBool(); break;
+    case AOGSetting::setDisplay_lineWidth: v.setDisplay_lineWidth = value.toInt(); break;
+    case AOGSetting::setDisplay_panelSimLocation: v.setDisplay_panelSimLocation = value.toPoint(); break;
+    case AOGSetting::setTram_tramWidth: v.setTram_tramWidth = value.toDouble(); break;
+    case AOGSetting::setTram_snapAdj: v.setTram_snapAdj = value.toDouble(); break;
+    case AOGSetting::setTram_passes: v.setTram_passes = value.toInt(); break;
+    case AOGSetting::setTram_offset: v.setTram_offset = value.toDouble(); break;
+    case AOGSetting::setMenu_isOGLZoomOn: v.setMenu_isOGLZoomOn = value.toInt(); break;
+    case AOGSetting::setMenu_isCompassOn: v.setMenu_isCompassOn = value.toBool(); break;
+    case AOGSetting::setMenu_isSpeedoOn: v.setMenu_isSpeedoOn = value.toBool(); break;
+    case AOGSetting::setDisplay_colorDayFrame: v.setDisplay_colorDayFrame = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_colorNightFrame: v.setDisplay_colorNightFrame = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_colorSectionsDay: v.setDisplay_colorSectionsDay = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_colorFieldDay: v.setDisplay_colorFieldDay = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_isDayMode: v.setDisplay_isDayMode = value.toBool(); break;
+    case AOGSetting::setDisplay_colorSectionsNight: v.setDisplay_colorSectionsNight = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_colorFieldNight: v.setDisplay_colorFieldNight = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_isAutoDayNight: v.setDisplay_isAutoDayNight = value.toBool(); break;
+    case AOGSetting::setDisplay_customColors: v.setDisplay_customColors = value.toString(); break;
+    case AOGSetting::setDisplay_isTermsAccepted: v.setDisplay_isTermsAccepted = value.toBool(); break;
+    case AOGSetting::setGPS_isRTK: v.setGPS_isRTK = value.toBool(); break;
+    case AOGSetting::setDisplay_isStartFullScreen: v.setDisplay_isStartFullScreen = value.toBool(); break;
+    case AOGSetting::setDisplay_isKeyboardOn: v.setDisplay_isKeyboardOn = value.toBool(); break;
+    case AOGSetting::setIMU_rollFilter: v.setIMU_rollFilter = value.toDouble(); break;
+    case AOGSetting::setAS_uTurnSmoothing: v.setAS_uTurnSmoothing = value.toInt(); break;
+    case AOGSetting::setIMU_invertRoll: v.setIMU_invertRoll = value.toBool(); break;
+    case AOGSetting::setAS_ackerman: v.setAS_ackerman = value.toDouble(); break;
+    case AOGSetting::setF_isWorkSwitchActiveLow: v.setF_isWorkSwitchActiveLow = value.toBool(); break;
+    case AOGSetting::setAS_Kp: v.setAS_Kp = value.toDouble(); break;
+    case AOGSetting::setSound_isUturnOn: v.setSound_isUturnOn = value.toBool(); break;
+    case AOGSetting::setSound_isHydLiftOn: v.setSound_isHydLiftOn = value.toBool(); break;
+    case AOGSetting::setDisplay_colorTextNight: v.setDisplay_colorTextNight = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_colorTextDay: v.setDisplay_colorTextDay = value.value<QColor>(); break;
+    case AOGSetting::setTram_isTramOnBackBuffer: v.setTram_isTramOnBackBuffer = value.toBool(); break;
+    case AOGSetting::setDisplay_camZoom: v.setDisplay_camZoom = value.toDouble(); break;
+    case AOGSetting::setDisplay_colorVehicle: v.setDisplay_colorVehicle = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_vehicleOpacity: v.setDisplay_vehicleOpacity = value.toInt(); break;
+    case AOGSetting::setDisplay_isVehicleImage: v.setDisplay_isVehicleImage = value.toBool(); break;
+    case AOGSetting::setIMU_isHeadingCorrectionFromAutoSteer: v.setIMU_isHeadingCorrectionFromAutoSteer = value.toString(); break;
+    case AOGSetting::setDisplay_isTextureOn: v.setDisplay_isTextureOn = value.toBool(); break;
+    case AOGSetting::setAB_lineLength: v.setAB_lineLength = value.toDouble(); break;
+    case AOGSetting::setGPS_udpWatchMsec: v.setGPS_udpWatchMsec = value.toInt(); break;
+    case AOGSetting::setF_isSteerWorkSwitchManualSections: v.setF_isSteerWorkSwitchManualSections = value.toBool(); break;
+    case AOGSetting::setAS_isConstantContourOn: v.setAS_isConstantContourOn = value.toBool(); break;
+    case AOGSetting::setAS_guidanceLookAheadTime: v.setAS_guidanceLookAheadTime = value.toDouble(); break;
+    case AOGSetting::setFeatures: v.setFeatures = value.toString(); break;
+    case AOGSetting::setIMU_isDualAsIMU: v.setIMU_isDualAsIMU = value.toBool(); break;
+    case AOGSetting::setAS_sideHillComp: v.setAS_sideHillComp = value.toDouble(); break;
+    case AOGSetting::setIMU_isReverseOn: v.setIMU_isReverseOn = value.toBool(); break;
+    case AOGSetting::setGPS_forwardComp: v.setGPS_forwardComp = value.toDouble(); break;
+    case AOGSetting::setGPS_reverseComp: v.setGPS_reverseComp = value.toDouble(); break;
+    case AOGSetting::setGPS_ageAlarm: v.setGPS_ageAlarm = value.toInt(); break;
+    case AOGSetting::setGPS_isRTK_KillAutoSteer: v.setGPS_isRTK_KillAutoSteer = value.toBool(); break;
+    case AOGSetting::setColor_sec01: v.setColor_sec01 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec02: v.setColor_sec02 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec03: v.setColor_sec03 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec04: v.setColor_sec04 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec05: v.setColor_sec05 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec06: v.setColor_sec06 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec07: v.setColor_sec07 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec08: v.setColor_sec08 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec09: v.setColor_sec09 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec10: v.setColor_sec10 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec11: v.setColor_sec11 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec12: v.setColor_sec12 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec13: v.setColor_sec13 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec14: v.setColor_sec14 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec15: v.setColor_sec15 = value.value<QColor>(); break;
+    case AOGSetting::setColor_sec16: v.setColor_sec16 = value.value<QColor>(); break;
+    case AOGSetting::setColor_isMultiColorSections: v.setColor_isMultiColorSections = value.toBool(); break;
+    case AOGSetting::setDisplay_customSectionColors: v.setDisplay_customSectionColors = value.toString(); break;
+    case AOGSetting::setBrand_TBrand: v.setBrand_TBrand = value.toString(); break;
+    case AOGSetting::setHeadland_isSectionControlled: v.setHeadland_isSectionControlled = value.toBool(); break;
+    case AOGSetting::setSound_isAutoSteerOn: v.setSound_isAutoSteerOn = value.toBool(); break;
+    case AOGSetting::setRelay_pinConfig: v.setRelay_pinConfig = toVector<int>(value); break;
+    case AOGSetting::setDisplay_camSmooth: v.setDisplay_camSmooth = value.toInt(); break;
+    case AOGSetting::setGPS_dualHeadingOffset: v.setGPS_dualHeadingOffset = value.toDouble(); break;
+    case AOGSetting::setF_isSteerWorkSwitchEnabled: v.setF_isSteerWorkSwitchEnabled = value.toBool(); break;
+    case AOGSetting::setF_isRemoteWorkSystemOn: v.setF_isRemoteWorkSystemOn = value.toBool(); break;
+    case AOGSetting::setDisplay_isAutoStartAgIO: v.setDisplay_isAutoStartAgIO = value.toBool(); break;
+    case AOGSetting::setAS_ModeXTE: v.setAS_ModeXTE = value.toDouble(); break;
+    case AOGSetting::setAS_ModeTime: v.setAS_ModeTime = value.toInt(); break;
+    case AOGSetting::setVehicle_toolWidth: v.setVehicle_toolWidth = value.toDouble(); break;
+    case AOGSetting::setVehicle_toolOverlap: v.setVehicle_toolOverlap = value.toDouble(); break;
+    case AOGSetting::setTool_toolTrailingHitchLength: v.setTool_toolTrailingHitchLength = value.toDouble(); break;
+    case AOGSetting::setVehicle_numSections: v.setVehicle_numSections = value.toInt(); break;
+    case AOGSetting::setSection_position1: v.setSection_position1 = value.toDouble(); break;
+    case AOGSetting::setSection_position2: v.setSection_position2 = value.toDouble(); break;
+    case AOGSetting::setSection_position3: v.setSection_position3 = value.toDouble(); break;
+    case AOGSetting::setSection_position4: v.setSection_position4 = value.toDouble(); break;
+    case AOGSetting::setSection_position5: v.setSection_position5 = value.toDouble(); break;
+    case AOGSetting::setSection_position6: v.setSection_position6 = value.toDouble(); break;
+    case AOGSetting::setSection_position7: v.setSection_position7 = value.toDouble(); break;
+    case AOGSetting::setSection_position8: v.setSection_position8 = value.toDouble(); break;
+    case AOGSetting::setSection_position9: v.setSection_position9 = value.toDouble(); break;
+    case AOGSetting::setSection_position10: v.setSection_position10 = value.toDouble(); break;
+    case AOGSetting::setSection_position11: v.setSection_position11 = value.toDouble(); break;
+    case AOGSetting::setSection_position12: v.setSection_position12 = value.toDouble(); break;
+    case AOGSetting::setSection_position13: v.setSection_position13 = value.toDouble(); break;
+    case AOGSetting::setSection_position14: v.setSection_position14 = value.toDouble(); break;
+    case AOGSetting::setSection_position15: v.setSection_position15 = value.toDouble(); break;
+    case AOGSetting::setSection_position16: v.setSection_position16 = value.toDouble(); break;
+    case AOGSetting::setSection_position17: v.setSection_position17 = value.toDouble(); break;
+    case AOGSetting::purePursuitIntegralGainAB: v.purePursuitIntegralGainAB = value.toDouble(); break;
+    case AOGSetting::set_youMoveDistance: v.set_youMoveDistance = value.toDouble(); break;
+    case AOGSetting::setVehicle_antennaHeight: v.setVehicle_antennaHeight = value.toDouble(); break;
+    case AOGSetting::setVehicle_toolLookAheadOn: v.setVehicle_toolLookAheadOn = value.toDouble(); break;
+    case AOGSetting::setTool_isToolTrailing: v.setTool_isToolTrailing = value.toBool(); break;
+    case AOGSetting::setVehicle_toolOffset: v.setVehicle_toolOffset = value.toDouble(); break;
+    case AOGSetting::setTool_isToolRearFixed: v.setTool_isToolRearFixed = value.toBool(); break;
+    case AOGSetting::setVehicle_antennaPivot: v.setVehicle_antennaPivot = value.toDouble(); break;
+    case AOGSetting::setVehicle_wheelbase: v.setVehicle_wheelbase = value.toDouble(); break;
+    case AOGSetting::setVehicle_hitchLength: v.setVehicle_hitchLength = value.toDouble(); break;
+    case AOGSetting::setVehicle_toolLookAheadOff: v.setVehicle_toolLookAheadOff = value.toDouble(); break;
+    case AOGSetting::setVehicle_isPivotBehindAntenna: v.setVehicle_isPivotBehindAntenna = value.toBool(); break;
+    case AOGSetting::setVehicle_isSteerAxleAhead: v.setVehicle_isSteerAxleAhead = value.toBool(); break;
+    case AOGSetting::setVehicle_vehicleName: v.setVehicle_vehicleName = value.toString(); break;
+    case AOGSetting::setVehicle_slowSpeedCutoff: v.setVehicle_slowSpeedCutoff = value.toDouble(); break;
+    case AOGSetting::setVehicle_tankTrailingHitchLength: v.setVehicle_tankTrailingHitchLength = value.toDouble(); break;
+    case AOGSetting::setVehicle_minCoverage: v.setVehicle_minCoverage = value.toInt(); break;
+    case AOGSetting::setVehicle_goalPointLookAhead: v.setVehicle_goalPointLookAhead = value.toDouble(); break;
+    case AOGSetting::setVehicle_maxAngularVelocity: v.setVehicle_maxAngularVelocity = value.toDouble(); break;
+    case AOGSetting::setVehicle_maxSteerAngle: v.setVehicle_maxSteerAngle = value.toDouble(); break;
+    case AOGSetting::set_youTurnExtensionLength: v.set_youTurnExtensionLength = value.toInt(); break;
+    case AOGSetting::set_youToolWidths: v.set_youToolWidths = value.toDouble(); break;
+    case AOGSetting::setVehicle_minTurningRadius: v.setVehicle_minTurningRadius = value.toDouble(); break;
+    case AOGSetting::setVehicle_antennaOffset: v.setVehicle_antennaOffset = value.toDouble(); break;
+    case AOGSetting::set_youTurnDistanceFromBoundary: v.set_youTurnDistanceFromBoundary = value.toDouble(); break;
+    case AOGSetting::setVehicle_lookAheadMinimum: v.setVehicle_lookAheadMinimum = value.toDouble(); break;
+    case AOGSetting::setVehicle_goalPointLookAheadMult: v.setVehicle_goalPointLookAheadMult = value.toDouble(); break;
+    case AOGSetting::stanleyDistanceErrorGain: v.stanleyDistanceErrorGain = value.toDouble(); break;
+    case AOGSetting::stanleyHeadingErrorGain: v.stanleyHeadingErrorGain = value.toDouble(); break;
+    case AOGSetting::setVehicle_isStanleyUsed: v.setVehicle_isStanleyUsed = value.toBool(); break;
+    case AOGSetting::setTram_BasedOn: v.setTram_BasedOn = value.toInt(); break;
+    case AOGSetting::setTram_Skips: v.setTram_Skips = value.toInt(); break;
+    case AOGSetting::setTool_isToolTBT: v.setTool_isToolTBT = value.toBool(); break;
+    case AOGSetting::setVehicle_vehicleType: v.setVehicle_vehicleType = value.toInt(); break;
+    case AOGSetting::set_youSkipWidth: v.set_youSkipWidth = value.toInt(); break;
+    case AOGSetting::setArdSteer_setting1: v.setArdSteer_setting1 = value.toDouble(); break;
+    case AOGSetting::setArdSteer_minSpeed: v.setArdSteer_minSpeed = value.toDouble(); break;
+    case AOGSetting::setArdSteer_maxSpeed: v.setArdSteer_maxSpeed = value.toDouble(); break;
+    case AOGSetting::setArdSteer_setting0: v.setArdSteer_setting0 = value.toDouble(); break;
+    case AOGSetting::setVehicle_hydraulicLiftLookAhead: v.setVehicle_hydraulicLiftLookAhead = value.toDouble(); break;
+    case AOGSetting::setVehicle_isMachineControlToAutoSteer: v.setVehicle_isMachineControlToAutoSteer = value.toBool(); break;
+    case AOGSetting::setArdSteer_maxPulseCounts: v.setArdSteer_maxPulseCounts = value.toDouble(); break;
+    case AOGSetting::setArdMac_hydRaiseTime: v.setArdMac_hydRaiseTime = value.toDouble(); break;
+    case AOGSetting::setArdMac_hydLowerTime: v.setArdMac_hydLowerTime = value.toDouble(); break;
+    case AOGSetting::setArdMac_isHydEnabled: v.setArdMac_isHydEnabled = value.toDouble(); break;
+    case AOGSetting::setTool_defaultSectionWidth: v.setTool_defaultSectionWidth = value.toDouble(); break;
+    case AOGSetting::setVehicle_toolOffDelay: v.setVehicle_toolOffDelay = value.toDouble(); break;
+    case AOGSetting::setArdMac_setting0: v.setArdMac_setting0 = value.toDouble(); break;
+    case AOGSetting::setArdSteer_setting2: v.setArdSteer_setting2 = value.toDouble(); break;
+    case AOGSetting::stanleyIntegralDistanceAwayTriggerAB: v.stanleyIntegralDistanceAwayTriggerAB = value.toDouble(); break;
+    case AOGSetting::setTool_isToolFront: v.setTool_isToolFront = value.toBool(); break;
+    case AOGSetting::setVehicle_trackWidth: v.setVehicle_trackWidth = value.toDouble(); break;
+    case AOGSetting::setArdMac_isDanfoss: v.setArdMac_isDanfoss = value.toBool(); break;
+    case AOGSetting::stanleyIntegralGainAB: v.stanleyIntegralGainAB = value.toDouble(); break;
+    case AOGSetting::setSection_isFast: v.setSection_isFast = value.toBool(); break;
+    case AOGSetting::setArdMac_user1: v.setArdMac_user1 = value.toDouble(); break;
+    case AOGSetting::setArdMac_user2: v.setArdMac_user2 = value.toDouble(); break;
+    case AOGSetting::setArdMac_user3: v.setArdMac_user3 = value.toDouble(); break;
+    case AOGSetting::setArdMac_user4: v.setArdMac_user4 = value.toDouble(); break;
+    case AOGSetting::setVehicle_panicStopSpeed: v.setVehicle_panicStopSpeed = value.toDouble(); break;
+    case AOGSetting::setAS_ModeMultiplierStanley: v.setAS_ModeMultiplierStanley = value.toDouble(); break;
+    case AOGSetting::setDisplay_brightness: v.setDisplay_brightness = value.toInt(); break;
+    case AOGSetting::set_youTurnRadius: v.set_youTurnRadius = value.toDouble(); break;
+    case AOGSetting::setDisplay_brightnessSystem: v.setDisplay_brightnessSystem = value.toInt(); break;
+    case AOGSetting::setTool_isSectionsNotZones: v.setTool_isSectionsNotZones = value.toBool(); break;
+    case AOGSetting::setTool_numSectionsMulti: v.setTool_numSectionsMulti = value.toInt(); break;
+    case AOGSetting::setTool_zones: v.setTool_zones = toVector<int>(value); break;
+    case AOGSetting::setTool_sectionWidthMulti: v.setTool_sectionWidthMulti = value.toDouble(); break;
+    case AOGSetting::setDisplay_isBrightnessOn: v.setDisplay_isBrightnessOn = value.toBool(); break;
+    case AOGSetting::setKey_hotkeys: v.setKey_hotkeys = value.toString(); break;
+    case AOGSetting::setVehicle_goalPointLookAheadHold: v.setVehicle_goalPointLookAheadHold = value.toDouble(); break;
+    case AOGSetting::setTool_isSectionOffWhenOut: v.setTool_isSectionOffWhenOut = value.toBool(); break;
+    case AOGSetting::set_uTurnStyle: v.set_uTurnStyle = value.toInt(); break;
+    case AOGSetting::setGPS_minimumStepLimit: v.setGPS_minimumStepLimit = value.toDouble(); break;
+    case AOGSetting::setAS_isSteerInReverse: v.setAS_isSteerInReverse = value.toBool(); break;
+    case AOGSetting::setAS_functionSpeedLimit: v.setAS_functionSpeedLimit = value.toDouble(); break;
+    case AOGSetting::setAS_maxSteerSpeed: v.setAS_maxSteerSpeed = value.toDouble(); break;
+    case AOGSetting::setAS_minSteerSpeed: v.setAS_minSteerSpeed = value.toDouble(); break;
+    case AOGSetting::setBrand_HBrand: v.setBrand_HBrand = value.toString(); break;
+    case AOGSetting::setBrand_WDBrand: v.setBrand_WDBrand = value.toString(); break;
+    case AOGSetting::setIMU_fusionWeight2: v.setIMU_fusionWeight2 = value.toDouble(); break;
+    case AOGSetting::setDisplay_isSvennArrowOn: v.setDisplay_isSvennArrowOn = value.toBool(); break;
+    case AOGSetting::setTool_isTramOuterInverted: v.setTool_isTramOuterInverted = value.toBool(); break;
+    case AOGSetting::setJobMenu_location: v.setJobMenu_location = value.toPoint(); break;
+    case AOGSetting::setJobMenu_size: v.setJobMenu_size = value.toString(); break;
+    case AOGSetting::setWindow_steerSettingsLocation: v.setWindow_steerSettingsLocation = value.toPoint(); break;
+    case AOGSetting::setWindow_buildTracksLocation: v.setWindow_buildTracksLocation = value.toPoint(); break;
+    case AOGSetting::setTool_trailingToolToPivotLength: v.setTool_trailingToolToPivotLength = value.toDouble(); break;
+    case AOGSetting::setWindow_formNudgeLocation: v.setWindow_formNudgeLocation = value.toPoint(); break;
+    case AOGSetting::setWindow_formNudgeSize: v.setWindow_formNudgeSize = value.toString(); break;
+    case AOGSetting::setAS_snapDistanceRef: v.setAS_snapDistanceRef = value.toDouble(); break;
+    case AOGSetting::setDisplay_buttonOrder: v.setDisplay_buttonOrder = value.toString(); break;
+    case AOGSetting::setDisplay_camPitch: v.setDisplay_camPitch = value.toDouble(); break;
+    case AOGSetting::setWindow_abDrawSize: v.setWindow_abDrawSize = value.toString(); break;
+    case AOGSetting::setWindow_HeadlineSize: v.setWindow_HeadlineSize = value.toString(); break;
+    case AOGSetting::setWindow_HeadAcheSize: v.setWindow_HeadAcheSize = value.toString(); break;
+    case AOGSetting::setWindow_MapBndSize: v.setWindow_MapBndSize = value.toString(); break;
+    case AOGSetting::setWindow_BingMapSize: v.setWindow_BingMapSize = value.toString(); break;
+    case AOGSetting::setWindow_BingZoom: v.setWindow_BingZoom = value.toInt(); break;
+    case AOGSetting::setWindow_RateMapSize: v.setWindow_RateMapSize = value.toString(); break;
+    case AOGSetting::setWindow_RateMapZoom: v.setWindow_RateMapZoom = value.toInt(); break;
+    case AOGSetting::setWindow_QuickABLocation: v.setWindow_QuickABLocation = value.toPoint(); break;
+    case AOGSetting::setDisplay_isLogElevation: v.setDisplay_isLogElevation = value.toBool(); break;
+    case AOGSetting::setSound_isSectionsOn: v.setSound_isSectionsOn = value.toBool(); break;
+    case AOGSetting::setGPS_dualReverseDetectionDistance: v.setGPS_dualReverseDetectionDistance = value.toDouble(); break;
+    case AOGSetting::setTool_isDisplayTramControl: v.setTool_isDisplayTramControl = value.toBool(); break;
+    case AOGSetting::setAS_uTurnCompensation: v.setAS_uTurnCompensation = value.toDouble(); break;
+    case AOGSetting::setFeature_isHeadlandOn: v.setFeature_isHeadlandOn = value.toBool(); break;
+    case AOGSetting::setFeature_isTramOn: v.setFeature_isTramOn = value.toBool(); break;
+    case AOGSetting::setFeature_isBoundaryOn: v.setFeature_isBoundaryOn = value.toBool(); break;
+    case AOGSetting::setFeature_isBndContourOn: v.setFeature_isBndContourOn = value.toBool(); break;
+    case AOGSetting::setFeature_isRecPathOn: v.setFeature_isRecPathOn = value.toBool(); break;
+    case AOGSetting::setFeature_isABSmoothOn: v.setFeature_isABSmoothOn = value.toBool(); break;
+    case AOGSetting::setFeature_isHideContourOn: v.setFeature_isHideContourOn = value.toBool(); break;
+    case AOGSetting::setFeature_isWebCamOn: v.setFeature_isWebCamOn = value.toBool(); break;
+    case AOGSetting::setFeature_isOffsetFixOn: v.setFeature_isOffsetFixOn = value.toBool(); break;
+    case AOGSetting::setFeature_isAgIOOn: v.setFeature_isAgIOOn = value.toBool(); break;
+    case AOGSetting::setFeature_isContourOn: v.setFeature_isContourOn = value.toBool(); break;
+    case AOGSetting::setFeature_isYouTurnOn: v.setFeature_isYouTurnOn = value.toBool(); break;
+    case AOGSetting::setFeature_isSteerModeOn: v.setFeature_isSteerModeOn = value.toBool(); break;
+    case AOGSetting::setFeature_isManualSectionOn: v.setFeature_isManualSectionOn = value.toBool(); break;
+    case AOGSetting::setFeature_isAutoSectionOn: v.setFeature_isAutoSectionOn = value.toBool(); break;
+    case AOGSetting::setFeature_isCycleLinesOn: v.setFeature_isCycleLinesOn = value.toBool(); break;
+    case AOGSetting::setFeature_isABLineOn: v.setFeature_isABLineOn = value.toBool(); break;
+    case AOGSetting::setFeature_isCurveOn: v.setFeature_isCurveOn = value.toBool(); break;
+    case AOGSetting::setFeature_isAutoSteerOn: v.setFeature_isAutoSteerOn = value.toBool(); break;
+    case AOGSetting::setFeature_isUTurnOn: v.setFeature_isUTurnOn = value.toBool(); break;
+    case AOGSetting::setFeature_isLateralOn: v.setFeature_isLateralOn = value.toBool(); break;
+    case AOGSetting::displayShowBack: v.displayShowBack = value.toBool(); break;
+    case AOGSetting::displayAntiAliasSamples: v.displayAntiAliasSamples = value.toBool(); break;
+    case AOGSetting::setDisplay_useTrackZero: v.setDisplay_useTrackZero = value.toBool(); break;
+    case AOGSetting::setDisplay_topTrackNum: v.setDisplay_topTrackNum = value.toBool(); break;
+    case AOGSetting::setDisplay_colorDayBackground: v.setDisplay_colorDayBackground = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_colorNightBackground: v.setDisplay_colorNightBackground = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_colorDayBorder: v.setDisplay_colorDayBorder = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_colorNightBorder: v.setDisplay_colorNightBorder = value.value<QColor>(); break;
+    }
+}
+
+QVariant AOGSettingsStore::variant(AOGSetting id) const
+{
+    switch (id) {
+    case AOGSetting::setWindow_Location: return QVariant::fromValue(v.setWindow_Location);
+    case AOGSetting::setWindow_Size: return QVariant::fromValue(v.setWindow_Size);
+    case AOGSetting::setWindow_Maximized: return QVariant::fromValue(v.setWindow_Maximized);
+    case AOGSetting::setWindow_Minimized: return QVariant::fromValue(v.setWindow_Minimized);
+    case AOGSetting::setDisplay_triangleResolution: return QVariant::fromValue(v.setDisplay_triangleResolution);
+    case AOGSetting::setMenu_isMetric: return QVariant::fromValue(v.setMenu_isMetric);
+    case AOGSetting::setMenu_isGridOn: return QVariant::fromValue(v.setMenu_isGridOn);
+    case AOGSetting::setMenu_isLightbarOn: return QVariant::fromValue(v.setMenu_isLightbarOn);
+    case AOGSetting::setF_CurrentDir: return QVariant::fromValue(v.setF_CurrentDir);
+    case AOGSetting::setF_isWorkSwitchEnabled: return QVariant::fromValue(v.setF_isWorkSwitchEnabled);
+    case AOGSetting::setIMU_pitchZeroX16: return QVariant::fromValue(v.setIMU_pitchZeroX16);
+    case AOGSetting::setIMU_rollZero: return QVariant::fromValue(v.setIMU_rollZero);
+    case AOGSetting::setF_minHeadingStepDistance: return QVariant::fromValue(v.setF_minHeadingStepDistance);
+    case AOGSetting::setAS_lowSteerPWM: return QVariant::fromValue(v.setAS_lowSteerPWM);
+    case AOGSetting::setAS_wasOffset: return QVariant::fromValue(v.setAS_wasOffset);
+    case AOGSetting::setF_UserTotalArea: return QVariant::fromValue(v.setF_UserTotalArea);
+    case AOGSetting::setAS_minSteerPWM: return QVariant::fromValue(v.setAS_minSteerPWM);
+    case AOGSetting::setF_boundaryTriggerDistance: return QVariant::fromValue(v.setF_boundaryTriggerDistance);
+    case AOGSetting::setAS_highSteerPWM: return QVariant::fromValue(v.setAS_highSteerPWM);
+    case AOGSetting::setMenu_isSideGuideLines: return QVariant::fromValue(v.setMenu_isSideGuideLines);
+    case AOGSetting::setAS_countsPerDegree: return QVariant::fromValue(v.setAS_countsPerDegree);
+    case AOGSetting::setMenu_isPureOn: return QVariant::fromValue(v.setMenu_isPureOn);
+    case AOGSetting::setMenu_isSimulatorOn: return QVariant::fromValue(v.setMenu_isSimulatorOn);
+    case AOGSetting::setMenu_isSkyOn: return QVariant::fromValue(v.setMenu_isSkyOn);
+    case AOGSetting::setF_culture: return QVariant::fromValue(v.setF_culture);
+    case AOGSetting::setF_workingDirectory: return QVariant::fromValue(v.setF_workingDirectory);
+    case AOGSetting::setDisplay_lightbarCmPerPixel: return QVariant::fromValue(v.setDisplay_lightbarCmPerPixel);
+    case AOGSetting::setGPS_fixFromWhichSentence: return QVariant::fromValue(v.setGPS_fixFromWhichSentence);
+    case AOGSetting::setGPS_headingFromWhichSource: return QVariant::fromValue(v.setGPS_headingFromWhichSource);
+    case AOGSetting::setGPS_SimLatitude: return QVariant::fromValue(v.setGPS_SimLatitude);
+    case AOGSetting::setGPS_SimLongitude: return QVariant::fromValue(v.setGPS_SimLongitude);
+    case AOGSetting::setAS_snapDistance: return QVariant::fromValue(v.setAS_snapDistance);
+    case AOGSetting::setF_isWorkSwitchManualSections: return QVariant::fromValue(v.setF_isWorkSwitchManualSections);
+    case AOGSetting::setAS_isAutoSteerAutoOn: return QVariant::fromValue(v.setAS_isAutoSteerAutoOn);
+    case AOGSetting::setDisplay_lineWidth: return QVariant::fromValue(v.setDisplay_lineWidth);
+    case AOGSetting::setDisplay_panelSimLocation: return QVariant::fromValue(v.setDisplay_panelSimLocation);
+    case AOGSetting::setTram_tramWidth: return QVariant::fromValue(v.setTram_tramWidth);
+    case AOGSetting::setTram_snapAdj: return QVariant::fromValue(v.setTram_snapAdj);
+    case AOGSetting::setTram_passes: return QVariant::fromValue(v.setTram_passes);
+    case AOGSetting::setTram_offset: return QVariant::fromValue(v.setTram_offset);
+    case AOGSetting::setMenu_isOGLZoomOn: return QVariant::fromValue(v.setMenu_isOGLZoomOn);
+    case AOGSetting::setMenu_isCompassOn: return QVariant::fromValue(v.setMenu_isCompassOn);
+    case AOGSetting::setMenu_isSpeedoOn: return QVariant::fromValue(v.setMenu_isSpeedoOn);
+    case AOGSetting::setDisplay_colorDayFrame: return QVariant::fromValue(v.setDisplay_colorDayFrame);
+    case AOGSetting::setDisplay_colorNightFrame: return QVariant::fromValue(v.setDisplay_colorNightFrame);
+    case AOGSetting::setDisplay_colorSectionsDay: return QVariant::fromValue(v.setDisplay_colorSectionsDay);
+    case AOGSetting::setDisplay_colorFieldDay: return QVariant::fromValue(v.setDisplay_colorFieldDay);
+    case AOGSetting::setDisplay_isDayMode: return QVariant::fromValue(v.setDisplay_isDayMode);
+    case AOGSetting::setDisplay_colorSectionsNight: return QVariant::fromValue(v.setDisplay_colorSectionsNight);
+    case AOGSetting::setDisplay_colorFieldNight: return QVariant::fromValue(v.setDisplay_colorFieldNight);
+    case AOGSetting::setDisplay_isAutoDayNight: return QVariant::fromValue(v.setDisplay_isAutoDayNight);
+    case AOGSetting::setDisplay_customColors: return QVariant::fromValue(v.setDisplay_customColors);
+    case AOGSetting::setDisplay_isTermsAccepted: return QVariant::fromValue(v.setDisplay_isTermsAccepted);
+    case AOGSetting::setGPS_isRTK: return QVariant::fromValue(v.setGPS_isRTK);
+    case AOGSetting::setDisplay_isStartFullScreen: return QVariant::fromValue(v.setDisplay_isStartFullScreen);
+    case AOGSetting::setDisplay_isKeyboardOn: return QVariant::fromValue(v.setDisplay_isKeyboardOn);
+    case AOGSetting::setIMU_rollFilter: return QVariant::fromValue(v.setIMU_rollFilter);
+    case AOGSetting::setAS_uTurnSmoothing: return QVariant::fromValue(v.setAS_uTurnSmoothing);
+    case AOGSetting::setIMU_invertRoll: return QVariant::fromValue(v.setIMU_invertRoll);
+    case AOGSetting::setAS_ackerman: return QVariant::fromValue(v.setAS_ackerman);
+    case AOGSetting::setF_isWorkSwitchActiveLow: return QVariant::fromValue(v.setF_isWorkSwitchActiveLow);
+    case AOGSetting::setAS_Kp: return QVariant::fromValue(v.setAS_Kp);
+    case AOGSetting::setSound_isUturnOn: return QVariant::fromValue(v.setSound_isUturnOn);
+    case AOGSetting::setSound_isHydLiftOn: return QVariant::fromValue(v.setSound_isHydLiftOn);
+    case AOGSetting::setDisplay_colorTextNight: return QVariant::fromValue(v.setDisplay_colorTextNight);
+    case AOGSetting::setDisplay_colorTextDay: return QVariant::fromValue(v.setDisplay_colorTextDay);
+    case AOGSetting::setTram_isTramOnBackBuffer: return QVariant::fromValue(v.setTram_isTramOnBackBuffer);
+    case AOGSetting::setDisplay_camZoom: return QVariant::fromValue(v.setDisplay_camZoom);
+    case AOGSetting::setDisplay_colorVehicle: return QVariant::fromValue(v.setDisplay_colorVehicle);
+    case AOGSetting::setDisplay_vehicleOpacity: return QVariant::fromValue(v.setDisplay_vehicleOpacity);
+    case AOGSetting::setDisplay_isVehicleImage: return QVariant::fromValue(v.setDisplay_isVehicleImage);
+    case AOGSetting::setIMU_isHeadingCorrectionFromAutoSteer: return QVariant::fromValue(v.setIMU_isHeadingCorrectionFromAutoSteer);
+    case AOGSetting::setDisplay_isTextureOn: return QVariant::fromValue(v.setDisplay_isTextureOn);
+    case AOGSetting::setAB_lineLength: return QVariant::fromValue(v.setAB_lineLength);
+    case AOGSetting::setGPS_udpWatchMsec: return QVariant::fromValue(v.setGPS_udpWatchMsec);
+    case AOGSetting::setF_isSteerWorkSwitchManualSections: return QVariant::fromValue(v.setF_isSteerWorkSwitchManualSections);
+    case AOGSetting::setAS_isConstantContourOn: return QVariant::fromValue(v.setAS_isConstantContourOn);
+    case AOGSetting::setAS_guidanceLookAheadTime: return QVariant::fromValue(v.setAS_guidanceLookAheadTime);
+    case AOGSetting::setFeatures: return QVariant::fromValue(v.setFeatures);
+    case AOGSetting::setIMU_isDualAsIMU: return QVariant::fromValue(v.setIMU_isDualAsIMU);
+    case AOGSetting::setAS_sideHillComp: return QVariant::fromValue(v.setAS_sideHillComp);
+    case AOGSetting::setIMU_isReverseOn: return QVariant::fromValue(v.setIMU_isReverseOn);
+    case AOGSetting::setGPS_forwardComp: return QVariant::fromValue(v.setGPS_forwardComp);
+    case AOGSetting::setGPS_reverseComp: return QVariant::fromValue(v.setGPS_reverseComp);
+    case AOGSetting::setGPS_ageAlarm: return QVariant::fromValue(v.setGPS_ageAlarm);
+    case AOGSetting::setGPS_isRTK_KillAutoSteer: return QVariant::fromValue(v.setGPS_isRTK_KillAutoSteer);
+    case AOGSetting::setColor_sec01: return QVariant::fromValue(v.setColor_sec01);
+    case AOGSetting::setColor_sec02: return QVariant::fromValue(v.setColor_sec02);
+    case AOGSetting::setColor_sec03: return QVariant::fromValue(v.setColor_sec03);
+    case AOGSetting::setColor_sec04: return QVariant::fromValue(v.setColor_sec04);
+    case AOGSetting::setColor_sec05: return QVariant::fromValue(v.setColor_sec05);
+    case AOGSetting::setColor_sec06: return QVariant::fromValue(v.setColor_sec06);
+    case AOGSetting::setColor_sec07: return QVariant::fromValue(v.setColor_sec07);
+    case AOGSetting::setColor_sec08: return QVariant::fromValue(v.setColor_sec08);
+    case AOGSetting::setColor_sec09: return QVariant::fromValue(v.setColor_sec09);
+    case AOGSetting::setColor_sec10: return QVariant::fromValue(v.setColor_sec10);
+    case AOGSetting::setColor_sec11: return QVariant::fromValue(v.setColor_sec11);
+    case AOGSetting::setColor_sec12: return QVariant::fromValue(v.setColor_sec12);
+    case AOGSetting::setColor_sec13: return QVariant::fromValue(v.setColor_sec13);
+    case AOGSetting::setColor_sec14: return QVariant::fromValue(v.setColor_sec14);
+    case AOGSetting::setColor_sec15: return QVariant::fromValue(v.setColor_sec15);
+    case AOGSetting::setColor_sec16: return QVariant::fromValue(v.setColor_sec16);
+    case AOGSetting::setColor_isMultiColorSections: return QVariant::fromValue(v.setColor_isMultiColorSections);
+    case AOGSetting::setDisplay_customSectionColors: return QVariant::fromValue(v.setDisplay_customSectionColors);
+    case AOGSetting::setBrand_TBrand: return QVariant::fromValue(v.setBrand_TBrand);
+    case AOGSetting::setHeadland_isSectionControlled: return QVariant::fromValue(v.setHeadland_isSectionControlled);
+    case AOGSetting::setSound_isAutoSteerOn: return QVariant::fromValue(v.setSound_isAutoSteerOn);
+    case AOGSetting::setRelay_pinConfig: return toVariant(v.setRelay_pinConfig);
+    case AOGSetting::setDisplay_camSmooth: return QVariant::fromValue(v.setDisplay_camSmooth);
+    case AOGSetting::setGPS_dualHeadingOffset: return QVariant::fromValue(v.setGPS_dualHeadingOffset);
+    case AOGSetting::setF_isSteerWorkSwitchEnabled: return QVariant::fromValue(v.setF_isSteerWorkSwitchEnabled);
+    case AOGSetting::setF_isRemoteWorkSystemOn: return QVariant::fromValue(v.setF_isRemoteWorkSystemOn);
+    case AOGSetting::setDisplay_isAutoStartAgIO: return QVariant::fromValue(v.setDisplay_isAutoStartAgIO);
+    case AOGSetting::setAS_ModeXTE: return QVariant::fromValue(v.setAS_ModeXTE);
+    case AOGSetting::setAS_ModeTime: return QVariant::fromValue(v.setAS_ModeTime);
+    case AOGSetting::setVehicle_toolWidth: return QVariant::fromValue(v.setVehicle_toolWidth);
+    case AOGSetting::setVehicle_toolOverlap: return QVariant::fromValue(v.setVehicle_toolOverlap);
+    case AOGSetting::setTool_toolTrailingHitchLength: return QVariant::fromValue(v.setTool_toolTrailingHitchLength);
+    case AOGSetting::setVehicle_numSections: return QVariant::fromValue(v.setVehicle_numSections);
+    case AOGSetting::setSection_position1: return QVariant::fromValue(v.setSection_position1);
+    case AOGSetting::setSection_position2: return QVariant::fromValue(v.setSection_position2);
+    case AOGSetting::setSection_position3: return QVariant::fromValue(v.setSection_position3);
+    case AOGSetting::setSection_position4: return QVariant::fromValue(v.setSection_position4);
+    case AOGSetting::setSection_position5: return QVariant::fromValue(v.setSection_position5);
+    case AOGSetting::setSection_position6: return QVariant::fromValue(v.setSection_position6);
+    case AOGSetting::setSection_position7: return QVariant::fromValue(v.setSection_position7);
+    case AOGSetting::setSection_position8: return QVariant::fromValue(v.setSection_position8);
+    case AOGSetting::setSection_position9: return QVariant::fromValue(v.setSection_position9);
+    case AOGSetting::setSection_position10: return QVariant::fromValue(v.setSection_position10);
+    case AOGSetting::setSection_position11: return QVariant::fromValue(v.setSection_position11);
+    case AOGSetting::setSection_position12: return QVariant::fromValue(v.setSection_position12);
+    case AOGSetting::setSection_position13: return QVariant::fromValue(v.setSection_position13);
+    case AOGSetting::setSection_position14: return QVariant::fromValue(v.setSection_position14);
+    case AOGSetting::setSection_position15: return QVariant::fromValue(v.setSection_position15);
+    case AOGSetting::setSection_position16: return QVariant::fromValue(v.setSection_position16);
+    case AOGSetting::setSection_position17: return QVariant::fromValue(v.setSection_position17);
+    case AOGSetting::purePursuitIntegralGainAB: return QVariant::fromValue(v.purePursuitIntegralGainAB);
+    case AOGSetting::set_youMoveDistance: return QVariant::fromValue(v.set_youMoveDistance);
+    case AOGSetting::setVehicle_antennaHeight: return QVariant::fromValue(v.setVehicle_antennaHeight);
+    case AOGSetting::setVehicle_toolLookAheadOn: return QVariant::fromValue(v.setVehicle_toolLookAheadOn);
+    case AOGSetting::setTool_isToolTrailing: return QVariant::fromValue(v.setTool_isToolTrailing);
+    case AOGSetting::setVehicle_toolOffset: return QVariant::fromValue(v.setVehicle_toolOffset);
+    case AOGSetting::setTool_isToolRearFixed: return QVariant::fromValue(v.setTool_isToolRearFixed);
+    case AOGSetting::setVehicle_antennaPivot: return QVariant::fromValue(v.setVehicle_antennaPivot);
+    case AOGSetting::setVehicle_wheelbase: return QVariant::fromValue(v.setVehicle_wheelbase);
+    case AOGSetting::setVehicle_hitchLength: return QVariant::fromValue(v.setVehicle_hitchLength);
+    case AOGSetting::setVehicle_toolLookAheadOff: return QVariant::fromValue(v.setVehicle_toolLookAheadOff);
+    case AOGSetting::setVehicle_isPivotBehindAntenna: return QVariant::fromValue(v.setVehicle_isPivotBehindAntenna);
+    case AOGSetting::setVehicle_isSteerAxleAhead: return QVariant::fromValue(v.setVehicle_isSteerAxleAhead);
+    case AOGSetting::setVehicle_vehicleName: return QVariant::fromValue(v.setVehicle_vehicleName);
+    case AOGSetting::setVehicle_slowSpeedCutoff: return QVariant::fromValue(v.setVehicle_slowSpeedCutoff);
+    case AOGSetting::setVehicle_tankTrailingHitchLength: return QVariant::fromValue(v.setVehicle_tankTrailingHitchLength);
+    case AOGSetting::setVehicle_minCoverage: return QVariant::fromValue(v.setVehicle_minCoverage);
+    case AOGSetting::setVehicle_goalPointLookAhead: return QVariant::fromValue(v.setVehicle_goalPointLookAhead);
+    case AOGSetting::setVehicle_maxAngularVelocity: return QVariant::fromValue(v.setVehicle_maxAngularVelocity);
+    case AOGSetting::setVehicle_maxSteerAngle: return QVariant::fromValue(v.setVehicle_maxSteerAngle);
+    case AOGSetting::set_youTurnExtensionLength: return QVariant::fromValue(v.set_youTurnExtensionLength);
+    case AOGSetting::set_youToolWidths: return QVariant::fromValue(v.set_youToolWidths);
+    case AOGSetting::setVehicle_minTurningRadius: return QVariant::fromValue(v.setVehicle_minTurningRadius);
+    case AOGSetting::setVehicle_antennaOffset: return QVariant::fromValue(v.setVehicle_antennaOffset);
+    case AOGSetting::set_youTurnDistanceFromBoundary: return QVariant::fromValue(v.set_youTurnDistanceFromBoundary);
+    case AOGSetting::setVehicle_lookAheadMinimum: return QVariant::fromValue(v.setVehicle_lookAheadMinimum);
+    case AOGSetting::setVehicle_goalPointLookAheadMult: return QVariant::fromValue(v.setVehicle_goalPointLookAheadMult);
+    case AOGSetting::stanleyDistanceErrorGain: return QVariant::fromValue(v.stanleyDistanceErrorGain);
+    case AOGSetting::stanleyHeadingErrorGain: return QVariant::fromValue(v.stanleyHeadingErrorGain);
+    case AOGSetting::setVehicle_isStanleyUsed: return QVariant::fromValue(v.setVehicle_isStanleyUsed);
+    case AOGSetting::setTram_BasedOn: return QVariant::fromValue(v.setTram_BasedOn);
+    case AOGSetting::setTram_Skips: return QVariant::fromValue(v.setTram_Skips);
+    case AOGSetting::setTool_isToolTBT: return QVariant::fromValue(v.setTool_isToolTBT);
+    case AOGSetting::setVehicle_vehicleType: return QVariant::fromValue(v.setVehicle_vehicleType);
+    case AOGSetting::set_youSkipWidth: return QVariant::fromValue(v.set_youSkipWidth);
+    case AOGSetting::setArdSteer_setting1: return QVariant::fromValue(v.setArdSteer_setting1);
+    case AOGSetting::setArdSteer_minSpeed: return QVariant::fromValue(v.setArdSteer_minSpeed);
+    case AOGSetting::setArdSteer_maxSpeed: return QVariant::fromValue(v.setArdSteer_maxSpeed);
+    case AOGSetting::setArdSteer_setting0: return QVariant::fromValue(v.setArdSteer_setting0);
+    case AOGSetting::setVehicle_hydraulicLiftLookAhead: return QVariant::fromValue(v.setVehicle_hydraulicLiftLookAhead);
+    case AOGSetting::setVehicle_isMachineControlToAutoSteer: return QVariant::fromValue(v.setVehicle_isMachineControlToAutoSteer);
+    case AOGSetting::setArdSteer_maxPulseCounts: return QVariant::fromValue(v.setArdSteer_maxPulseCounts);
+    case AOGSetting::setArdMac_hydRaiseTime: return QVariant::fromValue(v.setArdMac_hydRaiseTime);
+    case AOGSetting::setArdMac_hydLowerTime: return QVariant::fromValue(v.setArdMac_hydLowerTime);
+    case AOGSetting::setArdMac_isHydEnabled: return QVariant::fromValue(v.setArdMac_isHydEnabled);
+    case AOGSetting::setTool_defaultSectionWidth: return QVariant::fromValue(v.setTool_defaultSectionWidth);
+    case AOGSetting::setVehicle_toolOffDelay: return QVariant::fromValue(v.setVehicle_toolOffDelay);
+    case AOGSetting::setArdMac_setting0: return QVariant::fromValue(v.setArdMac_setting0);
+    case AOGSetting::setArdSteer_setting2: return QVariant::fromValue(v.setArdSteer_setting2);
+    case AOGSetting::stanleyIntegralDistanceAwayTriggerAB: return QVariant::fromValue(v.stanleyIntegralDistanceAwayTriggerAB);
+    case AOGSetting::setTool_isToolFront: return QVariant::fromValue(v.setTool_isToolFront);
+    case AOGSetting::setVehicle_trackWidth: return QVariant::fromValue(v.setVehicle_trackWidth);
+    case AOGSetting::setArdMac_isDanfoss: return QVariant::fromValue(v.setArdMac_isDanfoss);
+    case AOGSetting::stanleyIntegralGainAB: return QVariant::fromValue(v.stanleyIntegralGainAB);
+    case AOGSetting::setSection_isFast: return QVariant::fromValue(v.setSection_isFast);
+    case AOGSetting::setArdMac_user1: return QVariant::fromValue(v.setArdMac_user1);
+    case AOGSetting::setArdMac_user2: return QVariant::fromValue(v.setArdMac_user2);
+    case AOGSetting::setArdMac_user3: return QVariant::fromValue(v.setArdMac_user3);
+    case AOGSetting::setArdMac_user4: return QVariant::fromValue(v.setArdMac_user4);
+    case AOGSetting::setVehicle_panicStopSpeed: return QVariant::fromValue(v.setVehicle_panicStopSpeed);
+    case AOGSetting::setAS_ModeMultiplierStanley: return QVariant::fromValue(v.setAS_ModeMultiplierStanley);
+    case AOGSetting::setDisplay_brightness: return QVariant::fromValue(v.setDisplay_brightness);
+    case AOGSetting::set_youTurnRadius: return QVariant::fromValue(v.set_youTurnRadius);
+    case AOGSetting::setDisplay_brightnessSystem: return QVariant::fromValue(v.setDisplay_brightnessSystem);
+    case AOGSetting::setTool_isSectionsNotZones: return QVariant::fromValue(v.setTool_isSectionsNotZones);
+    case AOGSetting::setTool_numSectionsMulti: return QVariant::fromValue(v.setTool_numSectionsMulti);
+    case AOGSetting::setTool_zones: return toVariant(v.setTool_zones);
+    case AOGSetting::setTool_sectionWidthMulti: return QVariant::fromValue(v.setTool_sectionWidthMulti);
+    case AOGSetting::setDisplay_isBrightnessOn: return QVariant::fromValue(v.setDisplay_isBrightnessOn);
+    case AOGSetting::setKey_hotkeys: return QVariant::fromValue(v.setKey_hotkeys);
+    case AOGSetting::setVehicle_goalPointLookAheadHold: return QVariant::fromValue(v.setVehicle_goalPointLookAheadHold);
+    case AOGSetting::setTool_isSectionOffWhenOut: return QVariant::fromValue(v.setTool_isSectionOffWhenOut);
+    case AOGSetting::set_uTurnStyle: return QVariant::fromValue(v.set_uTurnStyle);
+    case AOGSetting::setGPS_minimumStepLimit: return QVariant::fromValue(v.setGPS_minimumStepLimit);
+    case AOGSetting::setAS_isSteerInReverse: return QVariant::fromValue(v.setAS_isSteerInReverse);
+    case AOGSetting::setAS_functionSpeedLimit: return QVariant::fromValue(v.setAS_functionSpeedLimit);
+    case AOGSetting::setAS_maxSteerSpeed: return QVariant::fromValue(v.setAS_maxSteerSpeed);
+    case AOGSetting::setAS_minSteerSpeed: return QVariant::fromValue(v.setAS_minSteerSpeed);
+    case AOGSetting::setBrand_HBrand: return QVariant::fromValue(v.setBrand_HBrand);
+    case AOGSetting::setBrand_WDBrand: return QVariant::fromValue(v.setBrand_WDBrand);
+    case AOGSetting::setIMU_fusionWeight2: return QVariant::fromValue(v.setIMU_fusionWeight2);
+    case AOGSetting::setDisplay_isSvennArrowOn: return QVariant::fromValue(v.setDisplay_isSvennArrowOn);
+    case AOGSetting::setTool_isTramOuterInverted: return QVariant::fromValue(v.setTool_isTramOuterInverted);
+    case AOGSetting::setJobMenu_location: return QVariant::fromValue(v.setJobMenu_location);
+    case AOGSetting::setJobMenu_size: return QVariant::fromValue(v.setJobMenu_size);
+    case AOGSetting::setWindow_steerSettingsLocation: return QVariant::fromValue(v.setWindow_steerSettingsLocation);
+    case AOGSetting::setWindow_buildTracksLocation: return QVariant::fromValue(v.setWindow_buildTracksLocation);
+    case AOGSetting::setTool_trailingToolToPivotLength: return QVariant::fromValue(v.setTool_trailingToolToPivotLength);
+    case AOGSetting::setWindow_formNudgeLocation: return QVariant::fromValue(v.setWindow_formNudgeLocation);
+    case AOGSetting::setWindow_formNudgeSize: return QVariant::fromValue(v.setWindow_formNudgeSize);
+    case AOGSetting::setAS_snapDistanceRef: return QVariant::fromValue(v.setAS_snapDistanceRef);
+    case AOGSetting::setDisplay_buttonOrder: return QVariant::fromValue(v.setDisplay_buttonOrder);
+    case AOGSetting::setDisplay_camPitch: return QVariant::fromValue(v.setDisplay_camPitch);
+    case AOGSetting::setWindow_abDrawSize: return QVariant::fromValue(v.setWindow_abDrawSize);
+    case AOGSetting::setWindow_HeadlineSize: return QVariant::fromValue(v.setWindow_HeadlineSize);
+    case AOGSetting::setWindow_HeadAcheSize: return QVariant::fromValue(v.setWindow_HeadAcheSize);
+    case AOGSetting::setWindow_MapBndSize: return QVariant::fromValue(v.setWindow_MapBndSize);
+    case AOGSetting::setWindow_BingMapSize: return QVariant::fromValue(v.setWindow_BingMapSize);
+    case AOGSetting::setWindow_BingZoom: return QVariant::fromValue(v.setWindow_BingZoom);
+    case AOGSetting::setWindow_RateMapSize: return QVariant::fromValue(v.setWindow_RateMapSize);
+    case AOGSetting::setWindow_RateMapZoom: return QVariant::fromValue(v.setWindow_RateMapZoom);
+    case AOGSetting::setWindow_QuickABLocation: return QVariant::fromValue(v.setWindow_QuickABLocation);
+    case AOGSetting::setDisplay_isLogElevation: return QVariant::fromValue(v.setDisplay_isLogElevation);
+    case AOGSetting::setSound_isSectionsOn: return QVariant::fromValue(v.setSound_isSectionsOn);
+    case AOGSetting::setGPS_dualReverseDetectionDistance: return QVariant::fromValue(v.setGPS_dualReverseDetectionDistance);
+    case AOGSetting::setTool_isDisplayTramControl: return QVariant::fromValue(v.setTool_isDisplayTramControl);
+    case AOGSetting::setAS_uTurnCompensation: return QVariant::fromValue(v.setAS_uTurnCompensation);
+    case AOGSetting::setFeature_isHeadlandOn: return QVariant::fromValue(v.setFeature_isHeadlandOn);
+    case AOGSetting::setFeature_isTramOn: return QVariant::fromValue(v.setFeature_isTramOn);
+    case AOGSetting::setFeature_isBoundaryOn: return QVariant::fromValue(v.setFeature_isBoundaryOn);
+    case AOGSetting::setFeature_isBndContourOn: return QVariant::fromValue(v.setFeature_isBndContourOn);
+    case AOGSetting::setFeature_isRecPathOn: return QVariant::fromValue(v.setFeature_isRecPathOn);
+    case AOGSetting::setFeature_isABSmoothOn: return QVariant::fromValue(v.setFeature_isABSmoothOn);
+    case AOGSetting::setFeature_isHideContourOn: return QVariant::fromValue(v.setFeature_isHideContourOn);
+    case AOGSetting::setFeature_isWebCamOn: return QVariant::fromValue(v.setFeature_isWebCamOn);
+    case AOGSetting::setFeature_isOffsetFixOn: return QVariant::fromValue(v.setFeature_isOffsetFixOn);
+    case AOGSetting::setFeature_isAgIOOn: return QVariant::fromValue(v.setFeature_isAgIOOn);
+    case AOGSetting::setFeature_isContourOn: return QVariant::fromValue(v.setFeature_isContourOn);
+    case AOGSetting::setFeature_isYouTurnOn: return QVariant::fromValue(v.setFeature_isYouTurnOn);
+    case AOGSetting::setFeature_isSteerModeOn: return QVariant::fromValue(v.setFeature_isSteerModeOn);
+    case AOGSetting::setFeature_isManualSectionOn: return QVariant::fromValue(v.setFeature_isManualSectionOn);
+    case AOGSetting::setFeature_isAutoSectionOn: return QVariant::fromValue(v.setFeature_isAutoSectionOn);
+    case AOGSetting::setFeature_isCycleLinesOn: return QVariant::fromValue(v.setFeature_isCycleLinesOn);
+    case AOGSetting::setFeature_isABLineOn: return QVariant::fromValue(v.setFeature_isABLineOn);
+    case AOGSetting::setFeature_isCurveOn: return QVariant::fromValue(v.setFeature_isCurveOn);
+    case AOGSetting::setFeature_isAutoSteerOn: return QVariant::fromValue(v.setFeature_isAutoSteerOn);
+    case AOGSetting::setFeature_isUTurnOn: return QVariant::fromValue(v.setFeature_isUTurnOn);
+    case AOGSetting::setFeature_isLateralOn: return QVariant::fromValue(v.setFeature_isLateralOn);
+    case AOGSetting::displayShowBack: return QVariant::fromValue(v.displayShowBack);
+    case AOGSetting::displayAntiAliasSamples: return QVariant::fromValue(v.displayAntiAliasSamples);
+    case AOGSetting::setDisplay_useTrackZero: return QVariant::fromValue(v.setDisplay_useTrackZero);
+    case AOGSetting::setDisplay_topTrackNum: return QVariant::fromValue(v.setDisplay_topTrackNum);
+    case AOGSetting::setDisplay_colorDayBackground: return QVariant::fromValue(v.setDisplay_colorDayBackground);
+    case AOGSetting::setDisplay_colorNightBackground: return QVariant::fromValue(v.setDisplay_colorNightBackground);
+    case AOGSetting::setDisplay_colorDayBorder: return QVariant::fromValue(v.setDisplay_colorDayBorder);
+    case AOGSetting::setDisplay_colorNightBorder: return QVariant::fromValue(v.setDisplay_colorNightBorder);
+    }
+    return QVariant();
+}
+
+double AOGSettingsStore::toDouble(AOGSetting id) const
+{
+    QReadLocker locker(&lock);
+    switch (id) {
+    case AOGSetting::setWindow_Maximized: return v.setWindow_Maximized;
+    case AOGSetting::setWindow_Minimized: return v.setWindow_Minimized;
+    case AOGSetting::setDisplay_triangleResolution: return v.setDisplay_triangleResolution;
+    case AOGSetting::setMenu_isMetric: return v.setMenu_isMetric;
+    case AOGSetting::setMenu_isGridOn: return v.setMenu_isGridOn;
+    case AOGSetting::setMenu_isLightbarOn: return v.setMenu_isLightbarOn;
+    case AOGSetting::setF_isWorkSwitchEnabled: return v.setF_isWorkSwitchEnabled;
+    case AOGSetting::setIMU_pitchZeroX16: return v.setIMU_pitchZeroX16;
+    case AOGSetting::setIMU_rollZero: return v.setIMU_rollZero;
+    case AOGSetting::setF_minHeadingStepDistance: return v.setF_minHeadingStepDistance;
+    case AOGSetting::setAS_lowSteerPWM: return v.setAS_lowSteerPWM;
+    case AOGSetting::setAS_wasOffset: return v.setAS_wasOffset;
+    case AOGSetting::setF_UserTotalArea: return v.setF_UserTotalArea;
+    case AOGSetting::setAS_minSteerPWM: return v.setAS_minSteerPWM;
+    case AOGSetting::setF_boundaryTriggerDistance: return v.setF_boundaryTriggerDistance;
+    case AOGSetting::setAS_highSteerPWM: return v.setAS_highSteerPWM;
+    case AOGSetting::setMenu_isSideGuideLines: return v.setMenu_isSideGuideLines;
+    case AOGSetting::setAS_countsPerDegree: return v.setAS_countsPerDegree;
+    case AOGSetting::setMenu_isPureOn: return v.setMenu_isPureOn;
+    case AOGSetting::setMenu_isSimulatorOn: return v.setMenu_isSimulatorOn;
+    case AOGSetting::setMenu_isSkyOn: return v.setMenu_isSkyOn;
+    case AOGSetting::setDisplay_lightbarCmPerPixel: return v.setDisplay_lightbarCmPerPixel;
+    case AOGSetting::setGPS_SimLatitude: return v.setGPS_SimLatitude;
+    case AOGSetting::setGPS_SimLongitude: return v.setGPS_SimLongitude;
+    case AOGSetting::setAS_snapDistance: return v.setAS_snapDistance;
+    case AOGSetting::setF_isWorkSwitchManualSections: return v.setF_isWorkSwitchManualSections;
+    case AOGSetting::setAS_isAutoSteerAutoOn: return v.setAS_isAutoSteerAutoOn;
+    case AOGSetting::setDisplay_lineWidth: return v.setDisplay_lineWidth;
+    case AOGSetting::setTram_tramWidth: return v.setTram_tramWidth;
+    case AOGSetting::setTram_snapAdj: return v.setTram_snapAdj;
+    case AOGSetting::setTram_passes: return v.setTram_passes;
+    case AOGSetting::setTram_offset: return v.setTram_offset;
+    case AOGSetting::setMenu_isOGLZoomOn: return v.setMenu_isOGLZoomOn;
+    case AOGSetting::setMenu_isCompassOn: return v.setMenu_isCompassOn;
+    case AOGSetting::setMenu_isSpeedoOn: return v.setMenu_isSpeedoOn;
+    case AOGSetting::setDisplay_isDayMode: return v.setDisplay_isDayMode;
+    case AOGSetting::setDisplay_isAutoDayNight: return v.setDisplay_isAutoDayNight;
+    case AOGSetting::setDisplay_isTermsAccepted: return v.setDisplay_isTermsAccepted;
+    case AOGSetting::setGPS_isRTK: return v.setGPS_isRTK;
+    case AOGSetting::setDisplay_isStartFullScreen: return v.setDisplay_isStartFullScreen;
+    case AOGSetting::setDisplay_isKeyboardOn: return v.setDisplay_isKeyboardOn;
+    case AOGSetting::setIMU_rollFilter: return v.setIMU_rollFilter;
+    case AOGSetting::setAS_uTurnSmoothing: return v.setAS_uTurnSmoothing;
+    case AOGSetting::setIMU_invertRoll: return v.setIMU_invertRoll;
+    case AOGSetting::setAS_ackerman: return v.setAS_ackerman;
+    case AOGSetting::setF_isWorkSwitchActiveLow: return v.setF_isWorkSwitchActiveLow;
+    case AOGSetting::setAS_Kp: return v.setAS_Kp;
+    case AOGSetting::setSound_isUturnOn: return v.setSound_isUturnOn;
+    case AOGSetting::setSound_isHydLiftOn: return v.setSound_isHydLiftOn;
+    case AOGSetting::setTram_isTramOnBackBuffer: return v.setTram_isTramOnBackBuffer;
+    case AOGSetting::setDisplay_camZoom: return v.setDisplay_camZoom;
+    case AOGSetting::setDisplay_vehicleOpacity: return v.setDisplay_vehicleOpacity;
+    case AOGSetting::setDisplay_isVehicleImage: return v.setDisplay_isVehicleImage;
+    case AOGSetting::setDisplay_isTextureOn: return v.setDisplay_isTextureOn;
+    case AOGSetting::setAB_lineLength: return v.setAB_lineLength;
+    case AOGSetting::setGPS_udpWatchMsec: return v.setGPS_udpWatchMsec;
+    case AOGSetting::setF_isSteerWorkSwitchManualSections: return v.setF_isSteerWorkSwitchManualSections;
+    case AOGSetting::setAS_isConstantContourOn: return v.setAS_isConstantContourOn;
+    case AOGSetting::setAS_guidanceLookAheadTime: return v.setAS_guidanceLookAheadTime;
+    case AOGSetting::setIMU_isDualAsIMU: return v.setIMU_isDualAsIMU;
+    case AOGSetting::setAS_sideHillComp: return v.setAS_sideHillComp;
+    case AOGSetting::setIMU_isReverseOn: return v.setIMU_isReverseOn;
+    case AOGSetting::setGPS_forwardComp: return v.setGPS_forwardComp;
+    case AOGSetting::setGPS_reverseComp: return v.setGPS_reverseComp;
+    case AOGSetting::setGPS_ageAlarm: return v.setGPS_ageAlarm;
+    case AOGSetting::setGPS_isRTK_KillAutoSteer: return v.setGPS_isRTK_KillAutoSteer;
+    case AOGSetting::setColor_isMultiColorSections: return v.setColor_isMultiColorSections;
+    case AOGSetting::setHeadland_isSectionControlled: return v.setHeadland_isSectionControlled;
+    case AOGSetting::setSound_isAutoSteerOn: return v.setSound_isAutoSteerOn;
+    case AOGSetting::setDisplay_camSmooth: return v.setDisplay_camSmooth;
+    case AOGSetting::setGPS_dualHeadingOffset: return v.setGPS_dualHeadingOffset;
+    case AOGSetting::setF_isSteerWorkSwitchEnabled: return v.setF_isSteerWorkSwitchEnabled;
+    case AOGSetting::setF_isRemoteWorkSystemOn: return v.setF_isRemoteWorkSystemOn;
+    case AOGSetting::setDisplay_isAutoStartAgIO: return v.setDisplay_isAutoStartAgIO;
+    case AOGSetting::setAS_ModeXTE: return v.setAS_ModeXTE;
+    case AOGSetting::setAS_ModeTime: return v.setAS_ModeTime;
+    case AOGSetting::setVehicle_toolWidth: return v.setVehicle_toolWidth;
+    case AOGSetting::setVehicle_toolOverlap: return v.setVehicle_toolOverlap;
+    case AOGSetting::setTool_toolTrailingHitchLength: return v.setTool_toolTrailingHitchLength;
+    case AOGSetting::setVehicle_numSections: return v.setVehicle_numSections;
+    case AOGSetting::setSection_position1: return v.setSection_position1;
+    case AOGSetting::setSection_position2: return v.setSection_position2;
+    case AOGSetting::setSection_position3: return v.setSection_position3;
+    case AOGSetting::setSection_position4: return v.setSection_position4;
+    case AOGSetting::setSection_position5: return v.setSection_position5;
+    case AOGSetting::setSection_position6: return v.setSection_position6;
+    case AOGSetting::setSection_position7: return v.setSection_position7;
+    case AOGSetting::setSection_position8: return v.setSection_position8;
+    case AOGSetting::setSection_position9: return v.setSection_position9;
+    case AOGSetting::setSection_position10: return v.setSection_position10;
+    case AOGSetting::setSection_position11: return v.setSection_position11;
+    case AOGSetting::setSection_position12: return v.setSection_position12;
+    case AOGSetting::setSection_position13: return v.setSection_position13;
+    case AOGSetting::setSection_position14: return v.setSection_position14;
+    case AOGSetting::setSection_position15: return v.setSection_position15;
+    case AOGSetting::setSection_position16: return v.setSection_position16;
+    case AOGSetting::setSection_position17: return v.setSection_position17;
+    case AOGSetting::purePursuitIntegralGainAB: return v.purePursuitIntegralGainAB;
+    case AOGSetting::set_youMoveDistance: return v.set_youMoveDistance;
+    case AOGSetting::setVehicle_antennaHeight: return v.setVehicle_antennaHeight;
+    case AOGSetting::setVehicle_toolLookAheadOn: return v.setVehicle_toolLookAheadOn;
+    case AOGSetting::setTool_isToolTrailing: return v.setTool_isToolTrailing;
+    case AOGSetting::setVehicle_toolOffset: return v.setVehicle_toolOffset;
+    case AOGSetting::setTool_isToolRearFixed: return v.setTool_isToolRearFixed;
+    case AOGSetting::setVehicle_antennaPivot: return v.setVehicle_antennaPivot;
+    case AOGSetting::setVehicle_wheelbase: return v.setVehicle_wheelbase;
+    case AOGSetting::setVehicle_hitchLength: return v.setVehicle_hitchLength;
+    case AOGSetting::setVehicle_toolLookAheadOff: return v.setVehicle_toolLookAheadOff;
+    case AOGSetting::setVehicle_isPivotBehindAntenna: return v.setVehicle_isPivotBehindAntenna;
+    case AOGSetting::setVehicle_isSteerAxleAhead: return v.setVehicle_isSteerAxleAhead;
+    case AOGSetting::setVehicle_slowSpeedCutoff: return v.setVehicle_slowSpeedCutoff;
+    case AOGSetting::setVehicle_tankTrailingHitchLength: return v.setVehicle_tankTrailingHitchLength;
+    case AOGSetting::setVehicle_minCoverage: return v.setVehicle_minCoverage;
+    case AOGSetting::setVehicle_goalPointLookAhead: return v.setVehicle_goalPointLookAhead;
+    case AOGSetting::setVehicle_maxAngularVelocity: return v.setVehicle_maxAngularVelocity;
+    case AOGSetting::setVehicle_maxSteerAngle: return v.setVehicle_maxSteerAngle;
+    case AOGSetting::set_youTurnExtensionLength: return v.set_youTurnExtensionLength;
+    case AOGSetting::set_youToolWidths: return v.set_youToolWidths;
+    case AOGSetting::setVehicle_minTurningRadius: return v.setVehicle_minTurningRadius;
+    case AOGSetting::setVehicle_antennaOffset: return v.setVehicle_antennaOffset;
+    case AOGSetting::set_youTurnDistanceFromBoundary: return v.set_youTurnDistanceFromBoundary;
+    case AOGSetting::setVehicle_lookAheadMinimum: return v.setVehicle_lookAheadMinimum;
+    case AOGSetting::setVehicle_goalPointLookAheadMult: return v.setVehicle_goalPointLookAheadMult;
+    case AOGSetting::stanleyDistanceErrorGain: return v.stanleyDistanceErrorGain;
+    case AOGSetting::stanleyHeadingErrorGain: return v.stanleyHeadingErrorGain;
+    case AOGSetting::setVehicle_isStanleyUsed: return v.setVehicle_isStanleyUsed;
+    case AOGSetting::setTram_BasedOn: return v.setTram_BasedOn;
+    case AOGSetting::setTram_Skips: return v.setTram_Skips;
+    case AOGSetting::setTool_isToolTBT: return v.setTool_isToolTBT;
+    case AOGSetting::setVehicle_vehicleType: return v.setVehicle_vehicleType;
+    case AOGSetting::set_youSkipWidth: return v.set_youSkipWidth;
+    case AOGSetting::setArdSteer_setting1: return v.setArdSteer_setting1;
+    case AOGSetting::setArdSteer_minSpeed: return v.setArdSteer_minSpeed;
+    case AOGSetting::setArdSteer_maxSpeed: return v.setArdSteer_maxSpeed;
+    case AOGSetting::setArdSteer_setting0: return v.setArdSteer_setting0;
+    case AOGSetting::setVehicle_hydraulicLiftLookAhead: return v.setVehicle_hydraulicLiftLookAhead;
+    case AOGSetting::setVehicle_isMachineControlToAutoSteer: return v.setVehicle_isMachineControlToAutoSteer;
+    case AOGSetting::setArdSteer_maxPulseCounts: return v.setArdSteer_maxPulseCounts;
+    case AOGSetting::setArdMac_hydRaiseTime: return v.setArdMac_hydRaiseTime;
+    case AOGSetting::setArdMac_hydLowerTime: return v.setArdMac_hydLowerTime;
+    case AOGSetting::setArdMac_isHydEnabled: return v.setArdMac_isHydEnabled;
+    case AOGSetting::setTool_defaultSectionWidth: return v.setTool_defaultSectionWidth;
+    case AOGSetting::setVehicle_toolOffDelay: return v.setVehicle_toolOffDelay;
+    case AOGSetting::setArdMac_setting0: return v.setArdMac_setting0;
+    case AOGSetting::setArdSteer_setting2: return v.setArdSteer_setting2;
+    case AOGSetting::stanleyIntegralDistanceAwayTriggerAB: return v.stanleyIntegralDistanceAwayTriggerAB;
+    case AOGSetting::setTool_isToolFront: return v.setTool_isToolFront;
+    case AOGSetting::setVehicle_trackWidth: return v.setVehicle_trackWidth;
+    case AOGSetting::setArdMac_isDanfoss: return v.setArdMac_isDanfoss;
+    case AOGSetting::stanleyIntegralGainAB: return v.stanleyIntegralGainAB;
+    case AOGSetting::setSection_isFast: return v.setSection_isFast;
+    case AOGSetting::setArdMac_user1: return v.setArdMac_user1;
+    case AOGSetting::setArdMac_user2: return v.setArdMac_user2;
+    case AOGSetting::setArdMac_user3: return v.setArdMac_user3;
+    case AOGSetting::setArdMac_user4: return v.setArdMac_user4;
+    case AOGSetting::setVehicle_panicStopSpeed: return v.setVehicle_panicStopSpeed;
+    case AOGSetting::setAS_ModeMultiplierStanley: return v.setAS_ModeMultiplierStanley;
+    case AOGSetting::setDisplay_brightness: return v.setDisplay_brightness;
+    case AOGSetting::set_youTurnRadius: return v.set_youTurnRadius;
+    case AOGSetting::setDisplay_brightnessSystem: return v.setDisplay_brightnessSystem;
+    case AOGSetting::setTool_isSectionsNotZones: return v.setTool_isSectionsNotZones;
+    case AOGSetting::setTool_numSectionsMulti: return v.setTool_numSectionsMulti;
+    case AOGSetting::setTool_sectionWidthMulti: return v.setTool_sectionWidthMulti;
+    case AOGSetting::setDisplay_isBrightnessOn: return v.setDisplay_isBrightnessOn;
+    case AOGSetting::setVehicle_goalPointLookAheadHold: return v.setVehicle_goalPointLookAheadHold;
+    case AOGSetting::setTool_isSectionOffWhenOut: return v.setTool_isSectionOffWhenOut;
+    case AOGSetting::set_uTurnStyle: return v.set_uTurnStyle;
+    case AOGSetting::setGPS_minimumStepLimit: return v.setGPS_minimumStepLimit;
+    case AOGSetting::setAS_isSteerInReverse: return v.setAS_isSteerInReverse;
+    case AOGSetting::setAS_functionSpeedLimit: return v.setAS_functionSpeedLimit;
+    case AOGSetting::setAS_maxSteerSpeed: return v.setAS_maxSteerSpeed;
+    case AOGSetting::setAS_minSteerSpeed: return v.setAS_minSteerSpeed;
+    case AOGSetting::setIMU_fusionWeight2: return v.setIMU_fusionWeight2;
+    case AOGSetting::setDisplay_isSvennArrowOn: return v.setDisplay_isSvennArrowOn;
+    case AOGSetting::setTool_isTramOuterInverted: return v.setTool_isTramOuterInverted;
+    case AOGSetting::setTool_trailingToolToPivotLength: return v.setTool_trailingToolToPivotLength;
+    case AOGSetting::setAS_snapDistanceRef: return v.setAS_snapDistanceRef;
+    case AOGSetting::setDisplay_camPitch: return v.setDisplay_camPitch;
+    case AOGSetting::setWindow_BingZoom: return v.setWindow_BingZoom;
+    case AOGSetting::setWindow_RateMapZoom: return v.setWindow_RateMapZoom;
+    case AOGSetting::setDisplay_isLogElevation: return v.setDisplay_isLogElevation;
+    case AOGSetting::setSound_isSectionsOn: return v.setSound_isSectionsOn;
+    case AOGSetting::setGPS_dualReverseDetectionDistance: return v.setGPS_dualReverseDetectionDistance;
+    case AOGSetting::setTool_isDisplayTramControl: return v.setTool_isDisplayTramControl;
+    case AOGSetting::setAS_uTurnCompensation: return v.setAS_uTurnCompensation;
+    case AOGSetting::setFeature_isHeadlandOn: return v.setFeature_isHeadlandOn;
+    case AOGSetting::setFeature_isTramOn: return v.setFeature_isTramOn;
+    case AOGSetting::setFeature_isBoundaryOn: return v.setFeature_isBoundaryOn;
+    case AOGSetting::setFeature_isBndContourOn: return v.setFeature_isBndContourOn;
+    case AOGSetting::setFeature_isRecPathOn: return v.setFeature_isRecPathOn;
+    case AOGSetting::setFeature_isABSmoothOn: return v.setFeature_isABSmoothOn;
+    case AOGSetting::setFeature_isHideContourOn: return v.setFeature_isHideContourOn;
+    case AOGSetting::setFeature_isWebCamOn: return v.setFeature_isWebCamOn;
+    case AOGSetting::setFeature_isOffsetFixOn: return v.setFeature_isOffsetFixOn;
+    case AOGSetting::setFeature_isAgIOOn: return v.setFeature_isAgIOOn;
+    case AOGSetting::setFeature_isContourOn: return v.setFeature_isContourOn;
+    case AOGSetting::setFeature_isYouTurnOn: return v.setFeature_isYouTurnOn;
+    case AOGSetting::setFeature_isSteerModeOn: return v.setFeature_isSteerModeOn;
+    case AOGSetting::setFeature_isManualSectionOn: return v.setFeature_isManualSectionOn;
+    case AOGSetting::setFeature_isAutoSectionOn: return v.setFeature_isAutoSectionOn;
+    case AOGSetting::setFeature_isCycleLinesOn: return v.setFeature_isCycleLinesOn;
+    case AOGSetting::setFeature_isABLineOn: return v.setFeature_isABLineOn;
+    case AOGSetting::setFeature_isCurveOn: return v.setFeature_isCurveOn;
+    case AOGSetting::setFeature_isAutoSteerOn: return v.setFeature_isAutoSteerOn;
+    case AOGSetting::setFeature_isUTurnOn: return v.setFeature_isUTurnOn;
+    case AOGSetting::setFeature_isLateralOn: return v.setFeature_isLateralOn;
+    case AOGSetting::displayShowBack: return v.displayShowBack;
+    case AOGSetting::displayAntiAliasSamples: return v.displayAntiAliasSamples;
+    case AOGSetting::setDisplay_useTrackZero: return v.setDisplay_useTrackZero;
+    case AOGSetting::setDisplay_topTrackNum: return v.setDisplay_topTrackNum;
+    default: return variant(id).toDouble();
+    }
+}
+
+int AOGSettingsStore::toInt(AOGSetting id) const
+{
+    QReadLocker locker(&lock);
+    switch (id) {
+    case AOGSetting::setWindow_Maximized: return v.setWindow_Maximized;
+    case AOGSetting::setWindow_Minimized: return v.setWindow_Minimized;
+    case AOGSetting::setDisplay_triangleResolution: return qRound(v.setDisplay_triangleResolution);
+    case AOGSetting::setMenu_isMetric: return v.setMenu_isMetric;
+    case AOGSetting::setMenu_isGridOn: return v.setMenu_isGridOn;
+    case AOGSetting::setMenu_isLightbarOn: return v.setMenu_isLightbarOn;
+    case AOGSetting::setF_isWorkSwitchEnabled: return v.setF_isWorkSwitchEnabled;
+    case AOGSetting::setIMU_pitchZeroX16: return v.setIMU_pitchZeroX16;
+    case AOGSetting::setIMU_rollZero: return qRound(v.setIMU_rollZero);
+    case AOGSetting::setF_minHeadingStepDistance: return qRound(v.setF_minHeadingStepDistance);
+    case AOGSetting::setAS_lowSteerPWM: return qRound(v.setAS_lowSteerPWM);
+    case AOGSetting::setAS_wasOffset: return v.setAS_wasOffset;
+    case AOGSetting::setF_UserTotalArea: return qRound(v.setF_UserTotalArea);
+    case AOGSetting::setAS_minSteerPWM: return qRound(v.setAS_minSteerPWM);
+    case AOGSetting::setF_boundaryTriggerDistance: return qRound(v.setF_boundaryTriggerDistance);
+    case AOGSetting::setAS_highSteerPWM: return qRound(v.setAS_highSteerPWM);
+    case AOGSetting::setMenu_isSideGuideLines: return v.setMenu_isSideGuideLines;
+    case AOGSetting::setAS_countsPerDegree: return qRound(v.setAS_countsPerDegree);
+    case AOGSetting::setMenu_isPureOn: return v.setMenu_isPureOn;
+    case AOGSetting::setMenu_isSimulatorOn: return v.setMenu_isSimulatorOn;
+    case AOGSetting::setMenu_isSkyOn: return v.setMenu_isSkyOn;
+    case AOGSetting::setDisplay_lightbarCmPerPixel: return v.setDisplay_lightbarCmPerPixel;
+    case AOGSetting::setGPS_SimLatitude: return qRound(v.setGPS_SimLatitude);
+    case AOGSetting::setGPS_SimLongitude: return qRound(v.setGPS_SimLongitude);
+    case AOGSetting::setAS_snapDistance: return qRound(v.setAS_snapDistance);
+    case AOGSetting::setF_isWorkSwitchManualSections: return v.setF_isWorkSwitchManualSections;
+    case AOGSetting::setAS_isAutoSteerAutoOn: return v.setAS_isAutoSteerAutoOn;
+    case AOGSetting::setDisplay_lineWidth: return v.setDisplay_lineWidth;
+    case AOGSetting::setTram_tramWidth: return qRound(v.setTram_tramWidth);
+    case AOGSetting::setTram_snapAdj: return qRound(v.setTram_snapAdj);
+    case AOGSetting::setTram_passes: return v.setTram_passes;
+    case AOGSetting::setTram_offset: return qRound(v.setTram_offset);
+    case AOGSetting::setMenu_isOGLZoomOn: return v.setMenu_isOGLZoomOn;
+    case AOGSetting::setMenu_isCompassOn: return v.setMenu_isCompassOn;
+    case AOGSetting::setMenu_isSpeedoOn: return v.setMenu_isSpeedoOn;
+    case AOGSetting::setDisplay_isDayMode: return v.setDisplay_isDayMode;
+    case AOGSetting::setDisplay_isAutoDayNight: return v.setDisplay_isAutoDayNight;
+    case AOGSetting::setDisplay_isTermsAccepted: return v.setDisplay_isTermsAccepted;
+    case AOGSetting::setGPS_isRTK: return v.setGPS_isRTK;
+    case AOGSetting::setDisplay_isStartFullScreen: return v.setDisplay_isStartFullScreen;
+    case AOGSetting::setDisplay_isKeyboardOn: return v.setDisplay_isKeyboardOn;
+    case AOGSetting::setIMU_rollFilter: return qRound(v.setIMU_rollFilter);
+    case AOGSetting::setAS_uTurnSmoothing: return v.setAS_uTurnSmoothing;
+    case AOGSetting::setIMU_invertRoll: return v.setIMU_invertRoll;
+    case AOGSetting::setAS_ackerman: return qRound(v.setAS_ackerman);
+    case AOGSetting::setF_isWorkSwitchActiveLow: return v.setF_isWorkSwitchActiveLow;
+    case AOGSetting::setAS_Kp: return qRound(v.setAS_Kp);
+    case AOGSetting::setSound_isUturnOn: return v.setSound_isUturnOn;
+    case AOGSetting::setSound_isHydLiftOn: return v.setSound_isHydLiftOn;
+    case AOGSetting::setTram_isTramOnBackBuffer: return v.setTram_isTramOnBackBuffer;
+    case AOGSetting::setDisplay_camZoom: return qRound(v.setDisplay_camZoom);
+    case AOGSetting::setDisplay_vehicleOpacity: return v.setDisplay_vehicleOpacity;
+    case AOGSetting::setDisplay_isVehicleImage: return v.setDisplay_isVehicleImage;
+    case AOGSetting::setDisplay_isTextureOn: return v.setDisplay_isTextureOn;
+    case AOGSetting::setAB_lineLength: return qRound(v.setAB_lineLength);
+    case AOGSetting::setGPS_udpWatchMsec: return v.setGPS_udpWatchMsec;
+    case AOGSetting::setF_isSteerWorkSwitchManualSections: return v.setF_isSteerWorkSwitchManualSections;
+    case AOGSetting::setAS_isConstantContourOn: return v.setAS_isConstantContourOn;
+    case AOGSetting::setAS_guidanceLookAheadTime: return qRound(v.setAS_guidanceLookAheadTime);
+    case AOGSetting::setIMU_isDualAsIMU: return v.setIMU_isDualAsIMU;
+    case AOGSetting::setAS_sideHillComp: return qRound(v.setAS_sideHillComp);
+    case AOGSetting::setIMU_isReverseOn: return v.setIMU_isReverseOn;
+    case AOGSetting::setGPS_forwardComp: return qRound(v.setGPS_forwardComp);
+    case AOGSetting::setGPS_reverseComp: return qRound(v.setGPS_reverseComp);
+    case AOGSetting::setGPS_ageAlarm: return v.setGPS_ageAlarm;
+    case AOGSetting::setGPS_isRTK_KillAutoSteer: return v.setGPS_isRTK_KillAutoSteer;
+    case AOGSetting::setColor_isMultiColorSections: return v.setColor_isMultiColorSections;
+    case AOGSetting::setHeadland_isSectionControlled: return v.setHeadland_isSectionControlled;
+    case AOGSetting::setSound_isAutoSteerOn: return v.setSound_isAutoSteerOn;
+    case AOGSetting::setDisplay_camSmooth: return v.setDisplay_camSmooth;
+    case AOGSetting::setGPS_dualHeadingOffset: return qRound(v.setGPS_dualHeadingOffset);
+    case AOGSetting::setF_isSteerWorkSwitchEnabled: return v.setF_isSteerWorkSwitchEnabled;
+    case AOGSetting::setF_isRemoteWorkSystemOn: return v.setF_isRemoteWorkSystemOn;
+    case AOGSetting::setDisplay_isAutoStartAgIO: return v.setDisplay_isAutoStartAgIO;
+    case AOGSetting::setAS_ModeXTE: return qRound(v.setAS_ModeXTE);
+    case AOGSetting::setAS_ModeTime: return v.setAS_ModeTime;
+    case AOGSetting::setVehicle_toolWidth: return qRound(v.setVehicle_toolWidth);
+    case AOGSetting::setVehicle_toolOverlap: return qRound(v.setVehicle_toolOverlap);
+    case AOGSetting::setTool_toolTrailingHitchLength: return qRound(v.setTool_toolTrailingHitchLength);
+    case AOGSetting::setVehicle_numSections: return v.setVehicle_numSections;
+    case AOGSetting::setSection_position1: return qRound(v.setSection_position1);
+    case AOGSetting::setSection_position2: return qRound(v.setSection_position2);
+    case AOGSetting::setSection_position3: return qRound(v.setSection_position3);
+    case AOGSetting::setSection_position4: return qRound(v.setSection_position4);
+    case AOGSetting::setSection_position5: return qRound(v.setSection_position5);
+    case AOGSetting::setSection_position6: return qRound(v.setSection_position6);
+    case AOGSetting::setSection_position7: return qRound(v.setSection_position7);
+    case AOGSetting::setSection_position8: return qRound(v.setSection_position8);
+    case AOGSetting::setSection_position9: return qRound(v.setSection_position9);
+    case AOGSetting::setSection_position10: return qRound(v.setSection_position10);
+    case AOGSetting::setSection_position11: return qRound(v.setSection_position11);
+    case AOGSetting::setSection_position12: return qRound(v.setSection_position12);
+    case AOGSetting::setSection_position13: return qRound(v.setSection_position13);
+    case AOGSetting::setSection_position14: return qRound(v.setSection_position14);
+    case AOGSetting::setSection_position15: return qRound(v.setSection_position15);
+    case AOGSetting::setSection_position16: return qRound(v.setSection_position16);
+    case AOGSetting::setSection_position17: return qRound(v.setSection_position17);
+    case AOGSetting::purePursuitIntegralGainAB: return qRound(v.purePursuitIntegralGainAB);
+    case AOGSetting::set_youMoveDistance: return qRound(v.set_youMoveDistance);
+    case AOGSetting::setVehicle_antennaHeight: return qRound(v.setVehicle_antennaHeight);
+    case AOGSetting::setVehicle_toolLookAheadOn: return qRound(v.setVehicle_toolLookAheadOn);
+    case AOGSetting::setTool_isToolTrailing: return v.setTool_isToolTrailing;
+    case AOGSetting::setVehicle_toolOffset: return qRound(v.setVehicle_toolOffset);
+    case AOGSetting::setTool_isToolRearFixed: return v.setTool_isToolRearFixed;
+    case AOGSetting::setVehicle_antennaPivot: return qRound(v.setVehicle_antennaPivot);
+    case AOGSetting::setVehicle_wheelbase: return qRound(v.setVehicle_wheelbase);
+    case AOGSetting::setVehicle_hitchLength: return qRound(v.setVehicle_hitchLength);
+    case AOGSetting::setVehicle_toolLookAheadOff: return qRound(v.setVehicle_toolLookAheadOff);
+    case AOGSetting::setVehicle_isPivotBehindAntenna: return v.setVehicle_isPivotBehindAntenna;
+    case AOGSetting::setVehicle_isSteerAxleAhead: return v.setVehicle_isSteerAxleAhead;
+    case AOGSetting::setVehicle_slowSpeedCutoff: return qRound(v.setVehicle_slowSpeedCutoff);
+    case AOGSetting::setVehicle_tankTrailingHitchLength: return qRound(v.setVehicle_tankTrailingHitchLength);
+    case AOGSetting::setVehicle_minCoverage: return v.setVehicle_minCoverage;
+    case AOGSetting::setVehicle_goalPointLookAhead: return qRound(v.setVehicle_goalPointLookAhead);
+    case AOGSetting::setVehicle_maxAngularVelocity: return qRound(v.setVehicle_maxAngularVelocity);
+    case AOGSetting::setVehicle_maxSteerAngle: return qRound(v.setVehicle_maxSteerAngle);
+    case AOGSetting::set_youTurnExtensionLength: return v.set_youTurnExtensionLength;
+    case AOGSetting::set_youToolWidths: return qRound(v.set_youToolWidths);
+    case AOGSetting::setVehicle_minTurningRadius: return qRound(v.setVehicle_minTurningRadius);
+    case AOGSetting::setVehicle_antennaOffset: return qRound(v.setVehicle_antennaOffset);
+    case AOGSetting::set_youTurnDistanceFromBoundary: return qRound(v.set_youTurnDistanceFromBoundary);
+    case AOGSetting::setVehicle_lookAheadMinimum: return qRound(v.setVehicle_lookAheadMinimum);
+    case AOGSetting::setVehicle_goalPointLookAheadMult: return qRound(v.setVehicle_goalPointLookAheadMult);
+    case AOGSetting::stanleyDistanceErrorGain: return qRound(v.stanleyDistanceErrorGain);
+    case AOGSetting::stanleyHeadingErrorGain: return qRound(v.stanleyHeadingErrorGain);
+    case AOGSetting::setVehicle_isStanleyUsed: return v.setVehicle_isStanleyUsed;
+    case AOGSetting::setTram_BasedOn: return v.setTram_BasedOn;
+    case AOGSetting::setTram_Skips: return v.setTram_Skips;
+    case AOGSetting::setTool_isToolTBT: return v.setTool_isToolTBT;
+    case AOGSetting::setVehicle_vehicleType: return v.setVehicle_vehicleType;
+    case AOGSetting::set_youSkipWidth: return v.set_youSkipWidth;
+    case AOGSetting::setArdSteer_setting1: return qRound(v.setArdSteer_setting1);
+    case AOGSetting::setArdSteer_minSpeed: return qRound(v.setArdSteer_minSpeed);
+    case AOGSetting::setArdSteer_maxSpeed: return qRound(v.setArdSteer_maxSpeed);
+    case AOGSetting::setArdSteer_setting0: return qRound(v.setArdSteer_setting0);
+    case AOGSetting::setVehicle_hydraulicLiftLookAhead: return qRound(v.setVehicle_hydraulicLiftLookAhead);
+    case AOGSetting::setVehicle_isMachineControlToAutoSteer: return v.setVehicle_isMachineControlToAutoSteer;
+    case AOGSetting::setArdSteer_maxPulseCounts: return qRound(v.setArdSteer_maxPulseCounts);
+    case AOGSetting::setArdMac_hydRaiseTime: return qRound(v.setArdMac_hydRaiseTime);
+    case AOGSetting::setArdMac_hydLowerTime: return qRound(v.setArdMac_hydLowerTime);
+    case AOGSetting::setArdMac_isHydEnabled: return qRound(v.setArdMac_isHydEnabled);
+    case AOGSetting::setTool_defaultSectionWidth: return qRound(v.setTool_defaultSectionWidth);
+    case AOGSetting::setVehicle_toolOffDelay: return qRound(v.setVehicle_toolOffDelay);
+    case AOGSetting::setArdMac_setting0: return qRound(v.setArdMac_setting0);
+    case AOGSetting::setArdSteer_setting2: return qRound(v.setArdSteer_setting2);
+    case AOGSetting::stanleyIntegralDistanceAwayTriggerAB: return qRound(v.stanleyIntegralDistanceAwayTriggerAB);
+    case AOGSetting::setTool_isToolFront: return v.setTool_isToolFront;
+    case AOGSetting::setVehicle_trackWidth: return qRound(v.setVehicle_trackWidth);
+    case AOGSetting::setArdMac_isDanfoss: return v.setArdMac_isDanfoss;
+    case AOGSetting::stanleyIntegralGainAB: return qRound(v.stanleyIntegralGainAB);
+    case AOGSetting::setSection_isFast: return v.setSection_isFast;
+    case AOGSetting::setArdMac_user1: return qRound(v.setArdMac_user1);
+    case AOGSetting::setArdMac_user2: return qRound(v.setArdMac_user2);
+    case AOGSetting::setArdMac_user3: return qRound(v.setArdMac_user3);
+    case AOGSetting::setArdMac_user4: return qRound(v.setArdMac_user4);
+    case AOGSetting::setVehicle_panicStopSpeed: return qRound(v.setVehicle_panicStopSpeed);
+    case AOGSetting::setAS_ModeMultiplierStanley: return qRound(v.setAS_ModeMultiplierStanley);
+    case AOGSetting::setDisplay_brightness: return v.setDisplay_brightness;
+    case AOGSetting::set_youTurnRadius: return qRound(v.set_youTurnRadius);
+    case AOGSetting::setDisplay_brightnessSystem: return v.setDisplay_brightnessSystem;
+    case AOGSetting::setTool_isSectionsNotZones: return v.setTool_isSectionsNotZones;
+    case AOGSetting::setTool_numSectionsMulti: return v.setTool_numSectionsMulti;
+    case AOGSetting::setTool_sectionWidthMulti: return qRound(v.setTool_sectionWidthMulti);
+    case AOGSetting::setDisplay_isBrightnessOn: return v.setDisplay_isBrightnessOn;
+    case AOGSetting::setVehicle_goalPointLookAheadHold: return qRound(v.setVehicle_goalPointLookAheadHold);
+    case AOGSetting::setTool_isSectionOffWhenOut: return v.setTool_isSectionOffWhenOut;
+    case AOGSetting::set_uTurnStyle: return v.set_uTurnStyle;
+    case AOGSetting::setGPS_minimumStepLimit: return qRound(v.setGPS_minimumStepLimit);
+    case AOGSetting::setAS_isSteerInReverse: return v.setAS_isSteerInReverse;
+    case AOGSetting::setAS_functionSpeedLimit: return qRound(v.setAS_functionSpeedLimit);
+    case AOGSetting::setAS_maxSteerSpeed: return qRound(v.setAS_maxSteerSpeed);
+    case AOGSetting::setAS_minSteerSpeed: return qRound(v.setAS_minSteerSpeed);
+    case AOGSetting::setIMU_fusionWeight2: return qRound(v.setIMU_fusionWeight2);
+    case AOGSetting::setDisplay_isSvennArrowOn: return v.setDisplay_isSvennArrowOn;
+    case AOGSetting::setTool_isTramOuterInverted: return v.setTool_isTramOuterInverted;
+    case AOGSetting::setTool_trailingToolToPivotLength: return qRound(v.setTool_trailingToolToPivotLength);
+    case AOGSetting::setAS_snapDistanceRef: return qRound(v.setAS_snapDistanceRef);
+    case AOGSetting::setDisplay_camPitch: return qRound(v.setDisplay_camPitch);
+    case AOGSetting::setWindow_BingZoom: return v.setWindow_BingZoom;
+    case AOGSetting::setWindow_RateMapZoom: return v.setWindow_RateMapZoom;
+    case AOGSetting::setDisplay_isLogElevation: return v.setDisplay_isLogElevation;
+    case AOGSetting::setSound_isSectionsOn: return v.setSound_isSectionsOn;
+    case AOGSetting::setGPS_dualReverseDetectionDistance: return qRound(v.setGPS_dualReverseDetectionDistance);
+    case AOGSetting::setTool_isDisplayTramControl: return v.setTool_isDisplayTramControl;
+    case AOGSetting::setAS_uTurnCompensation: return qRound(v.setAS_uTurnCompensation);
+    case AOGSetting::setFeature_isHeadlandOn: return v.setFeature_isHeadlandOn;
+    case AOGSetting::setFeature_isTramOn: return v.setFeature_isTramOn;
+    case AOGSetting::setFeature_isBoundaryOn: return v.setFeature_isBoundaryOn;
+    case AOGSetting::setFeature_isBndContourOn: return v.setFeature_isBndContourOn;
+    case AOGSetting::setFeature_isRecPathOn: return v.setFeature_isRecPathOn;
+    case AOGSetting::setFeature_isABSmoothOn: return v.setFeature_isABSmoothOn;
+    case AOGSetting::setFeature_isHideContourOn: return v.setFeature_isHideContourOn;
+    case AOGSetting::setFeature_isWebCamOn: return v.setFeature_isWebCamOn;
+    case AOGSetting::setFeature_isOffsetFixOn: return v.setFeature_isOffsetFixOn;
+    case AOGSetting::setFeature_isAgIOOn: return v.setFeature_isAgIOOn;
+    case AOGSetting::setFeature_isContourOn: return v.setFeature_isContourOn;
+    case AOGSetting::setFeature_isYouTurnOn: return v.setFeature_isYouTurnOn;
+    case AOGSetting::setFeature_isSteerModeOn: return v.setFeature_isSteerModeOn;
+    case AOGSetting::setFeature_isManualSectionOn: return v.setFeature_isManualSectionOn;
+    case AOGSetting::setFeature_isAutoSectionOn: return v.setFeature_isAutoSectionOn;
+    case AOGSetting::setFeature_isCycleLinesOn: return v.setFeature_isCycleLinesOn;
+    case AOGSetting::setFeature_isABLineOn: return v.setFeature_isABLineOn;
+    case AOGSetting::setFeature_isCurveOn: return v.setFeature_isCurveOn;
+    case AOGSetting::setFeature_isAutoSteerOn: return v.setFeature_isAutoSteerOn;
+    case AOGSetting::setFeature_isUTurnOn: return v.setFeature_isUTurnOn;
+    case AOGSetting::setFeature_isLateralOn: return v.setFeature_isLateralOn;
+    case AOGSetting::displayShowBack: return v.displayShowBack;
+    case AOGSetting::displayAntiAliasSamples: return v.displayAntiAliasSamples;
+    case AOGSetting::setDisplay_useTrackZero: return v.setDisplay_useTrackZero;
+    case AOGSetting::setDisplay_topTrackNum: return v.setDisplay_topTrackNum;
+    default: return variant(id).toInt();
+    }
+}
+
+bool AOGSettingsStore::toBool(AOGSetting id) const
+{
+    QReadLocker locker(&lock);
+    switch (id) {
+    case AOGSetting::setWindow_Maximized: return v.setWindow_Maximized;
+    case AOGSetting::setWindow_Minimized: return v.setWindow_Minimized;
+    case AOGSetting::setDisplay_triangleResolution: return v.setDisplay_triangleResolution != 0;
+    case AOGSetting::setMenu_isMetric: return v.setMenu_isMetric;
+    case AOGSetting::setMenu_isGridOn: return v.setMenu_isGridOn;
+    case AOGSetting::setMenu_isLightbarOn: return v.setMenu_isLightbarOn;
+    case AOGSetting::setF_isWorkSwitchEnabled: return v.setF_isWorkSwitchEnabled;
+    case AOGSetting::setIMU_pitchZeroX16: return v.setIMU_pitchZeroX16 != 0;
+    case AOGSetting::setIMU_rollZero: return v.setIMU_rollZero != 0;
+    case AOGSetting::setF_minHeadingStepDistance: return v.setF_minHeadingStepDistance != 0;
+    case AOGSetting::setAS_lowSteerPWM: return v.setAS_lowSteerPWM != 0;
+    case AOGSetting::setAS_wasOffset: return v.setAS_wasOffset != 0;
+    case AOGSetting::setF_UserTotalArea: return v.setF_UserTotalArea != 0;
+    case AOGSetting::setAS_minSteerPWM: return v.setAS_minSteerPWM != 0;
+    case AOGSetting::setF_boundaryTriggerDistance: return v.setF_boundaryTriggerDistance != 0;
+    case AOGSetting::setAS_highSteerPWM: return v.setAS_highSteerPWM != 0;
+    case AOGSetting::setMenu_isSideGuideLines: return v.setMenu_isSideGuideLines;
+    case AOGSetting::setAS_countsPerDegree: return v.setAS_countsPerDegree != 0;
+    case AOGSetting::setMenu_isPureOn: return v.setMenu_isPureOn;
+    case AOGSetting::setMenu_isSimulatorOn: return v.setMenu_isSimulatorOn;
+    case AOGSetting::setMenu_isSkyOn: return v.setMenu_isSkyOn;
+    case AOGSetting::setDisplay_lightbarCmPerPixel: return v.setDisplay_lightbarCmPerPixel != 0;
+    case AOGSetting::setGPS_SimLatitude: return v.setGPS_SimLatitude != 0;
+    case AOGSetting::setGPS_SimLongitude: return v.setGPS_SimLongitude != 0;
+    case AOGSetting::setAS_snapDistance: return v.setAS_snapDistance != 0;
+    case AOGSetting::setF_isWorkSwitchManualSections: return v.setF_isWorkSwitchManualSections;
+    case AOGSetting::setAS_isAutoSteerAutoOn: return v.setAS_isAutoSteerAutoOn;
+    case AOGSetting::setDisplay_lineWidth: return v.setDisplay_lineWidth != 0;
+    case AOGSetting::setTram_tramWidth: return v.setTram_tramWidth != 0;
+    case AOGSetting::setTram_snapAdj: return v.setTram_snapAdj != 0;
+    case AOGSetting::setTram_passes: return v.setTram_passes != 0;
+    case AOGSetting::setTram_offset: return v.setTram_offset != 0;
+    case AOGSetting::setMenu_isOGLZoomOn: return v.setMenu_isOGLZoomOn != 0;
+    case AOGSetting::setMenu_isCompassOn: return v.setMenu_isCompassOn;
+    case AOGSetting::setMenu_isSpeedoOn: return v.setMenu_isSpeedoOn;
+    case AOGSetting::setDisplay_isDayMode: return v.setDisplay_isDayMode;
+    case AOGSetting::setDisplay_isAutoDayNight: return v.setDisplay_isAutoDayNight;
+    case AOGSetting::setDisplay_isTermsAccepted: return v.setDisplay_isTermsAccepted;
+    case AOGSetting::setGPS_isRTK: return v.setGPS_isRTK;
+    case AOGSetting::setDisplay_isStartFullScreen: return v.setDisplay_isStartFullScreen;
+    case AOGSetting::setDisplay_isKeyboardOn: return v.setDisplay_isKeyboardOn;
+    case AOGSetting::setIMU_rollFilter: return v.setIMU_rollFilter != 0;
+    case AOGSetting::setAS_uTurnSmoothing: return v.setAS_uTurnSmoothing != 0;
+    case AOGSetting::setIMU_invertRoll: return v.setIMU_invertRoll;
+    case AOGSetting::setAS_ackerman: return v.setAS_ackerman != 0;
+    case AOGSetting::setF_isWorkSwitchActiveLow: return v.setF_isWorkSwitchActiveLow;
+    case AOGSetting::setAS_Kp: return v.setAS_Kp != 0;
+    case AOGSetting::setSound_isUturnOn: return v.setSound_isUturnOn;
+    case AOGSetting::setSound_isHydLiftOn: return v.setSound_isHydLiftOn;
+    case AOGSetting::setTram_isTramOnBackBuffer: return v.setTram_isTramOnBackBuffer;
+    case AOGSetting::setDisplay_camZoom: return v.setDisplay_camZoom != 0;
+    case AOGSetting::setDisplay_vehicleOpacity: return v.setDisplay_vehicleOpacity != 0;
+    case AOGSetting::setDisplay_isVehicleImage: return v.setDisplay_isVehicleImage;
+    case AOGSetting::setDisplay_isTextureOn: return v.setDisplay_isTextureOn;
+    case AOGSetting::setAB_lineLength: return v.setAB_lineLength != 0;
+    case AOGSetting::setGPS_udpWatchMsec: return v.setGPS_udpWatchMsec != 0;
+    case AOGSetting::setF_isSteerWorkSwitchManualSections: return v.setF_isSteerWorkSwitchManualSections;
+    case AOGSetting::setAS_isConstantContourOn: return v.setAS_isConstantContourOn;
+    case AOGSetting::setAS_guidanceLookAheadTime: return v.setAS_guidanceLookAheadTime != 0;
+    case AOGSetting::setIMU_isDualAsIMU: return v.setIMU_isDualAsIMU;
+    case AOGSetting::setAS_sideHillComp: return v.setAS_sideHillComp != 0;
+    case AOGSetting::setIMU_isReverseOn: return v.setIMU_isReverseOn;
+    case AOGSetting::setGPS_forwardComp: return v.setGPS_forwardComp != 0;
+    case AOGSetting::setGPS_reverseComp: return v.setGPS_reverseComp != 0;
+    case AOGSetting::setGPS_ageAlarm: return v.setGPS_ageAlarm != 0;
+    case AOGSetting::setGPS_isRTK_KillAutoSteer: return v.setGPS_isRTK_KillAutoSteer;
+    case AOGSetting::setColor_isMultiColorSections: return v.setColor_isMultiColorSections;
+    case AOGSetting::setHeadland_isSectionControlled: return v.setHeadland_isSectionControlled;
+    case AOGSetting::setSound_isAutoSteerOn: return v.setSound_isAutoSteerOn;
+    case AOGSetting::setDisplay_camSmooth: return v.setDisplay_camSmooth != 0;
+    case AOGSetting::setGPS_dualHeadingOffset: return v.setGPS_dualHeadingOffset != 0;
+    case AOGSetting::setF_isSteerWorkSwitchEnabled: return v.setF_isSteerWorkSwitchEnabled;
+    case AOGSetting::setF_isRemoteWorkSystemOn: return v.setF_isRemoteWorkSystemOn;
+    case AOGSetting::setDisplay_isAutoStartAgIO: return v.setDisplay_isAutoStartAgIO;
+    case AOGSetting::setAS_ModeXTE: return v.setAS_ModeXTE != 0;
+    case AOGSetting::setAS_ModeTime: return v.setAS_ModeTime != 0;
+    case AOGSetting::setVehicle_toolWidth: return v.setVehicle_toolWidth != 0;
+    case AOGSetting::setVehicle_toolOverlap: return v.setVehicle_toolOverlap != 0;
+    case AOGSetting::setTool_toolTrailingHitchLength: return v.setTool_toolTrailingHitchLength != 0;
+    case AOGSetting::setVehicle_numSections: return v.setVehicle_numSections != 0;
+    case AOGSetting::setSection_position1: return v.setSection_position1 != 0;
+    case AOGSetting::setSection_position2: return v.setSection_position2 != 0;
+    case AOGSetting::setSection_position3: return v.setSection_position3 != 0;
+    case AOGSetting::setSection_position4: return v.setSection_position4 != 0;
+    case AOGSetting::setSection_position5: return v.setSection_position5 != 0;
+    case AOGSetting::setSection_position6: return v.setSection_position6 != 0;
+    case AOGSetting::setSection_position7: return v.setSection_position7 != 0;
+    case AOGSetting::setSection_position8: return v.setSection_position8 != 0;
+    case AOGSetting::setSection_position9: return v.setSection_position9 != 0;
+    case AOGSetting::setSection_position10: return v.setSection_position10 != 0;
+    case AOGSetting::setSection_position11: return v.setSection_position11 != 0;
+    case AOGSetting::setSection_position12: return v.setSection_position12 != 0;
+    case AOGSetting::setSection_position13: return v.setSection_position13 != 0;
+    case AOGSetting::setSection_position14: return v.setSection_position14 != 0;
+    case AOGSetting::setSection_position15: return v.setSection_position15 != 0;
+    case AOGSetting::setSection_position16: return v.setSection_position16 != 0;
+    case AOGSetting::setSection_position17: return v.setSection_position17 != 0;
+    case AOGSetting::purePursuitIntegralGainAB: return v.purePursuitIntegralGainAB != 0;
+    case AOGSetting::set_youMoveDistance: return v.set_youMoveDistance != 0;
+    case AOGSetting::setVehicle_antennaHeight: return v.setVehicle_antennaHeight != 0;
+    case AOGSetting::setVehicle_toolLookAheadOn: return v.setVehicle_toolLookAheadOn != 0;
+    case AOGSetting::setTool_isToolTrailing: return v.setTool_isToolTrailing;
+    case AOGSetting::setVehicle_toolOffset: return v.setVehicle_toolOffset != 0;
+    case AOGSetting::setTool_isToolRearFixed: return v.setTool_isToolRearFixed;
+    case AOGSetting::setVehicle_antennaPivot: return v.setVehicle_antennaPivot != 0;
+    case AOGSetting::setVehicle_wheelbase: return v.setVehicle_wheelbase != 0;
+    case AOGSetting::setVehicle_hitchLength: return v.setVehicle_hitchLength != 0;
+    case AOGSetting::setVehicle_toolLookAheadOff: return v.setVehicle_toolLookAheadOff != 0;
+    case AOGSetting::setVehicle_isPivotBehindAntenna: return v.setVehicle_isPivotBehindAntenna;
+    case AOGSetting::setVehicle_isSteerAxleAhead: return v.setVehicle_isSteerAxleAhead;
+    case AOGSetting::setVehicle_slowSpeedCutoff: return v.setVehicle_slowSpeedCutoff != 0;
+    case AOGSetting::setVehicle_tankTrailingHitchLength: return v.setVehicle_tankTrailingHitchLength != 0;
+    case AOGSetting::setVehicle_minCoverage: return v.setVehicle_minCoverage != 0;
+    case AOGSetting::setVehicle_goalPointLookAhead: return v.setVehicle_goalPointLookAhead != 0;
+    case AOGSetting::setVehicle_maxAngularVelocity: return v.setVehicle_maxAngularVelocity != 0;
+    case AOGSetting::setVehicle_maxSteerAngle: return v.setVehicle_maxSteerAngle != 0;
+    case AOGSetting::set_youTurnExtensionLength: return v.set_youTurnExtensionLength != 0;
+    case AOGSetting::set_youToolWidths: return v.set_youToolWidths != 0;
+    case AOGSetting::setVehicle_minTurningRadius: return v.setVehicle_minTurningRadius != 0;
+    case AOGSetting::setVehicle_antennaOffset: return v.setVehicle_antennaOffset != 0;
+    case AOGSetting::set_youTurnDistanceFromBoundary: return v.set_youTurnDistanceFromBoundary != 0;
+    case AOGSetting::setVehicle_lookAheadMinimum: return v.setVehicle_lookAheadMinimum != 0;
+    case AOGSetting::setVehicle_goalPointLookAheadMult: return v.setVehicle_goalPointLookAheadMult != 0;
+    case AOGSetting::stanleyDistanceErrorGain: return v.stanleyDistanceErrorGain != 0;
+    case AOGSetting::stanleyHeadingErrorGain: return v.stanleyHeadingErrorGain != 0;
+    case AOGSetting::setVehicle_isStanleyUsed: return v.setVehicle_isStanleyUsed;
+    case AOGSetting::setTram_BasedOn: return v.setTram_BasedOn != 0;
+    case AOGSetting::setTram_Skips: return v.setTram_Skips != 0;
+    case AOGSetting::setTool_isToolTBT: return v.setTool_isToolTBT;
+    case AOGSetting::setVehicle_vehicleType: return v.setVehicle_vehicleType != 0;
+    case AOGSetting::set_youSkipWidth: return v.set_youSkipWidth != 0;
+    case AOGSetting::setArdSteer_setting1: return v.setArdSteer_setting1 != 0;
+    case AOGSetting::setArdSteer_minSpeed: return v.setArdSteer_minSpeed != 0;
+    case AOGSetting::setArdSteer_maxSpeed: return v.setArdSteer_maxSpeed != 0;
+    case AOGSetting::setArdSteer_setting0: return v.setArdSteer_setting0 != 0;
+    case AOGSetting::setVehicle_hydraulicLiftLookAhead: return v.setVehicle_hydraulicLiftLookAhead != 0;
+    case AOGSetting::setVehicle_isMachineControlToAutoSteer: return v.setVehicle_isMachineControlToAutoSteer;
+    case AOGSetting::setArdSteer_maxPulseCounts: return v.setArdSteer_maxPulseCounts != 0;
+    case AOGSetting::setArdMac_hydRaiseTime: return v.setArdMac_hydRaiseTime != 0;
+    case AOGSetting::setArdMac_hydLowerTime: return v.setArdMac_hydLowerTime != 0;
+    case AOGSetting::setArdMac_isHydEnabled: return v.setArdMac_isHydEnabled != 0;
+    case AOGSetting::setTool_defaultSectionWidth: return v.setTool_defaultSectionWidth != 0;
+    case AOGSetting::setVehicle_toolOffDelay: return v.setVehicle_toolOffDelay != 0;
+    case AOGSetting::setArdMac_setting0: return v.setArdMac_setting0 != 0;
+    case AOGSetting::setArdSteer_setting2: return v.setArdSteer_setting2 != 0;
+    case AOGSetting::stanleyIntegralDistanceAwayTriggerAB: return v.stanleyIntegralDistanceAwayTriggerAB != 0;
+    case AOGSetting::setTool_isToolFront: return v.setTool_isToolFront;
+    case AOGSetting::setVehicle_trackWidth: return v.setVehicle_trackWidth != 0;
+    case AOGSetting::setArdMac_isDanfoss: return v.setArdMac_isDanfoss;
+    case AOGSetting::stanleyIntegralGainAB: return v.stanleyIntegralGainAB != 0;
+    case AOGSetting::setSection_isFast: return v.setSection_isFast;
+    case AOGSetting::setArdMac_user1: return v.setArdMac_user1 != 0;
+    case AOGSetting::setArdMac_user2: return v.setArdMac_user2 != 0;
+    case AOGSetting::setArdMac_user3: return v.setArdMac_user3 != 0;
+    case AOGSetting::setArdMac_user4: return v.setArdMac_user4 != 0;
+    case AOGSetting::setVehicle_panicStopSpeed: return v.setVehicle_panicStopSpeed != 0;
+    case AOGSetting::setAS_ModeMultiplierStanley: return v.setAS_ModeMultiplierStanley != 0;
+    case AOGSetting::setDisplay_brightness: return v.setDisplay_brightness != 0;
+    case AOGSetting::set_youTurnRadius: return v.set_youTurnRadius != 0;
+    case AOGSetting::setDisplay_brightnessSystem: return v.setDisplay_brightnessSystem != 0;
+    case AOGSetting::setTool_isSectionsNotZones: return v.setTool_isSectionsNotZones;
+    case AOGSetting::setTool_numSectionsMulti: return v.setTool_numSectionsMulti != 0;
+    case AOGSetting::setTool_sectionWidthMulti: return v.setTool_sectionWidthMulti != 0;
+    case AOGSetting::setDisplay_isBrightnessOn: return v.setDisplay_isBrightnessOn;
+    case AOGSetting::setVehicle_goalPointLookAheadHold: return v.setVehicle_goalPointLookAheadHold != 0;
+    case AOGSetting::setTool_isSectionOffWhenOut: return v.setTool_isSectionOffWhenOut;
+    case AOGSetting::set_uTurnStyle: return v.set_uTurnStyle != 0;
+    case AOGSetting::setGPS_minimumStepLimit: return v.setGPS_minimumStepLimit != 0;
+    case AOGSetting::setAS_isSteerInReverse: return v.setAS_isSteerInReverse;
+    case AOGSetting::setAS_functionSpeedLimit: return v.setAS_functionSpeedLimit != 0;
+    case AOGSetting::setAS_maxSteerSpeed: return v.setAS_maxSteerSpeed != 0;
+    case AOGSetting::setAS_minSteerSpeed: return v.setAS_minSteerSpeed != 0;
+    case AOGSetting::setIMU_fusionWeight2: return v.setIMU_fusionWeight2 != 0;
+    case AOGSetting::setDisplay_isSvennArrowOn: return v.setDisplay_isSvennArrowOn;
+    case AOGSetting::setTool_isTramOuterInverted: return v.setTool_isTramOuterInverted;
+    case AOGSetting::setTool_trailingToolToPivotLength: return v.setTool_trailingToolToPivotLength != 0;
+    case AOGSetting::setAS_snapDistanceRef: return v.setAS_snapDistanceRef != 0;
+    case AOGSetting::setDisplay_camPitch: return v.setDisplay_camPitch != 0;
+    case AOGSetting::setWindow_BingZoom: return v.setWindow_BingZoom != 0;
+    case AOGSetting::setWindow_RateMapZoom: return v.setWindow_RateMapZoom != 0;
+    case AOGSetting::setDisplay_isLogElevation: return v.setDisplay_isLogElevation;
+    case AOGSetting::setSound_isSectionsOn: return v.setSound_isSectionsOn;
+    case AOGSetting::setGPS_dualReverseDetectionDistance: return v.setGPS_dualReverseDetectionDistance != 0;
+    case AOGSetting::setTool_isDisplayTramControl: return v.setTool_isDisplayTramControl;
+    case AOGSetting::setAS_uTurnCompensation: return v.setAS_uTurnCompensation != 0;
+    case AOGSetting::setFeature_isHeadlandOn: return v.setFeature_isHeadlandOn;
+    case AOGSetting::setFeature_isTramOn: return v.setFeature_isTramOn;
+    case AOGSetting::setFeature_isBoundaryOn: return v.setFeature_isBoundaryOn;
+    case AOGSetting::setFeature_isBndContourOn: return v.setFeature_isBndContourOn;
+    case AOGSetting::setFeature_isRecPathOn: return v.setFeature_isRecPathOn;
+    case AOGSetting::setFeature_isABSmoothOn: return v.setFeature_isABSmoothOn;
+    case AOGSetting::setFeature_isHideContourOn: return v.setFeature_isHideContourOn;
+    case AOGSetting::setFeature_isWebCamOn: return v.setFeature_isWebCamOn;
+    case AOGSetting::setFeature_isOffsetFixOn: return v.setFeature_isOffsetFixOn;
+    case AOGSetting::setFeature_isAgIOOn: return v.setFeature_isAgIOOn;
+    case AOGSetting::setFeature_isContourOn: return v.setFeature_isContourOn;
+    case AOGSetting::setFeature_isYouTurnOn: return v.setFeature_isYouTurnOn;
+    case AOGSetting::setFeature_isSteerModeOn: return v.setFeature_isSteerModeOn;
+    case AOGSetting::setFeature_isManualSectionOn: return v.setFeature_isManualSectionOn;
+    case AOGSetting::setFeature_isAutoSectionOn: return v.setFeature_isAutoSectionOn;
+    case AOGSetting::setFeature_isCycleLinesOn: return v.setFeature_isCycleLinesOn;
+    case AOGSetting::setFeature_isABLineOn: return v.setFeature_isABLineOn;
+    case AOGSetting::setFeature_isCurveOn: return v.setFeature_isCurveOn;
+    case AOGSetting::setFeature_isAutoSteerOn: return v.setFeature_isAutoSteerOn;
+    case AOGSetting::setFeature_isUTurnOn: return v.setFeature_isUTurnOn;
+    case AOGSetting::setFeature_isLateralOn: return v.setFeature_isLateralOn;
+    case AOGSetting::displayShowBack: return v.displayShowBack;
+    case AOGSetting::displayAntiAliasSamples: return v.displayAntiAliasSamples;
+    case AOGSetting::setDisplay_useTrackZero: return v.setDisplay_useTrackZero;
+    case AOGSetting::setDisplay_topTrackNum: return v.setDisplay_topTrackNum;
+    default: return variant(id).toBool();
+    }
+}
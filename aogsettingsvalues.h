@@ -0,0 +1,563 @@
+#ifndef AOGSETTINGSVALUES_H
+#define AOGSETTINGSVALUES_H
+
+//Generated by parse_properties.py
+
+#include <QString>
+#include <QPoint>
+#include <QColor>
+#include <QVector>
+
+enum class AOGSetting {
+    setWindow_Location,
+    setWindow_Size,
+    setWindow_Maximized,
+    setWindow_Minimized,
+    setDisplay_triangleResolution,
+    setMenu_isMetric,
+    setMenu_isGridOn,
+    setMenu_isLightbarOn,
+    setF_CurrentDir,
+    setF_isWorkSwitchEnabled,
+    setIMU_pitchZeroX16,
+    setIMU_rollZero,
+    setF_minHeadingStepDistance,
+    setAS_lowSteerPWM,
+    setAS_wasOffset,
+    setF_UserTotalArea,
+    setAS_minSteerPWM,
+    setF_boundaryTriggerDistance,
+    setAS_highSteerPWM,
+    setMenu_isSideGuideLines,
+    setAS_countsPerDegree,
+    setMenu_isPureOn,
+    setMenu_isSimulatorOn,
+    setMenu_isSkyOn,
+    setF_culture,
+    setF_workingDirectory,
+    setDisplay_lightbarCmPerPixel,
+    setGPS_fixFromWhichSentence,
+    setGPS_headingFromWhichSource,
+    setGPS_SimLatitude,
+    setGPS_SimLongitude,
+    setAS_snapDistance,
+    setF_isWorkSwitchManualSections,
+    setAS_isAutoSteerAutoOn,
+    setDisplay_lineWidth,
+    setDisplay_panelSimLocation,
+    setTram_tramWidth,
+    setTram_snapAdj,
+    setTram_passes,
+    setTram_offset,
+    setMenu_isOGLZoomOn,
+    setMenu_isCompassOn,
+    setMenu_isSpeedoOn,
+    setDisplay_colorDayFrame,
+    setDisplay_colorNightFrame,
+    setDisplay_colorSectionsDay,
+    setDisplay_colorFieldDay,
+    setDisplay_isDayMode,
+    setDisplay_colorSectionsNight,
+    setDisplay_colorFieldNight,
+    setDisplay_isAutoDayNight,
+    setDisplay_customColors,
+    setDisplay_isTermsAccepted,
+    setGPS_isRTK,
+    setDisplay_isStartFullScreen,
+    setDisplay_isKeyboardOn,
+    setIMU_rollFilter,
+    setAS_uTurnSmoothing,
+    setIMU_invertRoll,
+    setAS_ackerman,
+    setF_isWorkSwitchActiveLow,
+    setAS_Kp,
+    setSound_isUturnOn,
+    setSound_isHydLiftOn,
+    setDisplay_colorTextNight,
+    setDisplay_colorTextDay,
+    setTram_isTramOnBackBuffer,
+    setDisplay_camZoom,
+    setDisplay_colorVehicle,
+    setDisplay_vehicleOpacity,
+    setDisplay_isVehicleImage,
+    setIMU_isHeadingCorrectionFromAutoSteer,
+    setDisplay_isTextureOn,
+    setAB_lineLength,
+    setGPS_udpWatchMsec,
+    setF_isSteerWorkSwitchManualSections,
+    setAS_isConstantContourOn,
+    setAS_guidanceLookAheadTime,
+    setFeatures,
+    setIMU_isDualAsIMU,
+    setAS_sideHillComp,
+    setIMU_isReverseOn,
+    setGPS_forwardComp,
+    setGPS_reverseComp,
+    setGPS_ageAlarm,
+    setGPS_isRTK_KillAutoSteer,
+    setColor_sec01,
+    setColor_sec02,
+    setColor_sec03,
+    setColor_sec04,
+    setColor_sec05,
+    setColor_sec06,
+    setColor_sec07,
+    setColor_sec08,
+    setColor_sec09,
+    setColor_sec10,
+    setColor_sec11,
+    setColor_sec12,
+    setColor_sec13,
+    setColor_sec14,
+    setColor_sec15,
+    setColor_sec16,
+    setColor_isMultiColorSections,
+    setDisplay_customSectionColors,
+    setBrand_TBrand,
+    setHeadland_isSectionControlled,
+    setSound_isAutoSteerOn,
+    setRelay_pinConfig,
+    setDisplay_camSmooth,
+    setGPS_dualHeadingOffset,
+    setF_isSteerWorkSwitchEnabled,
+    setF_isRemoteWorkSystemOn,
+    setDisplay_isAutoStartAgIO,
+    setAS_ModeXTE,
+    setAS_ModeTime,
+    setVehicle_toolWidth,
+    setVehicle_toolOverlap,
+    setTool_toolTrailingHitchLength,
+    setVehicle_numSections,
+    setSection_position1,
+    setSection_position2,
+    setSection_position3,
+    setSection_position4,
+    setSection_position5,
+    setSection_position6,
+    setSection_position7,
+    setSection_position8,
+    setSection_position9,
+    setSection_position10,
+    setSection_position11,
+    setSection_position12,
+    setSection_position13,
+    setSection_position14,
+    setSection_position15,
+    setSection_position16,
+    setSection_position17,
+    purePursuitIntegralGainAB,
+    set_youMoveDistance,
+    setVehicle_antennaHeight,
+    setVehicle_toolLookAheadOn,
+    setTool_isToolTrailing,
+    setVehicle_toolOffset,
+    setTool_isToolRearFixed,
+    setVehicle_antennaPivot,
+    setVehicle_wheelbase,
+    setVehicle_hitchLength,
+    setVehicle_toolLookAheadOff,
+    setVehicle_isPivotBehindAntenna,
+    setVehicle_isSteerAxleAhead,
+    setVehicle_vehicleName,
+    setVehicle_slowSpeedCutoff,
+    setVehicle_tankTrailingHitchLength,
+    setVehicle_minCoverage,
+    setVehicle_goalPointLookAhead,
+    setVehicle_maxAngularVelocity,
+    setVehicle_maxSteerAngle,
+    set_youTurnExtensionLength,
+    set_youToolWidths,
+    setVehicle_minTurningRadius,
+    setVehicle_antennaOffset,
+    set_youTurnDistanceFromBoundary,
+    setVehicle_lookAheadMinimum,
+    setVehicle_goalPointLookAheadMult,
+    stanleyDistanceErrorGain,
+    stanleyHeadingErrorGain,
+    setVehicle_isStanleyUsed,
+    setTram_BasedOn,
+    setTram_Skips,
+    setTool_isToolTBT,
+    setVehicle_vehicleType,
+    set_youSkipWidth,
+    setArdSteer_setting1,
+    setArdSteer_minSpeed,
+    setArdSteer_maxSpeed,
+    setArdSteer_setting0,
+    setVehicle_hydraulicLiftLookAhead,
+    setVehicle_isMachineControlToAutoSteer,
+    setArdSteer_maxPulseCounts,
+    setArdMac_hydRaiseTime,
+    setArdMac_hydLowerTime,
+    setArdMac_isHydEnabled,
+    setTool_defaultSectionWidth,
+    setVehicle_toolOffDelay,
+    setArdMac_setting0,
+    setArdSteer_setting2,
+    stanleyIntegralDistanceAwayTriggerAB,
+    setTool_isToolFront,
+    setVehicle_trackWidth,
+    setArdMac_isDanfoss,
+    stanleyIntegralGainAB,
+    setSection_isFast,
+    setArdMac_user1,
+    setArdMac_user2,
+    setArdMac_user3,
+    setArdMac_user4,
+    setVehicle_panicStopSpeed,
+    setAS_ModeMultiplierStanley,
+    setDisplay_brightness,
+    set_youTurnRadius,
+    setDisplay_brightnessSystem,
+    setTool_isSectionsNotZones,
+    setTool_numSectionsMulti,
+    setTool_zones,
+    setTool_sectionWidthMulti,
+    setDisplay_isBrightnessOn,
+    setKey_hotkeys,
+    setVehicle_goalPointLookAheadHold,
+    setTool_isSectionOffWhenOut,
+    set_uTurnStyle,
+    setGPS_minimumStepLimit,
+    setAS_isSteerInReverse,
+    setAS_functionSpeedLimit,
+    setAS_maxSteerSpeed,
+    setAS_minSteerSpeed,
+    setBrand_HBrand,
+    setBrand_WDBrand,
+    setIMU_fusionWeight2,
+    setDisplay_isSvennArrowOn,
+    setTool_isTramOuterInverted,
+    setJobMenu_location,
+    setJobMenu_size,
+    setWindow_steerSettingsLocation,
+    setWindow_buildTracksLocation,
+    setTool_trailingToolToPivotLength,
+    setWindow_formNudgeLocation,
+    setWindow_formNudgeSize,
+    setAS_snapDistanceRef,
+    setDisplay_buttonOrder,
+    setDisplay_camPitch,
+    setWindow_abDrawSize,
+    setWindow_HeadlineSize,
+    setWindow_HeadAcheSize,
+    setWindow_MapBndSize,
+    setWindow_BingMapSize,
+    setWindow_BingZoom,
+    setWindow_RateMapSize,
+    setWindow_RateMapZoom,
+    setWindow_QuickABLocation,
+    setDisplay_isLogElevation,
+    setSound_isSectionsOn,
+    setGPS_dualReverseDetectionDistance,
+    setTool_isDisplayTramControl,
+    setAS_uTurnCompensation,
+    setFeature_isHeadlandOn,
+    setFeature_isTramOn,
+    setFeature_isBoundaryOn,
+    setFeature_isBndContourOn,
+    setFeature_isRecPathOn,
+    setFeature_isABSmoothOn,
+    setFeature_isHideContourOn,
+    setFeature_isWebCamOn,
+    setFeature_isOffsetFixOn,
+    setFeature_isAgIOOn,
+    setFeature_isContourOn,
+    setFeature_isYouTurnOn,
+    setFeature_isSteerModeOn,
+    setFeature_isManualSectionOn,
+    setFeature_isAutoSectionOn,
+    setFeature_isCycleLinesOn,
+    setFeature_isABLineOn,
+    setFeature_isCurveOn,
+    setFeature_isAutoSteerOn,
+    setFeature_isUTurnOn,
+    setFeature_isLateralOn,
+    displayShowBack,
+    displayAntiAliasSamples,
+    setDisplay_useTrackZero,
+    setDisplay_topTrackNum,
+    setDisplay_colorDayBackground,
+    setDisplay_colorNightBackground,
+    setDisplay_colorDayBorder,
+    setDisplay_colorNightBorder,
+};
+
+constexpr int AOGSettingCount = 272;
+
+struct AOGSettingsValues {
+    QPoint setWindow_Location;
+    QString setWindow_Size;
+    bool setWindow_Maximized = false;
+    bool setWindow_Minimized = false;
+    double setDisplay_triangleResolution = 0;
+    bool setMenu_isMetric = false;
+    bool setMenu_isGridOn = false;
+    bool setMenu_isLightbarOn = false;
+    QString setF_CurrentDir;
+    bool setF_isWorkSwitchEnabled = false;
+    int setIMU_pitchZeroX16 = 0;
+    double setIMU_rollZero = 0;
+    double setF_minHeadingStepDistance = 0;
+    double setAS_lowSteerPWM = 0;
+    int setAS_wasOffset = 0;
+    double setF_UserTotalArea = 0;
+    double setAS_minSteerPWM = 0;
+    double setF_boundaryTriggerDistance = 0;
+    double setAS_highSteerPWM = 0;
+    bool setMenu_isSideGuideLines = false;
+    double setAS_countsPerDegree = 0;
+    bool setMenu_isPureOn = false;
+    bool setMenu_isSimulatorOn = false;
+    bool setMenu_isSkyOn = false;
+    QString setF_culture;
+    QString setF_workingDirectory;
+    int setDisplay_lightbarCmPerPixel = 0;
+    QString setGPS_fixFromWhichSentence;
+    QString setGPS_headingFromWhichSource;
+    double setGPS_SimLatitude = 0;
+    double setGPS_SimLongitude = 0;
+    double setAS_snapDistance = 0;
+    bool setF_isWorkSwitchManualSections = false;
+    bool setAS_isAutoSteerAutoOn = false;
+    int setDisplay_lineWidth = 0;
+    QPoint setDisplay_panelSimLocation;
+    double setTram_tramWidth = 0;
+    double setTram_snapAdj = 0;
+    int setTram_passes = 0;
+    double setTram_offset = 0;
+    int setMenu_isOGLZoomOn = 0;
+    bool setMenu_isCompassOn = false;
+    bool setMenu_isSpeedoOn = false;
+    QColor setDisplay_colorDayFrame;
+    QColor setDisplay_colorNightFrame;
+    QColor setDisplay_colorSectionsDay;
+    QColor setDisplay_colorFieldDay;
+    bool setDisplay_isDayMode = false;
+    QColor setDisplay_colorSectionsNight;
+    QColor setDisplay_colorFieldNight;
+    bool setDisplay_isAutoDayNight = false;
+    QString setDisplay_customColors;
+    bool setDisplay_isTermsAccepted = false;
+    bool setGPS_isRTK = false;
+    bool setDisplay_isStartFullScreen = false;
+    bool setDisplay_isKeyboardOn = false;
+    double setIMU_rollFilter = 0;
+    int setAS_uTurnSmoothing = 0;
+    bool setIMU_invertRoll = false;
+    double setAS_ackerman = 0;
+    bool setF_isWorkSwitchActiveLow = false;
+    double setAS_Kp = 0;
+    bool setSound_isUturnOn = false;
+    bool setSound_isHydLiftOn = false;
+    QColor setDisplay_colorTextNight;
+    QColor setDisplay_colorTextDay;
+    bool setTram_isTramOnBackBuffer = false;
+    double setDisplay_camZoom = 0;
+    QColor setDisplay_colorVehicle;
+    int setDisplay_vehicleOpacity = 0;
+    bool setDisplay_isVehicleImage = false;
+    QString setIMU_isHeadingCorrectionFromAutoSteer;
+    bool setDisplay_isTextureOn = false;
+    double setAB_lineLength = 0;
+    int setGPS_udpWatchMsec = 0;
+    bool setF_isSteerWorkSwitchManualSections = false;
+    bool setAS_isConstantContourOn = false;
+    double setAS_guidanceLookAheadTime = 0;
+    QString setFeatures;
+    bool setIMU_isDualAsIMU = false;
+    double setAS_sideHillComp = 0;
+    bool setIMU_isReverseOn = false;
+    double setGPS_forwardComp = 0;
+    double setGPS_reverseComp = 0;
+    int setGPS_ageAlarm = 0;
+    bool setGPS_isRTK_KillAutoSteer = false;
+    QColor setColor_sec01;
+    QColor setColor_sec02;
+    QColor setColor_sec03;
+    QColor setColor_sec04;
+    QColor setColor_sec05;
+    QColor setColor_sec06;
+    QColor setColor_sec07;
+    QColor setColor_sec08;
+    QColor setColor_sec09;
+    QColor setColor_sec10;
+    QColor setColor_sec11;
+    QColor setColor_sec12;
+    QColor setColor_sec13;
+    QColor setColor_sec14;
+    QColor setColor_sec15;
+    QColor setColor_sec16;
+    bool setColor_isMultiColorSections = false;
+    QString setDisplay_customSectionColors;
+    QString setBrand_TBrand;
+    bool setHeadland_isSectionControlled = false;
+    bool setSound_isAutoSteerOn = false;
+    QVector<int> setRelay_pinConfig;
+    int setDisplay_camSmooth = 0;
+    double setGPS_dualHeadingOffset = 0;
+    bool setF_isSteerWorkSwitchEnabled = false;
+    bool setF_isRemoteWorkSystemOn = false;
+    bool setDisplay_isAutoStartAgIO = false;
+    double setAS_ModeXTE = 0;
+    int setAS_ModeTime = 0;
+    double setVehicle_toolWidth = 0;
+    double setVehicle_toolOverlap = 0;
+    double setTool_toolTrailingHitchLength = 0;
+    int setVehicle_numSections = 0;
+    double setSection_position1 = 0;
+    double setSection_position2 = 0;
+    double setSection_position3 = 0;
+    double setSection_position4 = 0;
+    double setSection_position5 = 0;
+    double setSection_position6 = 0;
+    double setSection_position7 = 0;
+    double setSection_position8 = 0;
+    double setSection_position9 = 0;
+    double setSection_position10 = 0;
+    double setSection_position11 = 0;
+    double setSection_position12 = 0;
+    double setSection_position13 = 0;
+    double setSection_position14 = 0;
+    double setSection_position15 = 0;
+    double setSection_position16 = 0;
+    double setSection_position17 = 0;
+    double purePursuitIntegralGainAB = 0;
+    double set_youMoveDistance = 0;
+    double setVehicle_antennaHeight = 0;
+    double setVehicle_toolLookAheadOn = 0;
+    bool setTool_isToolTrailing = false;
+    double setVehicle_toolOffset = 0;
+    bool setTool_isToolRearFixed = false;
+    double setVehicle_antennaPivot = 0;
+    double setVehicle_wheelbase = 0;
+    double setVehicle_hitchLength = 0;
+    double setVehicle_toolLookAheadOff = 0;
+    bool setVehicle_isPivotBehindAntenna = false;
+    bool setVehicle_isSteerAxleAhead = false;
+    QString setVehicle_vehicleName;
+    double setVehicle_slowSpeedCutoff = 0;
+    double setVehicle_tankTrailingHitchLength = 0;
+    int setVehicle_minCoverage = 0;
+    double setVehicle_goalPointLookAhead = 0;
+    double setVehicle_maxAngularVelocity = 0;
+    double setVehicle_maxSteerAngle = 0;
+    int set_youTurnExtensionLength = 0;
+    double set_youToolWidths = 0;
+    double setVehicle_minTurningRadius = 0;
+    double setVehicle_antennaOffset = 0;
+    double set_youTurnDistanceFromBoundary = 0;
+    double setVehicle_lookAheadMinimum = 0;
+    double setVehicle_goalPointLookAheadMult = 0;
+    double stanleyDistanceErrorGain = 0;
+    double stanleyHeadingErrorGain = 0;
+    bool setVehicle_isStanleyUsed = false;
+    int setTram_BasedOn = 0;
+    int setTram_Skips = 0;
+    bool setTool_isToolTBT = false;
+    int setVehicle_vehicleType = 0;
+    int set_youSkipWidth = 0;
+    double setArdSteer_setting1 = 0;
+    double setArdSteer_minSpeed = 0;
+    double setArdSteer_maxSpeed = 0;
+    double setArdSteer_setting0 = 0;
+    double setVehicle_hydraulicLiftLookAhead = 0;
+    bool setVehicle_isMachineControlToAutoSteer = false;
+    double setArdSteer_maxPulseCounts = 0;
+    double setArdMac_hydRaiseTime = 0;
+    double setArdMac_hydLowerTime = 0;
+    double setArdMac_isHydEnabled = 0;
+    double setTool_defaultSectionWidth = 0;
+    double setVehicle_toolOffDelay = 0;
+    double setArdMac_setting0 = 0;
+    double setArdSteer_setting2 = 0;
+    double stanleyIntegralDistanceAwayTriggerAB = 0;
+    bool setTool_isToolFront = false;
+    double setVehicle_trackWidth = 0;
+    bool setArdMac_isDanfoss = false;
+    double stanleyIntegralGainAB = 0;
+    bool setSection_isFast = false;
+    double setArdMac_user1 = 0;
+    double setArdMac_user2 = 0;
+    double setArdMac_user3 = 0;
+    double setArdMac_user4 = 0;
+    double setVehicle_panicStopSpeed = 0;
+    double setAS_ModeMultiplierStanley = 0;
+    int setDisplay_brightness = 0;
+    double set_youTurnRadius = 0;
+    int setDisplay_brightnessSystem = 0;
+    bool setTool_isSectionsNotZones = false;
+    int setTool_numSectionsMulti = 0;
+    QVector<int> setTool_zones;
+    double setTool_sectionWidthMulti = 0;
+    bool setDisplay_isBrightnessOn = false;
+    QString setKey_hotkeys;
+    double setVehicle_goalPointLookAheadHold = 0;
+    bool setTool_isSectionOffWhenOut = false;
+    int set_uTurnStyle = 0;
+    double setGPS_minimumStepLimit = 0;
+    bool setAS_isSteerInReverse = false;
+    double setAS_functionSpeedLimit = 0;
+    double setAS_maxSteerSpeed = 0;
+    double setAS_minSteerSpeed = 0;
+    QString setBrand_HBrand;
+    QString setBrand_WDBrand;
+    double setIMU_fusionWeight2 = 0;
+    bool setDisplay_isSvennArrowOn = false;
+    bool setTool_isTramOuterInverted = false;
+    QPoint setJobMenu_location;
+    QString setJobMenu_size;
+    QPoint setWindow_steerSettingsLocation;
+    QPoint setWindow_buildTracksLocation;
+    double setTool_trailingToolToPivotLength = 0;
+    QPoint setWindow_formNudgeLocation;
+    QString setWindow_formNudgeSize;
+    double setAS_snapDistanceRef = 0;
+    QString setDisplay_buttonOrder;
+    double setDisplay_camPitch = 0;
+    QString setWindow_abDrawSize;
+    QString setWindow_HeadlineSize;
+    QString setWindow_HeadAcheSize;
+    QString setWindow_MapBndSize;
+    QString setWindow_BingMapSize;
+    int setWindow_BingZoom = 0;
+    QString setWindow_RateMapSize;
+    int setWindow_RateMapZoom = 0;
+    QPoint setWindow_QuickABLocation;
+    bool setDisplay_isLogElevation = false;
+    bool setSound_isSectionsOn = false;
+    double setGPS_dualReverseDetectionDistance = 0;
+    bool setTool_isDisplayTramControl = false;
+    double setAS_uTurnCompensation = 0;
+    bool setFeature_isHeadlandOn = false;
+    bool setFeature_isTramOn = false;
+    bool setFeature_isBoundaryOn = false;
+    bool setFeature_isBndContourOn = false;
+    bool setFeature_isRecPathOn = false;
+    bool setFeature_isABSmoothOn = false;
+    bool setFeature_isHideContourOn = false;
+    bool setFeature_isWebCamOn = false;
+    bool setFeature_isOffsetFixOn = false;
+    bool setFeature_isAgIOOn = false;
+    bool setFeature_isContourOn = false;
+    bool setFeature_isYouTurnOn = false;
+    bool setFeature_isSteerModeOn = false;
+    bool setFeature_isManualSectionOn = false;
+    bool setFeature_isAutoSectionOn = false;
+    bool setFeature_isCycleLinesOn = false;
+    bool setFeature_isABLineOn = false;
+    bool setFeature_isCurveOn = false;
+    bool setFeature_isAutoSteerOn = false;
+    bool setFeature_isUTurnOn = false;
+    bool setFeature_isLateralOn = false;
+    bool displayShowBack = false;
+    bool displayAntiAliasSamples = false;
+    bool setDisplay_useTrackZero = false;
+    bool setDisplay_topTrackNum = false;
+    QColor setDisplay_colorDayBackground;
+    QColor setDisplay_colorNightBackground;
+    QColor setDisplay_colorDayBorder;
+    QColor setDisplay_colorNightBorder;
+};
+
+#endif // AOGSETTINGSVALUES_H
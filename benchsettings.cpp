@@ -0,0 +1,127 @@
+#ifdef BENCH_SETTINGS
+// Per frame cost of reading settings: the QSettings lookup every AOGProperty
+// conversion used to do, against the typed copy in settings_store.  Also
+// times the startup steps: loading settings_store and the QML settings.
+//
+// Build with DEFINES += TESTING BENCH_SETTINGS, or configure CMake with
+// -DBENCH_SETTINGS=ON for a benchsettings target that only links the
+// settings code, and run the binary; it uses a throwaway ini file.
+#include <QCoreApplication>
+#include <QSettings>
+#include <QTemporaryDir>
+#include <QElapsedTimer>
+#include <iostream>
+#include "aogproperty.h"
+#include "aogsettingsstore.h"
+#include "qmlsettings.h"
+#include "properties_vehicle.h"
+#include "properties_uturn.h"
+#include "properties_autosteer.h"
+#include "properties_display.h"
+#include "properties_tool.h"
+
+extern QMLSettings qml_settings;
+
+static const int FRAMES = 20000;
+
+//the 42 property reads classes/cyouturn.cpp does for one frame
+static double read_properties()
+{
+    double sum = 0;
+    for (int i = 0; i < 9; i++) {
+        double tool_toolWidth = property_setVehicle_toolWidth;
+        double tool_toolOverlap = property_setVehicle_toolOverlap;
+        double tool_toolOffset = property_setVehicle_toolOffset;
+        sum += tool_toolWidth - tool_toolOverlap + tool_toolOffset;
+    }
+    sum += (double)property_setVehicle_toolWidth + (double)property_setVehicle_toolOverlap;
+    sum += (double)property_stanleyDistanceErrorGain * 2;
+    sum += (double)property_set_youTurnRadius + (double)property_set_youTurnExtensionLength;
+    sum += (double)property_set_youTurnDistanceFromBoundary + (double)property_set_youSkipWidth;
+    sum += (int)property_set_uTurnStyle + (int)property_setAS_uTurnSmoothing;
+    sum += (double)property_setVehicle_wheelbase + (double)property_setVehicle_minTurningRadius;
+    sum += (double)property_setVehicle_maxSteerAngle + (int)property_setDisplay_lineWidth;
+    sum += (bool)property_setVehicle_isStanleyUsed;
+    return sum;
+}
+
+//the same reads straight from the typed struct (GUI thread only, unlocked)
+static double read_values()
+{
+    const AOGSettingsValues &v = settings_store.values();
+    double sum = 0;
+    for (int i = 0; i < 9; i++) {
+        sum += v.setVehicle_toolWidth - v.setVehicle_toolOverlap + v.setVehicle_toolOffset;
+    }
+    sum += v.setVehicle_toolWidth + v.setVehicle_toolOverlap;
+    sum += v.stanleyDistanceErrorGain * 2;
+    sum += v.set_youTurnRadius + v.set_youTurnExtensionLength;
+    sum += v.set_youTurnDistanceFromBoundary + v.set_youSkipWidth;
+    sum += v.set_uTurnStyle + v.setAS_uTurnSmoothing;
+    sum += v.setVehicle_wheelbase + v.setVehicle_minTurningRadius;
+    sum += v.setVehicle_maxSteerAngle + v.setDisplay_lineWidth;
+    sum += v.setVehicle_isStanleyUsed;
+    return sum;
+}
+
+static double time_frames(const char *label, double (*frame)(), double baseline)
+{
+    volatile double sink = 0;
+    QElapsedTimer timer;
+
+    timer.start();
+    for (int i = 0; i < FRAMES; i++)
+        sink = sink + frame();
+    double ns = (double)timer.nsecsElapsed() / FRAMES;
+
+    std::cout << label << ": " << ns << " ns/frame";
+    if (baseline > 0)
+        std::cout << " (" << baseline / ns << "x faster)";
+    std::cout << std::endl;
+    return ns;
+}
+
+int main(int argc, char *argv[])
+{
+    QCoreApplication a(argc, argv);
+    QTemporaryDir dir;
+
+    QCoreApplication::setOrganizationName("QtAgOpenGPS");
+    QCoreApplication::setApplicationName("BenchSettings");
+    QSettings::setDefaultFormat(QSettings::IniFormat);
+    QSettings::setPath(QSettings::IniFormat, QSettings::UserScope, dir.path());
+
+    settings = new AOGSettings();
+    AOGProperty::init_defaults();
+
+    std::cout << FRAMES << " frames of 42 property reads" << std::endl;
+
+    //settings_store is not loaded yet, so AOGProperty looks every key up in
+    //QSettings, as it did before the store existed
+    double lookup = time_frames("QSettings lookup", read_properties, 0);
+
+    QElapsedTimer timer;
+    timer.start();
+    settings_store.load();
+    std::cout << "settings_store.load(): " << timer.nsecsElapsed() / 1000 << " us" << std::endl;
+
+    timer.restart();
+    qml_settings.loadSettings();
+    std::cout << "QMLSettings::loadSettings(): " << timer.nsecsElapsed() / 1000 << " us" << std::endl;
+
+    time_frames("AOGProperty, cached", read_properties, lookup);
+    time_frames("AOGSettingsValues fields", read_values, lookup);
+
+    //writes still reach the cache and QML
+    property_setVehicle_toolWidth = 7.5;
+    if ((double)property_setVehicle_toolWidth != 7.5 ||
+        settings_store.values().setVehicle_toolWidth != 7.5 ||
+        qml_settings.value("setVehicle_toolWidth").toDouble() != 7.5) {
+        std::cout << "write-through failed" << std::endl;
+        return 1;
+    }
+
+    return 0;
+}
+
+#endif
@@ -18,6 +18,11 @@
 #include "cahrs.h"
 #include "cguidance.h"
 #include "aogproperty.h"
+#include "properties_display.h"
+#include "properties_gps.h"
+#include "properties_tool.h"
+#include "properties_tram.h"
+#include "properties_vehicle.h"
 #include "ctrack.h"
 
 CABCurve::CABCurve(QObject *parent) : QObject(parent)
@@ -10,6 +10,12 @@
 #include "cguidance.h"
 #include "ctrack.h"
 #include "aogproperty.h"
+#include "properties_abline.h"
+#include "properties_display.h"
+#include "properties_gps.h"
+#include "properties_tool.h"
+#include "properties_tram.h"
+#include "properties_vehicle.h"
 #include <QOpenGLFunctions>
 #include <QColor>
 #include "glutils.h"
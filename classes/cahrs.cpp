@@ -1,5 +1,7 @@
 #include "cahrs.h"
 #include "aogproperty.h"
+#include "properties_autosteer.h"
+#include "properties_gps.h"
 #include <QDebug>
 
 CAHRS::CAHRS(QObject *parent) : QObject(parent)
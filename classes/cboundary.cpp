@@ -1,5 +1,6 @@
 #include "cboundary.h"
 #include "aogproperty.h"
+#include "properties_todo.h"
 
 CBoundary::CBoundary(QObject *parent) : QObject(parent)
 {
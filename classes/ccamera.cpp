@@ -1,6 +1,7 @@
 #include "ccamera.h"
 #include <QOpenGLContext>
 #include "aogproperty.h"
+#include "properties_display.h"
 #include <math.h>
 #include "glm.h"
 
@@ -11,6 +11,10 @@
 #include "cyouturn.h"
 #include "cahrs.h"
 #include "aogproperty.h"
+#include "properties_display.h"
+#include "properties_gps.h"
+#include "properties_tool.h"
+#include "properties_vehicle.h"
 #include "cnmea.h"
 //#include "common.h"
 
@@ -1,5 +1,6 @@
 #include "cdubins.h"
 #include "aogproperty.h"
+#include "properties_vehicle.h"
 #include "glm.h"
 
 static const double driveDistance = 0.05;
@@ -2,6 +2,7 @@
 #include "glm.h"
 #include "glutils.h"
 #include "aogproperty.h"
+#include "properties_display.h"
 #include "cvehicle.h"
 #include "cmodulecomm.h"
 
@@ -6,6 +6,8 @@
 #include "cabcurve.h"
 #include "glm.h"
 #include "aogproperty.h"
+#include "properties_gps.h"
+#include "properties_vehicle.h"
 
 CGuidance::CGuidance() {}
 
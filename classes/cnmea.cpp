@@ -4,6 +4,7 @@
 #include "vec2.h"
 #include "glm.h"
 #include "aogproperty.h"
+#include "properties_gps.h"
 
 
 CNMEA::CNMEA(QObject *parent) : QObject(parent)
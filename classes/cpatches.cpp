@@ -2,6 +2,7 @@
 #include "cfielddata.h"
 #include "ctool.h"
 #include "aogproperty.h"
+#include "properties_display.h"
 
 CPatches::CPatches() {
    triangleList = QSharedPointer<PatchTriangleList>( new PatchTriangleList);
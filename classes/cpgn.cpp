@@ -1,5 +1,7 @@
 #include "cpgn.h"
 #include "aogproperty.h"
+#include "properties_autosteer.h"
+#include "properties_todo.h"
 
 CPGN_FC::CPGN_FC(): pgn(QByteArray( "\x80\x81\x7f\xfc\x08\x00\x00\x00\x00\x00\x00\x00\x00\xCC", 14))
 {
@@ -4,6 +4,7 @@
 #include <cmath>
 #include "glm.h"
 #include "aogproperty.h"
+#include "properties_sim.h"
 
 
 CSim::CSim(QObject *parent) : QObject(parent)
@@ -2,6 +2,9 @@
 #include "cvehicle.h"
 #include "glm.h"
 #include "aogproperty.h"
+#include "properties_display.h"
+#include "properties_tool.h"
+#include "properties_vehicle.h"
 #include "glutils.h"
 #include "ccamera.h"
 #include "ctram.h"
@@ -6,6 +6,9 @@
 #include "cboundary.h"
 #include "ccamera.h"
 #include "aogproperty.h"
+#include "properties_tool.h"
+#include "properties_tram.h"
+#include "properties_vehicle.h"
 #include "glm.h"
 
 //TODO: move all these to own file, centralize the names we're using
@@ -1,6 +1,7 @@
 #include "cboundary.h"
 #include "glm.h"
 #include "aogproperty.h"
+#include "properties_uturn.h"
 #include "cabline.h"
 #include "cfielddata.h"
 
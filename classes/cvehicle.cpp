@@ -4,6 +4,9 @@
 #include <QOpenGLFunctions>
 #include <QRgb>
 #include "aogproperty.h"
+#include "properties_autosteer.h"
+#include "properties_display.h"
+#include "properties_vehicle.h"
 #include "ccamera.h"
 #include "cboundary.h"
 #include "ctool.h"
@@ -3,6 +3,11 @@
 #include <QFile>
 #include "cyouturn.h"
 #include "aogproperty.h"
+#include "properties_autosteer.h"
+#include "properties_display.h"
+#include "properties_tool.h"
+#include "properties_uturn.h"
+#include "properties_vehicle.h"
 #include "cabline.h"
 #include "cvehicle.h"
 #include "cnmea.h"
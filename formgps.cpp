@@ -4,6 +4,9 @@
 // Main class where everything is initialized
 #include "formgps.h"
 #include "aogproperty.h"
+#include "properties_display.h"
+#include "properties_sim.h"
+#include "properties_vehicle.h"
 #include <QColor>
 #include <QRgb>
 #include "qmlutil.h"
@@ -21,7 +24,6 @@ FormGPS::FormGPS(QWidget *parent) : QQmlApplicationEngine(parent)
 {
 
     connect_classes(); //make all the inter-class connections
-    qml_settings.setupKeys();
     qml_settings.loadSettings();  //fetch everything from QSettings for QML to use
 
     /* Temporary test data to see if drawing routines are working. */
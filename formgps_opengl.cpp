@@ -23,6 +23,7 @@
 #include <QOpenGLShaderProgram>
 #include <QOpenGLBuffer>
 #include "aogproperty.h"
+#include "properties_display.h"
 #include "cpgn.h"
 
 #include <assert.h>
@@ -8,6 +8,8 @@
 //#include "cmodulecomm.h"
 #include "cboundarylist.h"
 #include "aogproperty.h"
+#include "properties_display.h"
+#include "properties_sim.h"
 
 enum OPEN_FLAGS {
     LOAD_MAPPING = 1,
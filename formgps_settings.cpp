@@ -4,6 +4,11 @@
 // This loads the setting (or some of them) into variables, that we can access later
 #include "formgps.h"
 #include "aogproperty.h"
+#include "properties_autosteer.h"
+#include "properties_display.h"
+#include "properties_displayfeatures.h"
+#include "properties_gps.h"
+#include "properties_vehicle.h"
 
 void FormGPS::loadSettings()
 {
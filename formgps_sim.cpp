@@ -6,6 +6,7 @@
 #include "classes/csim.h"
 #include "qmlutil.h"
 #include "aogproperty.h"
+#include "properties_sim.h"
 
 /* Callback for Simulator new position */
 void FormGPS::simConnectSlots()
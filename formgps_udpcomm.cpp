@@ -5,6 +5,7 @@
 #include <QNetworkDatagram>
 #include "formgps.h"
 #include "aogproperty.h"
+#include "properties_sim.h"
 #include "cnmea.h"
 #include <QHostAddress>
 #include "qmlutil.h"
@@ -9,6 +9,10 @@
 #include "ccontour.h"
 #include "cabline.h"
 #include "aogproperty.h"
+#include "properties_autosteer.h"
+#include "properties_display.h"
+#include "properties_sim.h"
+#include "properties_todo.h"
 #include <QGuiApplication>
 #include <QQmlEngine>
 #include <functional>
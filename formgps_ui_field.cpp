@@ -5,6 +5,7 @@
 #include "formgps.h"
 #include "qmlutil.h"
 #include "aogproperty.h"
+#include "properties_display.h"
 
 
 void FormGPS::field_update_list() {
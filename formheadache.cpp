@@ -14,6 +14,7 @@
 #include <QOpenGLFunctions>
 #include "glutils.h"
 #include "aogproperty.h"
+#include "properties_todo.h"
 #include "aogrenderer.h"
 #include <QTime>
 
@@ -12,6 +12,7 @@
 #include <QOpenGLFunctions>
 #include "glutils.h"
 #include "aogproperty.h"
+#include "properties_todo.h"
 #include "aogrenderer.h"
 
 //here for now.  Put in another module for use in other places.
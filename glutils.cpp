@@ -9,6 +9,7 @@
 #include <assert.h>
 #include <math.h>
 #include "aogproperty.h"
+#include "properties_display.h"
 
 //module-level symbols
 QOpenGLShaderProgram *simpleColorShader = 0;
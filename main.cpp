@@ -8,11 +8,13 @@
 #include <QLabel>
 #include "aogrenderer.h"
 #include "aogproperty.h"
+#include "aogsettingsstore.h"
+#include "properties_display.h"
+#include "properties_displayfeatures.h"
 #include <QProcess>
 #include <QSysInfo>
 
 QLabel *grnPixelsWindow;
-AOGSettings *settings;
 
 #ifndef TESTING
 int main(int argc, char *argv[])
@@ -41,6 +43,7 @@ int main(int argc, char *argv[])
     QQuickWindow::setGraphicsApi(QSGRendererInterface::OpenGL);
     settings = new AOGSettings();
     AOGProperty::init_defaults();
+    settings_store.load();
     settings->sync();
     FormGPS w;
     //w.show();
@@ -1,9 +1,68 @@
 #!/usr/bin/python3
 
-import bs4 #beautifulSoup
+import hashlib
+import json
+import os
+import re
 import sys
 from props import props
 
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# files generated by --all, relative to --output-dir
+OUTPUTS = [ ('cpp', 'aogproperties.cpp'),
+            ('header', 'properties.h'),
+            ('qmlcpp', 'qmlsettings_addkeys.cpp'),
+            ('mockqml', 'qml/MockSettings.qml'),
+            ('values', 'aogsettingsvalues.h'),
+            ('store', 'aogsettingsstore_fields.cpp'),
+          ]
+
+# license header of the generated files that carry one in the tree; the
+# last line describes the file (empty for the QMLSettings key table)
+def license_header(description):
+    return ['// Copyright (C) 2024 Michael Torrie and the QtAgOpenGPS Dev Team',
+            '// SPDX-License-Identifier: GNU General Public License v3.0 or later',
+            '//',
+            '// ' + description]
+
+# sources scanned by --report (the generated files themselves are skipped)
+SOURCE_DIRS = [ '.', 'classes' ]
+GENERATED_SOURCES = [ 'aogproperties.cpp', 'properties.h' ]
+
+# C++ field type in AOGSettingsValues for each QMLSettings type name
+STORE_TYPES = { 'int': 'int',
+                'double': 'double',
+                'bool': 'bool',
+                'QString': 'QString',
+                'QPoint': 'QPoint',
+                'QColor': 'QColor',
+                'intlist': 'QVector<int>',
+              }
+NUMERIC_TYPES = [ 'int', 'double', 'bool' ]
+
+# QMetaType id in the QMLSettings key table for each QMLSettings type name;
+# UnknownType means the value is passed to QML as it is, QVariantList marks
+# a list of ints that the ini file may hand back as strings
+QML_METATYPES = { 'int': 'QMetaType::Int',
+                  'double': 'QMetaType::Double',
+                  'bool': 'QMetaType::Bool',
+                  'QString': 'QMetaType::QString',
+                  'QPoint': 'QMetaType::QPoint',
+                  'QColor': 'QMetaType::QColor',
+                  'leavealone': 'QMetaType::UnknownType',
+                  'intlist': 'QMetaType::QVariantList',
+                }
+
+CACHE_FILE = '.parse_properties.cache.json'
+CACHE_VERSION = 3
+
+warnings = []
+
+def warn(message):
+    warnings.append(message)
+    sys.stderr.write(message)
+
 add_props = [
     { 'ini_path':      'display/showBack',
       'cpp_name':      'property_displayShowBack',
@@ -64,6 +123,77 @@ add_props = [
     },
 ]
 
+# Converters for each C# setting type.  Each takes the setting name and the
+# text of its default <Value> and returns (C++ default expression, QMLSettings
+# type name, MockSettings.qml property line, extra lines for the cpp preamble).
+
+def int_setting(n, value):
+    value = number_default(n, value)
+    return (value, 'int', "property int %s: %s" % (n, value), [])
+
+def double_setting(n, value):
+    value = number_default(n, value)
+    return (value, 'double', "property double %s: %s" % (n, value), [])
+
+def number_default(n, value):
+    #special case for a bad default value in Settings.settings
+    if n == 'setVehicle_tankTrailingHitchLength' and value[0] != '-':
+        value = "-" + value
+    return value
+
+def bool_setting(n, value):
+    value = value.lower()
+    return (value, 'bool', "property bool %s: %s" % (n, value), [])
+
+# string settings that hold a list of integers; the C++ default is a
+# QVector<int> declared in the preamble
+list_settings = { 'setTool_zones': 'default_zones',
+                  'setRelay_pinConfig': 'default_relay_pinConfig',
+                }
+
+def string_setting(n, value):
+    if n in list_settings:
+        name = list_settings[n]
+        return (name, 'intlist', "property var %s: [ %s ]" % (n, value),
+                ['QVector<int> %s = { %s };' % (name, value)])
+    return text_setting(n, value)
+
+def text_setting(n, value):
+    default_value = '"' + value + '"'
+    return (default_value, 'QString', "property string %s: %s" % (n, default_value), [])
+
+def point_setting(n, value):
+    return ('QPoint(%s)' % value, 'QPoint', "property point %s: \"%s\"" % (n, value), [])
+
+def color_setting(n, value):
+    if "," in value:
+        default_value = 'QColor(%s)' % value
+        values = value.split(',')
+        colorstring = "#%02x%02x%02x" % (int(values[0]), int(values[1]), int(values[2]))
+    else:
+        default_value = 'QColor("%s")' % value
+        colorstring = value
+    return (default_value, 'QColor', "property string %s: \"%s\"" % (n, colorstring), [])
+
+setting_types = { 'System.Int32': int_setting,
+                  'System.Double': double_setting,
+                  'System.Decimal': double_setting,
+                  'System.Byte': double_setting, # has always been generated as a double
+                  'System.Boolean': bool_setting,
+                  'System.String': string_setting,
+                  'AgOpenGPS.TBrand': text_setting,
+                  'AgOpenGPS.HBrand': text_setting,
+                  'AgOpenGPS.WDBrand': text_setting,
+                  'AgOpenGPS.CFeatureSettings': text_setting,
+                  'System.Drawing.Point': point_setting,
+                  'System.Drawing.Color': color_setting,
+                }
+
+def local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+# single streaming pass over Settings.settings; each <Setting> is converted
+# when its end tag is seen and then dropped
 def parse_settings(file):
     cpp = []
     qml_cpp = []
@@ -72,112 +202,46 @@ def parse_settings(file):
     preamble = ['#include "aogproperty.h"','',
                 '//Generated by parse_properties.py','']
 
-    with file:
-        parser = bs4.BeautifulSoup(file.read(),'lxml-xml')
-
-        settings = parser.findAll('Setting')
-        for s in settings:
-            s['Name'] = s['Name'][0].lower() + s['Name'][1:]
-            t = s['Type']
-            n = s['Name']
-            #print (t)
-            if t == 'setFeatures':
-                #we'll parse these separately
-                pass 
-            if t == 'System.Int32' or \
-               t == 'System.Double' or \
-               t == 'System.Decimal' or \
-               t == 'System.Byte':
-
-                default_value = s.Value.contents[0]
-
-                #special case for a bad default value in Settings.settings
-                if n == 'setVehicle_tankTrailingHitchLength' and default_value[0] != '-':
-                    default_value = "-" + default_value
-
-                if t == 'System.Int32' or t == 'system.Byte':
-                    mock_qml.append("property int %s: %s" % (n, default_value))
-                    qt = 'int'
-                else:
-                    mock_qml.append("property double %s: %s" % (n, default_value))
-                    qt = 'double'
-
-            elif t == 'System.Boolean':
-                default_value = s.Value.contents[0].lower()
-                mock_qml.append("property bool %s: %s" % (n, default_value))
-                qt = 'bool'
-
-            elif t == 'System.String' and n == 'setTool_zones':
-                preamble.append('QVector<int> default_zones = { ' + s.Value.contents[0] + ' };')
-                mock_qml.append("property var %s: [ %s ]" % (n, s.Value.contents[0]))
-                default_value = 'default_zones'
-                qt = 'leavealone'
-           
-            elif t == 'System.String' and n == 'setRelay_pinConfig':
-                preamble.append('QVector<int> default_relay_pinConfig = { ' + s.Value.contents[0] + ' };')
-                mock_qml.append("property var %s: [ %s ]" % (n, s.Value.contents[0]))
-                default_value = 'default_relay_pinConfig'
-                qt = 'leavealone'
-
-            elif t == 'System.String' or \
-                 t == 'AgOpenGPS.TBrand' or \
-                 t == 'AgOpenGPS.HBrand' or \
-                 t == 'AgOpenGPS.WDBrand' or \
-                 t == 'AgOpenGPS.CFeatureSettings':
-                c = s.Value.contents
-                if c:
-                    default_value = '"' + s.Value.contents[0] + '"'
-                else:
-                    default_value = '""'
-                mock_qml.append("property string %s: %s" % (n, default_value))
-                qt = 'QString'
-
-            elif t == 'System.Drawing.Point':
-                default_value = 'QPoint(%s)' % s.Value.contents[0]
-                mock_qml.append("property point %s: \"%s\"" % (n, s.Value.contents[0]))
-                qt = 'QPoint'
-
-            elif t == 'System.Drawing.Color':
-                fields = s.Value.contents[0].split(',')
-                if len(fields) > 1:
-                    default_value = 'QColor(%s)' % s.Value.contents[0]
-                else:
-                    default_value = 'QColor("%s")' % s.Value.contents[0]
-
-                if "," in s.Value.contents[0]:
-                    values = s.Value.contents[0].split(',')
-                    colorstring = "#%02x%02x%02x" % (int(values[0]), int(values[1]), int(values[2]))
-                else:
-                    colorstring = s.Value.contents[0]
-                mock_qml.append("property string %s: \"%s\"" % (n, colorstring))
-                qt = 'QColor'
-
-            else:
-                if s.Value.contents:
-                    default_value = '"' + s.Value.contents[0] + '"'
-                else:
-                    default_value = '""'
-                mock_qml.append("property string %s: %s" % (n, default_value))
-                qt = "QString"
+    import xml.etree.ElementTree as ET
 
-
-            if s['Name'] in props:
-                qs_name = props[s['Name']]
+    with file:
+        for event, s in ET.iterparse(file):
+            if local_name(s.tag) != 'Setting':
+                continue
+
+            n = s.get('Name')
+            n = n[0].lower() + n[1:]
+            value = ''
+            for child in s.iter():
+                if local_name(child.tag) == 'Value':
+                    value = child.text or ''
+                    break
+
+            convert = setting_types.get(s.get('Type'), text_setting)
+            default_value, qt, mock_line, pre = convert(n, value)
+            preamble.extend(pre)
+            mock_qml.append(mock_line)
+
+            if n in props:
+                qs_name = props[n]
             else:
-                props[s['Name']] = ''
+                props[n] = ''
                 qs_name = ""
 
             if not qs_name:
-                sys.stderr.write ("Warning! No ini path found for %s. Generate props.py and fix.\n" % s['Name'])
+                warn ("Warning! No ini path found for %s. Generate props.py and fix.\n" % n)
 
-            cpp.append('AOGProperty property_%s("%s",%s);'% (s['Name'], qs_name, default_value))
-            qml_cpp.append('    addKey(QString("%s"),QString("%s"),"%s");' % (s['Name'], qs_name, qt));
-            h.append('extern AOGProperty property_%s;' % s['Name'])
+            cpp.append('AOGProperty property_%s("%s",%s);'% (n, qs_name, default_value))
+            qml_cpp.append((n, qs_name, qt))
+            h.append('extern AOGProperty property_%s;' % n)
 
-            #preamble.extend(cpp)
+            s.clear()
 
     return (preamble, cpp, h, qml_cpp, mock_qml)
 
+# "public bool isSomething = true;" members of CFeatureSettings
+csettings_bool = re.compile(r'^\s*public bool (\w+)\s*=\s*([^;]*?)\s*;', re.M)
+
 def parse_csettings(file):
     cpp = []
     qml_cpp = []
@@ -185,69 +249,525 @@ def parse_csettings(file):
     mock_qml = []
 
     with file:
-        for line in file.readlines():
-            if 'public bool' in line and 'is' in line:
-                line = line.strip()[12:]
-                line = line.split(';')[0]
-                parts = [x.strip() for x in line.split('=')]
-                name = 'setFeature_%s' % parts[0]
-
-                if name in props:
-                    qs_name = props[name]
-                else:
-                    props[name] = 'displayFeatures/%s' % parts[0]
-                    qs_name = 'displayFeatures/%s' % parts[0]
-                cpp.append('AOGProperty property_%s("%s",%s);'% (name, qs_name, parts[1]))
-                qml_cpp.append('    addKey(QString("%s"),QString("%s"), "bool");' % (name, qs_name));
-                h.append('extern AOGProperty property_%s;' % name)
-                mock_qml.append('property bool %s: %s' % (name, parts[1]))
+        text = file.read()
+
+    for m in csettings_bool.finditer(text):
+        if 'is' not in m.group(0):
+            continue
+        name = 'setFeature_%s' % m.group(1)
+        default = m.group(2)
+
+        if name in props:
+            qs_name = props[name]
+        else:
+            props[name] = 'displayFeatures/%s' % m.group(1)
+            qs_name = 'displayFeatures/%s' % m.group(1)
+        cpp.append('AOGProperty property_%s("%s",%s);'% (name, qs_name, default))
+        qml_cpp.append((name, qs_name, 'bool'))
+        h.append('extern AOGProperty property_%s;' % name)
+        mock_qml.append('property bool %s: %s' % (name, default))
 
     return ([], cpp, h, qml_cpp, mock_qml)
-                
 
 
+def input_hash(settings_path, csettings_path):
+    # the generator and props.py are part of the key: changing either one
+    # must invalidate the cached model
+    h = hashlib.sha256()
+    for path in (settings_path, csettings_path,
+                 os.path.join(SCRIPT_DIR, 'parse_properties.py'),
+                 os.path.join(SCRIPT_DIR, 'props.py')):
+        with open(path, 'rb') as f:
+            h.update(f.read())
+        h.update(b'\0')
+    return h.hexdigest()
+
+# parse both input files, or reuse the model cached for the same inputs
+def load_model(settings_path, csettings_path, cache_path=None):
+    key = input_hash(settings_path, csettings_path)
+
+    if cache_path:
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+            if cached.get('version') == CACHE_VERSION and cached.get('key') == key:
+                for message in cached['warnings']:
+                    sys.stderr.write(message)
+                props.clear()
+                props.update(cached['props'])
+                return cached
+        except (OSError, ValueError, KeyError):
+            pass
+
+    model = { 'version': CACHE_VERSION,
+              'key': key,
+              'settings': parse_settings(open(settings_path,'rb')),
+              'csettings': parse_csettings(open(csettings_path,'r')),
+              'props': props,
+              'warnings': warnings,
+            }
+
+    if cache_path:
+        try:
+            with open(cache_path + '.tmp', 'w') as f:
+                json.dump(model, f)
+            os.replace(cache_path + '.tmp', cache_path)
+        except OSError as e:
+            sys.stderr.write("Warning! Could not write cache %s: %s\n" % (cache_path, e))
+
+    return model
+
+# settings group of an ini path: its prefix (vehicle/, tool/, display/...)
+def group_name(ini_path):
+    if '/' not in ini_path:
+        return 'misc'
+    return ini_path.split('/')[0].lower()
+
+def group_header(group):
+    return 'properties_%s.h' % group
+
+# (cpp symbol, group) of every generated property, in declaration order
+def property_groups(model):
+    symbols = []
+    for line in model['settings'][2] + model['csettings'][2]:
+        symbol = line.split()[2].rstrip(';')
+        name = symbol[len('property_'):]
+        symbols.append((symbol, group_name(model['props'].get(name, ''))))
+    for i in add_props:
+        symbols.append((i['cpp_name'], group_name(i['ini_path'])))
+    return symbols
+
+# one header per settings group, so adding a display setting only
+# recompiles the sources that use display settings
+def render_group_headers(model):
+    groups = {}
+    for symbol, group in property_groups(model):
+        groups.setdefault(group, []).append(symbol)
+
+    headers = {}
+    for group in sorted(groups):
+        guard = 'PROPERTIES_%s_H' % group.upper()
+        lines = ['#ifndef %s' % guard,
+                 '#define %s' % guard,
+                 '',
+                 '//Generated by parse_properties.py',
+                 '',
+                 '#include "aogproperty.h"',
+                 '']
+        for symbol in groups[group]:
+            lines.append('extern AOGProperty %s;' % symbol)
+        lines.append('')
+        lines.append('#endif // %s' % guard)
+        headers[group_header(group)] = lines
+    return headers
+
+# umbrella header with every group, kept for compatibility
+def render_header(model):
+    lines = ['#ifndef PROPERTIES_H',
+             '#define PROPERTIES_H',
+             '',
+             '//Generated by parse_properties.py',
+             '//Includes every settings group. New code should include only the',
+             '//properties_<group>.h headers it uses (see parse_properties.py --report).',
+             '']
+    for filename in render_group_headers(model):
+        lines.append('#include "%s"' % filename)
+
+    lines.append('')
+    lines.append('#endif // PROPERTIES_H')
+    return lines
+
+# (setting name, ini path, C++ type) of every setting AOGSettingsStore
+# caches, in declaration order
+def store_fields(model):
+    fields = []
+    seen = set()
+    for name, ini_path, qt in model['settings'][3] + model['csettings'][3]:
+        if ini_path and name not in seen:
+            fields.append((name, ini_path, STORE_TYPES[qt]))
+            seen.add(name)
+    for i in add_props:
+        name = i['cpp_name'][len('property_'):]
+        if name in seen:
+            continue
+        if 'cpp_type' in i:
+            cpp_type = i['cpp_type']
+        elif i['cpp_default'].startswith('QColor'):
+            cpp_type = 'QColor'
+        else:
+            cpp_type = 'QString'
+        fields.append((name, i['ini_path'], cpp_type))
+        seen.add(name)
+    return fields
+
+def render_values(model):
+    fields = store_fields(model)
+    lines = ['#ifndef AOGSETTINGSVALUES_H',
+             '#define AOGSETTINGSVALUES_H',
+             '',
+             '//Generated by parse_properties.py',
+             '',
+             '#include <QString>',
+             '#include <QPoint>',
+             '#include <QColor>',
+             '#include <QVector>',
+             '',
+             'enum class AOGSetting {']
+    for name, ini_path, cpp_type in fields:
+        lines.append('    %s,' % name)
+    lines.append('};')
+    lines.append('')
+    lines.append('constexpr int AOGSettingCount = %d;' % len(fields))
+    lines.append('')
+    lines.append('struct AOGSettingsValues {')
+    for name, ini_path, cpp_type in fields:
+        if cpp_type in NUMERIC_TYPES:
+            lines.append('    %s %s = %s;' % (cpp_type, name, 'false' if cpp_type == 'bool' else '0'))
+        else:
+            lines.append('    %s %s;' % (cpp_type, name))
+    lines.append('};')
+    lines.append('')
+    lines.append('#endif // AOGSETTINGSVALUES_H')
+    return lines
+
+def render_store(model):
+    fields = store_fields(model)
+    lines = ['#include "aogsettingsstore.h"',
+             '#include "aogsettings.h"',
+             '',
+             '//Generated by parse_properties.py',
+             '',
+             'const char *const AOGSettingsStore::keys[AOGSettingCount] = {']
+    for name, ini_path, cpp_type in fields:
+        lines.append('    "%s",' % ini_path)
+    lines.append('};')
+
+    convert = { 'int': 'value.toInt()',
+                'double': 'value.toDouble()',
+                'bool': 'value.toBool()',
+                'QString': 'value.toString()',
+                'QPoint': 'value.toPoint()',
+                'QColor': 'value.value<QColor>()',
+                'QVector<int>': 'toVector<int>(value)',
+              }
+    lines.extend(['',
+                  'void AOGSettingsStore::assign(AOGSetting id, const QVariant &value)',
+                  '{',
+                  '    switch (id) {'])
+    for name, ini_path, cpp_type in fields:
+        lines.append('    case AOGSetting::%s: v.%s = %s; break;' % (name, name, convert[cpp_type]))
+    lines.extend(['    }', '}'])
+
+    lines.extend(['',
+                  'QVariant AOGSettingsStore::variant(AOGSetting id) const',
+                  '{',
+                  '    switch (id) {'])
+    for name, ini_path, cpp_type in fields:
+        if cpp_type == 'QVector<int>':
+            lines.append('    case AOGSetting::%s: return toVariant(v.%s);' % (name, name))
+        else:
+            lines.append('    case AOGSetting::%s: return QVariant::fromValue(v.%s);' % (name, name))
+    lines.extend(['    }', '    return QVariant();', '}'])
+
+    # numeric conversions read the native field; anything else goes
+    # through QVariant like AOGProperty always did.  update() may write from
+    # another thread, so both take the read lock (uncontended, one atomic op)
+    numeric = [ ('double', 'toDouble', { 'int': 'v.%s', 'double': 'v.%s', 'bool': 'v.%s' }),
+                ('int', 'toInt', { 'int': 'v.%s', 'double': 'qRound(v.%s)', 'bool': 'v.%s' }),
+                ('bool', 'toBool', { 'int': 'v.%s != 0', 'double': 'v.%s != 0', 'bool': 'v.%s' }),
+              ]
+    for result, method, expressions in numeric:
+        lines.extend(['',
+                      '%s AOGSettingsStore::%s(AOGSetting id) const' % (result, method),
+                      '{',
+                      '    QReadLocker locker(&lock);',
+                      '    switch (id) {'])
+        for name, ini_path, cpp_type in fields:
+            if cpp_type in expressions:
+                lines.append('    case AOGSetting::%s: return %s;' % (name, expressions[cpp_type] % name))
+        lines.extend(['    default: return variant(id).%s();' % method, '    }', '}'])
+    return lines
+
+def render_mockqml(model):
+    mock_qml = model['settings'][4]
+    mock_qml1 = model['csettings'][4]
+
+    lines = license_header("For when we use qmlscene")
+    lines += ["import QtQuick 2.15",
+              "",
+              "//generated by parse_properties.py -m",
+              "",
+              "Item {",
+              "    id: mockSettings"]
+
+    for line in mock_qml:
+        lines.append("    %s"  % line)
+    for line in mock_qml1:
+        lines.append("    %s"  % line)
+    for prop in add_props:
+        if 'qml_name' in prop and 'qml_type' in prop:
+            if 'qml_default' in prop:
+                lines.append('    property %s %s: %s' % (prop['qml_type'], prop['qml_name'], prop['qml_default']))
+            else:
+                lines.append('    property %s %s' % (prop['qml_type'], prop['qml_name']))
+    lines.append("}")
+    return lines
+
+# (qml name, ini path, QMLSettings type name) of every setting exposed to QML
+def qml_keys(model):
+    keys = [tuple(k) for k in model['settings'][3] + model['csettings'][3]]
+    for prop in add_props:
+        if 'qml_name' in prop and 'cpp_type' in prop:
+            keys.append((prop['qml_name'], prop['ini_path'], prop['cpp_type']))
+    return keys
+
+# static key table for QMLSettings: sorted by qml name so a name is found
+# with a binary search, and indexed by AOGSetting so a changed ini key is
+# found without one
+def render_qmlcpp(model):
+    setting_index = dict((ini_path, i) for i, (name, ini_path, cpp_type) in enumerate(store_fields(model)))
+    setting_names = [name for name, ini_path, cpp_type in store_fields(model)]
+    keys = sorted(qml_keys(model))
+
+    lines = license_header('')
+    lines += ['#include "qmlsettings.h"',
+              '#include "aogsettingsvalues.h"',
+              '',
+              '//Generated by parse_properties.py',
+              '',
+              'const QMLSettings::Key QMLSettings::keys[] = {']
+    for qml_name, ini_path, qt in keys:
+        if ini_path in setting_index:
+            setting = 'int(AOGSetting::%s)' % setting_names[setting_index[ini_path]]
+        else:
+            setting = '-1'
+        lines.append('    { "%s", "%s", %s, %s },' % (qml_name, ini_path, QML_METATYPES[qt], setting))
+    lines.append('};')
+    lines.append('')
+    lines.append('const int QMLSettings::key_count = %d;' % len(keys))
+    lines.append('')
+
+    rows = {}
+    for row, (qml_name, ini_path, qt) in enumerate(keys):
+        rows.setdefault(ini_path, row)
+    lines.append('const int QMLSettings::key_of_setting[AOGSettingCount] = {')
+    for name, ini_path, cpp_type in store_fields(model):
+        lines.append('    %d, // %s' % (rows.get(ini_path, -1), name))
+    lines.append('};')
+    return lines
+
+def render_cpp(model):
+    cpp_pre, cpp = model['settings'][0:2]
+    cpp1 = model['csettings'][1]
+
+    lines = list(cpp_pre)
+    lines.extend(cpp)
+    lines.extend(cpp1)
+
+    for i in add_props:
+        lines.append('AOGProperty %s("%s",false);' % (i['cpp_name'], i['ini_path']))
+    return lines
+
+renderers = { 'cpp': render_cpp,
+              'header': render_header,
+              'qmlcpp': render_qmlcpp,
+              'mockqml': render_mockqml,
+              'values': render_values,
+              'store': render_store,
+            }
+
+def render(model, kind):
+    return ''.join(line + '\n' for line in renderers[kind](model))
+
+def strip_comments(text):
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+    return re.sub(r'//[^\n]*', '', text)
+
+# which settings groups each source uses and which group headers it is
+# missing; returns report lines
+def dependency_report(model, root):
+    groups = dict(property_groups(model))
+    uses = {}
+    missing = {}
+
+    for directory in SOURCE_DIRS:
+        path = os.path.join(root, directory)
+        for filename in sorted(os.listdir(path)):
+            source = os.path.normpath(os.path.join(directory, filename))
+            if not filename.endswith(('.cpp', '.h')) or source in GENERATED_SOURCES or \
+               filename.startswith('properties_'):
+                continue
+            with open(os.path.join(path, filename), 'r', errors='replace') as f:
+                text = f.read()
+            code = strip_comments(text)
+            used = sorted(set(groups[symbol] for symbol in re.findall(r'\bproperty_\w+', code)
+                              if symbol in groups))
+            if not used:
+                continue
+            uses[source] = used
+            included = set(re.findall(r'#include\s+"properties_(\w+)\.h"', code))
+            if '#include "properties.h"' not in code:
+                missing[source] = [group for group in used if group not in included]
+
+    lines = ['Settings groups used by each source:']
+    for source, used in uses.items():
+        line = '  %s: %s' % (source, ', '.join(used))
+        if missing.get(source):
+            line += '  (missing: %s)' % ', '.join(group_header(group) for group in missing[source])
+        lines.append(line)
+
+    lines.append('')
+    lines.append('Sources recompiled when a group header changes:')
+    for group in sorted(set(groups.values())):
+        users = [source for source, used in uses.items() if group in used]
+        lines.append('  %-32s %3d  %s' % (group_header(group), len(users), ' '.join(users)))
+    return lines, missing
+
+# (filename, text) of every file --all writes
+def generated_files(model):
+    files = [ (filename, render(model, kind)) for kind, filename in OUTPUTS ]
+    for filename, lines in render_group_headers(model).items():
+        files.append((filename, ''.join(line + '\n' for line in lines)))
+    return files
+
+# compare every generated file with its copy under golden_dir (written
+# earlier with --all -o golden_dir); prints a diff for each file that
+# differs and returns their names
+def golden_check(model, golden_dir):
+    import difflib
+
+    differ = []
+    for filename, text in generated_files(model):
+        path = os.path.join(golden_dir, filename)
+        try:
+            with open(path, 'rb') as f:
+                expected = f.read().decode('utf-8')
+        except FileNotFoundError:
+            expected = None
+
+        if expected == text:
+            continue
+        differ.append(filename)
+        if expected is None:
+            print ("%s: missing from %s" % (filename, golden_dir))
+        else:
+            sys.stdout.writelines(difflib.unified_diff(expected.splitlines(True), text.splitlines(True),
+                                                       path, filename))
+    return differ
+
+# time uncached parses of both inputs and a render of every output;
+# returns report lines
+def benchmark(settings_path, csettings_path, runs):
+    import contextlib
+    import io
+    import statistics
+    import time
+
+    timings = [ ('parse Settings.settings', []),
+                ('parse CSettings.cs', []),
+                ('render all outputs', []),
+              ]
+    for i in range(runs):
+        del warnings[:]
+        with contextlib.redirect_stderr(io.StringIO()):
+            start = time.perf_counter()
+            settings = parse_settings(open(settings_path, 'rb'))
+            parsed = time.perf_counter()
+            csettings = parse_csettings(open(csettings_path, 'r'))
+            parsed_cs = time.perf_counter()
+            generated_files({ 'settings': settings, 'csettings': csettings, 'props': props })
+            rendered = time.perf_counter()
+
+        timings[0][1].append(parsed - start)
+        timings[1][1].append(parsed_cs - parsed)
+        timings[2][1].append(rendered - parsed_cs)
+
+    lines = ['%d runs, %d settings parsed:' % (runs, len(settings[1]) + len(csettings[1]))]
+    for name, times in timings:
+        lines.append('  %-24s min %7.2f ms  median %7.2f ms' % (name, min(times) * 1000, statistics.median(times) * 1000))
+    return lines
+
+# write text to path only if the content hash differs, so unchanged files
+# keep their timestamps and nothing that includes them rebuilds
+def write_if_changed(path, text):
+    data = text.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if hashlib.sha256(f.read()).digest() == hashlib.sha256(data).digest():
+                return False
+    except FileNotFoundError:
+        pass
+
+    with open(path + '.tmp', 'wb') as f:
+        f.write(data)
+    os.replace(path + '.tmp', path)
+    return True
+
 
 if __name__ == '__main__':
     import argparse
 
     argparser = argparse.ArgumentParser(prog = sys.argv[0],
                                        description='Parse C# .settings file to create c++ declarations for AOGProperty')
+    argparser.add_argument('-a','--all', action = "store_true", help = 'Write all generated files (cpp, headers, settings store, QMLSettings keys, MockSettings.qml), skipping unchanged ones')
+    argparser.add_argument('-o','--output-dir', default = '.', help = 'Root of the source tree for --all (default: current directory)')
     argparser.add_argument('-c','--cpp', action = "store_true", help = 'Output code for cpp file')
-    argparser.add_argument('-q','--qmlcpp', action = "store_true", help = 'Output code for QMLSettings::setupKeys() cpp file')
+    argparser.add_argument('-q','--qmlcpp', action = "store_true", help = 'Output the QMLSettings key table cpp file')
     argparser.add_argument('-m','--mockqml', action = "store_true", help = 'Output code for MockSettings.qml')
     argparser.add_argument('-i','--header', action = "store_true", help = 'Output header file')
+    argparser.add_argument('-s','--store', action = "store_true", help = 'Output code for the AOGSettingsStore fields cpp file')
+    argparser.add_argument('--values', action = "store_true", help = 'Output the AOGSetting enum and AOGSettingsValues struct header')
+    argparser.add_argument('-r','--report', action = "store_true", help = 'Report which settings groups each source under --output-dir uses and which group headers it is missing')
+    argparser.add_argument('-g','--golden', metavar = 'DIR', help = 'Compare every generated file with the copy in DIR (written earlier with --all -o DIR) and exit 1 if any differs')
+    argparser.add_argument('-b','--bench', type = int, metavar = 'N', help = 'Time N uncached parses of the inputs and renders of every output, then exit')
     argparser.add_argument('-d','--dict', action = "store_true", help = 'output python dict of names to help with this script.')
+    argparser.add_argument('--cache', default = CACHE_FILE, help = 'Parsed settings cache, keyed on the input file hashes (default: %s)' % CACHE_FILE)
+    argparser.add_argument('--no-cache', action = "store_true", help = 'Always parse the input files')
 
     argparser.add_argument('settings_file', help = 'path to AOG C# Settings.settings file')
     argparser.add_argument('csettings_file', help = 'path to the AOG C# Classes/CSettings.cs file')
 
 
     args = argparser.parse_args()
-    
-    cpp_pre,cpp,h,qml_cpp, mock_qml = parse_settings(open(args.settings_file,'r'))
-
-    cpp_pre1,cpp1,h1,qml_cpp1, mock_qml1 = parse_csettings(open(args.csettings_file,'r'))
-
-
 
-    if (args.header):
-        print ('#ifndef PROPERTIES_H')
-        print ('#define PROPERTIES_H')
-        print ()
-        print ('#include "aogsettings.h"')
-        print ()
-        for line in h:
+    if args.bench:
+        for line in benchmark(args.settings_file, args.csettings_file, args.bench):
             print (line)
+        sys.exit(0)
 
-        for line in h1:
+    model = load_model(args.settings_file, args.csettings_file,
+                       None if args.no_cache else args.cache)
+
+    if args.all:
+        for filename, text in generated_files(model):
+            path = os.path.join(args.output_dir, filename)
+            if write_if_changed(path, text):
+                print ("Generated %s" % filename)
+            else:
+                print ("%s unchanged" % filename)
+
+    elif args.golden:
+        differ = golden_check(model, args.golden)
+        if differ:
+            print ("%d generated file(s) differ from %s: %s" % (len(differ), args.golden, ' '.join(differ)))
+            sys.exit(1)
+        print ("All generated files match %s" % args.golden)
+
+    elif args.report:
+        lines, missing = dependency_report(model, args.output_dir)
+        for line in lines:
             print (line)
+        if any(missing.values()):
+            sys.exit(1)
 
-        for i in add_props:
-            print ('extern AOGProperty %s;' % i['cpp_name'])
+    elif (args.header):
+        sys.stdout.write(render(model, 'header'))
 
-        print ()
+    elif args.store:
+        sys.stdout.write(render(model, 'store'))
 
-        print ('#endif // PROPERTIES_H')
+    elif args.values:
+        sys.stdout.write(render(model, 'values'))
 
     elif args.dict:
         import pprint
@@ -255,50 +775,10 @@ if __name__ == '__main__':
         pprint.pprint (props, sort_dicts = False)
         
     elif args.mockqml:
-        print ("import QtQuick 2.15")
-        print ()
-        print ("//generated by parse_properties.py -m")
-        print ()
-        print ("Item {" )
-        print ("    id: mockSettings")
-
-        for line in mock_qml:
-            print ("    %s"  % line)
-        for line in mock_qml1:
-            print ("    %s"  % line)
-        for prop in add_props:
-            if 'qml_name' in prop and 'qml_type' in prop:
-                if 'qml_default' in prop:
-                    print ('    property %s %s: %s' % (prop['qml_type'], prop['qml_name'], prop['qml_default']))
-                else:
-                    print ('    property %s %s' % (prop['qml_type'], prop['qml_name']))
-        print ("}")
+        sys.stdout.write(render(model, 'mockqml'))
 
     elif args.qmlcpp:
-        print ('#include "qmlsettings.h"')
-        print ()
-        print ('void QMLSettings::setupKeys() {')
-        for line in qml_cpp:
-            print (line)
-        for line in qml_cpp1:
-            print (line)
-        for prop in add_props:
-            if 'qml_name' in prop and 'cpp_type' in prop:
-                print ('    addKey(QString("%s"),QString("%s"),"%s");' % (prop['qml_name'], prop['ini_path'], prop['cpp_type']))
-        print ('}')
-
-
+        sys.stdout.write(render(model, 'qmlcpp'))
 
     else: 
-        for line in cpp_pre:
-            print (line)
-
-        for line in cpp:
-            print (line)
-
-        for line in cpp1:
-            print (line)
-
-        for i in add_props:
-            print ('AOGProperty %s("%s",false);' % (i['cpp_name'], i['ini_path']))
-
+        sys.stdout.write(render(model, 'cpp'))
@@ -14,12 +14,14 @@ if [ ! -n "$AOG_PATH" ]; then
 	exit 1
 fi
 
-echo "Generating aogproperties.cpp"
-python3 parse_properties.py "$AOG_PATH/SourceCode/GPS/Properties/Settings.settings" "$AOG_PATH/SourceCode/GPS/Classes/CSettings.cs" -c > aogproperties.cpp
-echo "Generating properties.h"
-python3 parse_properties.py "$AOG_PATH/SourceCode/GPS/Properties/Settings.settings" "$AOG_PATH/SourceCode/GPS/Classes/CSettings.cs" -i > properties.h
-echo "Generating qmlsettings_addkeys.cpp"
-python3 parse_properties.py "$AOG_PATH/SourceCode/GPS/Properties/Settings.settings" "$AOG_PATH/SourceCode/GPS/Classes/CSettings.cs" -q  > qmlsettings_addkeys.cpp
-echo "Generating qml/MockSettings.qml"
-python3 parse_properties.py "$AOG_PATH/SourceCode/GPS/Properties/Settings.settings" "$AOG_PATH/SourceCode/GPS/Classes/CSettings.cs" -m > qml/MockSettings.qml    
+# One pass: both inputs are parsed once (or taken from the cache when they
+# have not changed) and only files whose content changed are rewritten, so
+# a no-op regeneration does not trigger a rebuild.
+python3 parse_properties.py "$AOG_PATH/SourceCode/GPS/Properties/Settings.settings" "$AOG_PATH/SourceCode/GPS/Classes/CSettings.cs" --all
 
+# Every source must include the properties_<group>.h headers of the settings
+# it uses; list the ones that do not (the model comes from the cache above)
+if ! python3 parse_properties.py "$AOG_PATH/SourceCode/GPS/Properties/Settings.settings" "$AOG_PATH/SourceCode/GPS/Classes/CSettings.cs" --report > /dev/null; then
+	python3 parse_properties.py "$AOG_PATH/SourceCode/GPS/Properties/Settings.settings" "$AOG_PATH/SourceCode/GPS/Classes/CSettings.cs" --report | grep missing
+	exit 1
+fi
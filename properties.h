@@ -1,279 +1,22 @@
 #ifndef PROPERTIES_H
 #define PROPERTIES_H
 
-#include "aogsettings.h"
+//Generated by parse_properties.py
+//Includes every settings group. New code should include only the
+//properties_<group>.h headers it uses (see parse_properties.py --report).
 
-extern AOGProperty property_setWindow_Location;
-extern AOGProperty property_setWindow_Size;
-extern AOGProperty property_setWindow_Maximized;
-extern AOGProperty property_setWindow_Minimized;
-extern AOGProperty property_setDisplay_triangleResolution;
-extern AOGProperty property_setMenu_isMetric;
-extern AOGProperty property_setMenu_isGridOn;
-extern AOGProperty property_setMenu_isLightbarOn;
-extern AOGProperty property_setF_CurrentDir;
-extern AOGProperty property_setF_isWorkSwitchEnabled;
-extern AOGProperty property_setIMU_pitchZeroX16;
-extern AOGProperty property_setIMU_rollZero;
-extern AOGProperty property_setF_minHeadingStepDistance;
-extern AOGProperty property_setAS_lowSteerPWM;
-extern AOGProperty property_setAS_wasOffset;
-extern AOGProperty property_setF_UserTotalArea;
-extern AOGProperty property_setAS_minSteerPWM;
-extern AOGProperty property_setF_boundaryTriggerDistance;
-extern AOGProperty property_setAS_highSteerPWM;
-extern AOGProperty property_setMenu_isSideGuideLines;
-extern AOGProperty property_setAS_countsPerDegree;
-extern AOGProperty property_setMenu_isPureOn;
-extern AOGProperty property_setMenu_isSimulatorOn;
-extern AOGProperty property_setMenu_isSkyOn;
-extern AOGProperty property_setF_culture;
-extern AOGProperty property_setF_workingDirectory;
-extern AOGProperty property_setDisplay_lightbarCmPerPixel;
-extern AOGProperty property_setGPS_fixFromWhichSentence;
-extern AOGProperty property_setGPS_headingFromWhichSource;
-extern AOGProperty property_setGPS_SimLatitude;
-extern AOGProperty property_setGPS_SimLongitude;
-extern AOGProperty property_setAS_snapDistance;
-extern AOGProperty property_setF_isWorkSwitchManualSections;
-extern AOGProperty property_setAS_isAutoSteerAutoOn;
-extern AOGProperty property_setDisplay_lineWidth;
-extern AOGProperty property_setDisplay_panelSimLocation;
-extern AOGProperty property_setTram_tramWidth;
-extern AOGProperty property_setTram_snapAdj;
-extern AOGProperty property_setTram_passes;
-extern AOGProperty property_setTram_offset;
-extern AOGProperty property_setMenu_isOGLZoomOn;
-extern AOGProperty property_setMenu_isCompassOn;
-extern AOGProperty property_setMenu_isSpeedoOn;
-extern AOGProperty property_setDisplay_colorDayFrame;
-extern AOGProperty property_setDisplay_colorNightFrame;
-extern AOGProperty property_setDisplay_colorSectionsDay;
-extern AOGProperty property_setDisplay_colorFieldDay;
-extern AOGProperty property_setDisplay_isDayMode;
-extern AOGProperty property_setDisplay_colorSectionsNight;
-extern AOGProperty property_setDisplay_colorFieldNight;
-extern AOGProperty property_setDisplay_isAutoDayNight;
-extern AOGProperty property_setDisplay_customColors;
-extern AOGProperty property_setDisplay_isTermsAccepted;
-extern AOGProperty property_setGPS_isRTK;
-extern AOGProperty property_setDisplay_isStartFullScreen;
-extern AOGProperty property_setDisplay_isKeyboardOn;
-extern AOGProperty property_setIMU_rollFilter;
-extern AOGProperty property_setAS_uTurnSmoothing;
-extern AOGProperty property_setIMU_invertRoll;
-extern AOGProperty property_setAS_ackerman;
-extern AOGProperty property_setF_isWorkSwitchActiveLow;
-extern AOGProperty property_setAS_Kp;
-extern AOGProperty property_setSound_isUturnOn;
-extern AOGProperty property_setSound_isHydLiftOn;
-extern AOGProperty property_setDisplay_colorTextNight;
-extern AOGProperty property_setDisplay_colorTextDay;
-extern AOGProperty property_setTram_isTramOnBackBuffer;
-extern AOGProperty property_setDisplay_camZoom;
-extern AOGProperty property_setDisplay_colorVehicle;
-extern AOGProperty property_setDisplay_vehicleOpacity;
-extern AOGProperty property_setDisplay_isVehicleImage;
-extern AOGProperty property_setIMU_isHeadingCorrectionFromAutoSteer;
-extern AOGProperty property_setDisplay_isTextureOn;
-extern AOGProperty property_setAB_lineLength;
-extern AOGProperty property_setGPS_udpWatchMsec;
-extern AOGProperty property_setF_isSteerWorkSwitchManualSections;
-extern AOGProperty property_setAS_isConstantContourOn;
-extern AOGProperty property_setAS_guidanceLookAheadTime;
-extern AOGProperty property_setFeatures;
-extern AOGProperty property_setIMU_isDualAsIMU;
-extern AOGProperty property_setAS_sideHillComp;
-extern AOGProperty property_setIMU_isReverseOn;
-extern AOGProperty property_setGPS_forwardComp;
-extern AOGProperty property_setGPS_reverseComp;
-extern AOGProperty property_setGPS_ageAlarm;
-extern AOGProperty property_setGPS_isRTK_KillAutoSteer;
-extern AOGProperty property_setColor_sec01;
-extern AOGProperty property_setColor_sec02;
-extern AOGProperty property_setColor_sec03;
-extern AOGProperty property_setColor_sec04;
-extern AOGProperty property_setColor_sec05;
-extern AOGProperty property_setColor_sec06;
-extern AOGProperty property_setColor_sec07;
-extern AOGProperty property_setColor_sec08;
-extern AOGProperty property_setColor_sec09;
-extern AOGProperty property_setColor_sec10;
-extern AOGProperty property_setColor_sec11;
-extern AOGProperty property_setColor_sec12;
-extern AOGProperty property_setColor_sec13;
-extern AOGProperty property_setColor_sec14;
-extern AOGProperty property_setColor_sec15;
-extern AOGProperty property_setColor_sec16;
-extern AOGProperty property_setColor_isMultiColorSections;
-extern AOGProperty property_setDisplay_customSectionColors;
-extern AOGProperty property_setBrand_TBrand;
-extern AOGProperty property_setHeadland_isSectionControlled;
-extern AOGProperty property_setSound_isAutoSteerOn;
-extern AOGProperty property_setRelay_pinConfig;
-extern AOGProperty property_setDisplay_camSmooth;
-extern AOGProperty property_setGPS_dualHeadingOffset;
-extern AOGProperty property_setF_isSteerWorkSwitchEnabled;
-extern AOGProperty property_setF_isRemoteWorkSystemOn;
-extern AOGProperty property_setDisplay_isAutoStartAgIO;
-extern AOGProperty property_setAS_ModeXTE;
-extern AOGProperty property_setAS_ModeTime;
-extern AOGProperty property_setVehicle_toolWidth;
-extern AOGProperty property_setVehicle_toolOverlap;
-extern AOGProperty property_setTool_toolTrailingHitchLength;
-extern AOGProperty property_setVehicle_numSections;
-extern AOGProperty property_setSection_position1;
-extern AOGProperty property_setSection_position2;
-extern AOGProperty property_setSection_position3;
-extern AOGProperty property_setSection_position4;
-extern AOGProperty property_setSection_position5;
-extern AOGProperty property_setSection_position6;
-extern AOGProperty property_setSection_position7;
-extern AOGProperty property_setSection_position8;
-extern AOGProperty property_setSection_position9;
-extern AOGProperty property_setSection_position10;
-extern AOGProperty property_setSection_position11;
-extern AOGProperty property_setSection_position12;
-extern AOGProperty property_setSection_position13;
-extern AOGProperty property_setSection_position14;
-extern AOGProperty property_setSection_position15;
-extern AOGProperty property_setSection_position16;
-extern AOGProperty property_setSection_position17;
-extern AOGProperty property_purePursuitIntegralGainAB;
-extern AOGProperty property_set_youMoveDistance;
-extern AOGProperty property_setVehicle_antennaHeight;
-extern AOGProperty property_setVehicle_toolLookAheadOn;
-extern AOGProperty property_setTool_isToolTrailing;
-extern AOGProperty property_setVehicle_toolOffset;
-extern AOGProperty property_setTool_isToolRearFixed;
-extern AOGProperty property_setVehicle_antennaPivot;
-extern AOGProperty property_setVehicle_wheelbase;
-extern AOGProperty property_setVehicle_hitchLength;
-extern AOGProperty property_setVehicle_toolLookAheadOff;
-extern AOGProperty property_setVehicle_isPivotBehindAntenna;
-extern AOGProperty property_setVehicle_isSteerAxleAhead;
-extern AOGProperty property_setVehicle_vehicleName;
-extern AOGProperty property_setVehicle_slowSpeedCutoff;
-extern AOGProperty property_setVehicle_tankTrailingHitchLength;
-extern AOGProperty property_setVehicle_minCoverage;
-extern AOGProperty property_setVehicle_goalPointLookAhead;
-extern AOGProperty property_setVehicle_maxAngularVelocity;
-extern AOGProperty property_setVehicle_maxSteerAngle;
-extern AOGProperty property_set_youTurnExtensionLength;
-extern AOGProperty property_set_youToolWidths;
-extern AOGProperty property_setVehicle_minTurningRadius;
-extern AOGProperty property_setVehicle_antennaOffset;
-extern AOGProperty property_set_youTurnDistanceFromBoundary;
-extern AOGProperty property_setVehicle_lookAheadMinimum;
-extern AOGProperty property_setVehicle_goalPointLookAheadMult;
-extern AOGProperty property_stanleyDistanceErrorGain;
-extern AOGProperty property_stanleyHeadingErrorGain;
-extern AOGProperty property_setVehicle_isStanleyUsed;
-extern AOGProperty property_setTram_BasedOn;
-extern AOGProperty property_setTram_Skips;
-extern AOGProperty property_setTool_isToolTBT;
-extern AOGProperty property_setVehicle_vehicleType;
-extern AOGProperty property_set_youSkipWidth;
-extern AOGProperty property_setArdSteer_setting1;
-extern AOGProperty property_setArdSteer_minSpeed;
-extern AOGProperty property_setArdSteer_maxSpeed;
-extern AOGProperty property_setArdSteer_setting0;
-extern AOGProperty property_setVehicle_hydraulicLiftLookAhead;
-extern AOGProperty property_setVehicle_isMachineControlToAutoSteer;
-extern AOGProperty property_setArdSteer_maxPulseCounts;
-extern AOGProperty property_setArdMac_hydRaiseTime;
-extern AOGProperty property_setArdMac_hydLowerTime;
-extern AOGProperty property_setArdMac_isHydEnabled;
-extern AOGProperty property_setTool_defaultSectionWidth;
-extern AOGProperty property_setVehicle_toolOffDelay;
-extern AOGProperty property_setArdMac_setting0;
-extern AOGProperty property_setArdSteer_setting2;
-extern AOGProperty property_stanleyIntegralDistanceAwayTriggerAB;
-extern AOGProperty property_setTool_isToolFront;
-extern AOGProperty property_setVehicle_trackWidth;
-extern AOGProperty property_setArdMac_isDanfoss;
-extern AOGProperty property_stanleyIntegralGainAB;
-extern AOGProperty property_setSection_isFast;
-extern AOGProperty property_setArdMac_user1;
-extern AOGProperty property_setArdMac_user2;
-extern AOGProperty property_setArdMac_user3;
-extern AOGProperty property_setArdMac_user4;
-extern AOGProperty property_setVehicle_panicStopSpeed;
-extern AOGProperty property_setAS_ModeMultiplierStanley;
-extern AOGProperty property_setDisplay_brightness;
-extern AOGProperty property_set_youTurnRadius;
-extern AOGProperty property_setDisplay_brightnessSystem;
-extern AOGProperty property_setTool_isSectionsNotZones;
-extern AOGProperty property_setTool_numSectionsMulti;
-extern AOGProperty property_setTool_zones;
-extern AOGProperty property_setTool_sectionWidthMulti;
-extern AOGProperty property_setDisplay_isBrightnessOn;
-extern AOGProperty property_setKey_hotkeys;
-extern AOGProperty property_setVehicle_goalPointLookAheadHold;
-extern AOGProperty property_setTool_isSectionOffWhenOut;
-extern AOGProperty property_set_uTurnStyle;
-extern AOGProperty property_setGPS_minimumStepLimit;
-extern AOGProperty property_setAS_isSteerInReverse;
-extern AOGProperty property_setAS_functionSpeedLimit;
-extern AOGProperty property_setAS_maxSteerSpeed;
-extern AOGProperty property_setAS_minSteerSpeed;
-extern AOGProperty property_setBrand_HBrand;
-extern AOGProperty property_setBrand_WDBrand;
-extern AOGProperty property_setIMU_fusionWeight2;
-extern AOGProperty property_setDisplay_isSvennArrowOn;
-extern AOGProperty property_setTool_isTramOuterInverted;
-extern AOGProperty property_setJobMenu_location;
-extern AOGProperty property_setJobMenu_size;
-extern AOGProperty property_setWindow_steerSettingsLocation;
-extern AOGProperty property_setWindow_buildTracksLocation;
-extern AOGProperty property_setTool_trailingToolToPivotLength;
-extern AOGProperty property_setWindow_formNudgeLocation;
-extern AOGProperty property_setWindow_formNudgeSize;
-extern AOGProperty property_setAS_snapDistanceRef;
-extern AOGProperty property_setDisplay_buttonOrder;
-extern AOGProperty property_setDisplay_camPitch;
-extern AOGProperty property_setWindow_abDrawSize;
-extern AOGProperty property_setWindow_HeadlineSize;
-extern AOGProperty property_setWindow_HeadAcheSize;
-extern AOGProperty property_setWindow_MapBndSize;
-extern AOGProperty property_setWindow_BingMapSize;
-extern AOGProperty property_setWindow_BingZoom;
-extern AOGProperty property_setWindow_RateMapSize;
-extern AOGProperty property_setWindow_RateMapZoom;
-extern AOGProperty property_setWindow_QuickABLocation;
-extern AOGProperty property_setDisplay_isLogElevation;
-extern AOGProperty property_setSound_isSectionsOn;
-extern AOGProperty property_setGPS_dualReverseDetectionDistance;
-extern AOGProperty property_setTool_isDisplayTramControl;
-extern AOGProperty property_setAS_uTurnCompensation;
-extern AOGProperty property_setFeature_isHeadlandOn;
-extern AOGProperty property_setFeature_isTramOn;
-extern AOGProperty property_setFeature_isBoundaryOn;
-extern AOGProperty property_setFeature_isBndContourOn;
-extern AOGProperty property_setFeature_isRecPathOn;
-extern AOGProperty property_setFeature_isABSmoothOn;
-extern AOGProperty property_setFeature_isHideContourOn;
-extern AOGProperty property_setFeature_isWebCamOn;
-extern AOGProperty property_setFeature_isOffsetFixOn;
-extern AOGProperty property_setFeature_isAgIOOn;
-extern AOGProperty property_setFeature_isContourOn;
-extern AOGProperty property_setFeature_isYouTurnOn;
-extern AOGProperty property_setFeature_isSteerModeOn;
-extern AOGProperty property_setFeature_isManualSectionOn;
-extern AOGProperty property_setFeature_isAutoSectionOn;
-extern AOGProperty property_setFeature_isCycleLinesOn;
-extern AOGProperty property_setFeature_isABLineOn;
-extern AOGProperty property_setFeature_isCurveOn;
-extern AOGProperty property_setFeature_isAutoSteerOn;
-extern AOGProperty property_setFeature_isUTurnOn;
-extern AOGProperty property_setFeature_isLateralOn;
-extern AOGProperty property_displayShowBack;
-extern AOGProperty property_displayAntiAliasSamples;
-extern AOGProperty property_setDisplay_useTrackZero;
-extern AOGProperty property_setDisplay_topTrackNum;
-extern AOGProperty property_setDisplay_colorDayBackground;
-extern AOGProperty property_setDisplay_colorNightBackground;
-extern AOGProperty property_setDisplay_colorDayBorder;
-extern AOGProperty property_setDisplay_colorNightBorder;
+#include "properties_abline.h"
+#include "properties_autosteer.h"
+#include "properties_dialogs.h"
+#include "properties_display.h"
+#include "properties_displayfeatures.h"
+#include "properties_gps.h"
+#include "properties_sim.h"
+#include "properties_todo.h"
+#include "properties_tool.h"
+#include "properties_tram.h"
+#include "properties_uturn.h"
+#include "properties_vehicle.h"
+#include "properties_yturn.h"
 
 #endif // PROPERTIES_H
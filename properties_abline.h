@@ -0,0 +1,10 @@
+#ifndef PROPERTIES_ABLINE_H
+#define PROPERTIES_ABLINE_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setAB_lineLength;
+
+#endif // PROPERTIES_ABLINE_H
@@ -0,0 +1,37 @@
+#ifndef PROPERTIES_AUTOSTEER_H
+#define PROPERTIES_AUTOSTEER_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setAS_lowSteerPWM;
+extern AOGProperty property_setAS_wasOffset;
+extern AOGProperty property_setAS_minSteerPWM;
+extern AOGProperty property_setF_boundaryTriggerDistance;
+extern AOGProperty property_setAS_highSteerPWM;
+extern AOGProperty property_setAS_countsPerDegree;
+extern AOGProperty property_setAS_snapDistance;
+extern AOGProperty property_setAS_isAutoSteerAutoOn;
+extern AOGProperty property_setAS_uTurnSmoothing;
+extern AOGProperty property_setAS_ackerman;
+extern AOGProperty property_setAS_Kp;
+extern AOGProperty property_setAS_isConstantContourOn;
+extern AOGProperty property_setAS_guidanceLookAheadTime;
+extern AOGProperty property_setAS_ModeXTE;
+extern AOGProperty property_setAS_ModeTime;
+extern AOGProperty property_setArdSteer_setting1;
+extern AOGProperty property_setArdSteer_minSpeed;
+extern AOGProperty property_setArdSteer_maxSpeed;
+extern AOGProperty property_setArdSteer_setting0;
+extern AOGProperty property_setArdSteer_maxPulseCounts;
+extern AOGProperty property_setAS_ModeMultiplierStanley;
+extern AOGProperty property_setAS_isSteerInReverse;
+extern AOGProperty property_setAS_functionSpeedLimit;
+extern AOGProperty property_setAS_maxSteerSpeed;
+extern AOGProperty property_setAS_minSteerSpeed;
+extern AOGProperty property_setWindow_formNudgeSize;
+extern AOGProperty property_setAS_snapDistanceRef;
+extern AOGProperty property_setAS_uTurnCompensation;
+
+#endif // PROPERTIES_AUTOSTEER_H
@@ -0,0 +1,20 @@
+#ifndef PROPERTIES_DIALOGS_H
+#define PROPERTIES_DIALOGS_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setWindow_buildTracksLocation;
+extern AOGProperty property_setWindow_formNudgeLocation;
+extern AOGProperty property_setWindow_abDrawSize;
+extern AOGProperty property_setWindow_HeadlineSize;
+extern AOGProperty property_setWindow_HeadAcheSize;
+extern AOGProperty property_setWindow_MapBndSize;
+extern AOGProperty property_setWindow_BingMapSize;
+extern AOGProperty property_setWindow_BingZoom;
+extern AOGProperty property_setWindow_RateMapSize;
+extern AOGProperty property_setWindow_RateMapZoom;
+extern AOGProperty property_setWindow_QuickABLocation;
+
+#endif // PROPERTIES_DIALOGS_H
@@ -0,0 +1,97 @@
+#ifndef PROPERTIES_DISPLAY_H
+#define PROPERTIES_DISPLAY_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setWindow_Location;
+extern AOGProperty property_setWindow_Size;
+extern AOGProperty property_setWindow_Maximized;
+extern AOGProperty property_setWindow_Minimized;
+extern AOGProperty property_setDisplay_triangleResolution;
+extern AOGProperty property_setMenu_isMetric;
+extern AOGProperty property_setMenu_isGridOn;
+extern AOGProperty property_setMenu_isLightbarOn;
+extern AOGProperty property_setF_CurrentDir;
+extern AOGProperty property_setF_UserTotalArea;
+extern AOGProperty property_setMenu_isSideGuideLines;
+extern AOGProperty property_setMenu_isPureOn;
+extern AOGProperty property_setMenu_isSkyOn;
+extern AOGProperty property_setF_culture;
+extern AOGProperty property_setF_workingDirectory;
+extern AOGProperty property_setDisplay_lightbarCmPerPixel;
+extern AOGProperty property_setDisplay_lineWidth;
+extern AOGProperty property_setDisplay_panelSimLocation;
+extern AOGProperty property_setMenu_isOGLZoomOn;
+extern AOGProperty property_setMenu_isCompassOn;
+extern AOGProperty property_setMenu_isSpeedoOn;
+extern AOGProperty property_setDisplay_colorDayFrame;
+extern AOGProperty property_setDisplay_colorNightFrame;
+extern AOGProperty property_setDisplay_colorSectionsDay;
+extern AOGProperty property_setDisplay_colorFieldDay;
+extern AOGProperty property_setDisplay_isDayMode;
+extern AOGProperty property_setDisplay_colorSectionsNight;
+extern AOGProperty property_setDisplay_colorFieldNight;
+extern AOGProperty property_setDisplay_isAutoDayNight;
+extern AOGProperty property_setDisplay_customColors;
+extern AOGProperty property_setDisplay_isTermsAccepted;
+extern AOGProperty property_setDisplay_isStartFullScreen;
+extern AOGProperty property_setDisplay_isKeyboardOn;
+extern AOGProperty property_setSound_isUturnOn;
+extern AOGProperty property_setSound_isHydLiftOn;
+extern AOGProperty property_setDisplay_colorTextNight;
+extern AOGProperty property_setDisplay_colorTextDay;
+extern AOGProperty property_setDisplay_camZoom;
+extern AOGProperty property_setDisplay_colorVehicle;
+extern AOGProperty property_setDisplay_vehicleOpacity;
+extern AOGProperty property_setDisplay_isVehicleImage;
+extern AOGProperty property_setDisplay_isTextureOn;
+extern AOGProperty property_setFeatures;
+extern AOGProperty property_setColor_sec01;
+extern AOGProperty property_setColor_sec02;
+extern AOGProperty property_setColor_sec03;
+extern AOGProperty property_setColor_sec04;
+extern AOGProperty property_setColor_sec05;
+extern AOGProperty property_setColor_sec06;
+extern AOGProperty property_setColor_sec07;
+extern AOGProperty property_setColor_sec08;
+extern AOGProperty property_setColor_sec09;
+extern AOGProperty property_setColor_sec10;
+extern AOGProperty property_setColor_sec11;
+extern AOGProperty property_setColor_sec12;
+extern AOGProperty property_setColor_sec13;
+extern AOGProperty property_setColor_sec14;
+extern AOGProperty property_setColor_sec15;
+extern AOGProperty property_setColor_sec16;
+extern AOGProperty property_setColor_isMultiColorSections;
+extern AOGProperty property_setDisplay_customSectionColors;
+extern AOGProperty property_setBrand_TBrand;
+extern AOGProperty property_setSound_isAutoSteerOn;
+extern AOGProperty property_setDisplay_camSmooth;
+extern AOGProperty property_setDisplay_isAutoStartAgIO;
+extern AOGProperty property_setDisplay_brightness;
+extern AOGProperty property_setDisplay_brightnessSystem;
+extern AOGProperty property_setDisplay_isBrightnessOn;
+extern AOGProperty property_setKey_hotkeys;
+extern AOGProperty property_setBrand_HBrand;
+extern AOGProperty property_setBrand_WDBrand;
+extern AOGProperty property_setDisplay_isSvennArrowOn;
+extern AOGProperty property_setJobMenu_location;
+extern AOGProperty property_setJobMenu_size;
+extern AOGProperty property_setWindow_steerSettingsLocation;
+extern AOGProperty property_setDisplay_buttonOrder;
+extern AOGProperty property_setDisplay_camPitch;
+extern AOGProperty property_setDisplay_isLogElevation;
+extern AOGProperty property_setSound_isSectionsOn;
+extern AOGProperty property_setTool_isDisplayTramControl;
+extern AOGProperty property_displayShowBack;
+extern AOGProperty property_displayAntiAliasSamples;
+extern AOGProperty property_setDisplay_useTrackZero;
+extern AOGProperty property_setDisplay_topTrackNum;
+extern AOGProperty property_setDisplay_colorDayBackground;
+extern AOGProperty property_setDisplay_colorNightBackground;
+extern AOGProperty property_setDisplay_colorDayBorder;
+extern AOGProperty property_setDisplay_colorNightBorder;
+
+#endif // PROPERTIES_DISPLAY_H
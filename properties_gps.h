@@ -0,0 +1,30 @@
+#ifndef PROPERTIES_GPS_H
+#define PROPERTIES_GPS_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setIMU_pitchZeroX16;
+extern AOGProperty property_setIMU_rollZero;
+extern AOGProperty property_setF_minHeadingStepDistance;
+extern AOGProperty property_setGPS_fixFromWhichSentence;
+extern AOGProperty property_setGPS_headingFromWhichSource;
+extern AOGProperty property_setGPS_isRTK;
+extern AOGProperty property_setIMU_rollFilter;
+extern AOGProperty property_setIMU_invertRoll;
+extern AOGProperty property_setIMU_isHeadingCorrectionFromAutoSteer;
+extern AOGProperty property_setGPS_udpWatchMsec;
+extern AOGProperty property_setIMU_isDualAsIMU;
+extern AOGProperty property_setAS_sideHillComp;
+extern AOGProperty property_setIMU_isReverseOn;
+extern AOGProperty property_setGPS_forwardComp;
+extern AOGProperty property_setGPS_reverseComp;
+extern AOGProperty property_setGPS_ageAlarm;
+extern AOGProperty property_setGPS_isRTK_KillAutoSteer;
+extern AOGProperty property_setGPS_dualHeadingOffset;
+extern AOGProperty property_setGPS_minimumStepLimit;
+extern AOGProperty property_setIMU_fusionWeight2;
+extern AOGProperty property_setGPS_dualReverseDetectionDistance;
+
+#endif // PROPERTIES_GPS_H
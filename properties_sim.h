@@ -0,0 +1,12 @@
+#ifndef PROPERTIES_SIM_H
+#define PROPERTIES_SIM_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setMenu_isSimulatorOn;
+extern AOGProperty property_setGPS_SimLatitude;
+extern AOGProperty property_setGPS_SimLongitude;
+
+#endif // PROPERTIES_SIM_H
@@ -0,0 +1,22 @@
+#ifndef PROPERTIES_TODO_H
+#define PROPERTIES_TODO_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setHeadland_isSectionControlled;
+extern AOGProperty property_setRelay_pinConfig;
+extern AOGProperty property_set_youMoveDistance;
+extern AOGProperty property_setArdMac_hydRaiseTime;
+extern AOGProperty property_setArdMac_hydLowerTime;
+extern AOGProperty property_setArdMac_isHydEnabled;
+extern AOGProperty property_setArdMac_setting0;
+extern AOGProperty property_setArdSteer_setting2;
+extern AOGProperty property_setArdMac_isDanfoss;
+extern AOGProperty property_setArdMac_user1;
+extern AOGProperty property_setArdMac_user2;
+extern AOGProperty property_setArdMac_user3;
+extern AOGProperty property_setArdMac_user4;
+
+#endif // PROPERTIES_TODO_H
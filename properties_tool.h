@@ -0,0 +1,54 @@
+#ifndef PROPERTIES_TOOL_H
+#define PROPERTIES_TOOL_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setF_isWorkSwitchEnabled;
+extern AOGProperty property_setF_isWorkSwitchManualSections;
+extern AOGProperty property_setF_isWorkSwitchActiveLow;
+extern AOGProperty property_setF_isSteerWorkSwitchManualSections;
+extern AOGProperty property_setF_isSteerWorkSwitchEnabled;
+extern AOGProperty property_setF_isRemoteWorkSystemOn;
+extern AOGProperty property_setVehicle_toolWidth;
+extern AOGProperty property_setVehicle_toolOverlap;
+extern AOGProperty property_setTool_toolTrailingHitchLength;
+extern AOGProperty property_setVehicle_numSections;
+extern AOGProperty property_setSection_position1;
+extern AOGProperty property_setSection_position2;
+extern AOGProperty property_setSection_position3;
+extern AOGProperty property_setSection_position4;
+extern AOGProperty property_setSection_position5;
+extern AOGProperty property_setSection_position6;
+extern AOGProperty property_setSection_position7;
+extern AOGProperty property_setSection_position8;
+extern AOGProperty property_setSection_position9;
+extern AOGProperty property_setSection_position10;
+extern AOGProperty property_setSection_position11;
+extern AOGProperty property_setSection_position12;
+extern AOGProperty property_setSection_position13;
+extern AOGProperty property_setSection_position14;
+extern AOGProperty property_setSection_position15;
+extern AOGProperty property_setSection_position16;
+extern AOGProperty property_setSection_position17;
+extern AOGProperty property_setVehicle_toolLookAheadOn;
+extern AOGProperty property_setTool_isToolTrailing;
+extern AOGProperty property_setVehicle_toolOffset;
+extern AOGProperty property_setTool_isToolRearFixed;
+extern AOGProperty property_setVehicle_toolLookAheadOff;
+extern AOGProperty property_setVehicle_tankTrailingHitchLength;
+extern AOGProperty property_setTool_isToolTBT;
+extern AOGProperty property_setTool_defaultSectionWidth;
+extern AOGProperty property_setVehicle_toolOffDelay;
+extern AOGProperty property_setTool_isToolFront;
+extern AOGProperty property_setSection_isFast;
+extern AOGProperty property_setTool_isSectionsNotZones;
+extern AOGProperty property_setTool_numSectionsMulti;
+extern AOGProperty property_setTool_zones;
+extern AOGProperty property_setTool_sectionWidthMulti;
+extern AOGProperty property_setTool_isSectionOffWhenOut;
+extern AOGProperty property_setTool_isTramOuterInverted;
+extern AOGProperty property_setTool_trailingToolToPivotLength;
+
+#endif // PROPERTIES_TOOL_H
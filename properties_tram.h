@@ -0,0 +1,16 @@
+#ifndef PROPERTIES_TRAM_H
+#define PROPERTIES_TRAM_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setTram_tramWidth;
+extern AOGProperty property_setTram_snapAdj;
+extern AOGProperty property_setTram_passes;
+extern AOGProperty property_setTram_offset;
+extern AOGProperty property_setTram_isTramOnBackBuffer;
+extern AOGProperty property_setTram_BasedOn;
+extern AOGProperty property_setTram_Skips;
+
+#endif // PROPERTIES_TRAM_H
@@ -0,0 +1,14 @@
+#ifndef PROPERTIES_UTURN_H
+#define PROPERTIES_UTURN_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_set_youTurnExtensionLength;
+extern AOGProperty property_set_youTurnDistanceFromBoundary;
+extern AOGProperty property_set_youSkipWidth;
+extern AOGProperty property_set_youTurnRadius;
+extern AOGProperty property_set_uTurnStyle;
+
+#endif // PROPERTIES_UTURN_H
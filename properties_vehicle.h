@@ -0,0 +1,37 @@
+#ifndef PROPERTIES_VEHICLE_H
+#define PROPERTIES_VEHICLE_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_purePursuitIntegralGainAB;
+extern AOGProperty property_setVehicle_antennaHeight;
+extern AOGProperty property_setVehicle_antennaPivot;
+extern AOGProperty property_setVehicle_wheelbase;
+extern AOGProperty property_setVehicle_hitchLength;
+extern AOGProperty property_setVehicle_isPivotBehindAntenna;
+extern AOGProperty property_setVehicle_isSteerAxleAhead;
+extern AOGProperty property_setVehicle_vehicleName;
+extern AOGProperty property_setVehicle_slowSpeedCutoff;
+extern AOGProperty property_setVehicle_minCoverage;
+extern AOGProperty property_setVehicle_goalPointLookAhead;
+extern AOGProperty property_setVehicle_maxAngularVelocity;
+extern AOGProperty property_setVehicle_maxSteerAngle;
+extern AOGProperty property_setVehicle_minTurningRadius;
+extern AOGProperty property_setVehicle_antennaOffset;
+extern AOGProperty property_setVehicle_lookAheadMinimum;
+extern AOGProperty property_setVehicle_goalPointLookAheadMult;
+extern AOGProperty property_stanleyDistanceErrorGain;
+extern AOGProperty property_stanleyHeadingErrorGain;
+extern AOGProperty property_setVehicle_isStanleyUsed;
+extern AOGProperty property_setVehicle_vehicleType;
+extern AOGProperty property_setVehicle_hydraulicLiftLookAhead;
+extern AOGProperty property_setVehicle_isMachineControlToAutoSteer;
+extern AOGProperty property_stanleyIntegralDistanceAwayTriggerAB;
+extern AOGProperty property_setVehicle_trackWidth;
+extern AOGProperty property_stanleyIntegralGainAB;
+extern AOGProperty property_setVehicle_panicStopSpeed;
+extern AOGProperty property_setVehicle_goalPointLookAheadHold;
+
+#endif // PROPERTIES_VEHICLE_H
@@ -0,0 +1,10 @@
+#ifndef PROPERTIES_YTURN_H
+#define PROPERTIES_YTURN_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_set_youToolWidths;
+
+#endif // PROPERTIES_YTURN_H
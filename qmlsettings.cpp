@@ -6,6 +6,8 @@
 #include <QDateTime>
 #include <QSettings>
 #include "aogproperty.h"
+#include "aogsettingsstore.h"
+#include <algorithm>
 
 QMLSettings qml_settings;
 
@@ -14,94 +16,81 @@ QMLSettings::QMLSettings(QObject *parent) :  QQmlPropertyMap(parent) {
     connect (this, &QQmlPropertyMap::valueChanged, this, &QMLSettings::onValueChanged);
 }
 
-void QMLSettings::addKey(QString qml_key, QString settings_key, QString type_name) {
-    //map property names to QSettings paths. property names are what are
-    //exposed to QML, settings paths are where the property lives in the
-    //ini file.
-    qml_to_settings_map[qml_key] = settings_key;
-    settings_to_qml_map[settings_key] = qml_key;
-    settings_type_map[settings_key] = type_name;
-}
+const QMLSettings::Key *QMLSettings::findKey(const QString &qml_key) const {
+    //keys is sorted by qml_key
+    const Key *end = keys + key_count;
+    const Key *key = std::lower_bound(keys, end, qml_key, [](const Key &k, const QString &name) {
+        return name.compare(QLatin1String(k.qml_key)) > 0;
+    });
 
-void QMLSettings::loadSettings() {
-    //load every setting that is in our map
-    QString settings_key;
-    QVariant settings_value;
-
-    for (QString &key: qml_to_settings_map.keys()) {
-        settings_key = qml_to_settings_map[key];
-        settings_value = settings->value(settings_key, unset);
+    if (key == end || qml_key != QLatin1String(key->qml_key)) return nullptr;
+    return key;
+}
 
-        if (settings_value == unset) continue;
+bool QMLSettings::keyValue(const Key &key, QVariant &settings_value) const {
+    if (key.setting >= 0 && settings_store.isLoaded()) {
+        //typed copy, no QSettings lookup
+        settings_value = settings_store.value(AOGSetting(key.setting));
+    } else {
+        settings_value = settings->value(QString::fromLatin1(key.settings_key), unset);
+        if (settings_value == unset) return false;
+    }
 
-        //fix QVariant type
-        if (settings_type_map[settings_key] != "leavealone") {
-            auto t = QMetaType::type(settings_type_map[settings_key].toUtf8());
-            if (settings_value.userType() != t && !settings_value.convert(t) && !settings_value.isNull()) {
-                qWarning() << "Could not set the type of qml setting " << key;
-            }
-        } else {
-            //special case these two which are lists of doubles and integers respectively
-            if (settings_key == "tool/zones" && QString(settings_value.typeName()) == "QStringList") {
-                QVariantList l;
-                for(QString &i: settings_value.toStringList()) {
-                    l.append(QVariant(i.toInt()));
-                }
-                settings_value = l;
-            } else if (settings_key == "todo/relayPincofig" && QString(settings_value.typeName()) == "QStringList"){
-                QVariantList l;
-                for(QString &i: settings_value.toStringList()) {
-                    l.append(QVariant(i.toInt()));
-                }
-                settings_value = l;
+    //fix QVariant to have the right type
+    if (key.type == QMetaType::QVariantList) {
+        //lists of integers (tool/zones, relay pin config), marked in the key
+        //table, come back from the ini file as strings
+        if (settings_value.userType() == QMetaType::QStringList) {
+            QVariantList l;
+            for(const QString &i: settings_value.toStringList()) {
+                l.append(QVariant(i.toInt()));
             }
+            settings_value = l;
         }
+    } else if (key.type != QMetaType::UnknownType) {
+        if (settings_value.userType() != key.type && !settings_value.convert(QMetaType(key.type)) && !settings_value.isNull()) {
+            qWarning() << "Could not set the type of qml setting " << key.qml_key;
+        }
+    }
+
+    return true;
+}
+
+void QMLSettings::loadSettings() {
+    //load every setting in the key table in one pass and hand them to QML
+    //in a single insert
+    QVariantHash values;
+    QVariant settings_value;
 
-        insert(key, (QVariant) settings_value);
-        //qDebug() << "loading " << key << " to " << settings_value;
+    values.reserve(key_count);
+    for (int i = 0; i < key_count; i++) {
+        if (keyValue(keys[i], settings_value))
+            values.insert(QString::fromLatin1(keys[i].qml_key), settings_value);
     }
+
+    insert(values);
 }
 
 void QMLSettings::updateSetting(const QString &settings_key) {
     //a QSetting key/value pair was updated, so update QML's view
-    QString qml_key = settings_to_qml_map[settings_key];
-    QVariant settings_value = settings->value(settings_key,unset);
-
-    if (settings_value == unset) return;
-
-    //fix QVariant to have the right type
-    if (settings_type_map[settings_key] != "leavealone") {
-        auto t = QMetaType::type(settings_type_map[settings_key].toUtf8());
-        if (settings_value.userType() != t && !settings_value.convert(t) && !settings_value.isNull()) {
-            qWarning() << "Could not set the type of setting " << settings_key;
-        }
-    } else {
-    //special case these two which are lists of doubles and integers respectively
-        if (settings_key == "tool/zones" && QString(settings_value.typeName()) == "QStringList") {
-            QVariantList l;
-            for(QString i: settings_value.toStringList()) {
-                l.append(QVariant(i.toInt()));
-            }
-            settings_value = l;
-        } else if (settings_key == "todo/relayPincofig" && QString(settings_value.typeName()) == "QStringList"){
-            QVariantList l;
-            for(QString i: settings_value.toStringList()) {
-                l.append(QVariant(i.toInt()));
-            }
-            settings_value = l;
-        }
-     }
+    int setting = AOGSettingsStore::indexOf(settings_key);
+    if (setting < 0 || key_of_setting[setting] < 0) return;
 
-    //qDebug() << "updated " << settings_key << " from " << (*this)[qml_key] << " to " << settings_value;
+    const Key &key = keys[key_of_setting[setting]];
+    QVariant settings_value;
 
-    insert(qml_key, settings_value);
+    if (keyValue(key, settings_value))
+        insert(QString::fromLatin1(key.qml_key), settings_value);
 }
 
 void QMLSettings::onValueChanged(const QString &key, const QVariant &value) {
     //Anytime QML changes a property, be sure to update it back to
     //the QSettings store.  We use AOGSetting's setValue_noqml to
     //prevent AOGSetting from calling our updateSetting which would loop!
-    QString settings_key = qml_to_settings_map[key];
+    const Key *k = findKey(key);
+    if (!k) return;
+
+    QString settings_key = QString::fromLatin1(k->settings_key);
     QString type_name = value.typeName();
     //qDebug() << "QML changed " << key << " to type " << type_name;
     if (type_name == "QJSValue") {
@@ -13,20 +13,31 @@ class QMLSettings : public QQmlPropertyMap
 {
     Q_OBJECT
 public:
-    QMap<QString, QString> qml_to_settings_map; //map of qml property keys to settings path keys
-    QMap<QString, QString> settings_to_qml_map; //map of qml property keys to settings path keys
-    QMap<QString, QString> settings_type_map; //map of qml property keys to settings path keys
+    //one row per setting exposed to QML.  The table is generated by
+    //parse_properties.py into qmlsettings_addkeys.cpp, sorted by qml_key.
+    struct Key {
+        const char *qml_key;      //qml property name
+        const char *settings_key; //where the property lives in the ini file
+        int type;                 //QMetaType id, UnknownType to leave it alone,
+                                  //or QVariantList for a list of ints
+        int setting;              //AOGSetting index in settings_store, or -1
+    };
+
+    static const Key keys[];
+    static const int key_count;
+    static const int key_of_setting[]; //row in keys of each AOGSetting, or -1
 
     QMLSettings(QObject *parent = 0);
 
-    void addKey(QString qml_key, QString settings_key, QString type_name);
-    void setupKeys();
-
     void loadSettings();
 
     void updateSetting(const QString &settings_key);
 public slots:
     void onValueChanged(const QString &key, const QVariant &value);
+
+protected:
+    const Key *findKey(const QString &qml_key) const;
+    bool keyValue(const Key &key, QVariant &settings_value) const;
 };
 
 #endif // QMLSETTINGS_H
@@ -3,272 +3,552 @@
 //
 // 
 #include "qmlsettings.h"
+#include "aogsettingsvalues.h"
 
-void QMLSettings::setupKeys() {
-    addKey(QString("setWindow_Location"),QString("display/windowLocation"),"QPoint");
-    addKey(QString("setWindow_Size"),QString("display/windowSize"),"QString");
-    addKey(QString("setWindow_Maximized"),QString("display/maximized"),"bool");
-    addKey(QString("setWindow_Minimized"),QString("display/minimized"),"bool");
-    addKey(QString("setDisplay_triangleResolution"),QString("display/triangleResolution"),"double");
-    addKey(QString("setMenu_isMetric"),QString("display/isMetric"),"bool");
-    addKey(QString("setMenu_isGridOn"),QString("display/showGrid"),"bool");
-    addKey(QString("setMenu_isLightbarOn"),QString("display/isLightBarOn"),"bool");
-    addKey(QString("setF_CurrentDir"),QString("display/currentDir"),"QString");
-    addKey(QString("setF_isWorkSwitchEnabled"),QString("tool/isWorkSwitchEnabled"),"bool");
-    addKey(QString("setIMU_pitchZeroX16"),QString("gps/IMUPitchZeroX16"),"int");
-    addKey(QString("setIMU_rollZero"),QString("gps/IMURollZeroX16"),"double");
-    addKey(QString("setF_minHeadingStepDistance"),QString("gps/minHeadingStepDistance"),"double");
-    addKey(QString("setAS_lowSteerPWM"),QString("autosteer/lowSteerPWM"),"double");
-    addKey(QString("setAS_wasOffset"),QString("autosteer/wasOffset"),"int");
-    addKey(QString("setF_UserTotalArea"),QString("display/userTotalArea"),"double");
-    addKey(QString("setAS_minSteerPWM"),QString("autosteer/minSteerPWM"),"double");
-    addKey(QString("setF_boundaryTriggerDistance"),QString("autosteer/boundaryTriggerDistance"),"double");
-    addKey(QString("setAS_highSteerPWM"),QString("autosteer/highSteerPWM"),"double");
-    addKey(QString("setMenu_isSideGuideLines"),QString("display/isSideGuideLines"),"bool");
-    addKey(QString("setAS_countsPerDegree"),QString("autosteer/countsPerDegree"),"double");
-    addKey(QString("setMenu_isPureOn"),QString("display/isPureOn"),"bool");
-    addKey(QString("setMenu_isSimulatorOn"),QString("sim/on"),"bool");
-    addKey(QString("setMenu_isSkyOn"),QString("display/isSkyOn"),"bool");
-    addKey(QString("setF_culture"),QString("display/culture"),"QString");
-    addKey(QString("setF_workingDirectory"),QString("display/workingDir"),"QString");
-    addKey(QString("setDisplay_lightbarCmPerPixel"),QString("display/lightbarCMPerPixel"),"int");
-    addKey(QString("setGPS_fixFromWhichSentence"),QString("gps/fixFromWhichSentence"),"QString");
-    addKey(QString("setGPS_headingFromWhichSource"),QString("gps/headingFromWhichSource"),"QString");
-    addKey(QString("setGPS_SimLatitude"),QString("sim/latitude"),"double");
-    addKey(QString("setGPS_SimLongitude"),QString("sim/longitude"),"double");
-    addKey(QString("setAS_snapDistance"),QString("autosteer/snapDistance"),"double");
-    addKey(QString("setF_isWorkSwitchManualSections"),QString("tool/isWorkSwitchManual"),"bool");
-    addKey(QString("setAS_isAutoSteerAutoOn"),QString("autosteer/autoOn"),"bool");
-    addKey(QString("setDisplay_lineWidth"),QString("display/lineWidth"),"int");
-    addKey(QString("setDisplay_panelSimLocation"),QString("display/simLocation"),"QPoint");
-    addKey(QString("setTram_tramWidth"),QString("tram/width"),"double");
-    addKey(QString("setTram_snapAdj"),QString("tram/swapAdj"),"double");
-    addKey(QString("setTram_passes"),QString("tram/passes"),"int");
-    addKey(QString("setTram_offset"),QString("tram/offset"),"double");
-    addKey(QString("setMenu_isOGLZoomOn"),QString("display/oglZoom"),"int");
-    addKey(QString("setMenu_isCompassOn"),QString("display/isCompassOn"),"bool");
-    addKey(QString("setMenu_isSpeedoOn"),QString("display/isSpeedOn"),"bool");
-    addKey(QString("setDisplay_colorDayFrame"),QString("display/colorDayFrame"),"QColor");
-    addKey(QString("setDisplay_colorNightFrame"),QString("display/colorNightFrame"),"QColor");
-    addKey(QString("setDisplay_colorSectionsDay"),QString("display/colorSectionsDay"),"QColor");
-    addKey(QString("setDisplay_colorFieldDay"),QString("display/colorFieldDay"),"QColor");
-    addKey(QString("setDisplay_isDayMode"),QString("display/dayMode"),"bool");
-    addKey(QString("setDisplay_colorSectionsNight"),QString("display/colorSectionsNight"),"QColor");
-    addKey(QString("setDisplay_colorFieldNight"),QString("display/colorFieldNight"),"QColor");
-    addKey(QString("setDisplay_isAutoDayNight"),QString("display/autoDayNight"),"bool");
-    addKey(QString("setDisplay_customColors"),QString("display/customColors"),"QString");
-    addKey(QString("setDisplay_isTermsAccepted"),QString("display/terms"),"bool");
-    addKey(QString("setGPS_isRTK"),QString("gps/isRTK"),"bool");
-    addKey(QString("setDisplay_isStartFullScreen"),QString("display/startFullscreen"),"bool");
-    addKey(QString("setDisplay_isKeyboardOn"),QString("display/keyboard"),"bool");
-    addKey(QString("setIMU_rollFilter"),QString("gps/IMURollFilter"),"double");
-    addKey(QString("setAS_uTurnSmoothing"),QString("autosteer/uTurnSmoothing"),"int");
-    addKey(QString("setIMU_invertRoll"),QString("gps/IMUInvertRoll"),"bool");
-    addKey(QString("setAS_ackerman"),QString("autosteer/ackerman"),"double");
-    addKey(QString("setF_isWorkSwitchActiveLow"),QString("tool/isWorkSwitchActiveLow"),"bool");
-    addKey(QString("setAS_Kp"),QString("autosteer/Kp"),"double");
-    addKey(QString("setSound_isUturnOn"),QString("display/soundUturn"),"bool");
-    addKey(QString("setSound_isHydLiftOn"),QString("display/soundHydLift"),"bool");
-    addKey(QString("setDisplay_colorTextNight"),QString("display/colorTextNight"),"QColor");
-    addKey(QString("setDisplay_colorTextDay"),QString("display/colorTextDay"),"QColor");
-    addKey(QString("setTram_isTramOnBackBuffer"),QString("tram/tramOnBackBuffer"),"bool");
-    addKey(QString("setDisplay_camZoom"),QString("display/camZoom"),"double");
-    addKey(QString("setDisplay_colorVehicle"),QString("display/vehicleColor"),"QColor");
-    addKey(QString("setDisplay_vehicleOpacity"),QString("display/vehicleOpacity"),"int");
-    addKey(QString("setDisplay_isVehicleImage"),QString("display/isVehicleImage"),"bool");
-    addKey(QString("setIMU_isHeadingCorrectionFromAutoSteer"),QString("gps/isHeadingCorrectionFromAutoSteer"),"QString");
-    addKey(QString("setDisplay_isTextureOn"),QString("display/texture"),"bool");
-    addKey(QString("setAB_lineLength"),QString("ABLine/lineLength"),"double");
-    addKey(QString("setGPS_udpWatchMsec"),QString("gps/udpWatchMS"),"int");
-    addKey(QString("setF_isSteerWorkSwitchManualSections"),QString("tool/isWorkSwitchManualSections"),"bool");
-    addKey(QString("setAS_isConstantContourOn"),QString("autosteer/constantContourOn"),"bool");
-    addKey(QString("setAS_guidanceLookAheadTime"),QString("autosteer/guidanceLookAheadTime"),"double");
-    addKey(QString("setFeatures"),QString("display/features"),"QString");
-    addKey(QString("setIMU_isDualAsIMU"),QString("gps/dualAsIMU"),"bool");
-    addKey(QString("setAS_sideHillComp"),QString("gps/sideHillCompensation"),"double");
-    addKey(QString("setIMU_isReverseOn"),QString("gps/revereOn"),"bool");
-    addKey(QString("setGPS_forwardComp"),QString("gps/forwardComp"),"double");
-    addKey(QString("setGPS_reverseComp"),QString("gps/reverseComp"),"double");
-    addKey(QString("setGPS_ageAlarm"),QString("gps/ageAlarm"),"int");
-    addKey(QString("setGPS_isRTK_KillAutoSteer"),QString("gps/RTKKillAutoSteer"),"bool");
-    addKey(QString("setColor_sec01"),QString("display/section1Color"),"QColor");
-    addKey(QString("setColor_sec02"),QString("display/section2Color"),"QColor");
-    addKey(QString("setColor_sec03"),QString("display/section3Color"),"QColor");
-    addKey(QString("setColor_sec04"),QString("display/section4Color"),"QColor");
-    addKey(QString("setColor_sec05"),QString("display/section5Color"),"QColor");
-    addKey(QString("setColor_sec06"),QString("display/section6Color"),"QColor");
-    addKey(QString("setColor_sec07"),QString("display/section7Color"),"QColor");
-    addKey(QString("setColor_sec08"),QString("display/section8Color"),"QColor");
-    addKey(QString("setColor_sec09"),QString("display/section9Color"),"QColor");
-    addKey(QString("setColor_sec10"),QString("display/section10Color"),"QColor");
-    addKey(QString("setColor_sec11"),QString("display/section11Color"),"QColor");
-    addKey(QString("setColor_sec12"),QString("display/section12Color"),"QColor");
-    addKey(QString("setColor_sec13"),QString("display/section13Color"),"QColor");
-    addKey(QString("setColor_sec14"),QString("display/section14Color"),"QColor");
-    addKey(QString("setColor_sec15"),QString("display/section15Color"),"QColor");
-    addKey(QString("setColor_sec16"),QString("display/section16Color"),"QColor");
-    addKey(QString("setColor_isMultiColorSections"),QString("display/multiColorSections"),"bool");
-    addKey(QString("setDisplay_customSectionColors"),QString("display/customSectionColors"),"QString");
-    addKey(QString("setBrand_TBrand"),QString("display/TBrand"),"QString");
-    addKey(QString("setHeadland_isSectionControlled"),QString("todo/headlandIsSectionControlled"),"bool");
-    addKey(QString("setSound_isAutoSteerOn"),QString("display/autoSteerSound"),"bool");
-    addKey(QString("setRelay_pinConfig"),QString("todo/relayPinConfig"),"leavealone");
-    addKey(QString("setDisplay_camSmooth"),QString("display/camSmooth"),"int");
-    addKey(QString("setGPS_dualHeadingOffset"),QString("gps/dualHeadingOffset"),"double");
-    addKey(QString("setF_isSteerWorkSwitchEnabled"),QString("tool/isSteerWorkSwitchEnabled"),"bool");
-    addKey(QString("setF_isRemoteWorkSystemOn"),QString("tool/isRemoteWorkSystemOn"),"bool");
-    addKey(QString("setDisplay_isAutoStartAgIO"),QString("display/autoStartAgIO"),"bool");
-    addKey(QString("setAS_ModeXTE"),QString("autosteer/modeXTE"),"double");
-    addKey(QString("setAS_ModeTime"),QString("autosteer/modeTime"),"int");
-    addKey(QString("setVehicle_toolWidth"),QString("tool/width"),"double");
-    addKey(QString("setVehicle_toolOverlap"),QString("tool/overlap"),"double");
-    addKey(QString("setTool_toolTrailingHitchLength"),QString("tool/trailingHitchLength"),"double");
-    addKey(QString("setVehicle_numSections"),QString("tool/numSections"),"int");
-    addKey(QString("setSection_position1"),QString("tool/sectionposition1"),"double");
-    addKey(QString("setSection_position2"),QString("tool/sectionposition2"),"double");
-    addKey(QString("setSection_position3"),QString("tool/sectionposition3"),"double");
-    addKey(QString("setSection_position4"),QString("tool/sectionposition4"),"double");
-    addKey(QString("setSection_position5"),QString("tool/sectionposition5"),"double");
-    addKey(QString("setSection_position6"),QString("tool/sectionposition6"),"double");
-    addKey(QString("setSection_position7"),QString("tool/sectionposition7"),"double");
-    addKey(QString("setSection_position8"),QString("tool/sectionposition8"),"double");
-    addKey(QString("setSection_position9"),QString("tool/sectionposition9"),"double");
-    addKey(QString("setSection_position10"),QString("tool/sectionposition10"),"double");
-    addKey(QString("setSection_position11"),QString("tool/sectionposition11"),"double");
-    addKey(QString("setSection_position12"),QString("tool/sectionposition12"),"double");
-    addKey(QString("setSection_position13"),QString("tool/sectionposition13"),"double");
-    addKey(QString("setSection_position14"),QString("tool/sectionposition14"),"double");
-    addKey(QString("setSection_position15"),QString("tool/sectionposition15"),"double");
-    addKey(QString("setSection_position16"),QString("tool/sectionposition16"),"double");
-    addKey(QString("setSection_position17"),QString("tool/sectionposition17"),"double");
-    addKey(QString("purePursuitIntegralGainAB"),QString("vehicle/purePursuitIntegralGainAB"),"double");
-    addKey(QString("set_youMoveDistance"),QString("todo/youMoveDistance"),"double");
-    addKey(QString("setVehicle_antennaHeight"),QString("vehicle/antennaHeight"),"double");
-    addKey(QString("setVehicle_toolLookAheadOn"),QString("tool/lookAheadOn"),"double");
-    addKey(QString("setTool_isToolTrailing"),QString("tool/isTrailing"),"bool");
-    addKey(QString("setVehicle_toolOffset"),QString("tool/offset"),"double");
-    addKey(QString("setTool_isToolRearFixed"),QString("tool/rearFixed"),"bool");
-    addKey(QString("setVehicle_antennaPivot"),QString("vehicle/antennaPivot"),"double");
-    addKey(QString("setVehicle_wheelbase"),QString("vehicle/wheelbase"),"double");
-    addKey(QString("setVehicle_hitchLength"),QString("vehicle/hitchLength"),"double");
-    addKey(QString("setVehicle_toolLookAheadOff"),QString("tool/lookAheadOff"),"double");
-    addKey(QString("setVehicle_isPivotBehindAntenna"),QString("vehicle/isPivotBehindAntenna"),"bool");
-    addKey(QString("setVehicle_isSteerAxleAhead"),QString("vehicle/isSteerAxleAhead"),"bool");
-    addKey(QString("setVehicle_vehicleName"),QString("vehicle/name"),"QString");
-    addKey(QString("setVehicle_slowSpeedCutoff"),QString("vehicle/slowSpeedCutoff"),"double");
-    addKey(QString("setVehicle_tankTrailingHitchLength"),QString("tool/tankTrailingHitchLength"),"double");
-    addKey(QString("setVehicle_minCoverage"),QString("vehicle/minCoverage"),"int");
-    addKey(QString("setVehicle_goalPointLookAhead"),QString("vehicle/goalPointLookAhead"),"double");
-    addKey(QString("setVehicle_maxAngularVelocity"),QString("vehicle/maxAngularVelocity"),"double");
-    addKey(QString("setVehicle_maxSteerAngle"),QString("vehicle/maxSteerAngle"),"double");
-    addKey(QString("set_youTurnExtensionLength"),QString("uturn/extensionLength"),"int");
-    addKey(QString("set_youToolWidths"),QString("yturn/toolWidths"),"double");
-    addKey(QString("setVehicle_minTurningRadius"),QString("vehicle/minTurningRadius"),"double");
-    addKey(QString("setVehicle_antennaOffset"),QString("vehicle/antennaOffset"),"double");
-    addKey(QString("set_youTurnDistanceFromBoundary"),QString("uturn/distanceFromBoundary"),"double");
-    addKey(QString("setVehicle_lookAheadMinimum"),QString("vehicle/lookAheadMinimum"),"double");
-    addKey(QString("setVehicle_goalPointLookAheadMult"),QString("vehicle/goalPointLookAheadMult"),"double");
-    addKey(QString("stanleyDistanceErrorGain"),QString("vehicle/stanleyDistanceErrorGain"),"double");
-    addKey(QString("stanleyHeadingErrorGain"),QString("vehicle/stanleyHeadingErrorGain"),"double");
-    addKey(QString("setVehicle_isStanleyUsed"),QString("vehicle/isStanlyUsed"),"bool");
-    addKey(QString("setTram_BasedOn"),QString("tram/basedOn"),"int");
-    addKey(QString("setTram_Skips"),QString("tram/skips"),"int");
-    addKey(QString("setTool_isToolTBT"),QString("tool/isTBT"),"bool");
-    addKey(QString("setVehicle_vehicleType"),QString("vehicle/type"),"int");
-    addKey(QString("set_youSkipWidth"),QString("uturn/skipWidth"),"int");
-    addKey(QString("setArdSteer_setting1"),QString("autosteer/ardSteerSetting1"),"double");
-    addKey(QString("setArdSteer_minSpeed"),QString("autosteer/ardSteerMinSpeed"),"double");
-    addKey(QString("setArdSteer_maxSpeed"),QString("autosteer/ardSteerMaxSpeed"),"double");
-    addKey(QString("setArdSteer_setting0"),QString("autosteer/ardSteerSetting0"),"double");
-    addKey(QString("setVehicle_hydraulicLiftLookAhead"),QString("vehicle/hydraulicLiftLookAhead"),"double");
-    addKey(QString("setVehicle_isMachineControlToAutoSteer"),QString("vehicle/isMachineControlToAutoSteer"),"bool");
-    addKey(QString("setArdSteer_maxPulseCounts"),QString("autosteer/ardSteerMaxPulseCounts"),"double");
-    addKey(QString("setArdMac_hydRaiseTime"),QString("todo/ardMacHydRaiseTime"),"double");
-    addKey(QString("setArdMac_hydLowerTime"),QString("todo/ardMacHydLowerTime"),"double");
-    addKey(QString("setArdMac_isHydEnabled"),QString("todo/ardMacIsHydEnabled"),"double");
-    addKey(QString("setTool_defaultSectionWidth"),QString("tool/defaultSectionWidth"),"double");
-    addKey(QString("setVehicle_toolOffDelay"),QString("tool/offDelay"),"double");
-    addKey(QString("setArdMac_setting0"),QString("todo/ardMacSetting0"),"double");
-    addKey(QString("setArdSteer_setting2"),QString("todo/ArdSteerSetting2"),"double");
-    addKey(QString("stanleyIntegralDistanceAwayTriggerAB"),QString("vehicle/stanleyIntegralDistanceAwayTriggerAB"),"double");
-    addKey(QString("setTool_isToolFront"),QString("tool/isFront"),"bool");
-    addKey(QString("setVehicle_trackWidth"),QString("vehicle/trackWidth"),"double");
-    addKey(QString("setArdMac_isDanfoss"),QString("todo/ardMacIsDanFoss"),"bool");
-    addKey(QString("stanleyIntegralGainAB"),QString("vehicle/stanleyIntegralGainAB"),"double");
-    addKey(QString("setSection_isFast"),QString("tool/sectionIsFast"),"bool");
-    addKey(QString("setArdMac_user1"),QString("todo/ardMacUser1"),"double");
-    addKey(QString("setArdMac_user2"),QString("todo/ardMacUser2"),"double");
-    addKey(QString("setArdMac_user3"),QString("todo/ardMacUser3"),"double");
-    addKey(QString("setArdMac_user4"),QString("todo/ardMacUser4"),"double");
-    addKey(QString("setVehicle_panicStopSpeed"),QString("vehicle/panicStopSpeed"),"double");
-    addKey(QString("setAS_ModeMultiplierStanley"),QString("autosteer/modeMultiplierStanley"),"double");
-    addKey(QString("setDisplay_brightness"),QString("display/brightness"),"int");
-    addKey(QString("set_youTurnRadius"),QString("uturn/radius"),"double");
-    addKey(QString("setDisplay_brightnessSystem"),QString("display/brightnessSystem"),"int");
-    addKey(QString("setTool_isSectionsNotZones"),QString("tool/sectionsNotZones"),"bool");
-    addKey(QString("setTool_numSectionsMulti"),QString("tool/numSectionsMulti"),"int");
-    addKey(QString("setTool_zones"),QString("tool/zones"),"leavealone");
-    addKey(QString("setTool_sectionWidthMulti"),QString("tool/sectionWidthMulti"),"double");
-    addKey(QString("setDisplay_isBrightnessOn"),QString("display/brightnessOn"),"bool");
-    addKey(QString("setKey_hotkeys"),QString("display/hotKeys"),"QString");
-    addKey(QString("setVehicle_goalPointLookAheadHold"),QString("vehicle/goalPointLookAheadHold"),"double");
-    addKey(QString("setTool_isSectionOffWhenOut"),QString("tool/isSectionOffWhenOut"),"bool");
-    addKey(QString("set_uTurnStyle"),QString("uturn/style"),"int");
-    addKey(QString("setGPS_minimumStepLimit"),QString("gps/minimumStepLimit"),"double");
-    addKey(QString("setAS_isSteerInReverse"),QString("autosteer/isSteerInReverse"),"bool");
-    addKey(QString("setAS_functionSpeedLimit"),QString("autosteer/functionSpeedLimit"),"double");
-    addKey(QString("setAS_maxSteerSpeed"),QString("autosteer/maxSteerSpeed"),"double");
-    addKey(QString("setAS_minSteerSpeed"),QString("autosteer/minSteerSpeed"),"double");
-    addKey(QString("setBrand_HBrand"),QString("display/HBrand"),"QString");
-    addKey(QString("setBrand_WDBrand"),QString("display/WDBrand"),"QString");
-    addKey(QString("setIMU_fusionWeight2"),QString("gps/IMUFusionWeight2"),"double");
-    addKey(QString("setDisplay_isSvennArrowOn"),QString("display/svennArrow"),"bool");
-    addKey(QString("setTool_isTramOuterInverted"),QString("tool/isTramOuterInverted"),"bool");
-    addKey(QString("setJobMenu_location"),QString("display/jobMenuLocation"),"QPoint");
-    addKey(QString("setJobMenu_size"),QString("display/jobMenuSize"),"QString");
-    addKey(QString("setWindow_steerSettingsLocation"),QString("display/steerSettingsLocation"),"QPoint");
-    addKey(QString("setWindow_buildTracksLocation"),QString("dialogs/tracksLocation"),"QPoint");
-    addKey(QString("setTool_trailingToolToPivotLength"),QString("tool/trailingToPivotLength"),"double");
-    addKey(QString("setWindow_formNudgeLocation"),QString("dialogs/nudgeLocation"),"QPoint");
-    addKey(QString("setWindow_formNudgeSize"),QString("autosteer/nudgeSize"),"QString");
-    addKey(QString("setAS_snapDistanceRef"),QString("autosteer/snapDistanceRef"),"double");
-    addKey(QString("setDisplay_buttonOrder"),QString("display/buttonOrder"),"QString");
-    addKey(QString("setDisplay_camPitch"),QString("display/camPitch"),"double");
-    addKey(QString("setWindow_abDrawSize"),QString("dialogs/abDrawSize"),"QString");
-    addKey(QString("setWindow_HeadlineSize"),QString("dialogs/headlineSize"),"QString");
-    addKey(QString("setWindow_HeadAcheSize"),QString("dialogs/headAcheSize"),"QString");
-    addKey(QString("setWindow_MapBndSize"),QString("dialogs/mapBndSize"),"QString");
-    addKey(QString("setWindow_BingMapSize"),QString("dialogs/bingMapSize"),"QString");
-    addKey(QString("setWindow_BingZoom"),QString("dialogs/bingZoom"),"int");
-    addKey(QString("setWindow_RateMapSize"),QString("dialogs/rateMapSize"),"QString");
-    addKey(QString("setWindow_RateMapZoom"),QString("dialogs/rateMapZoom"),"int");
-    addKey(QString("setWindow_QuickABLocation"),QString("dialogs/quickABLocation"),"QPoint");
-    addKey(QString("setDisplay_isLogElevation"),QString("display/isLogElevation"),"bool");
-    addKey(QString("setSound_isSectionsOn"),QString("display/soundIsSectionOn"),"bool");
-    addKey(QString("setGPS_dualReverseDetectionDistance"),QString("gps/dualReverseDetectionDistance"),"double");
-    addKey(QString("setTool_isDisplayTramControl"),QString("display/showTramControl"),"bool");
-    addKey(QString("setAS_uTurnCompensation"),QString("autosteer/uTurnCompensation"),"double");
-    addKey(QString("setFeature_isHeadlandOn"),QString("displayFeatures/isHeadlandOn"), "bool");
-    addKey(QString("setFeature_isTramOn"),QString("displayFeatures/isTramOn"), "bool");
-    addKey(QString("setFeature_isBoundaryOn"),QString("displayFeatures/isBoundaryOn"), "bool");
-    addKey(QString("setFeature_isBndContourOn"),QString("displayFeatures/isBndContourOn"), "bool");
-    addKey(QString("setFeature_isRecPathOn"),QString("displayFeatures/isRecPathOn"), "bool");
-    addKey(QString("setFeature_isABSmoothOn"),QString("displayFeatures/isABSmoothOn"), "bool");
-    addKey(QString("setFeature_isHideContourOn"),QString("displayFeatures/isHideContourOn"), "bool");
-    addKey(QString("setFeature_isWebCamOn"),QString("displayFeatures/isWebCamOn"), "bool");
-    addKey(QString("setFeature_isOffsetFixOn"),QString("displayFeatures/isOffsetFixOn"), "bool");
-    addKey(QString("setFeature_isAgIOOn"),QString("displayFeatures/isAgIOOn"), "bool");
-    addKey(QString("setFeature_isContourOn"),QString("displayFeatures/isContourOn"), "bool");
-    addKey(QString("setFeature_isYouTurnOn"),QString("displayFeatures/isYouTurnOn"), "bool");
-    addKey(QString("setFeature_isSteerModeOn"),QString("displayFeatures/isSteerModeOn"), "bool");
-    addKey(QString("setFeature_isManualSectionOn"),QString("displayFeatures/isManualSectionOn"), "bool");
-    addKey(QString("setFeature_isAutoSectionOn"),QString("displayFeatures/isAutoSectionOn"), "bool");
-    addKey(QString("setFeature_isCycleLinesOn"),QString("displayFeatures/isCycleLinesOn"), "bool");
-    addKey(QString("setFeature_isABLineOn"),QString("displayFeatures/isABLineOn"), "bool");
-    addKey(QString("setFeature_isCurveOn"),QString("displayFeatures/isCurveOn"), "bool");
-    addKey(QString("setFeature_isAutoSteerOn"),QString("displayFeatures/isAutoSteerOn"), "bool");
-    addKey(QString("setFeature_isUTurnOn"),QString("displayFeatures/isUTurnOn"), "bool");
-    addKey(QString("setFeature_isLateralOn"),QString("displayFeatures/isLateralOn"), "bool");
-    addKey(QString("setDisplay_useTrackZero"),QString("display/useTrackZero"),"bool");
-    addKey(QString("setDisplay_topTrackNum"),QString("display/topTrackNum"),"bool");
-}
+//Generated by parse_properties.py
+
+const QMLSettings::Key QMLSettings::keys[] = {
+    { "purePursuitIntegralGainAB", "vehicle/purePursuitIntegralGainAB", QMetaType::Double, int(AOGSetting::purePursuitIntegralGainAB) },
+    { "setAB_lineLength", "ABLine/lineLength", QMetaType::Double, int(AOGSetting::setAB_lineLength) },
+    { "setAS_Kp", "autosteer/Kp", QMetaType::Double, int(AOGSetting::setAS_Kp) },
+    { "setAS_ModeMultiplierStanley", "autosteer/modeMultiplierStanley", QMetaType::Double, int(AOGSetting::setAS_ModeMultiplierStanley) },
+    { "setAS_ModeTime", "autosteer/modeTime", QMetaType::Int, int(AOGSetting::setAS_ModeTime) },
+    { "setAS_ModeXTE", "autosteer/modeXTE", QMetaType::Double, int(AOGSetting::setAS_ModeXTE) },
+    { "setAS_ackerman", "autosteer/ackerman", QMetaType::Double, int(AOGSetting::setAS_ackerman) },
+    { "setAS_countsPerDegree", "autosteer/countsPerDegree", QMetaType::Double, int(AOGSetting::setAS_countsPerDegree) },
+    { "setAS_functionSpeedLimit", "autosteer/functionSpeedLimit", QMetaType::Double, int(AOGSetting::setAS_functionSpeedLimit) },
+    { "setAS_guidanceLookAheadTime", "autosteer/guidanceLookAheadTime", QMetaType::Double, int(AOGSetting::setAS_guidanceLookAheadTime) },
+    { "setAS_highSteerPWM", "autosteer/highSteerPWM", QMetaType::Double, int(AOGSetting::setAS_highSteerPWM) },
+    { "setAS_isAutoSteerAutoOn", "autosteer/autoOn", QMetaType::Bool, int(AOGSetting::setAS_isAutoSteerAutoOn) },
+    { "setAS_isConstantContourOn", "autosteer/constantContourOn", QMetaType::Bool, int(AOGSetting::setAS_isConstantContourOn) },
+    { "setAS_isSteerInReverse", "autosteer/isSteerInReverse", QMetaType::Bool, int(AOGSetting::setAS_isSteerInReverse) },
+    { "setAS_lowSteerPWM", "autosteer/lowSteerPWM", QMetaType::Double, int(AOGSetting::setAS_lowSteerPWM) },
+    { "setAS_maxSteerSpeed", "autosteer/maxSteerSpeed", QMetaType::Double, int(AOGSetting::setAS_maxSteerSpeed) },
+    { "setAS_minSteerPWM", "autosteer/minSteerPWM", QMetaType::Double, int(AOGSetting::setAS_minSteerPWM) },
+    { "setAS_minSteerSpeed", "autosteer/minSteerSpeed", QMetaType::Double, int(AOGSetting::setAS_minSteerSpeed) },
+    { "setAS_sideHillComp", "gps/sideHillCompensation", QMetaType::Double, int(AOGSetting::setAS_sideHillComp) },
+    { "setAS_snapDistance", "autosteer/snapDistance", QMetaType::Double, int(AOGSetting::setAS_snapDistance) },
+    { "setAS_snapDistanceRef", "autosteer/snapDistanceRef", QMetaType::Double, int(AOGSetting::setAS_snapDistanceRef) },
+    { "setAS_uTurnCompensation", "autosteer/uTurnCompensation", QMetaType::Double, int(AOGSetting::setAS_uTurnCompensation) },
+    { "setAS_uTurnSmoothing", "autosteer/uTurnSmoothing", QMetaType::Int, int(AOGSetting::setAS_uTurnSmoothing) },
+    { "setAS_wasOffset", "autosteer/wasOffset", QMetaType::Int, int(AOGSetting::setAS_wasOffset) },
+    { "setArdMac_hydLowerTime", "todo/ardMacHydLowerTime", QMetaType::Double, int(AOGSetting::setArdMac_hydLowerTime) },
+    { "setArdMac_hydRaiseTime", "todo/ardMacHydRaiseTime", QMetaType::Double, int(AOGSetting::setArdMac_hydRaiseTime) },
+    { "setArdMac_isDanfoss", "todo/ardMacIsDanFoss", QMetaType::Bool, int(AOGSetting::setArdMac_isDanfoss) },
+    { "setArdMac_isHydEnabled", "todo/ardMacIsHydEnabled", QMetaType::Double, int(AOGSetting::setArdMac_isHydEnabled) },
+    { "setArdMac_setting0", "todo/ardMacSetting0", QMetaType::Double, int(AOGSetting::setArdMac_setting0) },
+    { "setArdMac_user1", "todo/ardMacUser1", QMetaType::Double, int(AOGSetting::setArdMac_user1) },
+    { "setArdMac_user2", "todo/ardMacUser2", QMetaType::Double, int(AOGSetting::setArdMac_user2) },
+    { "setArdMac_user3", "todo/ardMacUser3", QMetaType::Double, int(AOGSetting::setArdMac_user3) },
+    { "setArdMac_user4", "todo/ardMacUser4", QMetaType::Double, int(AOGSetting::setArdMac_user4) },
+    { "setArdSteer_maxPulseCounts", "autosteer/ardSteerMaxPulseCounts", QMetaType::Double, int(AOGSetting::setArdSteer_maxPulseCounts) },
+    { "setArdSteer_maxSpeed", "autosteer/ardSteerMaxSpeed", QMetaType::Double, int(AOGSetting::setArdSteer_maxSpeed) },
+    { "setArdSteer_minSpeed", "autosteer/ardSteerMinSpeed", QMetaType::Double, int(AOGSetting::setArdSteer_minSpeed) },
+    { "setArdSteer_setting0", "autosteer/ardSteerSetting0", QMetaType::Double, int(AOGSetting::setArdSteer_setting0) },
+    { "setArdSteer_setting1", "autosteer/ardSteerSetting1", QMetaType::Double, int(AOGSetting::setArdSteer_setting1) },
+    { "setArdSteer_setting2", "todo/ArdSteerSetting2", QMetaType::Double, int(AOGSetting::setArdSteer_setting2) },
+    { "setBrand_HBrand", "display/HBrand", QMetaType::QString, int(AOGSetting::setBrand_HBrand) },
+    { "setBrand_TBrand", "display/TBrand", QMetaType::QString, int(AOGSetting::setBrand_TBrand) },
+    { "setBrand_WDBrand", "display/WDBrand", QMetaType::QString, int(AOGSetting::setBrand_WDBrand) },
+    { "setColor_isMultiColorSections", "display/multiColorSections", QMetaType::Bool, int(AOGSetting::setColor_isMultiColorSections) },
+    { "setColor_sec01", "display/section1Color", QMetaType::QColor, int(AOGSetting::setColor_sec01) },
+    { "setColor_sec02", "display/section2Color", QMetaType::QColor, int(AOGSetting::setColor_sec02) },
+    { "setColor_sec03", "display/section3Color", QMetaType::QColor, int(AOGSetting::setColor_sec03) },
+    { "setColor_sec04", "display/section4Color", QMetaType::QColor, int(AOGSetting::setColor_sec04) },
+    { "setColor_sec05", "display/section5Color", QMetaType::QColor, int(AOGSetting::setColor_sec05) },
+    { "setColor_sec06", "display/section6Color", QMetaType::QColor, int(AOGSetting::setColor_sec06) },
+    { "setColor_sec07", "display/section7Color", QMetaType::QColor, int(AOGSetting::setColor_sec07) },
+    { "setColor_sec08", "display/section8Color", QMetaType::QColor, int(AOGSetting::setColor_sec08) },
+    { "setColor_sec09", "display/section9Color", QMetaType::QColor, int(AOGSetting::setColor_sec09) },
+    { "setColor_sec10", "display/section10Color", QMetaType::QColor, int(AOGSetting::setColor_sec10) },
+    { "setColor_sec11", "display/section11Color", QMetaType::QColor, int(AOGSetting::setColor_sec11) },
+    { "setColor_sec12", "display/section12Color", QMetaType::QColor, int(AOGSetting::setColor_sec12) },
+    { "setColor_sec13", "display/section13Color", QMetaType::QColor, int(AOGSetting::setColor_sec13) },
+    { "setColor_sec14", "display/section14Color", QMetaType::QColor, int(AOGSetting::setColor_sec14) },
+    { "setColor_sec15", "display/section15Color", QMetaType::QColor, int(AOGSetting::setColor_sec15) },
+    { "setColor_sec16", "display/section16Color", QMetaType::QColor, int(AOGSetting::setColor_sec16) },
+    { "setDisplay_brightness", "display/brightness", QMetaType::Int, int(AOGSetting::setDisplay_brightness) },
+    { "setDisplay_brightnessSystem", "display/brightnessSystem", QMetaType::Int, int(AOGSetting::setDisplay_brightnessSystem) },
+    { "setDisplay_buttonOrder", "display/buttonOrder", QMetaType::QString, int(AOGSetting::setDisplay_buttonOrder) },
+    { "setDisplay_camPitch", "display/camPitch", QMetaType::Double, int(AOGSetting::setDisplay_camPitch) },
+    { "setDisplay_camSmooth", "display/camSmooth", QMetaType::Int, int(AOGSetting::setDisplay_camSmooth) },
+    { "setDisplay_camZoom", "display/camZoom", QMetaType::Double, int(AOGSetting::setDisplay_camZoom) },
+    { "setDisplay_colorDayFrame", "display/colorDayFrame", QMetaType::QColor, int(AOGSetting::setDisplay_colorDayFrame) },
+    { "setDisplay_colorFieldDay", "display/colorFieldDay", QMetaType::QColor, int(AOGSetting::setDisplay_colorFieldDay) },
+    { "setDisplay_colorFieldNight", "display/colorFieldNight", QMetaType::QColor, int(AOGSetting::setDisplay_colorFieldNight) },
+    { "setDisplay_colorNightFrame", "display/colorNightFrame", QMetaType::QColor, int(AOGSetting::setDisplay_colorNightFrame) },
+    { "setDisplay_colorSectionsDay", "display/colorSectionsDay", QMetaType::QColor, int(AOGSetting::setDisplay_colorSectionsDay) },
+    { "setDisplay_colorSectionsNight", "display/colorSectionsNight", QMetaType::QColor, int(AOGSetting::setDisplay_colorSectionsNight) },
+    { "setDisplay_colorTextDay", "display/colorTextDay", QMetaType::QColor, int(AOGSetting::setDisplay_colorTextDay) },
+    { "setDisplay_colorTextNight", "display/colorTextNight", QMetaType::QColor, int(AOGSetting::setDisplay_colorTextNight) },
+    { "setDisplay_colorVehicle", "display/vehicleColor", QMetaType::QColor, int(AOGSetting::setDisplay_colorVehicle) },
+    { "setDisplay_customColors", "display/customColors", QMetaType::QString, int(AOGSetting::setDisplay_customColors) },
+    { "setDisplay_customSectionColors", "display/customSectionColors", QMetaType::QString, int(AOGSetting::setDisplay_customSectionColors) },
+    { "setDisplay_isAutoDayNight", "display/autoDayNight", QMetaType::Bool, int(AOGSetting::setDisplay_isAutoDayNight) },
+    { "setDisplay_isAutoStartAgIO", "display/autoStartAgIO", QMetaType::Bool, int(AOGSetting::setDisplay_isAutoStartAgIO) },
+    { "setDisplay_isBrightnessOn", "display/brightnessOn", QMetaType::Bool, int(AOGSetting::setDisplay_isBrightnessOn) },
+    { "setDisplay_isDayMode", "display/dayMode", QMetaType::Bool, int(AOGSetting::setDisplay_isDayMode) },
+    { "setDisplay_isKeyboardOn", "display/keyboard", QMetaType::Bool, int(AOGSetting::setDisplay_isKeyboardOn) },
+    { "setDisplay_isLogElevation", "display/isLogElevation", QMetaType::Bool, int(AOGSetting::setDisplay_isLogElevation) },
+    { "setDisplay_isStartFullScreen", "display/startFullscreen", QMetaType::Bool, int(AOGSetting::setDisplay_isStartFullScreen) },
+    { "setDisplay_isSvennArrowOn", "display/svennArrow", QMetaType::Bool, int(AOGSetting::setDisplay_isSvennArrowOn) },
+    { "setDisplay_isTermsAccepted", "display/terms", QMetaType::Bool, int(AOGSetting::setDisplay_isTermsAccepted) },
+    { "setDisplay_isTextureOn", "display/texture", QMetaType::Bool, int(AOGSetting::setDisplay_isTextureOn) },
+    { "setDisplay_isVehicleImage", "display/isVehicleImage", QMetaType::Bool, int(AOGSetting::setDisplay_isVehicleImage) },
+    { "setDisplay_lightbarCmPerPixel", "display/lightbarCMPerPixel", QMetaType::Int, int(AOGSetting::setDisplay_lightbarCmPerPixel) },
+    { "setDisplay_lineWidth", "display/lineWidth", QMetaType::Int, int(AOGSetting::setDisplay_lineWidth) },
+    { "setDisplay_panelSimLocation", "display/simLocation", QMetaType::QPoint, int(AOGSetting::setDisplay_panelSimLocation) },
+    { "setDisplay_topTrackNum", "display/topTrackNum", QMetaType::Bool, int(AOGSetting::setDisplay_topTrackNum) },
+    { "setDisplay_triangleResolution", "display/triangleResolution", QMetaType::Double, int(AOGSetting::setDisplay_triangleResolution) },
+    { "setDisplay_useTrackZero", "display/useTrackZero", QMetaType::Bool, int(AOGSetting::setDisplay_useTrackZero) },
+    { "setDisplay_vehicleOpacity", "display/vehicleOpacity", QMetaType::Int, int(AOGSetting::setDisplay_vehicleOpacity) },
+    { "setF_CurrentDir", "display/currentDir", QMetaType::QString, int(AOGSetting::setF_CurrentDir) },
+    { "setF_UserTotalArea", "display/userTotalArea", QMetaType::Double, int(AOGSetting::setF_UserTotalArea) },
+    { "setF_boundaryTriggerDistance", "autosteer/boundaryTriggerDistance", QMetaType::Double, int(AOGSetting::setF_boundaryTriggerDistance) },
+    { "setF_culture", "display/culture", QMetaType::QString, int(AOGSetting::setF_culture) },
+    { "setF_isRemoteWorkSystemOn", "tool/isRemoteWorkSystemOn", QMetaType::Bool, int(AOGSetting::setF_isRemoteWorkSystemOn) },
+    { "setF_isSteerWorkSwitchEnabled", "tool/isSteerWorkSwitchEnabled", QMetaType::Bool, int(AOGSetting::setF_isSteerWorkSwitchEnabled) },
+    { "setF_isSteerWorkSwitchManualSections", "tool/isWorkSwitchManualSections", QMetaType::Bool, int(AOGSetting::setF_isSteerWorkSwitchManualSections) },
+    { "setF_isWorkSwitchActiveLow", "tool/isWorkSwitchActiveLow", QMetaType::Bool, int(AOGSetting::setF_isWorkSwitchActiveLow) },
+    { "setF_isWorkSwitchEnabled", "tool/isWorkSwitchEnabled", QMetaType::Bool, int(AOGSetting::setF_isWorkSwitchEnabled) },
+    { "setF_isWorkSwitchManualSections", "tool/isWorkSwitchManual", QMetaType::Bool, int(AOGSetting::setF_isWorkSwitchManualSections) },
+    { "setF_minHeadingStepDistance", "gps/minHeadingStepDistance", QMetaType::Double, int(AOGSetting::setF_minHeadingStepDistance) },
+    { "setF_workingDirectory", "display/workingDir", QMetaType::QString, int(AOGSetting::setF_workingDirectory) },
+    { "setFeature_isABLineOn", "displayFeatures/isABLineOn", QMetaType::Bool, int(AOGSetting::setFeature_isABLineOn) },
+    { "setFeature_isABSmoothOn", "displayFeatures/isABSmoothOn", QMetaType::Bool, int(AOGSetting::setFeature_isABSmoothOn) },
+    { "setFeature_isAgIOOn", "displayFeatures/isAgIOOn", QMetaType::Bool, int(AOGSetting::setFeature_isAgIOOn) },
+    { "setFeature_isAutoSectionOn", "displayFeatures/isAutoSectionOn", QMetaType::Bool, int(AOGSetting::setFeature_isAutoSectionOn) },
+    { "setFeature_isAutoSteerOn", "displayFeatures/isAutoSteerOn", QMetaType::Bool, int(AOGSetting::setFeature_isAutoSteerOn) },
+    { "setFeature_isBndContourOn", "displayFeatures/isBndContourOn", QMetaType::Bool, int(AOGSetting::setFeature_isBndContourOn) },
+    { "setFeature_isBoundaryOn", "displayFeatures/isBoundaryOn", QMetaType::Bool, int(AOGSetting::setFeature_isBoundaryOn) },
+    { "setFeature_isContourOn", "displayFeatures/isContourOn", QMetaType::Bool, int(AOGSetting::setFeature_isContourOn) },
+    { "setFeature_isCurveOn", "displayFeatures/isCurveOn", QMetaType::Bool, int(AOGSetting::setFeature_isCurveOn) },
+    { "setFeature_isCycleLinesOn", "displayFeatures/isCycleLinesOn", QMetaType::Bool, int(AOGSetting::setFeature_isCycleLinesOn) },
+    { "setFeature_isHeadlandOn", "displayFeatures/isHeadlandOn", QMetaType::Bool, int(AOGSetting::setFeature_isHeadlandOn) },
+    { "setFeature_isHideContourOn", "displayFeatures/isHideContourOn", QMetaType::Bool, int(AOGSetting::setFeature_isHideContourOn) },
+    { "setFeature_isLateralOn", "displayFeatures/isLateralOn", QMetaType::Bool, int(AOGSetting::setFeature_isLateralOn) },
+    { "setFeature_isManualSectionOn", "displayFeatures/isManualSectionOn", QMetaType::Bool, int(AOGSetting::setFeature_isManualSectionOn) },
+    { "setFeature_isOffsetFixOn", "displayFeatures/isOffsetFixOn", QMetaType::Bool, int(AOGSetting::setFeature_isOffsetFixOn) },
+    { "setFeature_isRecPathOn", "displayFeatures/isRecPathOn", QMetaType::Bool, int(AOGSetting::setFeature_isRecPathOn) },
+    { "setFeature_isSteerModeOn", "displayFeatures/isSteerModeOn", QMetaType::Bool, int(AOGSetting::setFeature_isSteerModeOn) },
+    { "setFeature_isTramOn", "displayFeatures/isTramOn", QMetaType::Bool, int(AOGSetting::setFeature_isTramOn) },
+    { "setFeature_isUTurnOn", "displayFeatures/isUTurnOn", QMetaType::Bool, int(AOGSetting::setFeature_isUTurnOn) },
+    { "setFeature_isWebCamOn", "displayFeatures/isWebCamOn", QMetaType::Bool, int(AOGSetting::setFeature_isWebCamOn) },
+    { "setFeature_isYouTurnOn", "displayFeatures/isYouTurnOn", QMetaType::Bool, int(AOGSetting::setFeature_isYouTurnOn) },
+    { "setFeatures", "display/features", QMetaType::QString, int(AOGSetting::setFeatures) },
+    { "setGPS_SimLatitude", "sim/latitude", QMetaType::Double, int(AOGSetting::setGPS_SimLatitude) },
+    { "setGPS_SimLongitude", "sim/longitude", QMetaType::Double, int(AOGSetting::setGPS_SimLongitude) },
+    { "setGPS_ageAlarm", "gps/ageAlarm", QMetaType::Int, int(AOGSetting::setGPS_ageAlarm) },
+    { "setGPS_dualHeadingOffset", "gps/dualHeadingOffset", QMetaType::Double, int(AOGSetting::setGPS_dualHeadingOffset) },
+    { "setGPS_dualReverseDetectionDistance", "gps/dualReverseDetectionDistance", QMetaType::Double, int(AOGSetting::setGPS_dualReverseDetectionDistance) },
+    { "setGPS_fixFromWhichSentence", "gps/fixFromWhichSentence", QMetaType::QString, int(AOGSetting::setGPS_fixFromWhichSentence) },
+    { "setGPS_forwardComp", "gps/forwardComp", QMetaType::Double, int(AOGSetting::setGPS_forwardComp) },
+    { "setGPS_headingFromWhichSource", "gps/headingFromWhichSource", QMetaType::QString, int(AOGSetting::setGPS_headingFromWhichSource) },
+    { "setGPS_isRTK", "gps/isRTK", QMetaType::Bool, int(AOGSetting::setGPS_isRTK) },
+    { "setGPS_isRTK_KillAutoSteer", "gps/RTKKillAutoSteer", QMetaType::Bool, int(AOGSetting::setGPS_isRTK_KillAutoSteer) },
+    { "setGPS_minimumStepLimit", "gps/minimumStepLimit", QMetaType::Double, int(AOGSetting::setGPS_minimumStepLimit) },
+    { "setGPS_reverseComp", "gps/reverseComp", QMetaType::Double, int(AOGSetting::setGPS_reverseComp) },
+    { "setGPS_udpWatchMsec", "gps/udpWatchMS", QMetaType::Int, int(AOGSetting::setGPS_udpWatchMsec) },
+    { "setHeadland_isSectionControlled", "todo/headlandIsSectionControlled", QMetaType::Bool, int(AOGSetting::setHeadland_isSectionControlled) },
+    { "setIMU_fusionWeight2", "gps/IMUFusionWeight2", QMetaType::Double, int(AOGSetting::setIMU_fusionWeight2) },
+    { "setIMU_invertRoll", "gps/IMUInvertRoll", QMetaType::Bool, int(AOGSetting::setIMU_invertRoll) },
+    { "setIMU_isDualAsIMU", "gps/dualAsIMU", QMetaType::Bool, int(AOGSetting::setIMU_isDualAsIMU) },
+    { "setIMU_isHeadingCorrectionFromAutoSteer", "gps/isHeadingCorrectionFromAutoSteer", QMetaType::QString, int(AOGSetting::setIMU_isHeadingCorrectionFromAutoSteer) },
+    { "setIMU_isReverseOn", "gps/revereOn", QMetaType::Bool, int(AOGSetting::setIMU_isReverseOn) },
+    { "setIMU_pitchZeroX16", "gps/IMUPitchZeroX16", QMetaType::Int, int(AOGSetting::setIMU_pitchZeroX16) },
+    { "setIMU_rollFilter", "gps/IMURollFilter", QMetaType::Double, int(AOGSetting::setIMU_rollFilter) },
+    { "setIMU_rollZero", "gps/IMURollZeroX16", QMetaType::Double, int(AOGSetting::setIMU_rollZero) },
+    { "setJobMenu_location", "display/jobMenuLocation", QMetaType::QPoint, int(AOGSetting::setJobMenu_location) },
+    { "setJobMenu_size", "display/jobMenuSize", QMetaType::QString, int(AOGSetting::setJobMenu_size) },
+    { "setKey_hotkeys", "display/hotKeys", QMetaType::QString, int(AOGSetting::setKey_hotkeys) },
+    { "setMenu_isCompassOn", "display/isCompassOn", QMetaType::Bool, int(AOGSetting::setMenu_isCompassOn) },
+    { "setMenu_isGridOn", "display/showGrid", QMetaType::Bool, int(AOGSetting::setMenu_isGridOn) },
+    { "setMenu_isLightbarOn", "display/isLightBarOn", QMetaType::Bool, int(AOGSetting::setMenu_isLightbarOn) },
+    { "setMenu_isMetric", "display/isMetric", QMetaType::Bool, int(AOGSetting::setMenu_isMetric) },
+    { "setMenu_isOGLZoomOn", "display/oglZoom", QMetaType::Int, int(AOGSetting::setMenu_isOGLZoomOn) },
+    { "setMenu_isPureOn", "display/isPureOn", QMetaType::Bool, int(AOGSetting::setMenu_isPureOn) },
+    { "setMenu_isSideGuideLines", "display/isSideGuideLines", QMetaType::Bool, int(AOGSetting::setMenu_isSideGuideLines) },
+    { "setMenu_isSimulatorOn", "sim/on", QMetaType::Bool, int(AOGSetting::setMenu_isSimulatorOn) },
+    { "setMenu_isSkyOn", "display/isSkyOn", QMetaType::Bool, int(AOGSetting::setMenu_isSkyOn) },
+    { "setMenu_isSpeedoOn", "display/isSpeedOn", QMetaType::Bool, int(AOGSetting::setMenu_isSpeedoOn) },
+    { "setRelay_pinConfig", "todo/relayPinConfig", QMetaType::QVariantList, int(AOGSetting::setRelay_pinConfig) },
+    { "setSection_isFast", "tool/sectionIsFast", QMetaType::Bool, int(AOGSetting::setSection_isFast) },
+    { "setSection_position1", "tool/sectionposition1", QMetaType::Double, int(AOGSetting::setSection_position1) },
+    { "setSection_position10", "tool/sectionposition10", QMetaType::Double, int(AOGSetting::setSection_position10) },
+    { "setSection_position11", "tool/sectionposition11", QMetaType::Double, int(AOGSetting::setSection_position11) },
+    { "setSection_position12", "tool/sectionposition12", QMetaType::Double, int(AOGSetting::setSection_position12) },
+    { "setSection_position13", "tool/sectionposition13", QMetaType::Double, int(AOGSetting::setSection_position13) },
+    { "setSection_position14", "tool/sectionposition14", QMetaType::Double, int(AOGSetting::setSection_position14) },
+    { "setSection_position15", "tool/sectionposition15", QMetaType::Double, int(AOGSetting::setSection_position15) },
+    { "setSection_position16", "tool/sectionposition16", QMetaType::Double, int(AOGSetting::setSection_position16) },
+    { "setSection_position17", "tool/sectionposition17", QMetaType::Double, int(AOGSetting::setSection_position17) },
+    { "setSection_position2", "tool/sectionposition2", QMetaType::Double, int(AOGSetting::setSection_position2) },
+    { "setSection_position3", "tool/sectionposition3", QMetaType::Double, int(AOGSetting::setSection_position3) },
+    { "setSection_position4", "tool/sectionposition4", QMetaType::Double, int(AOGSetting::setSection_position4) },
+    { "setSection_position5", "tool/sectionposition5", QMetaType::Double, int(AOGSetting::setSection_position5) },
+    { "setSection_position6", "tool/sectionposition6", QMetaType::Double, int(AOGSetting::setSection_position6) },
+    { "setSection_position7", "tool/sectionposition7", QMetaType::Double, int(AOGSetting::setSection_position7) },
+    { "setSection_position8", "tool/sectionposition8", QMetaType::Double, int(AOGSetting::setSection_position8) },
+    { "setSection_position9", "tool/sectionposition9", QMetaType::Double, int(AOGSetting::setSection_position9) },
+    { "setSound_isAutoSteerOn", "display/autoSteerSound", QMetaType::Bool, int(AOGSetting::setSound_isAutoSteerOn) },
+    { "setSound_isHydLiftOn", "display/soundHydLift", QMetaType::Bool, int(AOGSetting::setSound_isHydLiftOn) },
+    { "setSound_isSectionsOn", "display/soundIsSectionOn", QMetaType::Bool, int(AOGSetting::setSound_isSectionsOn) },
+    { "setSound_isUturnOn", "display/soundUturn", QMetaType::Bool, int(AOGSetting::setSound_isUturnOn) },
+    { "setTool_defaultSectionWidth", "tool/defaultSectionWidth", QMetaType::Double, int(AOGSetting::setTool_defaultSectionWidth) },
+    { "setTool_isDisplayTramControl", "display/showTramControl", QMetaType::Bool, int(AOGSetting::setTool_isDisplayTramControl) },
+    { "setTool_isSectionOffWhenOut", "tool/isSectionOffWhenOut", QMetaType::Bool, int(AOGSetting::setTool_isSectionOffWhenOut) },
+    { "setTool_isSectionsNotZones", "tool/sectionsNotZones", QMetaType::Bool, int(AOGSetting::setTool_isSectionsNotZones) },
+    { "setTool_isToolFront", "tool/isFront", QMetaType::Bool, int(AOGSetting::setTool_isToolFront) },
+    { "setTool_isToolRearFixed", "tool/rearFixed", QMetaType::Bool, int(AOGSetting::setTool_isToolRearFixed) },
+    { "setTool_isToolTBT", "tool/isTBT", QMetaType::Bool, int(AOGSetting::setTool_isToolTBT) },
+    { "setTool_isToolTrailing", "tool/isTrailing", QMetaType::Bool, int(AOGSetting::setTool_isToolTrailing) },
+    { "setTool_isTramOuterInverted", "tool/isTramOuterInverted", QMetaType::Bool, int(AOGSetting::setTool_isTramOuterInverted) },
+    { "setTool_numSectionsMulti", "tool/numSectionsMulti", QMetaType::Int, int(AOGSetting::setTool_numSectionsMulti) },
+    { "setTool_sectionWidthMulti", "tool/sectionWidthMulti", QMetaType::Double, int(AOGSetting::setTool_sectionWidthMulti) },
+    { "setTool_toolTrailingHitchLength", "tool/trailingHitchLength", QMetaType::Double, int(AOGSetting::setTool_toolTrailingHitchLength) },
+    { "setTool_trailingToolToPivotLength", "tool/trailingToPivotLength", QMetaType::Double, int(AOGSetting::setTool_trailingToolToPivotLength) },
+    { "setTool_zones", "tool/zones", QMetaType::QVariantList, int(AOGSetting::setTool_zones) },
+    { "setTram_BasedOn", "tram/basedOn", QMetaType::Int, int(AOGSetting::setTram_BasedOn) },
+    { "setTram_Skips", "tram/skips", QMetaType::Int, int(AOGSetting::setTram_Skips) },
+    { "setTram_isTramOnBackBuffer", "tram/tramOnBackBuffer", QMetaType::Bool, int(AOGSetting::setTram_isTramOnBackBuffer) },
+    { "setTram_offset", "tram/offset", QMetaType::Double, int(AOGSetting::setTram_offset) },
+    { "setTram_passes", "tram/passes", QMetaType::Int, int(AOGSetting::setTram_passes) },
+    { "setTram_snapAdj", "tram/swapAdj", QMetaType::Double, int(AOGSetting::setTram_snapAdj) },
+    { "setTram_tramWidth", "tram/width", QMetaType::Double, int(AOGSetting::setTram_tramWidth) },
+    { "setVehicle_antennaHeight", "vehicle/antennaHeight", QMetaType::Double, int(AOGSetting::setVehicle_antennaHeight) },
+    { "setVehicle_antennaOffset", "vehicle/antennaOffset", QMetaType::Double, int(AOGSetting::setVehicle_antennaOffset) },
+    { "setVehicle_antennaPivot", "vehicle/antennaPivot", QMetaType::Double, int(AOGSetting::setVehicle_antennaPivot) },
+    { "setVehicle_goalPointLookAhead", "vehicle/goalPointLookAhead", QMetaType::Double, int(AOGSetting::setVehicle_goalPointLookAhead) },
+    { "setVehicle_goalPointLookAheadHold", "vehicle/goalPointLookAheadHold", QMetaType::Double, int(AOGSetting::setVehicle_goalPointLookAheadHold) },
+    { "setVehicle_goalPointLookAheadMult", "vehicle/goalPointLookAheadMult", QMetaType::Double, int(AOGSetting::setVehicle_goalPointLookAheadMult) },
+    { "setVehicle_hitchLength", "vehicle/hitchLength", QMetaType::Double, int(AOGSetting::setVehicle_hitchLength) },
+    { "setVehicle_hydraulicLiftLookAhead", "vehicle/hydraulicLiftLookAhead", QMetaType::Double, int(AOGSetting::setVehicle_hydraulicLiftLookAhead) },
+    { "setVehicle_isMachineControlToAutoSteer", "vehicle/isMachineControlToAutoSteer", QMetaType::Bool, int(AOGSetting::setVehicle_isMachineControlToAutoSteer) },
+    { "setVehicle_isPivotBehindAntenna", "vehicle/isPivotBehindAntenna", QMetaType::Bool, int(AOGSetting::setVehicle_isPivotBehindAntenna) },
+    { "setVehicle_isStanleyUsed", "vehicle/isStanlyUsed", QMetaType::Bool, int(AOGSetting::setVehicle_isStanleyUsed) },
+    { "setVehicle_isSteerAxleAhead", "vehicle/isSteerAxleAhead", QMetaType::Bool, int(AOGSetting::setVehicle_isSteerAxleAhead) },
+    { "setVehicle_lookAheadMinimum", "vehicle/lookAheadMinimum", QMetaType::Double, int(AOGSetting::setVehicle_lookAheadMinimum) },
+    { "setVehicle_maxAngularVelocity", "vehicle/maxAngularVelocity", QMetaType::Double, int(AOGSetting::setVehicle_maxAngularVelocity) },
+    { "setVehicle_maxSteerAngle", "vehicle/maxSteerAngle", QMetaType::Double, int(AOGSetting::setVehicle_maxSteerAngle) },
+    { "setVehicle_minCoverage", "vehicle/minCoverage", QMetaType::Int, int(AOGSetting::setVehicle_minCoverage) },
+    { "setVehicle_minTurningRadius", "vehicle/minTurningRadius", QMetaType::Double, int(AOGSetting::setVehicle_minTurningRadius) },
+    { "setVehicle_numSections", "tool/numSections", QMetaType::Int, int(AOGSetting::setVehicle_numSections) },
+    { "setVehicle_panicStopSpeed", "vehicle/panicStopSpeed", QMetaType::Double, int(AOGSetting::setVehicle_panicStopSpeed) },
+    { "setVehicle_slowSpeedCutoff", "vehicle/slowSpeedCutoff", QMetaType::Double, int(AOGSetting::setVehicle_slowSpeedCutoff) },
+    { "setVehicle_tankTrailingHitchLength", "tool/tankTrailingHitchLength", QMetaType::Double, int(AOGSetting::setVehicle_tankTrailingHitchLength) },
+    { "setVehicle_toolLookAheadOff", "tool/lookAheadOff", QMetaType::Double, int(AOGSetting::setVehicle_toolLookAheadOff) },
+    { "setVehicle_toolLookAheadOn", "tool/lookAheadOn", QMetaType::Double, int(AOGSetting::setVehicle_toolLookAheadOn) },
+    { "setVehicle_toolOffDelay", "tool/offDelay", QMetaType::Double, int(AOGSetting::setVehicle_toolOffDelay) },
+    { "setVehicle_toolOffset", "tool/offset", QMetaType::Double, int(AOGSetting::setVehicle_toolOffset) },
+    { "setVehicle_toolOverlap", "tool/overlap", QMetaType::Double, int(AOGSetting::setVehicle_toolOverlap) },
+    { "setVehicle_toolWidth", "tool/width", QMetaType::Double, int(AOGSetting::setVehicle_toolWidth) },
+    { "setVehicle_trackWidth", "vehicle/trackWidth", QMetaType::Double, int(AOGSetting::setVehicle_trackWidth) },
+    { "setVehicle_vehicleName", "vehicle/name", QMetaType::QString, int(AOGSetting::setVehicle_vehicleName) },
+    { "setVehicle_vehicleType", "vehicle/type", QMetaType::Int, int(AOGSetting::setVehicle_vehicleType) },
+    { "setVehicle_wheelbase", "vehicle/wheelbase", QMetaType::Double, int(AOGSetting::setVehicle_wheelbase) },
+    { "setWindow_BingMapSize", "dialogs/bingMapSize", QMetaType::QString, int(AOGSetting::setWindow_BingMapSize) },
+    { "setWindow_BingZoom", "dialogs/bingZoom", QMetaType::Int, int(AOGSetting::setWindow_BingZoom) },
+    { "setWindow_HeadAcheSize", "dialogs/headAcheSize", QMetaType::QString, int(AOGSetting::setWindow_HeadAcheSize) },
+    { "setWindow_HeadlineSize", "dialogs/headlineSize", QMetaType::QString, int(AOGSetting::setWindow_HeadlineSize) },
+    { "setWindow_Location", "display/windowLocation", QMetaType::QPoint, int(AOGSetting::setWindow_Location) },
+    { "setWindow_MapBndSize", "dialogs/mapBndSize", QMetaType::QString, int(AOGSetting::setWindow_MapBndSize) },
+    { "setWindow_Maximized", "display/maximized", QMetaType::Bool, int(AOGSetting::setWindow_Maximized) },
+    { "setWindow_Minimized", "display/minimized", QMetaType::Bool, int(AOGSetting::setWindow_Minimized) },
+    { "setWindow_QuickABLocation", "dialogs/quickABLocation", QMetaType::QPoint, int(AOGSetting::setWindow_QuickABLocation) },
+    { "setWindow_RateMapSize", "dialogs/rateMapSize", QMetaType::QString, int(AOGSetting::setWindow_RateMapSize) },
+    { "setWindow_RateMapZoom", "dialogs/rateMapZoom", QMetaType::Int, int(AOGSetting::setWindow_RateMapZoom) },
+    { "setWindow_Size", "display/windowSize", QMetaType::QString, int(AOGSetting::setWindow_Size) },
+    { "setWindow_abDrawSize", "dialogs/abDrawSize", QMetaType::QString, int(AOGSetting::setWindow_abDrawSize) },
+    { "setWindow_buildTracksLocation", "dialogs/tracksLocation", QMetaType::QPoint, int(AOGSetting::setWindow_buildTracksLocation) },
+    { "setWindow_formNudgeLocation", "dialogs/nudgeLocation", QMetaType::QPoint, int(AOGSetting::setWindow_formNudgeLocation) },
+    { "setWindow_formNudgeSize", "autosteer/nudgeSize", QMetaType::QString, int(AOGSetting::setWindow_formNudgeSize) },
+    { "setWindow_steerSettingsLocation", "display/steerSettingsLocation", QMetaType::QPoint, int(AOGSetting::setWindow_steerSettingsLocation) },
+    { "set_uTurnStyle", "uturn/style", QMetaType::Int, int(AOGSetting::set_uTurnStyle) },
+    { "set_youMoveDistance", "todo/youMoveDistance", QMetaType::Double, int(AOGSetting::set_youMoveDistance) },
+    { "set_youSkipWidth", "uturn/skipWidth", QMetaType::Int, int(AOGSetting::set_youSkipWidth) },
+    { "set_youToolWidths", "yturn/toolWidths", QMetaType::Double, int(AOGSetting::set_youToolWidths) },
+    { "set_youTurnDistanceFromBoundary", "uturn/distanceFromBoundary", QMetaType::Double, int(AOGSetting::set_youTurnDistanceFromBoundary) },
+    { "set_youTurnExtensionLength", "uturn/extensionLength", QMetaType::Int, int(AOGSetting::set_youTurnExtensionLength) },
+    { "set_youTurnRadius", "uturn/radius", QMetaType::Double, int(AOGSetting::set_youTurnRadius) },
+    { "stanleyDistanceErrorGain", "vehicle/stanleyDistanceErrorGain", QMetaType::Double, int(AOGSetting::stanleyDistanceErrorGain) },
+    { "stanleyHeadingErrorGain", "vehicle/stanleyHeadingErrorGain", QMetaType::Double, int(AOGSetting::stanleyHeadingErrorGain) },
+    { "stanleyIntegralDistanceAwayTriggerAB", "vehicle/stanleyIntegralDistanceAwayTriggerAB", QMetaType::Double, int(AOGSetting::stanleyIntegralDistanceAwayTriggerAB) },
+    { "stanleyIntegralGainAB", "vehicle/stanleyIntegralGainAB", QMetaType::Double, int(AOGSetting::stanleyIntegralGainAB) },
+};
+
+const int QMLSettings::key_count = 266;
+
+const int QMLSettings::key_of_setting[AOGSettingCount] = {
+    242, // setWindow_Location
+    249, // setWindow_Size
+    244, // setWindow_Maximized
+    245, // setWindow_Minimized
+    91, // setDisplay_triangleResolution
+    156, // setMenu_isMetric
+    154, // setMenu_isGridOn
+    155, // setMenu_isLightbarOn
+    94, // setF_CurrentDir
+    102, // setF_isWorkSwitchEnabled
+    147, // setIMU_pitchZeroX16
+    149, // setIMU_rollZero
+    104, // setF_minHeadingStepDistance
+    14, // setAS_lowSteerPWM
+    23, // setAS_wasOffset
+    95, // setF_UserTotalArea
+    16, // setAS_minSteerPWM
+    96, // setF_boundaryTriggerDistance
+    10, // setAS_highSteerPWM
+    159, // setMenu_isSideGuideLines
+    7, // setAS_countsPerDegree
+    158, // setMenu_isPureOn
+    160, // setMenu_isSimulatorOn
+    161, // setMenu_isSkyOn
+    97, // setF_culture
+    105, // setF_workingDirectory
+    87, // setDisplay_lightbarCmPerPixel
+    133, // setGPS_fixFromWhichSentence
+    135, // setGPS_headingFromWhichSource
+    128, // setGPS_SimLatitude
+    129, // setGPS_SimLongitude
+    19, // setAS_snapDistance
+    103, // setF_isWorkSwitchManualSections
+    11, // setAS_isAutoSteerAutoOn
+    88, // setDisplay_lineWidth
+    89, // setDisplay_panelSimLocation
+    206, // setTram_tramWidth
+    205, // setTram_snapAdj
+    204, // setTram_passes
+    203, // setTram_offset
+    157, // setMenu_isOGLZoomOn
+    153, // setMenu_isCompassOn
+    162, // setMenu_isSpeedoOn
+    65, // setDisplay_colorDayFrame
+    68, // setDisplay_colorNightFrame
+    69, // setDisplay_colorSectionsDay
+    66, // setDisplay_colorFieldDay
+    79, // setDisplay_isDayMode
+    70, // setDisplay_colorSectionsNight
+    67, // setDisplay_colorFieldNight
+    76, // setDisplay_isAutoDayNight
+    74, // setDisplay_customColors
+    84, // setDisplay_isTermsAccepted
+    136, // setGPS_isRTK
+    82, // setDisplay_isStartFullScreen
+    80, // setDisplay_isKeyboardOn
+    148, // setIMU_rollFilter
+    22, // setAS_uTurnSmoothing
+    143, // setIMU_invertRoll
+    6, // setAS_ackerman
+    101, // setF_isWorkSwitchActiveLow
+    2, // setAS_Kp
+    185, // setSound_isUturnOn
+    183, // setSound_isHydLiftOn
+    72, // setDisplay_colorTextNight
+    71, // setDisplay_colorTextDay
+    202, // setTram_isTramOnBackBuffer
+    64, // setDisplay_camZoom
+    73, // setDisplay_colorVehicle
+    93, // setDisplay_vehicleOpacity
+    86, // setDisplay_isVehicleImage
+    145, // setIMU_isHeadingCorrectionFromAutoSteer
+    85, // setDisplay_isTextureOn
+    1, // setAB_lineLength
+    140, // setGPS_udpWatchMsec
+    100, // setF_isSteerWorkSwitchManualSections
+    12, // setAS_isConstantContourOn
+    9, // setAS_guidanceLookAheadTime
+    127, // setFeatures
+    144, // setIMU_isDualAsIMU
+    18, // setAS_sideHillComp
+    146, // setIMU_isReverseOn
+    134, // setGPS_forwardComp
+    139, // setGPS_reverseComp
+    130, // setGPS_ageAlarm
+    137, // setGPS_isRTK_KillAutoSteer
+    43, // setColor_sec01
+    44, // setColor_sec02
+    45, // setColor_sec03
+    46, // setColor_sec04
+    47, // setColor_sec05
+    48, // setColor_sec06
+    49, // setColor_sec07
+    50, // setColor_sec08
+    51, // setColor_sec09
+    52, // setColor_sec10
+    53, // setColor_sec11
+    54, // setColor_sec12
+    55, // setColor_sec13
+    56, // setColor_sec14
+    57, // setColor_sec15
+    58, // setColor_sec16
+    42, // setColor_isMultiColorSections
+    75, // setDisplay_customSectionColors
+    40, // setBrand_TBrand
+    141, // setHeadland_isSectionControlled
+    182, // setSound_isAutoSteerOn
+    163, // setRelay_pinConfig
+    63, // setDisplay_camSmooth
+    131, // setGPS_dualHeadingOffset
+    99, // setF_isSteerWorkSwitchEnabled
+    98, // setF_isRemoteWorkSystemOn
+    77, // setDisplay_isAutoStartAgIO
+    5, // setAS_ModeXTE
+    4, // setAS_ModeTime
+    233, // setVehicle_toolWidth
+    232, // setVehicle_toolOverlap
+    197, // setTool_toolTrailingHitchLength
+    224, // setVehicle_numSections
+    165, // setSection_position1
+    174, // setSection_position2
+    175, // setSection_position3
+    176, // setSection_position4
+    177, // setSection_position5
+    178, // setSection_position6
+    179, // setSection_position7
+    180, // setSection_position8
+    181, // setSection_position9
+    166, // setSection_position10
+    167, // setSection_position11
+    168, // setSection_position12
+    169, // setSection_position13
+    170, // setSection_position14
+    171, // setSection_position15
+    172, // setSection_position16
+    173, // setSection_position17
+    0, // purePursuitIntegralGainAB
+    256, // set_youMoveDistance
+    207, // setVehicle_antennaHeight
+    229, // setVehicle_toolLookAheadOn
+    193, // setTool_isToolTrailing
+    231, // setVehicle_toolOffset
+    191, // setTool_isToolRearFixed
+    209, // setVehicle_antennaPivot
+    237, // setVehicle_wheelbase
+    213, // setVehicle_hitchLength
+    228, // setVehicle_toolLookAheadOff
+    216, // setVehicle_isPivotBehindAntenna
+    218, // setVehicle_isSteerAxleAhead
+    235, // setVehicle_vehicleName
+    226, // setVehicle_slowSpeedCutoff
+    227, // setVehicle_tankTrailingHitchLength
+    222, // setVehicle_minCoverage
+    210, // setVehicle_goalPointLookAhead
+    220, // setVehicle_maxAngularVelocity
+    221, // setVehicle_maxSteerAngle
+    260, // set_youTurnExtensionLength
+    258, // set_youToolWidths
+    223, // setVehicle_minTurningRadius
+    208, // setVehicle_antennaOffset
+    259, // set_youTurnDistanceFromBoundary
+    219, // setVehicle_lookAheadMinimum
+    212, // setVehicle_goalPointLookAheadMult
+    262, // stanleyDistanceErrorGain
+    263, // stanleyHeadingErrorGain
+    217, // setVehicle_isStanleyUsed
+    200, // setTram_BasedOn
+    201, // setTram_Skips
+    192, // setTool_isToolTBT
+    236, // setVehicle_vehicleType
+    257, // set_youSkipWidth
+    37, // setArdSteer_setting1
+    35, // setArdSteer_minSpeed
+    34, // setArdSteer_maxSpeed
+    36, // setArdSteer_setting0
+    214, // setVehicle_hydraulicLiftLookAhead
+    215, // setVehicle_isMachineControlToAutoSteer
+    33, // setArdSteer_maxPulseCounts
+    25, // setArdMac_hydRaiseTime
+    24, // setArdMac_hydLowerTime
+    27, // setArdMac_isHydEnabled
+    186, // setTool_defaultSectionWidth
+    230, // setVehicle_toolOffDelay
+    28, // setArdMac_setting0
+    38, // setArdSteer_setting2
+    264, // stanleyIntegralDistanceAwayTriggerAB
+    190, // setTool_isToolFront
+    234, // setVehicle_trackWidth
+    26, // setArdMac_isDanfoss
+    265, // stanleyIntegralGainAB
+    164, // setSection_isFast
+    29, // setArdMac_user1
+    30, // setArdMac_user2
+    31, // setArdMac_user3
+    32, // setArdMac_user4
+    225, // setVehicle_panicStopSpeed
+    3, // setAS_ModeMultiplierStanley
+    59, // setDisplay_brightness
+    261, // set_youTurnRadius
+    60, // setDisplay_brightnessSystem
+    189, // setTool_isSectionsNotZones
+    195, // setTool_numSectionsMulti
+    199, // setTool_zones
+    196, // setTool_sectionWidthMulti
+    78, // setDisplay_isBrightnessOn
+    152, // setKey_hotkeys
+    211, // setVehicle_goalPointLookAheadHold
+    188, // setTool_isSectionOffWhenOut
+    255, // set_uTurnStyle
+    138, // setGPS_minimumStepLimit
+    13, // setAS_isSteerInReverse
+    8, // setAS_functionSpeedLimit
+    15, // setAS_maxSteerSpeed
+    17, // setAS_minSteerSpeed
+    39, // setBrand_HBrand
+    41, // setBrand_WDBrand
+    142, // setIMU_fusionWeight2
+    83, // setDisplay_isSvennArrowOn
+    194, // setTool_isTramOuterInverted
+    150, // setJobMenu_location
+    151, // setJobMenu_size
+    254, // setWindow_steerSettingsLocation
+    251, // setWindow_buildTracksLocation
+    198, // setTool_trailingToolToPivotLength
+    252, // setWindow_formNudgeLocation
+    253, // setWindow_formNudgeSize
+    20, // setAS_snapDistanceRef
+    61, // setDisplay_buttonOrder
+    62, // setDisplay_camPitch
+    250, // setWindow_abDrawSize
+    241, // setWindow_HeadlineSize
+    240, // setWindow_HeadAcheSize
+    243, // setWindow_MapBndSize
+    238, // setWindow_BingMapSize
+    239, // setWindow_BingZoom
+    247, // setWindow_RateMapSize
+    248, // setWindow_RateMapZoom
+    246, // setWindow_QuickABLocation
+    81, // setDisplay_isLogElevation
+    184, // setSound_isSectionsOn
+    132, // setGPS_dualReverseDetectionDistance
+    187, // setTool_isDisplayTramControl
+    21, // setAS_uTurnCompensation
+    116, // setFeature_isHeadlandOn
+    123, // setFeature_isTramOn
+    112, // setFeature_isBoundaryOn
+    111, // setFeature_isBndContourOn
+    121, // setFeature_isRecPathOn
+    107, // setFeature_isABSmoothOn
+    117, // setFeature_isHideContourOn
+    125, // setFeature_isWebCamOn
+    120, // setFeature_isOffsetFixOn
+    108, // setFeature_isAgIOOn
+    113, // setFeature_isContourOn
+    126, // setFeature_isYouTurnOn
+    122, // setFeature_isSteerModeOn
+    119, // setFeature_isManualSectionOn
+    109, // setFeature_isAutoSectionOn
+    115, // setFeature_isCycleLinesOn
+    106, // setFeature_isABLineOn
+    114, // setFeature_isCurveOn
+    110, // setFeature_isAutoSteerOn
+    124, // setFeature_isUTurnOn
+    118, // setFeature_isLateralOn
+    -1, // displayShowBack
+    -1, // displayAntiAliasSamples
+    92, // setDisplay_useTrackZero
+    90, // setDisplay_topTrackNum
+    -1, // setDisplay_colorDayBackground
+    -1, // setDisplay_colorNightBackground
+    -1, // setDisplay_colorDayBorder
+    -1, // setDisplay_colorNightBorder
+};
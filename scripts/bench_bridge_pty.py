@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Benchmark do GPS Bridge sem o M10Fly
+Um pseudo-terminal (pty) faz o papel da serial: o benchmark escreve épocas
+NMEA válidas (GGA, VTG, RMC, GSA, HDT com checksum) no lado mestre, roda o
+gps_bridge.py apontado para o lado escravo e recebe o UDP num socket local.
+
+Para cada taxa (10, 20, 50 e 100 Hz por padrão) informa:
+    sentenças/s recebidas, perdas, latência serial -> UDP (p50/p99/máx em µs)
+    e CPU% do processo do bridge durante a medição.
+
+Cada sentença gerada tem um campo que identifica a época (hora UTC, rumo,
+PDOP...), então a latência é medida por sentença, do write no pty até o
+recvfrom, no mesmo relógio (perf_counter_ns).
+
+Uso:
+    python3 bench_bridge_pty.py [--rates 10 20 50 100] [--duration 10]
+                                [--json resultado.json] [--baseline antes.json]
+                                [-- argumentos extras do gps_bridge.py]
+
+Exemplo (fusão de épocas, um $PAOGI por época):
+    python3 bench_bridge_pty.py --json fusao.json -- --fuse-epochs
+
+Jitter com a CPU ocupada (--load N: N processos em laço ocupado durante a
+medição, como o renderizador do QtAgOpenGPS no Pi), sem e com o modo tempo
+real:
+    python3 bench_bridge_pty.py --load 4 --json normal.json
+    python3 bench_bridge_pty.py --load 4 --baseline normal.json -- --realtime
+
+Autor: Configuração QtAgOpenGPS
+"""
+
+import argparse
+import json
+import os
+import platform
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import tty
+
+import nmea_bytes
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BRIDGE_SCRIPT = os.path.join(SCRIPT_DIR, 'gps_bridge.py')
+
+# Chaves únicas por época (ver epoch_sentences) se repetem depois disso
+MAX_EPOCHS = 3600
+
+WARMUP_TIMEOUT = 15.0   # tempo para o bridge abrir a serial e o UDP
+DRAIN_TIME = 0.5        # espera pelas últimas sentenças após a medição
+
+# Sentenças fundidas pelo bridge (--fuse-epochs) e a sentença de origem
+# que carrega a mesma hora UTC
+FUSED_TYPES = {b'PANDA': b'GGA', b'PAOGI': b'GGA'}
+
+
+def epoch_sentences(seq):
+    """Sentenças de uma época e a chave (tipo, campo) que identifica cada uma"""
+    utc = "%02d%02d%05.2f" % (12 + seq // 360000, (seq // 6000) % 60, (seq % 6000) / 100.0)
+    course = "%05.1f" % ((seq % 3600) / 10.0)
+    pdop = "%.2f" % (1 + (seq % 10000) / 100.0)
+    heading = "%.3f" % ((seq % 360000) / 1000.0)
+    bodies = (
+        (b'GGA', utc, "GNGGA,%s,4807.0380123,N,01131.0000456,E,4,12,0.9,545.4,M,46.9,M,1.0,0000" % utc),
+        (b'VTG', course, "GNVTG,%s,T,034.4,M,005.5,N,010.2,K,A" % course),
+        (b'RMC', utc, "GNRMC,%s,A,4807.0380123,N,01131.0000456,E,5.5,54.7,230394,003.1,W,A" % utc),
+        (b'GSA', pdop, "GNGSA,A,3,04,05,,09,12,,,24,,,,,%s,1.3,2.1" % pdop),
+        (b'HDT', heading, "GNHDT,%s,T" % heading),
+    )
+    keys = []
+    sentences = []
+    for sentence_type, key, body in bodies:
+        keys.append((sentence_type, key.encode('ascii')))
+        sentences.append(nmea_bytes.build_sentence(body.encode('ascii')))
+    return keys, b"".join(sentences)
+
+
+def sentence_key(data):
+    """Chave (tipo, campo) de um datagrama recebido, no formato de epoch_sentences"""
+    star = data.rfind(b"*")
+    fields = data[1:star if star != -1 else len(data)].split(b",")
+    address = fields[0]
+    if address in FUSED_TYPES:
+        return FUSED_TYPES[address], fields[1]
+    sentence_type = address[2:5]
+    try:
+        if sentence_type in (b'GGA', b'RMC', b'VTG', b'HDT'):
+            return sentence_type, fields[1]
+        if sentence_type == b'GSA':
+            return sentence_type, fields[15]
+    except IndexError:
+        pass
+    return None
+
+
+def percentiles(samples_ns):
+    """p50/p99/máximo em µs (mesma regra do GPSBridge.latency_summary)"""
+    if not samples_ns:
+        return None
+    samples = sorted(samples_ns)
+    count = len(samples)
+    return {
+        'p50': samples[count // 2] / 1000.0,
+        'p99': samples[min(count - 1, (count * 99) // 100)] / 1000.0,
+        'max': samples[-1] / 1000.0,
+    }
+
+
+class CpuLoad:
+    """Gerador de carga sintética: processos em laço ocupado"""
+
+    def __init__(self, processes):
+        self.processes = processes
+        self.children = []
+
+    def start(self):
+        for _ in range(self.processes):
+            self.children.append(subprocess.Popen([sys.executable, '-c', 'while True: pass']))
+
+    def stop(self):
+        for child in self.children:
+            child.kill()
+        for child in self.children:
+            child.wait()
+        self.children = []
+
+
+def process_cpu_seconds(pid):
+    """Tempo de CPU (usuário + sistema) do processo, via /proc; None fora do Linux"""
+    try:
+        with open(f'/proc/{pid}/stat', 'rb') as stat:
+            fields = stat.read().rsplit(b')', 1)[1].split()
+    except OSError:
+        return None
+    # Campos 14 e 15 do stat (utime, stime), contados após "(comm)"
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+class UdpCapture:
+    """Recebe os datagramas do bridge numa thread, com o instante de chegada"""
+
+    def __init__(self, host='127.0.0.1'):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        self.socket.bind((host, 0))
+        self.socket.settimeout(0.2)
+        self.port = self.socket.getsockname()[1]
+        self.packets = []
+        self.lock = threading.Lock()
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while self.running:
+            try:
+                data = self.socket.recv(2048)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            arrival_ns = time.perf_counter_ns()
+            with self.lock:
+                self.packets.append((arrival_ns, data))
+
+    def take(self):
+        """Retirar os datagramas recebidos até agora"""
+        with self.lock:
+            packets = self.packets
+            self.packets = []
+        return packets
+
+    def close(self):
+        self.running = False
+        self.thread.join()
+        self.socket.close()
+
+
+class PtyBenchmark:
+    """Uma rodada do bridge por taxa, alimentado por um pty"""
+
+    def __init__(self, duration, bridge_args, load=0):
+        self.duration = duration
+        self.bridge_args = bridge_args
+        self.load = CpuLoad(load)
+        self.fused = '--fuse-epochs' in bridge_args
+        self.seq = 0
+
+    def write_epoch(self, master, sent):
+        keys, block = epoch_sentences(self.seq)
+        self.seq += 1
+        write_ns = time.perf_counter_ns()
+        os.write(master, block)
+        for key in keys:
+            sent[key] = write_ns
+
+    def start_bridge(self, device, udp_port):
+        # GSA repassada em toda época: a medição confere cada sentença gerada
+        command = [sys.executable, BRIDGE_SCRIPT, '--device', device,
+                   '--udp-port', str(udp_port), '--no-state', '--filter', 'GSA=pass'] + self.bridge_args
+        return subprocess.Popen(command, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, cwd=SCRIPT_DIR)
+
+    def stop_bridge(self, process):
+        process.send_signal(signal.SIGINT)
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def warm_up(self, master, capture, process):
+        """Escrever épocas a 10 Hz até o bridge começar a repassar"""
+        deadline = time.monotonic() + WARMUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"gps_bridge.py terminou (código {process.returncode})")
+            self.write_epoch(master, {})
+            time.sleep(0.1)
+            if capture.take():
+                time.sleep(DRAIN_TIME)
+                capture.take()
+                return
+        raise RuntimeError("gps_bridge.py não repassou nenhuma sentença")
+
+    def run_rate(self, rate_hz):
+        epochs = int(self.duration * rate_hz)
+        if epochs > MAX_EPOCHS:
+            raise ValueError(f"{rate_hz} Hz x {self.duration} s passa de {MAX_EPOCHS} épocas")
+
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        capture = UdpCapture()
+        process = self.start_bridge(os.ttyname(slave), capture.port)
+        try:
+            self.warm_up(master, capture, process)
+            self.seq = 0
+
+            sent = {}
+            period = 1.0 / rate_hz
+            self.load.start()
+            cpu_start = process_cpu_seconds(process.pid)
+            wall_start = time.perf_counter()
+            for i in range(epochs):
+                delay = wall_start + i * period - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                self.write_epoch(master, sent)
+            wall = time.perf_counter() - wall_start
+            cpu_end = process_cpu_seconds(process.pid)
+            time.sleep(DRAIN_TIME)
+            packets = capture.take()
+        finally:
+            self.load.stop()
+            self.stop_bridge(process)
+            capture.close()
+            os.close(master)
+            os.close(slave)
+
+        expected = epochs if self.fused else len(sent)
+        latencies = []
+        unmatched = 0
+        for arrival_ns, data in packets:
+            write_ns = sent.get(sentence_key(data))
+            if write_ns is None:
+                unmatched += 1
+            else:
+                latencies.append(arrival_ns - write_ns)
+
+        cpu_percent = None
+        if cpu_start is not None and cpu_end is not None:
+            cpu_percent = 100.0 * (cpu_end - cpu_start) / wall
+
+        return {
+            'rate_hz': rate_hz,
+            'epochs': epochs,
+            'sentences_sent': len(sent),
+            'expected': expected,
+            'received': len(latencies),
+            'unmatched': unmatched,
+            'drops': max(expected - len(latencies), 0),
+            'sentences_per_s': len(latencies) / wall,
+            'latency_us': percentiles(latencies),
+            'cpu_percent': cpu_percent,
+        }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=SCRIPT_DIR,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def format_result(result):
+    latency = result['latency_us']
+    latency_text = ("%8.0f %8.0f %8.0f" % (latency['p50'], latency['p99'], latency['max'])
+                    if latency else "%8s %8s %8s" % ('-', '-', '-'))
+    cpu = result['cpu_percent']
+    return "%5d Hz %9.1f %7d %s %6s" % (
+        result['rate_hz'], result['sentences_per_s'], result['drops'], latency_text,
+        "%.1f" % cpu if cpu is not None else "n/d")
+
+
+def compare(results, baseline_path):
+    """Mostrar a variação de p99 e CPU em relação a um resultado anterior"""
+    with open(baseline_path) as baseline_file:
+        baseline = {item['rate_hz']: item for item in json.load(baseline_file)['results']}
+
+    print(f"\nComparação com {baseline_path}:")
+    for result in results:
+        before = baseline.get(result['rate_hz'])
+        if before is None:
+            continue
+        parts = []
+        if result['latency_us'] and before['latency_us']:
+            parts.append("p99 %+.0f µs" % (result['latency_us']['p99'] - before['latency_us']['p99']))
+        if result['cpu_percent'] is not None and before['cpu_percent'] is not None:
+            parts.append("CPU %+.1f%%" % (result['cpu_percent'] - before['cpu_percent']))
+        parts.append("perdas %+d" % (result['drops'] - before['drops']))
+        print(f"{result['rate_hz']:5d} Hz: " + ", ".join(parts))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark do GPS Bridge com um pty no lugar da serial',
+        epilog='Argumentos após "--" são repassados ao gps_bridge.py')
+    parser.add_argument('--rates', type=int, nargs='+', default=[10, 20, 50, 100],
+                        help='taxas de época em Hz')
+    parser.add_argument('--duration', type=float, default=10.0, help='segundos de medição por taxa')
+    parser.add_argument('--json', metavar='ARQUIVO', help='gravar os resultados em JSON')
+    parser.add_argument('--baseline', metavar='ARQUIVO', help='JSON de uma rodada anterior para comparar')
+    parser.add_argument('--load', type=int, default=0, metavar='N',
+                        help='processos de carga sintética (laço ocupado) durante a medição')
+    parser.add_argument('bridge_args', nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    bridge_args = args.bridge_args
+    if bridge_args and bridge_args[0] == '--':
+        bridge_args = bridge_args[1:]
+
+    benchmark = PtyBenchmark(args.duration, bridge_args, args.load)
+
+    print(f"=== Benchmark GPS Bridge (pty -> UDP), {args.duration:g} s por taxa ===")
+    if bridge_args:
+        print(f"Argumentos do bridge: {' '.join(bridge_args)}")
+    if args.load:
+        print(f"Carga sintética: {args.load} processos em laço ocupado "
+              f"({os.cpu_count()} núcleos)")
+    print("   taxa  sent./s  perdas  p50(µs)  p99(µs)  máx(µs)   CPU%")
+
+    results = []
+    for rate_hz in args.rates:
+        try:
+            result = benchmark.run_rate(rate_hz)
+        except (RuntimeError, ValueError) as e:
+            print(f"❌ {rate_hz} Hz: {e}")
+            sys.exit(1)
+        results.append(result)
+        print(format_result(result))
+
+    if args.json:
+        report = {
+            'revision': git_revision(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'machine': platform.machine(),
+            'python': platform.python_version(),
+            'duration_s': args.duration,
+            'load_processes': args.load,
+            'bridge_args': bridge_args,
+            'results': results,
+        }
+        with open(args.json, 'w') as json_file:
+            json.dump(report, json_file, indent=2)
+        print(f"💾 Resultados gravados em {args.json}")
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark do caminho quente NMEA do GPS Bridge
+Compara o caminho antigo em str (decode, strip, checksum com ord() por
+caractere, filtro, encode) com o caminho em bytes/memoryview (checksum por
+dobra de inteiro, classificação em posição fixa, memoryview até o sendto).
+
+O resultado é dado em sentenças/s por núcleo (tempo de CPU do processo),
+que é o que importa quando o bridge divide o Pi 4 com o QtAgOpenGPS.
+
+Uso:
+    python3 bench_nmea_hotpath.py [--epochs N] [--no-send]
+
+Autor: Configuração QtAgOpenGPS
+"""
+
+import argparse
+import logging
+import socket
+import time
+
+import nmea_bytes
+import sentence_filter
+from gps_bridge import GPSBridge
+
+
+def make_block(epochs):
+    """Gerar um bloco de bytes como o lido da serial: GGA+VTG+RMC+GSA+HDT
+    por época, com checksums corretos"""
+    lines = []
+    for i in range(epochs):
+        utc = "%02d%02d%05.2f" % (12, (i // 600) % 60, (i / 10.0) % 60)
+        for body in (
+            "GNGGA,%s,4807.0380123,N,01131.0000456,E,4,12,0.9,545.4,M,46.9,M,1.0,0000" % utc,
+            "GNVTG,054.7,T,034.4,M,005.5,N,010.2,K,A",
+            "GNRMC,%s,A,4807.0380123,N,01131.0000456,E,5.5,54.7,230394,003.1,W,A" % utc,
+            "GNGSA,A,3,04,05,,09,12,,,24,,,,,2.5,1.3,2.1",
+            "GNHDT,123.456,T",
+        ):
+            lines.append(nmea_bytes.build_sentence(body.encode('ascii')))
+    return b"".join(lines)
+
+
+def legacy_path(bridge, block, send):
+    """Caminho antigo: uma str por linha, do decode até o encode do envio"""
+    sent = 0
+    for raw_data in block.splitlines(keepends=True):
+        sentence = raw_data.decode('ascii', errors='ignore').strip()
+        if not sentence:
+            continue
+        processed_sentence = bridge.process_nmea_sentence(sentence)
+        if processed_sentence:
+            if not processed_sentence.endswith('\n'):
+                processed_sentence += '\n'
+            send(processed_sentence.encode('ascii'))
+            sent += 1
+    return sent
+
+
+def bytes_path(bridge, block, send):
+    """Caminho novo: índices sobre o bloco e memoryview até o sendto"""
+    sent = 0
+    view = memoryview(block)
+    start = 0
+    end = block.find(b"\n")
+    while end != -1:
+        data = bridge.filter_sentence(block, start, end + 1, view)
+        if data is not None:
+            send(data)
+            sent += 1
+        start = end + 1
+        end = block.find(b"\n", start)
+    return sent
+
+
+def run(name, path, bridge, block, send, repeat):
+    lines = block.count(b"\n")
+    best = None
+    for _ in range(repeat):
+        cpu_start = time.process_time()
+        path(bridge, block, send)
+        cpu = time.process_time() - cpu_start
+        best = cpu if best is None else min(best, cpu)
+    rate = lines / best if best > 0 else float('inf')
+    print(f"{name:>8}: {rate:12,.0f} sentenças/s por núcleo  ({best * 1e6 / lines:.2f} µs/sentença)")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-benchmark do caminho quente NMEA')
+    parser.add_argument('--epochs', type=int, default=2000, help='épocas (5 sentenças cada) por rodada')
+    parser.add_argument('--repeat', type=int, default=5, help='rodadas; vale a melhor')
+    parser.add_argument('--no-send', action='store_true', help='não chamar sendto (só processamento)')
+    args = parser.parse_args()
+
+    bridge = GPSBridge()
+    bridge.logger.setLevel(logging.ERROR)
+    # Sem dizimação: os dois caminhos repassam as mesmas sentenças
+    bridge.sentence_filter = sentence_filter.SentenceFilter(
+        dict(sentence_filter.DEFAULT_RULES, GSA=sentence_filter.PASS))
+
+    if args.no_send:
+        def send(data):
+            pass
+    else:
+        # Um socket local que ninguém lê: o kernel descarta os datagramas
+        # excedentes, mas o custo do sendto é medido
+        sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sink.bind(('127.0.0.1', 0))
+        address = sink.getsockname()
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+        def send(data):
+            sender.sendto(data, address)
+
+    block = make_block(args.epochs)
+    assert legacy_path(bridge, block, lambda data: None) == bytes_path(bridge, block, lambda data: None)
+
+    lines = block.count(b"\n")
+    print(f"=== Caminho quente NMEA: {lines} sentenças, "
+          f"{'sem' if args.no_send else 'com'} sendto ===")
+    before = run("antes", legacy_path, bridge, block, send, args.repeat)
+    after = run("depois", bytes_path, bridge, block, send, args.repeat)
+    print(f"Ganho: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,685 @@
+#!/usr/bin/env python3
+"""
+Motor asyncio do GPS Bridge
+Lê várias fontes ao mesmo tempo (serial, UDP, TCP, pty) e distribui cada
+sentença aceita para vários destinos (QtAgIO, arquivo de log, segundo
+display, cliente TCP) sem que um destino lento atrase os outros.
+
+Cada destino tem sua própria fila limitada: quando a fila enche, a sentença
+mais antiga é descartada (drop-oldest), pois para o piloto automático só a
+posição mais recente importa.
+
+Autor: Configuração QtAgOpenGPS
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import os
+import signal
+import socket
+import time
+import tty
+from collections import deque
+
+import serial
+
+import dual_antenna
+import nmea_bytes
+import ubx
+
+
+class LineAssembler:
+    """Buffer de remontagem: recebe blocos de bytes e devolve linhas completas"""
+
+    def __init__(self, max_line_length=512):
+        self.buffer = b""
+        self.max_line_length = max_line_length
+
+    def feed(self, chunk):
+        """Adicionar bytes e retornar a lista de linhas completas (com '\\n')"""
+        buffer = self.buffer + chunk
+        lines = []
+        start = 0
+        end = buffer.find(b"\n")
+        while end != -1:
+            lines.append(buffer[start:end + 1])
+            start = end + 1
+            end = buffer.find(b"\n", start)
+        buffer = buffer[start:]
+
+        # Lixo sem terminador não pode crescer indefinidamente
+        if len(buffer) > self.max_line_length:
+            buffer = b""
+        self.buffer = buffer
+        return lines
+
+
+# ---------------------------------------------------------------------------
+# Destinos (sinks)
+# ---------------------------------------------------------------------------
+
+class Sink:
+    """Destino com fila limitada e política drop-oldest"""
+
+    def __init__(self, name, queue_size=256):
+        self.name = name
+        self.queue = deque(maxlen=queue_size)
+        self.wakeup = asyncio.Event()
+        self.sent = 0
+        self.dropped = 0
+        self.errors = 0
+        # Chamado com o instante de chegada de cada sentença efetivamente
+        # enviada (usado para medir a latência até o QtAgIO)
+        self.latency_hook = None
+
+    def put(self, data, arrival_ns):
+        """Enfileirar sem nunca bloquear o leitor"""
+        if len(self.queue) == self.queue.maxlen:
+            self.dropped += 1  # deque(maxlen) descarta o mais antigo
+        self.queue.append((data, arrival_ns))
+        self.wakeup.set()
+
+    async def run(self, logger):
+        """Laço de escrita: esvazia a fila sempre que houver dados"""
+        await self.open()
+        try:
+            while True:
+                await self.wakeup.wait()
+                self.wakeup.clear()
+                while self.queue:
+                    data, arrival_ns = self.queue.popleft()
+                    try:
+                        if not await self.write(data):
+                            continue  # descartado pelo destino (já contado)
+                        self.sent += 1
+                        if self.latency_hook:
+                            self.latency_hook(arrival_ns)
+                    except (OSError, ConnectionError) as e:
+                        self.errors += 1
+                        logger.warning(f"Destino {self.name}: erro ao enviar: {e}")
+                        await self.recover()
+        finally:
+            self.close()
+
+    async def open(self):
+        pass
+
+    async def write(self, data):
+        """Enviar data; retorna False se o destino descartou a sentença"""
+        raise NotImplementedError
+
+    async def recover(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class UdpSink(Sink):
+    """Envio por datagrama UDP (ex.: QtAgIO em 127.0.0.1:9999)"""
+
+    def __init__(self, host, port, queue_size=256):
+        super().__init__(f"udp:{host}:{port}", queue_size)
+        self.address = (host, port)
+        self.sock = None
+
+    async def open(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+
+    async def write(self, data):
+        # sendto em socket UDP não bloqueia na prática; se o buffer do
+        # kernel estiver cheio o datagrama é perdido, como na versão serial
+        try:
+            self.sock.sendto(data, self.address)
+        except BlockingIOError:
+            self.dropped += 1
+            return False
+        return True
+
+    def close(self):
+        if self.sock:
+            self.sock.close()
+
+
+class TcpClientSink(Sink):
+    """Conexão TCP de saída, com reconexão automática"""
+
+    def __init__(self, host, port, queue_size=256):
+        super().__init__(f"tcp:{host}:{port}", queue_size)
+        self.host = host
+        self.port = port
+        self.writer = None
+
+    async def connect(self):
+        while self.writer is None:
+            try:
+                _, self.writer = await asyncio.open_connection(self.host, self.port)
+            except OSError:
+                await asyncio.sleep(2)
+
+    async def open(self):
+        await self.connect()
+
+    async def write(self, data):
+        if self.writer is None:
+            await self.connect()
+        self.writer.write(data)
+        await self.writer.drain()
+        return True
+
+    async def recover(self):
+        self.close()
+        self.writer = None
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+
+
+class TcpServerSink(Sink):
+    """Servidor TCP: cada cliente conectado recebe todas as sentenças e tem
+    sua própria fila, para que um cliente lento não atrase os demais"""
+
+    def __init__(self, host, port, queue_size=256):
+        super().__init__(f"tcp-server:{host}:{port}", queue_size)
+        self.host = host
+        self.port = port
+        self.queue_size = queue_size
+        self.clients = set()
+        self.server = None
+
+    def put(self, data, arrival_ns):
+        for client in self.clients:
+            client.put(data, arrival_ns)
+
+    async def run(self, logger):
+        async def handle_client(reader, writer):
+            client = _StreamClientSink(writer, self.queue_size, self)
+            self.clients.add(client)
+            logger.info(f"Destino {self.name}: cliente {client.name} conectado")
+            try:
+                await client.run(logger)
+            except (asyncio.CancelledError, ConnectionError):
+                pass
+            finally:
+                self.clients.discard(client)
+                logger.info(f"Destino {self.name}: cliente {client.name} desconectado")
+
+        self.server = await asyncio.start_server(handle_client, self.host, self.port)
+        async with self.server:
+            await self.server.serve_forever()
+
+
+class _StreamClientSink(Sink):
+    """Um cliente aceito pelo TcpServerSink"""
+
+    def __init__(self, writer, queue_size, server):
+        peer = writer.get_extra_info('peername')
+        super().__init__(f"{peer[0]}:{peer[1]}" if peer else "?", queue_size)
+        self.writer = writer
+        self.server = server
+
+    def put(self, data, arrival_ns):
+        if len(self.queue) == self.queue.maxlen:
+            self.server.dropped += 1
+        super().put(data, arrival_ns)
+
+    async def write(self, data):
+        self.writer.write(data)
+        await self.writer.drain()
+        self.server.sent += 1
+        return True
+
+    async def recover(self):
+        # Cliente caiu: encerra o laço deste cliente
+        raise ConnectionError("cliente desconectado")
+
+    def close(self):
+        self.writer.close()
+
+
+class FileSink(Sink):
+    """Gravação das sentenças em arquivo (log bruto). O write/flush do
+    arquivo pode travar no disco (cartão SD), então roda numa thread
+    própria; o laço só espera por ela nesta tarefa, atrás da fila
+    drop-oldest, e as demais saídas seguem normalmente."""
+
+    def __init__(self, path, queue_size=1024):
+        super().__init__(f"file:{path}", queue_size)
+        self.path = path
+        self.file = None
+        # Uma thread só: as escritas saem na ordem da fila
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="file-sink")
+
+    async def open(self):
+        loop = asyncio.get_running_loop()
+        self.file = await loop.run_in_executor(
+            self.executor, functools.partial(open, self.path, 'ab', buffering=64 * 1024))
+
+    async def write(self, data):
+        loop = asyncio.get_running_loop()
+        # Flush só quando a fila esvaziar (fim da rajada da época)
+        await loop.run_in_executor(self.executor, self.write_blocking,
+                                   bytes(data), not self.queue)
+        return True
+
+    def write_blocking(self, data, flush):
+        self.file.write(data)
+        if flush:
+            self.file.flush()
+
+    def close(self):
+        # Depois das escritas pendentes, na mesma thread
+        if self.file:
+            self.executor.submit(self.file.close)
+            self.file = None
+        self.executor.shutdown(wait=False)
+
+
+# ---------------------------------------------------------------------------
+# Fontes (sources)
+# ---------------------------------------------------------------------------
+
+class Source:
+    """Fonte de bytes; entrega linhas completas ao motor"""
+
+    def __init__(self, name):
+        self.name = name
+        self.bytes_received = 0
+        self.input_format = "nmea"
+
+    def new_decoder(self):
+        """Decodificador do fluxo: linhas NMEA ou UBX-NAV-PVT -> $PANDA"""
+        if self.input_format == "ubx":
+            return ubx.NavPvtToPanda()
+        return LineAssembler()
+
+    async def run(self, engine):
+        raise NotImplementedError
+
+
+class FdSource(Source):
+    """Fonte baseada em descritor de arquivo (serial, pty), lida com
+    loop.add_reader: o laço acorda assim que chegam bytes"""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.decoder = None
+        self.closed = None
+
+    def open_fd(self):
+        raise NotImplementedError
+
+    def close_fd(self):
+        pass
+
+    async def run(self, engine):
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                fd = self.open_fd()
+            except (OSError, serial.SerialException) as e:
+                engine.logger.error(f"Fonte {self.name}: erro ao abrir: {e}")
+                await asyncio.sleep(2)
+                continue
+
+            if isinstance(self, SerialSource):
+                engine.bridge.metrics.serial_fd = fd
+                engine.bridge.metrics.baud_rate = self.baud_rate
+            if self is engine.rtcm_source:
+                engine.bridge.rtcm_injector.attach(self.serial_conn)
+            self.decoder = self.new_decoder()
+            self.closed = loop.create_future()
+            loop.add_reader(fd, self.on_readable, fd, engine)
+            try:
+                await self.closed
+            finally:
+                loop.remove_reader(fd)
+                if self is engine.rtcm_source:
+                    engine.bridge.rtcm_injector.attach(None)
+                self.close_fd()
+            engine.logger.warning(f"Fonte {self.name}: fechada, reabrindo...")
+            await asyncio.sleep(1)
+
+    def on_readable(self, fd, engine):
+        arrival_ns = time.perf_counter_ns()
+        try:
+            chunk = os.read(fd, 4096)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            chunk = b""
+            engine.logger.error(f"Fonte {self.name}: erro de leitura: {e}")
+
+        if not chunk:
+            if not self.closed.done():
+                self.closed.set_result(None)
+            return
+
+        self.bytes_received += len(chunk)
+        if isinstance(self, SerialSource):
+            engine.bridge.metrics.serial_bytes += len(chunk)
+        if len(chunk) >= 4096:
+            engine.bridge.metrics.full_reads += 1
+        if engine.capture_writer is not None:
+            engine.capture_writer.write(chunk, arrival_ns)
+        if engine.raw_archive is not None and isinstance(self, SerialSource):
+            engine.raw_archive.write(chunk)
+        for line in self.decoder.feed(chunk):
+            engine.dispatch(line, arrival_ns, self)
+        engine.after_epoch(arrival_ns)
+
+
+class SerialSource(FdSource):
+    """Porta serial (ex.: /dev/ttyAMA0 @ 115200)"""
+
+    def __init__(self, device, baud_rate=115200):
+        super().__init__(f"serial:{device}@{baud_rate}")
+        self.device = device
+        self.baud_rate = baud_rate
+        self.serial_conn = None
+
+    def open_fd(self):
+        self.serial_conn = serial.Serial(port=self.device, baudrate=self.baud_rate,
+                                         bytesize=serial.EIGHTBITS,
+                                         parity=serial.PARITY_NONE,
+                                         stopbits=serial.STOPBITS_ONE,
+                                         timeout=0, xonxoff=False,
+                                         rtscts=False, dsrdtr=False)
+        return self.serial_conn.fileno()
+
+    def close_fd(self):
+        if self.serial_conn:
+            self.serial_conn.close()
+            self.serial_conn = None
+
+
+class PtySource(FdSource):
+    """Pseudo-terminal: outro programa escreve NMEA no lado escravo como se
+    fosse uma porta serial. Opcionalmente cria um link simbólico estável."""
+
+    def __init__(self, link_path=None):
+        super().__init__(f"pty:{link_path or 'auto'}")
+        self.link_path = link_path
+        self.master_fd = None
+        self.slave_fd = None
+
+    def open_fd(self):
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.slave_fd)
+        os.set_blocking(self.master_fd, False)
+        slave_name = os.ttyname(self.slave_fd)
+        if self.link_path:
+            if os.path.islink(self.link_path):
+                os.unlink(self.link_path)
+            os.symlink(slave_name, self.link_path)
+        self.name = f"pty:{self.link_path or slave_name}"
+        return self.master_fd
+
+    def close_fd(self):
+        for fd in (self.master_fd, self.slave_fd):
+            if fd is not None:
+                os.close(fd)
+        self.master_fd = self.slave_fd = None
+        if self.link_path and os.path.islink(self.link_path):
+            os.unlink(self.link_path)
+
+
+class UdpSource(Source):
+    """Recebe NMEA por UDP (um ou mais sentenças por datagrama)"""
+
+    def __init__(self, host, port):
+        super().__init__(f"udp:{host}:{port}")
+        self.host = host
+        self.port = port
+
+    async def run(self, engine):
+        source = self
+        decoder = self.new_decoder()
+        nmea = self.input_format == "nmea"
+
+        class Protocol(asyncio.DatagramProtocol):
+            def datagram_received(self, data, addr):
+                arrival_ns = time.perf_counter_ns()
+                source.bytes_received += len(data)
+                if nmea and not data.endswith(b"\n"):
+                    data += b"\n"
+                for line in decoder.feed(data):
+                    engine.dispatch(line, arrival_ns, source)
+
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            Protocol, local_addr=(self.host, self.port))
+        try:
+            await asyncio.Future()
+        finally:
+            transport.close()
+
+
+class TcpSource(Source):
+    """Conecta a um servidor TCP de NMEA (ex.: outro bridge ou receptor
+    em rede), com reconexão automática"""
+
+    def __init__(self, host, port):
+        super().__init__(f"tcp:{host}:{port}")
+        self.host = host
+        self.port = port
+
+    async def run(self, engine):
+        while True:
+            try:
+                reader, writer = await asyncio.open_connection(self.host, self.port)
+            except OSError as e:
+                engine.logger.warning(f"Fonte {self.name}: falha ao conectar: {e}")
+                await asyncio.sleep(2)
+                continue
+
+            decoder = self.new_decoder()
+            try:
+                while True:
+                    chunk = await reader.read(4096)
+                    if not chunk:
+                        break
+                    arrival_ns = time.perf_counter_ns()
+                    self.bytes_received += len(chunk)
+                    for line in decoder.feed(chunk):
+                        engine.dispatch(line, arrival_ns, self)
+            except OSError as e:
+                engine.logger.warning(f"Fonte {self.name}: conexão perdida: {e}")
+            finally:
+                writer.close()
+            await asyncio.sleep(1)
+
+
+# ---------------------------------------------------------------------------
+# Especificações de linha de comando
+# ---------------------------------------------------------------------------
+
+def _host_port(spec, kind):
+    host, _, port = spec.rpartition(':')
+    if not host or not port.isdigit():
+        raise ValueError(f"especificação {kind} inválida: '{spec}' (esperado host:porta)")
+    return host, int(port)
+
+
+def parse_source(spec, default_baud=115200, input_format="nmea"):
+    """serial:/dev/ttyAMA0[@baud], udp:host:porta, tcp:host:porta, pty[:link]"""
+    kind, _, rest = spec.partition(':')
+    if kind == 'serial':
+        device, _, baud = rest.partition('@')
+        source = SerialSource(device, int(baud) if baud else default_baud)
+    elif kind == 'udp':
+        source = UdpSource(*_host_port(rest, kind))
+    elif kind == 'tcp':
+        source = TcpSource(*_host_port(rest, kind))
+    elif kind == 'pty':
+        source = PtySource(rest or None)
+    else:
+        raise ValueError(f"tipo de entrada desconhecido: '{spec}'")
+    source.input_format = input_format
+    return source
+
+
+def parse_sink(spec, queue_size=256):
+    """udp:host:porta, tcp:host:porta, tcp-server:host:porta, file:caminho"""
+    kind, _, rest = spec.partition(':')
+    if kind == 'udp':
+        return UdpSink(*_host_port(rest, kind), queue_size=queue_size)
+    if kind == 'tcp':
+        return TcpClientSink(*_host_port(rest, kind), queue_size=queue_size)
+    if kind == 'tcp-server':
+        return TcpServerSink(*_host_port(rest, kind), queue_size=queue_size)
+    if kind == 'file':
+        return FileSink(rest, queue_size=max(queue_size, 1024))
+    raise ValueError(f"tipo de saída desconhecido: '{spec}'")
+
+
+# ---------------------------------------------------------------------------
+# Motor
+# ---------------------------------------------------------------------------
+
+class BridgeEngine:
+    """Liga as fontes aos destinos usando o filtro/validação do GPSBridge"""
+
+    def __init__(self, bridge, sources, sinks, rtcm_source=None):
+        self.bridge = bridge
+        self.logger = bridge.logger
+        self.sources = sources
+        self.sinks = sinks
+        self.capture_writer = bridge.capture_writer
+        self.raw_archive = bridge.raw_archive
+        # Serial que recebe as correções RTCM do injetor do bridge
+        self.rtcm_source = rtcm_source if bridge.rtcm_injector is not None else None
+        self.stop_event = None
+        # Um evento por temporizador de época (fusão/antena dupla), ligado
+        # quando uma época começa; sem época pendente o temporizador dorme
+        self.epoch_events = {}
+        # Modo tempo real: coleta do GC entre épocas (ver realtime.py)
+        self.gc_collector = bridge.gc_collector if bridge.realtime else None
+
+        # Antena dupla: a primeira entrada é o receptor principal, a segunda
+        # o secundário; as demais seguem o caminho normal
+        self.dual_aligner = bridge.dual_aligner
+        self.dual_roles = {}
+        if self.dual_aligner is not None:
+            self.dual_roles = {sources[0]: dual_antenna.PRIMARY,
+                               sources[1]: dual_antenna.SECONDARY}
+
+    def dispatch(self, raw_line, arrival_ns, source=None):
+        """Validar/filtrar uma linha e distribuí-la para todos os destinos"""
+        bridge = self.bridge
+        end = len(raw_line)
+        if raw_line[0] in nmea_bytes.LINE_TERMINATORS:
+            return
+
+        bridge.sentences_received += 1
+        role = self.dual_roles.get(source)
+        if role is None:
+            lines = bridge.accept_line(raw_line, 0, end, memoryview(raw_line), arrival_ns)
+        else:
+            lines = self.accept_dual(raw_line, end, arrival_ns, role)
+        for data in lines:
+            self.fan_out(data, arrival_ns)
+
+        for assembler, event in self.epoch_events.items():
+            if not event.is_set() and assembler.deadline_ns() is not None:
+                event.set()
+
+        if bridge.sentences_received % 100 == 0:
+            bridge.print_statistics()
+            self.print_sink_statistics()
+
+    def fan_out(self, data, arrival_ns):
+        for sink in self.sinks:
+            sink.put(data, arrival_ns)
+        self.bridge.sentences_sent += 1
+        self.bridge.metrics.count_sent(bytes(data[1:6]))
+
+    def accept_dual(self, raw_line, end, arrival_ns, role):
+        """Antena dupla: os GGA dos dois receptores vão para o alinhador; do
+        secundário, nada mais segue para os destinos"""
+        aligner = self.dual_aligner
+        sentence_type = raw_line[3:6]
+        if role == dual_antenna.SECONDARY:
+            if sentence_type != b'GGA' or \
+               nmea_bytes.check_sentence(raw_line, 0, end) != nmea_bytes.CHECKSUM_OK:
+                return ()
+            return aligner.feed_secondary(raw_line, arrival_ns)
+
+        bridge = self.bridge
+        data = bridge.filter_sentence(raw_line, 0, end, memoryview(raw_line), arrival_ns)
+        if data is None:
+            return ()
+        bridge.observe_sentence(raw_line, 0, end, arrival_ns)
+        if sentence_type == b'GGA':
+            return aligner.feed_primary(bytes(data), arrival_ns)
+        if sentence_type in dual_antenna.SPEED_TYPES:
+            aligner.feed_speed(raw_line)
+            if aligner.output == 'paogi':
+                return ()  # a velocidade já vai no $PAOGI/$PANDA
+        return (data,)
+
+    async def epoch_timer(self, assembler):
+        """Emitir épocas pendentes cujo tempo limite expirou (fusão ou
+        antena dupla)"""
+        pending = asyncio.Event()
+        self.epoch_events[assembler] = pending
+        while True:
+            deadline_ns = assembler.deadline_ns()
+            if deadline_ns is None:
+                # Nenhuma época aberta: esperar a primeira sentença da próxima
+                pending.clear()
+                await pending.wait()
+                continue
+            delay = (deadline_ns - time.perf_counter_ns()) / 1e9
+            if delay > 0:
+                await asyncio.sleep(delay)
+            now_ns = time.perf_counter_ns()
+            for data in assembler.poll(now_ns):
+                self.fan_out(data, now_ns)
+            self.after_epoch(now_ns)
+
+    def after_epoch(self, now_ns):
+        """Uma época (ou um bloco lido) acabou de sair: no modo tempo real é
+        a hora da coleta do GC, antes da próxima rajada"""
+        if self.gc_collector is not None:
+            self.gc_collector.after_epoch(now_ns)
+
+    def print_sink_statistics(self):
+        for sink in self.sinks:
+            self.logger.info(f"   ↳ {sink.name}: enviadas={sink.sent}, "
+                             f"descartadas={sink.dropped}, fila={len(getattr(sink, 'queue', ()))}")
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        self.stop_event = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stop_event.set)
+
+        for source in self.sources:
+            self.logger.info(f"📥 Entrada: {source.name}")
+        for sink in self.sinks:
+            self.logger.info(f"📤 Saída: {sink.name}")
+            if isinstance(sink, UdpSink):
+                sink.latency_hook = self.bridge.record_latency
+
+        tasks = [asyncio.create_task(sink.run(self.logger)) for sink in self.sinks]
+        tasks += [asyncio.create_task(source.run(self)) for source in self.sources]
+        if self.bridge.epoch_assembler is not None:
+            tasks.append(asyncio.create_task(self.epoch_timer(self.bridge.epoch_assembler)))
+        if self.dual_aligner is not None:
+            tasks.append(asyncio.create_task(self.epoch_timer(self.dual_aligner)))
+
+        stop_task = asyncio.create_task(self.stop_event.wait())
+        done, _ = await asyncio.wait(tasks + [stop_task], return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task is not stop_task and task.exception():
+                self.logger.error(f"Tarefa encerrada com erro: {task.exception()}")
+
+        for task in tasks + [stop_task]:
+            task.cancel()
+        await asyncio.gather(*tasks, stop_task, return_exceptions=True)
+        self.logger.info("🛑 Motor asyncio parado")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Captura binária do fluxo bruto do receptor
+Grava os bytes exatamente como chegaram da serial, com o intervalo entre
+leituras, para reproduzir no bridge (e no QtAgIO) um dia de campo na bancada.
+
+Formato (little-endian, só acrescenta no fim do arquivo):
+    cabeçalho: b"GBCAP1\\n\\0" (8 bytes, só no início do arquivo)
+    registros: intervalo desde o registro anterior em µs (U4)
+               tamanho do bloco (U2)
+               bytes do bloco
+
+O primeiro registro de cada sessão de gravação tem intervalo 0, então
+várias gravações podem ser acrescentadas ao mesmo arquivo. Um registro
+incompleto no fim (queda de energia no meio da escrita) é ignorado.
+
+Autor: Configuração QtAgOpenGPS
+"""
+
+import mmap
+import os
+import struct
+
+MAGIC = b"GBCAP1\n\0"
+RECORD_HEADER = struct.Struct('<IH')
+MAX_CHUNK = 0xFFFF
+MAX_DELTA_US = 0xFFFFFFFF
+FLUSH_INTERVAL_NS = 1000000000
+
+
+class CaptureWriter:
+    """Gravação dos blocos lidos da serial"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'ab', buffering=64 * 1024)
+        if self.file.tell() == 0:
+            self.file.write(MAGIC)
+        self.last_ns = None
+        self.last_flush_ns = 0
+        self.records = 0
+        self.bytes_written = 0
+
+    def write(self, chunk, arrival_ns):
+        """Acrescentar um bloco com o instante de chegada (perf_counter_ns)"""
+        if self.last_ns is None:
+            delta_us = 0
+        else:
+            delta_us = min((arrival_ns - self.last_ns) // 1000, MAX_DELTA_US)
+        self.last_ns = arrival_ns
+
+        # Blocos maiores que o campo de tamanho são divididos
+        for offset in range(0, len(chunk), MAX_CHUNK):
+            part = chunk[offset:offset + MAX_CHUNK]
+            self.file.write(RECORD_HEADER.pack(delta_us, len(part)))
+            self.file.write(part)
+            delta_us = 0
+            self.records += 1
+            self.bytes_written += len(part)
+
+        # Perder no máximo ~1 s de dados numa queda de energia
+        if arrival_ns - self.last_flush_ns > FLUSH_INTERVAL_NS:
+            self.file.flush()
+            self.last_flush_ns = arrival_ns
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class CaptureReader:
+    """Leitura de uma captura via mmap; itera (intervalo em µs, bloco em bytes)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.map = None
+        self.file = open(path, 'rb')
+        size = os.fstat(self.file.fileno()).st_size
+        if size < len(MAGIC):
+            self.file.close()
+            raise ValueError(f"{path}: arquivo de captura vazio ou truncado")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: não é um arquivo de captura do GPS Bridge")
+
+    def __iter__(self):
+        data = self.map
+        size = len(data)
+        pos = len(MAGIC)
+        while pos + RECORD_HEADER.size <= size:
+            delta_us, length = RECORD_HEADER.unpack_from(data, pos)
+            pos += RECORD_HEADER.size
+            if pos + length > size:
+                break  # registro incompleto no fim do arquivo
+            yield delta_us, data[pos:pos + length]
+            pos += length
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
@@ -7,76 +7,90 @@ Autor: Configuração QtAgOpenGPS
 Compatível com: Quescan M10Fly, u-blox M10
 """
 
+import argparse
+import hashlib
+import json
 import serial
 import time
 import sys
 import logging
 
+import rate_meter
+import serial_probe
+import uart_baud
+import ubx
+import ubx_transport
+
+# Entrada das correções do NTRIP via gps_bridge.py. Vai num CFG-VALSET à
+# parte (ver apply_optional): firmware que não conhece a chave responde NAK
+# e, junto com as outras, rejeitaria o perfil inteiro
+RTCM_INPUT = [('CFG-UART1INPROT-RTCM3X', 1)]
+
+def nmea_profile(rate_hz, baud=None):
+    """Perfil NMEA: GGA, RMC, VTG e GSA a cada época, sem GLL/GSV"""
+    return {
+        'description': f"{rate_hz} Hz NMEA (GGA, RMC, VTG, GSA)" +
+                       (f" a {baud}" if baud else ""),
+        'output': 'nmea',
+        'baud': baud,
+        'config': [
+            ('CFG-RATE-MEAS', 1000 // rate_hz),
+            ('CFG-RATE-NAV', 1),
+            ('CFG-UART1OUTPROT-NMEA', 1),
+            ('CFG-UART1OUTPROT-UBX', 0),
+            ('CFG-NMEA-HIGHPREC', 1),  # 7 casas decimais para RTK
+            ('CFG-MSGOUT-NMEA_ID_GGA_UART1', 1),
+            ('CFG-MSGOUT-NMEA_ID_RMC_UART1', 1),
+            ('CFG-MSGOUT-NMEA_ID_VTG_UART1', 1),
+            ('CFG-MSGOUT-NMEA_ID_GSA_UART1', 1),
+            ('CFG-MSGOUT-NMEA_ID_GLL_UART1', 0),
+            ('CFG-MSGOUT-NMEA_ID_GSV_UART1', 0),
+            ('CFG-MSGOUT-UBX_NAV_PVT_UART1', 0),
+        ],
+        'optional': RTCM_INPUT,
+    }
+
+
+# Perfis de configuração do M10 (chaves CFG-VALSET; ver ubx.CONFIG_KEYS);
+# 'optional' são chaves que o firmware pode não ter
+PROFILES = {
+    '10hz-nmea': nmea_profile(10),
+    '20hz-nmea-460800': nmea_profile(20, 460800),
+    '25hz-navpvt': {
+        'description': "25 Hz só UBX-NAV-PVT (gps_bridge.py --input-format ubx)",
+        'output': 'ubx',
+        'baud': None,
+        'config': [
+            ('CFG-RATE-MEAS', 40),
+            ('CFG-RATE-NAV', 1),
+            ('CFG-UART1OUTPROT-NMEA', 0),
+            ('CFG-UART1OUTPROT-UBX', 1),
+            ('CFG-MSGOUT-UBX_NAV_PVT_UART1', 1),
+        ],
+        'optional': RTCM_INPUT,
+    },
+}
+DEFAULT_PROFILE = '10hz-nmea'
+
 class M10FlyConfigurator:
-    def __init__(self):
+    def __init__(self, profile=DEFAULT_PROFILE):
         self.serial_device = "/dev/ttyAMA0"
         self.serial_device_alt = "/dev/ttyS0"
         self.baud_rate = 115200
+        self.serial_state_file = serial_probe.STATE_FILE
         self.serial_conn = None
         
         # Configurar logging
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
         self.logger = logging.getLogger(__name__)
         
-        # Comandos UBX para configuração do M10
-        self.ubx_commands = {
-            # Configurar taxa de atualização para 10Hz (100ms)
-            'set_rate_10hz': bytes([
-                0xB5, 0x62, 0x06, 0x08, 0x06, 0x00,
-                0x64, 0x00, 0x01, 0x00, 0x01, 0x00,
-                0x7A, 0x12
-            ]),
-            
-            # Habilitar sentenças NMEA importantes
-            'enable_gga': bytes([
-                0xB5, 0x62, 0x06, 0x01, 0x08, 0x00,
-                0xF0, 0x00, 0x00, 0x01, 0x01, 0x01, 0x01, 0x01,
-                0x05, 0x38
-            ]),
-            
-            'enable_rmc': bytes([
-                0xB5, 0x62, 0x06, 0x01, 0x08, 0x00,
-                0xF0, 0x04, 0x00, 0x01, 0x01, 0x01, 0x01, 0x01,
-                0x09, 0x54
-            ]),
-            
-            'enable_vtg': bytes([
-                0xB5, 0x62, 0x06, 0x01, 0x08, 0x00,
-                0xF0, 0x05, 0x00, 0x01, 0x01, 0x01, 0x01, 0x01,
-                0x0A, 0x5B
-            ]),
-            
-            'enable_gsa': bytes([
-                0xB5, 0x62, 0x06, 0x01, 0x08, 0x00,
-                0xF0, 0x02, 0x00, 0x01, 0x01, 0x01, 0x01, 0x01,
-                0x07, 0x47
-            ]),
-            
-            # Desabilitar sentenças desnecessárias
-            'disable_gll': bytes([
-                0xB5, 0x62, 0x06, 0x01, 0x08, 0x00,
-                0xF0, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-                0x00, 0x2A
-            ]),
-            
-            'disable_gsv': bytes([
-                0xB5, 0x62, 0x06, 0x01, 0x08, 0x00,
-                0xF0, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-                0x02, 0x38
-            ]),
-            
-            # Salvar configuração na memória não-volátil
-            'save_config': bytes([
-                0xB5, 0x62, 0x06, 0x09, 0x0D, 0x00,
-                0x00, 0x00, 0x00, 0x00, 0xFF, 0xFF, 0x00, 0x00,
-                0x00, 0x00, 0x00, 0x00, 0x03, 0x1D, 0xAB
-            ])
-        }
+        # Perfil de configuração (ver PROFILES), aplicado via CFG-VALSET
+        self.profile_name = profile
+        self.profile = PROFILES[profile]
+        self.config_layers = ubx.LAYER_RAM | ubx.LAYER_BBR | ubx.LAYER_FLASH
+        self.force = False  # True: gravar tudo sem comparar (CFG-VALGET)
+        self.upgrade_baud = None  # baud rates a tentar depois do perfil
+        self.measure_seconds = None  # medir taxa/jitter depois de configurar
         
         # Comandos NMEA alternativos (caso UBX não funcione)
         self.nmea_commands = [
@@ -90,9 +104,22 @@ class M10FlyConfigurator:
         ]
     
     def connect_serial(self):
-        """Conectar à porta serial"""
+        """Conectar à porta serial
+
+        Procura o módulo em todas as portas/baud rates ao mesmo tempo (NMEA
+        ou UBX), começando pela última combinação que funcionou. Se nada
+        responder, abre a primeira porta disponível no baud configurado."""
         devices_to_try = [self.serial_device, self.serial_device_alt]
         
+        found = serial_probe.find_receiver(devices_to_try, self.baud_rate, "any",
+                                           self.serial_state_file, timeout=2,
+                                           logger=self.logger)
+        if found is not None:
+            self.serial_conn, device, self.baud_rate = found
+            self.logger.info(f"✅ Conectado em {device} @ {self.baud_rate}")
+            return True
+        
+        self.logger.warning("⚠️  Módulo não respondeu; abrindo a porta no baud configurado")
         for device in devices_to_try:
             try:
                 self.logger.info(f"Tentando conectar em {device}...")
@@ -117,34 +144,42 @@ class M10FlyConfigurator:
         return False
     
     def send_ubx_command(self, command_name, command_bytes):
-        """Enviar comando UBX para o módulo"""
-        try:
-            self.logger.info(f"Enviando comando UBX: {command_name}")
-            self.serial_conn.write(command_bytes)
-            self.serial_conn.flush()
-            
-            # Aguardar resposta
-            time.sleep(0.5)
-            
-            # Ler resposta (se houver)
-            if self.serial_conn.in_waiting > 0:
-                response = self.serial_conn.read(self.serial_conn.in_waiting)
-                self.logger.debug(f"Resposta: {response.hex()}")
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Erro ao enviar comando {command_name}: {e}")
-            return False
+        """Enviar um comando UBX e aguardar o ACK; True se aceito"""
+        self.logger.info(f"Enviando comando UBX: {command_name}")
+        command, = self.ubx_transport().run([(command_name, command_bytes)])
+        if command.result != ubx_transport.ACK:
+            self.logger.error(f"Comando {command_name}: {command.result}")
+        return command.result == ubx_transport.ACK
+    
+    def ubx_transport(self):
+        return ubx_transport.UBXTransport(self.serial_conn, self.logger)
+    
+    def profile_commands(self):
+        """Comandos CFG-VALSET do perfil (sem a troca de baud rate)"""
+        frames = ubx.valset_frames(self.profile['config'], self.config_layers)
+        return [(f"{self.profile_name} ({index + 1}/{len(frames)})", frame)
+                for index, frame in enumerate(frames)]
+    
+    def send_ubx_commands(self, commands):
+        """Enviar os comandos UBX [(nome, quadro)] em pipeline, esperando
+        ACK/NAK de cada um. Retorna a lista de UBXCommand com o resultado."""
+        start_time = time.monotonic()
+        results = self.ubx_transport().run(commands)
+        elapsed = time.monotonic() - start_time
+        
+        for command in results:
+            icon = "✅" if command.result == ubx_transport.ACK else "❌"
+            retries = f" ({command.attempts} tentativas)" if command.attempts > 1 else ""
+            self.logger.info(f"   {icon} {command.name}: {command.result}{retries}")
+        self.logger.info(f"⏱️  {len(results)} comandos UBX em {elapsed * 1000:.0f} ms")
+        return results
     
     def send_nmea_command(self, command):
-        """Enviar comando NMEA para o módulo"""
+        """Enviar comando NMEA para o módulo (PUBX não tem confirmação)"""
         try:
             self.logger.info(f"Enviando comando NMEA: {command.strip()}")
             self.serial_conn.write(command.encode('ascii'))
             self.serial_conn.flush()
-            
-            time.sleep(0.5)
             return True
             
         except Exception as e:
@@ -152,35 +187,154 @@ class M10FlyConfigurator:
             return False
     
     def read_current_config(self):
-        """Ler configuração atual do módulo"""
+        """Ler configuração atual do módulo: as sentenças de uma época
+        completa (até o primeiro tipo se repetir)"""
         self.logger.info("📋 Lendo configuração atual...")
         
         # Limpar buffer
         self.serial_conn.reset_input_buffer()
         
-        # Aguardar algumas sentenças NMEA
-        sentences = []
+        # Ler até o primeiro tipo de sentença aparecer de novo
+        sentence_types = {}
+        first_type = None
         start_time = time.time()
         
-        while time.time() - start_time < 10 and len(sentences) < 20:
-            if self.serial_conn.in_waiting > 0:
-                line = self.serial_conn.readline().decode('ascii', errors='ignore').strip()
-                if line.startswith('$'):
-                    sentences.append(line)
-        
-        # Analisar sentenças recebidas
-        sentence_types = {}
-        for sentence in sentences:
-            if len(sentence) > 6:
-                sentence_type = sentence[1:6]  # Ex: GPGGA, GNRMC
-                sentence_types[sentence_type] = sentence_types.get(sentence_type, 0) + 1
+        while time.time() - start_time < 2.5:
+            line = self.serial_conn.readline().decode('ascii', errors='ignore').strip()
+            if not line.startswith('$') or len(line) <= 6:
+                continue
+            sentence_type = line[1:6]  # Ex: GPGGA, GNRMC
+            if sentence_type == first_type:
+                break
+            if first_type is None:
+                first_type = sentence_type
+            sentence_types[sentence_type] = sentence_types.get(sentence_type, 0) + 1
         
-        self.logger.info("📊 Sentenças NMEA detectadas:")
+        self.logger.info("📊 Sentenças NMEA detectadas (uma época):")
         for sentence_type, count in sentence_types.items():
             self.logger.info(f"   {sentence_type}: {count} vezes")
         
         return sentence_types
     
+    def measure_rate(self, seconds=10):
+        """Medir a taxa efetiva e o jitter de cada mensagem e conferir com
+        o perfil (ver rate_meter.py). True se a medição passou."""
+        rate_hz, expected_types = rate_meter.profile_expectations(self.profile['config'])
+        burst_gap_ns = rate_meter.BURST_GAP_NS
+        if rate_hz:
+            burst_gap_ns = int(1e9 / rate_hz / rate_meter.BURST_GAP_DIVISOR)
+        
+        self.logger.info(f"📏 Medindo a saída do módulo por {seconds:g} s "
+                         f"(perfil {self.profile_name})...")
+        meter = rate_meter.measure(self.serial_conn, seconds, burst_gap_ns)
+        report = meter.report(rate_hz)
+        rate_meter.log_report(report, self.serial_conn.baudrate, self.logger)
+        
+        failures = rate_meter.check(report, rate_hz, expected_types)
+        if failures:
+            self.logger.warning("❌ Medição reprovada:")
+            for failure in failures:
+                self.logger.warning(f"   {failure}")
+            return False
+        self.logger.info(f"✅ Medição aprovada: saída no perfil {self.profile_name}")
+        return True
+    
+    def change_baud_rate(self, baud_rate):
+        """Mudar o baud rate da UART1 do módulo e da porta local, com
+        verificação e retorno ao baud anterior se falhar (ver uart_baud.py)"""
+        if not uart_baud.switch_baud(self.serial_conn, baud_rate, self.logger,
+                                     self.config_layers & ~ubx.LAYER_RAM):
+            return False
+        self.save_baud_rate()
+        return True
+    
+    def upgrade_baud_rate(self, candidates=uart_baud.UPGRADE_BAUD_RATES):
+        """Subir para o maior baud rate que o módulo e a porta aguentam"""
+        old_baud = self.baud_rate
+        uart_baud.upgrade(self.serial_conn, self.logger, candidates,
+                          self.config_layers & ~ubx.LAYER_RAM)
+        if self.serial_conn.baudrate == old_baud:
+            self.logger.info(f"UART mantida em {old_baud} baud")
+        self.save_baud_rate()
+    
+    def save_baud_rate(self):
+        self.baud_rate = self.serial_conn.baudrate
+        try:
+            serial_probe.save_state(self.serial_state_file, self.serial_conn.port, self.baud_rate)
+        except OSError as e:
+            self.logger.warning(f"⚠️  Não foi possível gravar {self.serial_state_file}: {e}")
+    
+    def verify_nav_pvt(self):
+        """Medir a taxa de UBX-NAV-PVT durante 1 s"""
+        self.serial_conn.reset_input_buffer()
+        parser = ubx.UBXParser()
+        frames = 0
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < 1.0:
+            chunk = self.serial_conn.read(max(1, self.serial_conn.in_waiting))
+            frames += sum(1 for msg_class, msg_id, _ in parser.feed(chunk)
+                          if (msg_class, msg_id) == ubx.NAV_PVT)
+        
+        if frames:
+            self.logger.info(f"✅ UBX-NAV-PVT a ~{frames} Hz")
+            return True
+        self.logger.warning("⚠️  Nenhum UBX-NAV-PVT recebido")
+        return False
+    
+    def profile_fingerprint(self):
+        """Impressão digital do perfil (chaves, valores, camadas e baud rate)"""
+        data = json.dumps([self.profile['config'], self.profile.get('optional', []),
+                           self.profile['baud'], self.config_layers])
+        return hashlib.sha256(data.encode('ascii')).hexdigest()[:16]
+    
+    def read_config_values(self, layer):
+        """Valores atuais das chaves do perfil numa camada via CFG-VALGET:
+        {id: valor}, ou None se o módulo não respondeu"""
+        names = [name for name, _ in self.profile['config']]
+        transport = self.ubx_transport()
+        values = {}
+        for start in range(0, len(names), ubx.VALSET_MAX_KEYS):
+            payload = transport.poll("valget", ubx.valget_frame(
+                names[start:start + ubx.VALSET_MAX_KEYS], layer), ubx.CFG_VALGET)
+            if payload is None:
+                return None
+            values.update(ubx.parse_valget(payload)[1])
+        return values
+    
+    def diff_profile(self):
+        """Comparar o módulo com o perfil via CFG-VALGET. Retorna as chaves a
+        gravar (em todas as camadas, só RAM/BBR, só flash), ou None se o
+        módulo não responde ao CFG-VALGET"""
+        ram = self.read_config_values(ubx.VALGET_LAYER_RAM)
+        if ram is None:
+            return None
+        
+        config = self.profile['config']
+        ram_diff = [(name, value) for name, value in config
+                    if ram.get(ubx.config_key(name)[0]) != value]
+        
+        # RAM igual e perfil já aplicado por nós nesta porta: flash em dia
+        stored = serial_probe.load_profile_fingerprint(self.serial_state_file,
+                                                       self.serial_conn.port)
+        if not ram_diff and stored == self.profile_fingerprint():
+            return [], [], []
+        
+        # Chaves ausentes da flash (NAK) também precisam ser gravadas
+        flash = self.read_config_values(ubx.VALGET_LAYER_FLASH) or {}
+        flash_diff = [(name, value) for name, value in config
+                      if flash.get(ubx.config_key(name)[0]) != value]
+        
+        all_layers = [item for item in ram_diff if item in flash_diff]
+        ram_only = [item for item in ram_diff if item not in flash_diff]
+        flash_only = [item for item in flash_diff if item not in ram_diff]
+        
+        for name, value in ram_diff:
+            where = "" if (name, value) in flash_diff else " (flash já tem)"
+            self.logger.info(f"   ✏️  {name}: {ram.get(ubx.config_key(name)[0])} → {value}{where}")
+        for name, value in flash_only:
+            self.logger.info(f"   💾 {name}: gravar {value} na flash")
+        return all_layers, ram_only, flash_only
+    
     def configure_module(self):
         """Configurar o módulo M10Fly"""
         self.logger.info("🔧 Iniciando configuração do módulo M10Fly...")
@@ -189,48 +343,174 @@ class M10FlyConfigurator:
             self.logger.error("❌ Falha ao conectar com o módulo")
             return False
         
+        success = self.apply_profile()
+        if success and self.upgrade_baud:
+            self.upgrade_baud_rate(self.upgrade_baud)
+        if success and self.measure_seconds:
+            success = self.measure_rate(self.measure_seconds)
+        return success
+    
+    def attach(self, serial_conn):
+        """Usar uma porta já aberta e verificada (ex.: a do gps_bridge.py)"""
+        self.serial_conn = serial_conn
+        self.baud_rate = serial_conn.baudrate
+    
+    def detach(self):
+        """Devolver a porta sem fechá-la (o __del__ fecha a que estiver presa)"""
+        serial_conn, self.serial_conn = self.serial_conn, None
+        return serial_conn
+    
+    def apply_profile(self):
+        """Aplicar o perfil no módulo já conectado: só as diferenças
+        (CFG-VALGET) ou, com --force ou sem resposta, o perfil inteiro"""
+        self.logger.info(f"📋 Perfil: {self.profile['description']}")
+        
+        success = None
+        if not self.force:
+            start_time = time.monotonic()
+            changes = self.diff_profile()
+            if changes is not None:
+                success = self.apply_changes(*changes)
+                self.logger.info(f"⏱️  Configuração em {(time.monotonic() - start_time) * 1000:.0f} ms")
+            else:
+                self.logger.warning("⚠️  Módulo não respondeu ao CFG-VALGET; gravando o perfil inteiro")
+        
+        if success is None:
+            success = self.apply_full_profile()
+        if success:
+            self.apply_optional()
+        return success
+    
+    def apply_optional(self):
+        """Gravar as chaves opcionais do perfil, cada uma no seu CFG-VALSET.
+        Um NAK (firmware sem a chave) só gera aviso; o perfil segue valendo."""
+        transport = self.ubx_transport()
+        for name, value in self.profile.get('optional', []):
+            payload = transport.poll("valget", ubx.valget_frame([name], ubx.VALGET_LAYER_RAM),
+                                     ubx.CFG_VALGET)
+            if payload is not None and \
+               ubx.parse_valget(payload)[1].get(ubx.config_key(name)[0]) == value:
+                continue  # já gravada
+            
+            command, = transport.run([(name, frame) for frame in
+                                      ubx.valset_frames([(name, value)], self.config_layers)])
+            if command.result == ubx_transport.ACK:
+                self.logger.info(f"   ✏️  {name}: {value}")
+            elif command.result == ubx_transport.NAK:
+                self.logger.warning(f"⚠️  {name} rejeitada (NAK): firmware sem suporte; "
+                                    f"seguindo sem ela")
+            else:
+                self.logger.warning(f"⚠️  {name}: {command.result}; seguindo sem ela")
+    
+    def measure_module(self):
+        """Só medir a saída contra o perfil, sem gravar nada"""
+        if not self.connect_serial():
+            self.logger.error("❌ Falha ao conectar com o módulo")
+            return False
+        return self.measure_rate(self.measure_seconds or 10)
+    
+    def apply_changes(self, all_layers, ram_only, flash_only):
+        """Gravar só as chaves diferentes; a flash só é escrita se difere"""
+        baud_change = self.profile['baud'] and self.profile['baud'] != self.baud_rate
+        ram_changed = bool(all_layers or ram_only)
+        
+        if not ram_changed and not flash_only and not baud_change:
+            self.logger.info(f"✅ Módulo já está no perfil {self.profile_name} (nada a gravar)")
+            self.save_fingerprint()
+            return True
+        
+        commands = []
+        for label, items, layers in (
+            ("alterações", all_layers, self.config_layers),
+            ("RAM/BBR", ram_only, ubx.LAYER_RAM | ubx.LAYER_BBR),
+            ("flash", flash_only, ubx.LAYER_FLASH),
+        ):
+            if items:
+                commands += [(f"{self.profile_name} ({label})", frame)
+                             for frame in ubx.valset_frames(items, layers)]
+        
+        if commands:
+            results = self.send_ubx_commands(commands)
+            failed = [c.name for c in results if c.result != ubx_transport.ACK]
+            if failed:
+                self.logger.error(f"❌ Não aplicados: {', '.join(failed)}")
+                return False
+        
+        if baud_change and not self.change_baud_rate(self.profile['baud']):
+            return False
+        
+        if ram_changed or baud_change:
+            self.logger.info("🔍 Verificando nova configuração...")
+            if not self.verify_output():
+                return False
+        
+        self.save_fingerprint()
+        return True
+    
+    def save_fingerprint(self):
+        try:
+            serial_probe.save_profile_fingerprint(self.serial_state_file, self.serial_conn.port,
+                                                  self.profile_name, self.profile_fingerprint())
+        except OSError as e:
+            self.logger.warning(f"⚠️  Não foi possível gravar {self.serial_state_file}: {e}")
+    
+    def apply_full_profile(self):
+        """Gravar o perfil inteiro (--force ou módulo sem CFG-VALGET)"""
         # Ler configuração atual
         current_config = self.read_current_config()
         
         # Tentar configuração via comandos UBX primeiro
         self.logger.info("🔄 Tentando configuração via comandos UBX...")
-        ubx_success = True
+        results = self.send_ubx_commands(self.profile_commands())
+        rejected = [c.name for c in results if c.result == ubx_transport.NAK]
+        unanswered = [c.name for c in results
+                      if c.result in (ubx_transport.TIMEOUT, ubx_transport.SEND_ERROR)]
+        ubx_success = any(c.result == ubx_transport.ACK for c in results)
         
-        for command_name, command_bytes in self.ubx_commands.items():
-            if not self.send_ubx_command(command_name, command_bytes):
-                ubx_success = False
-                break
-            time.sleep(1)  # Pausa entre comandos
+        if rejected:
+            self.logger.warning(f"⚠️  Rejeitados pelo módulo (NAK): {', '.join(rejected)}")
+        if unanswered:
+            self.logger.warning(f"⚠️  Sem resposta: {', '.join(unanswered)}")
         
         if ubx_success:
-            self.logger.info("✅ Configuração UBX aplicada com sucesso")
+            self.logger.info("✅ Configuração UBX aplicada")
         else:
             self.logger.warning("⚠️  Configuração UBX falhou, tentando comandos NMEA...")
             
             # Tentar configuração via comandos NMEA
             for command in self.nmea_commands:
                 self.send_nmea_command(command)
-                time.sleep(1)
         
-        # Aguardar aplicação das configurações
-        self.logger.info("⏳ Aguardando aplicação das configurações...")
-        time.sleep(3)
+        # Troca de baud rate por último: a porta local acompanha o módulo
+        if ubx_success and self.profile['baud'] and self.profile['baud'] != self.baud_rate:
+            if not self.change_baud_rate(self.profile['baud']):
+                return False
         
         # Verificar nova configuração
         self.logger.info("🔍 Verificando nova configuração...")
+        success = self.verify_output(current_config)
+        if success and ubx_success and not rejected and not unanswered:
+            self.save_fingerprint()
+        return success
+    
+    def verify_output(self, current_config=None):
+        """Conferir a saída do módulo depois da configuração"""
+        if self.profile['output'] == 'ubx':
+            return self.verify_nav_pvt()
         new_config = self.read_current_config()
         
         # Comparar configurações
-        self.logger.info("📊 Comparação de configurações:")
-        all_sentence_types = set(current_config.keys()) | set(new_config.keys())
-        
-        for sentence_type in sorted(all_sentence_types):
-            old_count = current_config.get(sentence_type, 0)
-            new_count = new_config.get(sentence_type, 0)
+        if current_config is not None:
+            self.logger.info("📊 Comparação de configurações:")
+            all_sentence_types = set(current_config.keys()) | set(new_config.keys())
             
-            if old_count != new_count:
-                status = "📈" if new_count > old_count else "📉" if new_count < old_count else "➡️"
-                self.logger.info(f"   {sentence_type}: {old_count} → {new_count} {status}")
+            for sentence_type in sorted(all_sentence_types):
+                old_count = current_config.get(sentence_type, 0)
+                new_count = new_config.get(sentence_type, 0)
+                
+                if old_count != new_count:
+                    status = "📈" if new_count > old_count else "📉" if new_count < old_count else "➡️"
+                    self.logger.info(f"   {sentence_type}: {old_count} → {new_count} {status}")
         
         # Verificar se as sentenças importantes estão presentes
         important_sentences = ['GPGGA', 'GNRMC', 'GPVTG', 'GNGGA', 'GPRMC']
@@ -252,19 +532,53 @@ class M10FlyConfigurator:
 
 def main():
     """Função principal"""
+    parser = argparse.ArgumentParser(description='Configurador do módulo GNSS M10Fly')
+    parser.add_argument('--profile', choices=sorted(PROFILES), default=DEFAULT_PROFILE,
+                        help='perfil de configuração (padrão: %(default)s)')
+    parser.add_argument('--force', action='store_true',
+                        help='gravar o perfil inteiro, sem comparar com o módulo')
+    parser.add_argument('--baud', metavar='auto|BAUD',
+                        help='subir a UART depois do perfil: "auto" tenta 921600, 460800 '
+                             'e 230400; um número tenta só esse valor')
+    parser.add_argument('--measure', nargs='?', type=float, const=10.0, metavar='SEGUNDOS',
+                        help='depois de configurar, medir taxa e jitter por mensagem e '
+                             'conferir com o perfil (padrão: 10 s)')
+    parser.add_argument('--measure-only', action='store_true',
+                        help='só medir a saída contra o perfil, sem configurar')
+    args = parser.parse_args()
+    
     print("=== Configurador do Módulo GNSS M10Fly ===")
     print("Otimizando configurações para QtAgOpenGPS")
     print()
     
-    configurator = M10FlyConfigurator()
+    configurator = M10FlyConfigurator(args.profile)
+    configurator.force = args.force
+    if args.baud == 'auto':
+        configurator.upgrade_baud = uart_baud.UPGRADE_BAUD_RATES
+    elif args.baud:
+        if not args.baud.isdigit():
+            parser.error(f"--baud: use 'auto' ou um número, não '{args.baud}'")
+        configurator.upgrade_baud = (int(args.baud),)
+    if configurator.upgrade_baud and configurator.profile['baud']:
+        parser.error(f"o perfil {args.profile} já define o baud rate "
+                     f"({configurator.profile['baud']}); não use --baud")
+    
+    configurator.measure_seconds = args.measure
     
     try:
+        if args.measure_only:
+            success = configurator.measure_module()
+            sys.exit(0 if success else 1)
+        
         success = configurator.configure_module()
         
         if success:
             print("\n✅ Módulo configurado com sucesso!")
             print("📋 Próximos passos:")
-            print("   1. Execute: ./gps_bridge.py")
+            if configurator.profile['output'] == 'ubx':
+                print("   1. Execute: ./gps_bridge.py --input-format ubx")
+            else:
+                print("   1. Execute: ./gps_bridge.py")
             print("   2. Inicie o QtAgIO")
             print("   3. Inicie o QtAgOpenGPS")
         else:
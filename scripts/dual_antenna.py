@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Rumo e rolagem de dois receptores (antena dupla com receptores separados)
+Os GGA do receptor principal e do secundário são casados pela hora UTC da
+época. A linha de base (principal -> secundária) em coordenadas locais
+leste/norte/cima dá o rumo do trator e, com as antenas lado a lado, a
+rolagem. Para cada época alinhada sai:
+
+    nmea   o GGA do principal + $GNHDT com o rumo (FormLoop::ParseHDT)
+    paogi  um único $PAOGI com posição, velocidade, rumo e rolagem
+           (FormLoop::ParseOGI)
+
+A espera pelo secundário é limitada: se o GGA dele não chegar em wait_ms
+depois do principal, a época sai só com a posição ($PANDA sem rumo no modo
+paogi), e um receptor atrasado nunca segura a saída.
+
+Rumo de receptores sem RTK (como o M10) oscila muito com bases curtas.
+Por isso, por padrão, só épocas com fix RTK nos dois receptores (qualidade
+4 ou 5) têm rumo. Com o comprimento da base informado, épocas cuja base
+medida foge dele também ficam sem rumo.
+
+Autor: Configuração QtAgOpenGPS
+Compatível com: Quescan M10Fly, u-blox M10
+"""
+
+import math
+import time
+
+from epoch_fusion import NO_IMU_HEADING, NO_IMU_VALUE
+from nmea_bytes import build_sentence
+
+# Elipsoide WGS84
+WGS84_A = 6378137.0
+WGS84_E2 = 6.69437999014e-3
+
+# Posição da antena secundária em relação à principal -> ângulo entre a
+# base e a frente do trator
+MOUNT_OFFSETS = {'right': 90.0, 'left': -90.0, 'front': 0.0, 'rear': 180.0}
+
+PRIMARY = 'primary'
+SECONDARY = 'secondary'
+
+# Sentenças do principal de onde vem a velocidade da saída paogi (a época
+# sai com a velocidade mais recente, em geral a da época anterior)
+SPEED_TYPES = frozenset([b'RMC', b'VTG'])
+
+RTK_QUALITIES = frozenset([b'4', b'5'])
+BASELINE_TOLERANCE_M = 0.10
+MAX_SECONDARY_EPOCHS = 8  # GGA do secundário guardados à espera do principal
+
+
+def nmea_degrees(value, hemisphere):
+    """ddmm.mmmm / dddmm.mmmm + hemisfério -> graus decimais"""
+    number = float(value)
+    degrees = int(number // 100)
+    result = degrees + (number - degrees * 100) / 60.0
+    return -result if hemisphere in (b'S', b'W') else result
+
+
+class Fix:
+    """Campos de um GGA usados no cálculo e na saída"""
+
+    __slots__ = ('utc', 'fields', 'latitude', 'longitude', 'altitude', 'quality', 'line')
+
+    def __init__(self, line, fields):
+        self.line = line
+        self.fields = fields
+        self.utc = fields[1]
+        self.quality = fields[6]
+        self.latitude = nmea_degrees(fields[2], fields[3])
+        self.longitude = nmea_degrees(fields[4], fields[5])
+        self.altitude = float(fields[9]) if fields[9] else 0.0
+
+
+def parse_gga(line):
+    """Fix de uma linha GGA já validada, ou None sem posição"""
+    star = line.rfind(b"*")
+    fields = line[1:star if star != -1 else len(line)].split(b",")
+    if len(fields) < 14 or not fields[2] or not fields[4]:
+        return None
+    try:
+        return Fix(line, fields)
+    except ValueError:
+        return None
+
+
+def baseline(primary, secondary):
+    """(leste, norte, cima) em metros da antena principal até a secundária"""
+    latitude = math.radians(primary.latitude)
+    sin_lat = math.sin(latitude)
+    w = math.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat)
+    meridian_radius = WGS84_A * (1.0 - WGS84_E2) / (w * w * w)
+    normal_radius = WGS84_A / w
+    north = math.radians(secondary.latitude - primary.latitude) * meridian_radius
+    east = math.radians(secondary.longitude - primary.longitude) * normal_radius * math.cos(latitude)
+    return east, north, secondary.altitude - primary.altitude
+
+
+class DualAntennaAligner:
+    """Casa as épocas dos dois receptores e monta as sentenças de saída"""
+
+    def __init__(self, mount='right', output='nmea', wait_ms=50, baseline_m=None,
+                 require_rtk=True):
+        self.offset = MOUNT_OFFSETS[mount]
+        self.mount = mount
+        self.output = output
+        self.wait_ns = int(wait_ms * 1e6)
+        self.baseline_m = baseline_m
+        self.require_rtk = require_rtk
+
+        self.pending = None         # Fix do principal à espera do secundário
+        self.pending_ns = None
+        self.secondary = {}         # utc -> Fix do secundário
+        self.speed = b'0'           # nós, do último RMC/VTG do principal
+
+        self.aligned = 0
+        self.unpaired = 0
+        self.rejected = 0
+        self.last_length = None
+
+    def deadline_ns(self):
+        if self.pending is None:
+            return None
+        return self.pending_ns + self.wait_ns
+
+    def feed_primary(self, line, arrival_ns):
+        """GGA do receptor principal; retorna as sentenças prontas"""
+        fix = parse_gga(line)
+        output = []
+        if fix is None:
+            return output
+        if self.pending is not None:
+            self._emit(None, output)  # época anterior ficou sem par
+        partner = self.secondary.pop(fix.utc, None)
+        if partner is not None:
+            self._emit(partner, output, fix)
+            return output
+        self.pending = fix
+        self.pending_ns = arrival_ns
+        return output
+
+    def feed_secondary(self, line, arrival_ns):
+        """GGA do receptor secundário"""
+        fix = parse_gga(line)
+        output = []
+        if fix is None:
+            return output
+        if self.pending is not None and self.pending.utc == fix.utc:
+            self._emit(fix, output)
+            return output
+        self.secondary[fix.utc] = fix
+        while len(self.secondary) > MAX_SECONDARY_EPOCHS:
+            del self.secondary[next(iter(self.secondary))]
+        return output
+
+    def feed_speed(self, line):
+        """RMC/VTG do principal: guardar a velocidade em nós (saída paogi)"""
+        star = line.rfind(b"*")
+        fields = line[1:star if star != -1 else len(line)].split(b",")
+        sentence_type = fields[0][2:5]
+        try:
+            if sentence_type == b'VTG' and fields[5]:
+                self.speed = fields[5]
+            elif sentence_type == b'RMC' and fields[7]:
+                self.speed = fields[7]
+        except IndexError:
+            pass
+
+    def poll(self, now_ns=None):
+        """Emitir a época do principal cujo tempo de espera acabou"""
+        output = []
+        if self.pending is None:
+            return output
+        if now_ns is None:
+            now_ns = time.perf_counter_ns()
+        if now_ns >= self.deadline_ns():
+            self._emit(None, output)
+        return output
+
+    def attitude(self, primary, secondary):
+        """(rumo, rolagem, arfagem) em graus, ou None se a base não é confiável"""
+        if self.require_rtk and (primary.quality not in RTK_QUALITIES or
+                                 secondary.quality not in RTK_QUALITIES):
+            return None
+        east, north, up = baseline(primary, secondary)
+        horizontal = math.hypot(east, north)
+        length = math.sqrt(horizontal * horizontal + up * up)
+        self.last_length = length
+        if horizontal < 0.01 or (self.baseline_m is not None and
+                                 abs(length - self.baseline_m) > BASELINE_TOLERANCE_M):
+            return None
+
+        heading = (math.degrees(math.atan2(east, north)) - self.offset) % 360.0
+        tilt = math.degrees(math.atan2(up, horizontal))
+        # Rolagem positiva = lado direito para baixo (FormLoop::ParseOGI);
+        # arfagem positiva = frente para cima
+        if self.mount == 'right':
+            return heading, -tilt, None
+        if self.mount == 'left':
+            return heading, tilt, None
+        if self.mount == 'front':
+            return heading, None, tilt
+        return heading, None, -tilt
+
+    def _emit(self, secondary, output, primary=None):
+        if primary is None:
+            primary, self.pending = self.pending, None
+        else:
+            self.pending = None
+        attitude = None
+        if secondary is None:
+            self.unpaired += 1
+        else:
+            attitude = self.attitude(primary, secondary)
+            if attitude is None:
+                self.rejected += 1
+            else:
+                self.aligned += 1
+
+        if self.output == 'nmea':
+            output.append(primary.line)
+            if attitude is not None:
+                output.append(build_sentence(b"GNHDT,%.3f,T" % attitude[0]))
+            return
+
+        fields = primary.fields
+        common = [fields[1], fields[2], fields[3], fields[4], fields[5],
+                  fields[6] or b'0', fields[7], fields[8], fields[9],
+                  fields[13] or b'0', self.speed]
+        if attitude is None:
+            body = b",".join([b'PANDA'] + common +
+                             [NO_IMU_HEADING, NO_IMU_VALUE, NO_IMU_VALUE, NO_IMU_VALUE])
+        else:
+            heading, roll, pitch = attitude
+            body = b",".join([b'PAOGI'] + common + [
+                b"%.3f" % heading,
+                b"%.2f" % roll if roll is not None else b'',
+                b"%.2f" % pitch if pitch is not None else b'',
+                b'',
+            ])
+        output.append(build_sentence(body))
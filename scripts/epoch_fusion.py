@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Fusão de épocas NMEA
+Agrupa as sentenças de uma mesma época (GGA, RMC, VTG, HDT, GSA) pelo campo
+de hora UTC e emite uma única sentença por fix:
+
+    $PAOGI  quando a época tem rumo (HDT), lido por FormLoop::ParseOGI
+    $PANDA  nos demais casos, lido por FormLoop::ParsePANDA
+
+Assim o QtAgIO recebe um datagrama por época, e o gpsHz calculado no
+FormLoop::ParseNMEA passa a contar épocas em vez de sentenças.
+
+Uma época é emitida assim que chegam todos os tipos que o receptor costuma
+enviar, quando chega uma hora UTC diferente, ou após um tempo limite, de modo
+que uma sentença perdida nunca segura o fix. Um tipo que deixa de chegar em
+várias épocas seguidas sai da lista de esperados.
+
+Autor: Configuração QtAgOpenGPS
+"""
+
+import time
+
+from nmea_bytes import build_sentence
+
+# Sentenças com hora UTC no campo 1 (definem a época)
+TIMED_TYPES = frozenset([b'GGA', b'RMC'])
+FUSED_TYPES = frozenset([b'GGA', b'RMC', b'VTG', b'HDT', b'GSA'])
+
+# Épocas seguidas sem um tipo até ele deixar de ser esperado
+MISSING_EPOCHS_LIMIT = 5
+
+# Valores "sem IMU" usados pelo QtAgIO (glm::USHORT_MAX / glm::SHORT_MAX)
+NO_IMU_HEADING = b'65535'
+NO_IMU_VALUE = b'32767'
+
+
+class Epoch:
+    """Campos reunidos de uma época"""
+
+    __slots__ = ('utc', 'types', 'position', 'quality', 'satellites', 'hdop',
+                 'altitude', 'age', 'speed', 'heading', 'first_arrival_ns')
+
+    def __init__(self, arrival_ns):
+        self.utc = None
+        self.types = set()
+        self.position = None  # (lat, N/S, lon, E/W)
+        self.quality = None
+        self.satellites = b''
+        self.hdop = b''
+        self.altitude = b''
+        self.age = b''
+        self.speed = None
+        self.heading = None
+        self.first_arrival_ns = arrival_ns
+
+
+class EpochAssembler:
+    """Monta uma sentença $PAOGI/$PANDA por época"""
+
+    def __init__(self, timeout_ms=50):
+        self.timeout_ns = int(timeout_ms * 1e6)
+        self.epoch = None
+        self.expected_types = set()
+        self.missing_epochs = {}
+        self.epochs_emitted = 0
+        self.epochs_timed_out = 0
+
+    def deadline_ns(self):
+        """Instante (perf_counter_ns) em que a época pendente expira, ou None"""
+        if self.epoch is None:
+            return None
+        return self.epoch.first_arrival_ns + self.timeout_ns
+
+    def feed(self, buf, start, end, arrival_ns):
+        """Adicionar a sentença buf[start:end] (já validada).
+
+        Retorna a lista de sentenças fundidas prontas para envio."""
+        star = buf.rfind(b"*", start, end)
+        fields = buf[start + 1:star if star != -1 else end].split(b",")
+        sentence_type = fields[0][2:5]
+        output = []
+
+        if sentence_type in TIMED_TYPES and len(fields) > 1:
+            utc = fields[1]
+            epoch = self.epoch
+            if epoch is not None and epoch.utc is not None and epoch.utc != utc:
+                # Hora nova: a época anterior acabou, mesmo incompleta
+                self._emit(output)
+        if self.epoch is None:
+            self.epoch = Epoch(arrival_ns)
+
+        epoch = self.epoch
+        epoch.types.add(sentence_type)
+        try:
+            self._merge(epoch, sentence_type, fields)
+        except IndexError:
+            pass  # sentença curta: aproveita só os campos presentes
+
+        if self.expected_types and self.expected_types <= epoch.types:
+            self._emit(output)
+        return output
+
+    def poll(self, now_ns=None):
+        """Emitir a época pendente se o tempo limite passou"""
+        output = []
+        if self.epoch is None:
+            return output
+        if now_ns is None:
+            now_ns = time.perf_counter_ns()
+        if now_ns >= self.deadline_ns():
+            self.epochs_timed_out += 1
+            self._emit(output)
+        return output
+
+    def _merge(self, epoch, sentence_type, fields):
+        if sentence_type == b'GGA':
+            epoch.utc = fields[1]
+            if fields[2] and fields[4]:
+                epoch.position = (fields[2], fields[3], fields[4], fields[5])
+            epoch.quality = fields[6]
+            epoch.satellites = fields[7]
+            epoch.hdop = fields[8] or epoch.hdop
+            epoch.altitude = fields[9]
+            epoch.age = fields[13]
+        elif sentence_type == b'RMC':
+            if epoch.utc is None:
+                epoch.utc = fields[1]
+            if epoch.position is None and fields[3] and fields[5]:
+                epoch.position = (fields[3], fields[4], fields[5], fields[6])
+            if epoch.quality is None:
+                epoch.quality = b'1' if fields[2] == b'A' else b'0'
+            if epoch.speed is None:
+                epoch.speed = fields[7]
+        elif sentence_type == b'VTG':
+            # Velocidade em nós (campo 5) substitui a do RMC
+            epoch.speed = fields[5]
+        elif sentence_type == b'HDT':
+            epoch.heading = fields[1]
+        elif sentence_type == b'GSA':
+            if not epoch.hdop:
+                epoch.hdop = fields[16]
+
+    def _learn_types(self, types):
+        """Atualizar os tipos esperados por época"""
+        for sentence_type in list(self.expected_types - types):
+            missing = self.missing_epochs.get(sentence_type, 0) + 1
+            if missing >= MISSING_EPOCHS_LIMIT:
+                self.expected_types.discard(sentence_type)
+                missing = 0
+            self.missing_epochs[sentence_type] = missing
+        for sentence_type in types:
+            self.missing_epochs[sentence_type] = 0
+        self.expected_types |= types
+
+    def _emit(self, output):
+        epoch = self.epoch
+        self.epoch = None
+        self._learn_types(epoch.types)
+
+        if epoch.position is None or epoch.utc is None:
+            return
+
+        latitude, north_south, longitude, east_west = epoch.position
+        common = [
+            epoch.utc, latitude, north_south, longitude, east_west,
+            epoch.quality or b'0', epoch.satellites, epoch.hdop,
+            epoch.altitude, epoch.age or b'0', epoch.speed or b'0',
+        ]
+
+        if epoch.heading:
+            # Rumo de antena dupla; rolagem/arfagem/guinada desconhecidas
+            body = b",".join([b'PAOGI'] + common + [epoch.heading, b'', b'', b''])
+        else:
+            body = b",".join([b'PANDA'] + common +
+                             [NO_IMU_HEADING, NO_IMU_VALUE, NO_IMU_VALUE, NO_IMU_VALUE])
+
+        self.epochs_emitted += 1
+        output.append(build_sentence(body))
@@ -12,21 +12,90 @@ import socket
 import threading
 import time
 import sys
+import os
 import signal
 import logging
-from datetime import datetime
+import selectors
+import argparse
+import asyncio
+from collections import deque
+
+import bridge_engine
+import capture
+import configure_m10fly
+import dual_antenna
+import epoch_fusion
+import log_pipeline
+import metrics
+import nmea_bytes
+import raw_archive
+import realtime
+import receiver_watchdog
+import rtcm_injector
+import sentence_filter
+import serial_probe
+import uart_baud
+import ubx
+
+# Espera do select sem época pendente (para verificar self.running)
+SELECT_IDLE_SECONDS = 0.5
 
 class GPSBridge:
     def __init__(self):
         # Configurações do dispositivo serial
         self.serial_device = "/dev/ttyAMA0"  # Porta UART primária
         self.serial_device_alt = "/dev/ttyS0"  # Porta alternativa
-        self.baud_rate = 115200  # Baud rate do M10Fly
+        self.baud_rate = 115200  # Baud rate do M10Fly (testado primeiro)
+        self.serial_state_file = serial_probe.STATE_FILE  # Última porta/baud; None desativa
+        self.baud_upgrade = None  # Baud rates maiores a negociar na partida (uart_baud.py)
+        
+        # Configuração opcional do receptor na partida, na porta já aberta,
+        # reaplicada se ele reiniciar (ver configure_m10fly.py)
+        self.configurator = None
+        self.receiver_watchdog = None
         
         # Configurações UDP para QtAgIO
         self.udp_host = "127.0.0.1"  # Localhost
         self.udp_port = 9999  # Porta padrão do QtAgIO
         
+        # Correções RTCM3 do NTRIP do QtAgIO -> serial do receptor; 0 desativa
+        self.rtcm_port = rtcm_injector.NTRIP_UDP_PORT
+        self.rtcm_injector = None
+        self.serial_tx_lock = threading.Lock()  # escritores da serial (RTCM, UBX)
+        
+        # Modo de leitura serial: 'select' (bloqueia no descritor e lê em
+        # bloco) ou 'poll' (modo antigo: in_waiting + readline + sleep)
+        self.reader_mode = "select"
+        self.read_chunk_size = 4096  # Máximo de bytes por leitura em bloco
+        self.max_line_length = 512  # Descarta lixo sem '\n' acima disso
+        
+        # Formato de entrada: 'nmea' (texto) ou 'ubx' (UBX-NAV-PVT binário,
+        # convertido em uma sentença $PANDA por época)
+        self.input_format = "nmea"
+        self.ubx_decoder = None
+        
+        # Tabela de filtro por tipo de sentença (repassar, descartar, dizimar)
+        self.sentence_filter = sentence_filter.SentenceFilter()
+        
+        # Fusão opcional das sentenças de cada época em um único $PAOGI/$PANDA
+        self.epoch_assembler = None
+        
+        # Antena dupla com dois receptores (motor asyncio, ver dual_antenna.py)
+        self.dual_aligner = None
+        
+        # Modo tempo real opcional (ver realtime.py): núcleo fixo, prioridade,
+        # memória travada e GC desligado na thread de leitura
+        self.realtime = False
+        self.realtime_cpu = None  # None = último núcleo
+        self.realtime_priority = realtime.DEFAULT_FIFO_PRIORITY
+        self.gc_collector = realtime.EpochCollector()  # coleta entre épocas (GC desligado)
+        
+        # Gravação opcional do fluxo bruto (ver capture.py) e arquivo bruto
+        # compactado da safra (ver raw_archive.py)
+        self.capture_writer = None
+        self.raw_archive = None
+        self.rx_buffer = b""  # Buffer de remontagem de linhas
+        
         # Configurações de controle
         self.running = False
         self.serial_conn = None
@@ -36,61 +105,121 @@ class GPSBridge:
         self.sentences_received = 0
         self.sentences_sent = 0
         self.errors = 0
+        self.receiver_reconfigurations = 0
         self.start_time = None
         
-        # Configurar logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('/tmp/gps_bridge.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        # Latência chegada serial -> envio UDP (ns), janela das últimas amostras
+        self.latency_samples = deque(maxlen=1000)
+        self.latency_max_ns = 0
+        
+        # Métricas detalhadas (Prometheus); servidor HTTP opcional
+        self.metrics = metrics.BridgeMetrics()
+        self.metrics_port = 9108  # 0 desativa o servidor
+        self.metrics_server = None
+        
+        # Log por fila: formatação e escrita numa thread própria, avisos
+        # repetidos limitados (ver log_pipeline.py)
+        self.log_pipeline = log_pipeline.setup()
         self.logger = logging.getLogger(__name__)
+        self.log_sent = self.logger.isEnabledFor(logging.DEBUG)
+        self.log_suppressed_reported = 0
+        
+    def setup_serial(self, configure=True):
+        """Configurar conexão serial com o módulo GNSS
+
+        Começa pela última porta/baud que funcionou; se falhar, testa todas
+        as portas em paralelo, em vários baud rates, até chegar uma sentença
+        com checksum válido (ou um quadro UBX no modo ubx). Com
+        configure=False só detecta a porta, sem aplicar o perfil nem trocar
+        o baud rate (motor asyncio, que reabre a serial e não tem o watchdog)."""
+        devices_to_try = [self.serial_device]
+        if self.serial_device_alt and self.serial_device_alt != self.serial_device:
+            devices_to_try.append(self.serial_device_alt)
+        
+        # Antes de configurar, o receptor pode estar em outro formato
+        probe_format = "any" if configure and self.configurator is not None else self.input_format
+        found = serial_probe.find_receiver(devices_to_try, self.baud_rate, probe_format,
+                                           self.serial_state_file, timeout=1,
+                                           logger=self.logger)
+        if found is None:
+            self.logger.warning(f"Nenhum receptor respondeu em {', '.join(devices_to_try)}")
+            return False
         
-    def setup_serial(self):
-        """Configurar conexão serial com o módulo GNSS"""
-        devices_to_try = [self.serial_device, self.serial_device_alt]
+        self.serial_conn, device, self.baud_rate = found
+        self.logger.info(f"✅ Conexão estabelecida em {device} @ {self.baud_rate}")
         
-        for device in devices_to_try:
+        if configure and self.configurator is not None:
+            self.configure_receiver()
+        
+        if configure and self.baud_upgrade:
+            self.baud_rate = uart_baud.upgrade(self.serial_conn, self.logger, self.baud_upgrade)
             try:
-                self.logger.info(f"Tentando conectar em {device}...")
-                self.serial_conn = serial.Serial(
-                    port=device,
-                    baudrate=self.baud_rate,
-                    bytesize=serial.EIGHTBITS,
-                    parity=serial.PARITY_NONE,
-                    stopbits=serial.STOPBITS_ONE,
-                    timeout=1,
-                    xonxoff=False,
-                    rtscts=False,
-                    dsrdtr=False
-                )
-                
-                # Testar se está recebendo dados
-                self.logger.info(f"Testando comunicação em {device}...")
-                test_start = time.time()
-                while time.time() - test_start < 5:  # Testar por 5 segundos
-                    if self.serial_conn.in_waiting > 0:
-                        test_data = self.serial_conn.readline().decode('ascii', errors='ignore').strip()
-                        if test_data.startswith('$') and ',' in test_data:
-                            self.logger.info(f"✅ Conexão estabelecida em {device}")
-                            self.logger.info(f"Exemplo de dados: {test_data[:50]}...")
-                            return True
-                    time.sleep(0.1)
-                
-                # Se chegou aqui, não recebeu dados válidos
-                self.serial_conn.close()
-                self.logger.warning(f"Nenhum dado NMEA recebido em {device}")
-                
-            except Exception as e:
-                self.logger.error(f"Erro ao conectar em {device}: {e}")
-                if self.serial_conn:
-                    self.serial_conn.close()
-                    self.serial_conn = None
+                serial_probe.save_state(self.serial_state_file, device, self.baud_rate)
+            except OSError as e:
+                self.logger.warning(f"⚠️  Não foi possível gravar {self.serial_state_file}: {e}")
+        
+        self.metrics.baud_rate = self.baud_rate
+        return True
+    
+    def configure_receiver(self):
+        """Aplicar o perfil na porta já aberta e seguir direto para a
+        leitura, sem fechar nem procurar a porta de novo"""
+        start_time = time.monotonic()
+        self.configurator.attach(self.serial_conn)
+        if self.configurator.apply_profile():
+            self.logger.info(f"✅ Receptor no perfil {self.configurator.profile_name} "
+                             f"({(time.monotonic() - start_time) * 1000:.0f} ms)")
+        else:
+            self.logger.warning(f"⚠️  Perfil {self.configurator.profile_name} não confirmado; "
+                                f"seguindo com a saída atual do receptor")
+        # O perfil pode ter mudado o baud rate
+        self.baud_rate = self.serial_conn.baudrate
+        self.receiver_watchdog = receiver_watchdog.ReceiverWatchdog(self.metrics, time.monotonic())
+    
+    def check_receiver(self):
+        """Reaplicar o perfil se o receptor reiniciou ou mudou a saída
+        (chamado pela thread de leitura, dona da serial)"""
+        if self.receiver_watchdog is None:
+            return
+        now = time.monotonic()
+        reason = self.receiver_watchdog.check(now)
+        if reason is None:
+            return
         
-        return False
+        self.logger.warning(f"⚠️  {reason}; reaplicando o perfil {self.configurator.profile_name}...")
+        self.receiver_reconfigurations += 1
+        with self.serial_tx_lock:
+            applied = self.configurator.apply_profile()
+        if applied:
+            self.logger.info("✅ Perfil reaplicado")
+            self.receiver_watchdog.reset(time.monotonic())
+        else:
+            self.logger.error("❌ Receptor não aceitou o perfil; nova tentativa em "
+                              f"{receiver_watchdog.RETRY_SECONDS:.0f} s")
+            self.receiver_watchdog.hold(time.monotonic())
+        self.rx_buffer = b""
+        if self.input_format == "ubx":
+            self.ubx_decoder = ubx.NavPvtToPanda()
+    
+    def start_rtcm_injector(self, serial_conn, device):
+        """Receber as correções do QtAgIO por UDP e escrevê-las na serial
+        (no motor asyncio serial_conn é None e a fonte liga a porta depois)"""
+        if not self.rtcm_port:
+            return
+        injector = rtcm_injector.RTCMInjector(serial_conn, self.metrics, self.rtcm_port,
+                                              logger=self.logger, tx_lock=self.serial_tx_lock)
+        try:
+            injector.start()
+        except OSError as e:
+            self.logger.warning(f"⚠️  Correções RTCM indisponíveis na porta {self.rtcm_port}: {e}")
+            return
+        self.rtcm_injector = injector
+        self.logger.info(f"🛰️  Correções RTCM3: UDP {self.rtcm_port} -> {device}")
+    
+    def stop_rtcm_injector(self):
+        if self.rtcm_injector:
+            self.rtcm_injector.close()
+            self.rtcm_injector = None
     
     def setup_udp(self):
         """Configurar socket UDP para envio ao QtAgIO"""
@@ -130,74 +259,280 @@ class GPSBridge:
         
         # Validar checksum se presente
         if '*' in sentence and not self.validate_nmea_checksum(sentence):
-            self.logger.warning(f"Checksum inválido: {sentence[:30]}...")
+            self.logger.warning("Checksum inválido: %s...", sentence[:30])
             return None
         
-        # Filtrar sentenças importantes para QtAgOpenGPS
-        important_sentences = ['GGA', 'RMC', 'VTG', 'HDT', 'GSA']
-        sentence_type = sentence[3:6] if len(sentence) > 6 else ""
+        # Mesma tabela de filtro do caminho em bytes (sem dizimação)
+        address = sentence[1:sentence.find(',')].encode('ascii', errors='replace')
+        if self.sentence_filter.resolve(address).period_ns < 0:
+            return None
+        return sentence
+    
+    def filter_sentence(self, buf, start, end, view, arrival_ns=None):
+        """Caminho rápido em bytes: validar e filtrar a linha buf[start:end]
+        pela tabela de filtro (ver sentence_filter.py)
+
+        Retorna os bytes a enviar (um memoryview de buf quando a linha já
+        termina em '\\r\\n') ou None se a sentença deve ser descartada."""
+        status = nmea_bytes.check_sentence(buf, start, end, view)
         
-        if any(sentence_type == s for s in important_sentences):
-            return sentence
+        if status == nmea_bytes.NOT_NMEA:
+            self.metrics.not_nmea += 1
+            return None
         
-        # Também aceitar sentenças com prefixos diferentes (GP, GN, GL, etc.)
-        if len(sentence) > 6:
-            sentence_type = sentence[1:6]  # Pegar GPGGA, GNRMC, etc.
-            if any(sentence_type.endswith(s) for s in important_sentences):
-                return sentence
+        if status == nmea_bytes.CHECKSUM_BAD:
+            self.metrics.checksum_failures += 1
+            self.logger.warning("Checksum inválido: %s...",
+                                buf[start:start + 30].decode('ascii', errors='replace'))
+            return None
         
-        return None
+        rule = self.sentence_filter.rule(buf, start, end)
+        if rule.period_ns:
+            if rule.period_ns < 0:
+                self.metrics.filtered += 1
+                return None
+            # Com a fusão, o montador precisa de todas as sentenças da época
+            if self.epoch_assembler is None or \
+               buf[start + 3:start + 6] not in epoch_fusion.FUSED_TYPES:
+                if not rule.due(arrival_ns if arrival_ns is not None else time.perf_counter_ns()):
+                    self.metrics.decimated += 1
+                    return None
+        
+        # O FormLoop::Parse do QtAgIO procura o '\\r' no fim da sentença
+        if buf[end - 2:end] == b"\r\n":
+            return view[start:end]
+        return buf[start:nmea_bytes.sentence_end(buf, start, end)] + b"\r\n"
     
     def send_udp_packet(self, data):
-        """Enviar dados via UDP para QtAgIO"""
+        """Enviar dados (bytes ou memoryview) via UDP para QtAgIO"""
         try:
-            # Formato esperado pelo QtAgIO (baseado na análise do código)
-            # Adicionar quebra de linha se não tiver
-            if not data.endswith('\n'):
-                data += '\n'
-            
-            # Enviar dados
-            self.udp_socket.sendto(data.encode('ascii'), (self.udp_host, self.udp_port))
+            self.udp_socket.sendto(data, (self.udp_host, self.udp_port))
             self.sentences_sent += 1
             return True
         except Exception as e:
-            self.logger.error(f"Erro ao enviar UDP: {e}")
+            self.logger.error("Erro ao enviar UDP: %s", e)
             self.errors += 1
             return False
     
+    def accept_line(self, buf, start, end, view, arrival_ns):
+        """Validar/filtrar a linha e, com a fusão de épocas ativa, entregá-la
+        ao montador. Retorna as sentenças prontas para envio."""
+        data = self.filter_sentence(buf, start, end, view, arrival_ns)
+        
+        if data is None:
+            return ()
+        
+        self.observe_sentence(buf, start, end, arrival_ns)
+        
+        if self.epoch_assembler is not None and \
+           buf[start + 3:start + 6] in epoch_fusion.FUSED_TYPES:
+            return self.epoch_assembler.feed(buf, start, end, arrival_ns)
+        
+        return (data,)
+    
+    def observe_sentence(self, buf, start, end, arrival_ns):
+        """Contar a sentença aceita por endereço e marcar inícios de época"""
+        comma = buf.find(b",", start, end)
+        address = buf[start + 1:comma]
+        self.metrics.count_received(address, arrival_ns)
+        
+        if address[2:] in epoch_fusion.TIMED_TYPES or address in nmea_bytes.PROPRIETARY_TYPES:
+            utc_end = buf.find(b",", comma + 1, end)
+            self.metrics.observe_epoch(buf[comma + 1:utc_end], arrival_ns)
+    
+    def forward(self, data, arrival_ns):
+        """Enviar via UDP e registrar a latência"""
+        if self.send_udp_packet(data):
+            self.record_latency(arrival_ns)
+            self.metrics.count_sent(bytes(data[1:6]))  # GNGGA, PANDA, ...
+            if self.log_sent:
+                self.logger.debug("📡 Enviado: %s...", bytes(data[:50]))
+    
+    def flush_epochs(self):
+        """Enviar a época pendente cujo tempo limite expirou"""
+        if self.epoch_assembler is None:
+            return
+        now_ns = time.perf_counter_ns()
+        for data in self.epoch_assembler.poll(now_ns):
+            self.forward(data, now_ns)
+    
+    def select_timeout(self):
+        """Tempo máximo de espera no select: até o fim da época pendente"""
+        deadline_ns = self.epoch_assembler.deadline_ns() if self.epoch_assembler else None
+        if deadline_ns is None:
+            return SELECT_IDLE_SECONDS
+        return max(0.0, (deadline_ns - time.perf_counter_ns()) / 1e9)
+    
+    def handle_line(self, buf, start, end, arrival_ns, view):
+        """Processar a linha buf[start:end] e medir a latência até o envio UDP"""
+        # Linha vazia (só o terminador)
+        if buf[start] in nmea_bytes.LINE_TERMINATORS:
+            return
+        
+        self.sentences_received += 1
+        
+        for data in self.accept_line(buf, start, end, view, arrival_ns):
+            self.forward(data, arrival_ns)
+        
+        # Log periódico de estatísticas
+        if self.sentences_received % 100 == 0:
+            self.print_statistics()
+    
+    def handle_ubx(self, chunk, arrival_ns):
+        """Converter os quadros NAV-PVT completos do bloco em $PANDA e enviar"""
+        for sentence in self.ubx_decoder.feed(chunk):
+            self.handle_line(sentence, 0, len(sentence), arrival_ns, memoryview(sentence))
+    
+    def handle_chunk(self, chunk, arrival_ns):
+        """Processar um bloco de bytes lido de uma vez (serial ou captura)"""
+        if self.capture_writer is not None:
+            self.capture_writer.write(chunk, arrival_ns)
+        if self.raw_archive is not None:
+            self.raw_archive.write(chunk)
+        self.metrics.serial_bytes += len(chunk)
+        
+        # Leitura cheia: o driver tinha mais bytes esperando (leitor atrasado)
+        if len(chunk) >= self.read_chunk_size:
+            self.metrics.full_reads += 1
+        
+        if self.ubx_decoder is not None:
+            self.handle_ubx(chunk, arrival_ns)
+            return
+        
+        buffer = self.rx_buffer + chunk if self.rx_buffer else chunk
+        
+        # As linhas são tratadas por índices sobre o bloco lido;
+        # só o sendto recebe um memoryview do próprio bloco
+        view = memoryview(buffer)
+        start = 0
+        end = buffer.find(b"\n")
+        while end != -1:
+            self.handle_line(buffer, start, end + 1, arrival_ns, view)
+            start = end + 1
+            end = buffer.find(b"\n", start)
+        buffer = buffer[start:]
+        
+        # Lixo sem terminador não pode crescer indefinidamente
+        if len(buffer) > self.max_line_length:
+            self.metrics.rx_discards += 1
+            buffer = b""
+        self.rx_buffer = buffer
+    
     def serial_reader_thread(self):
         """Thread para ler dados da porta serial"""
-        self.logger.info("🔄 Thread de leitura serial iniciada")
+        self.logger.info(f"🔄 Thread de leitura serial iniciada (modo {self.reader_mode})")
+        
+        if self.input_format == "ubx":
+            self.ubx_decoder = ubx.NavPvtToPanda()
+        
+        if self.realtime:
+            realtime.apply(self.realtime_cpu, self.realtime_priority, self.logger)
         
+        if self.reader_mode == "select":
+            self.serial_reader_select()
+        else:
+            self.serial_reader_poll()
+    
+    def serial_reader_poll(self):
+        """Leitura por polling: in_waiting + readline + pausa de 10 ms"""
         while self.running:
             try:
                 if self.serial_conn and self.serial_conn.in_waiting > 0:
+                    if self.ubx_decoder is not None:
+                        chunk = self.serial_conn.read(self.serial_conn.in_waiting)
+                        self.handle_chunk(chunk, time.perf_counter_ns())
+                        continue
+                    
                     # Ler linha da porta serial
                     raw_data = self.serial_conn.readline()
-                    sentence = raw_data.decode('ascii', errors='ignore').strip()
-                    
-                    if sentence:
-                        self.sentences_received += 1
-                        
-                        # Processar sentença NMEA
-                        processed_sentence = self.process_nmea_sentence(sentence)
-                        
-                        if processed_sentence:
-                            # Enviar via UDP
-                            if self.send_udp_packet(processed_sentence):
-                                self.logger.debug(f"📡 Enviado: {processed_sentence[:50]}...")
-                            
-                        # Log periódico de estatísticas
-                        if self.sentences_received % 100 == 0:
-                            self.print_statistics()
+                    arrival_ns = time.perf_counter_ns()
+                    if self.capture_writer is not None:
+                        self.capture_writer.write(raw_data, arrival_ns)
+                    if self.raw_archive is not None:
+                        self.raw_archive.write(raw_data)
+                    self.metrics.serial_bytes += len(raw_data)
+                    self.handle_line(raw_data, 0, len(raw_data), arrival_ns,
+                                     memoryview(raw_data))
                 
+                self.flush_epochs()
+                self.check_receiver()
+                if self.realtime:
+                    self.gc_collector.after_epoch(time.perf_counter_ns())
                 time.sleep(0.01)  # Pequena pausa para não sobrecarregar CPU
                 
             except Exception as e:
-                self.logger.error(f"Erro na thread de leitura: {e}")
+                self.logger.error("Erro na thread de leitura: %s", e)
                 self.errors += 1
                 time.sleep(1)
     
+    def serial_reader_select(self):
+        """Leitura orientada a eventos: bloqueia no descritor, lê em bloco
+        tudo o que chegou e separa as sentenças completas de um buffer de
+        remontagem"""
+        fd = self.serial_conn.fileno()
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ)
+        
+        try:
+            while self.running:
+                try:
+                    # Timeout para verificar self.running e o fim da época pendente
+                    timeout = self.select_timeout()
+                    if not selector.select(timeout=timeout):
+                        self.flush_epochs()
+                        self.check_receiver()
+                        if self.realtime and timeout >= SELECT_IDLE_SECONDS:
+                            realtime.collect_idle()  # serial em silêncio
+                        elif self.realtime:
+                            # Época pendente acabou de sair por tempo limite
+                            self.gc_collector.after_epoch(time.perf_counter_ns())
+                        continue
+                    
+                    arrival_ns = time.perf_counter_ns()
+                    try:
+                        chunk = os.read(fd, self.read_chunk_size)
+                    except BlockingIOError:
+                        continue
+                    
+                    if not chunk:
+                        # Descritor fechado (dispositivo removido)
+                        raise serial.SerialException("dispositivo serial retornou EOF")
+                    
+                    self.handle_chunk(chunk, arrival_ns)
+                    self.check_receiver()
+                    if self.realtime and not self.rx_buffer:
+                        # Sem linha pela metade: fim da rajada da época
+                        self.gc_collector.after_epoch(arrival_ns)
+                    
+                except Exception as e:
+                    if not self.running:
+                        break
+                    self.logger.error("Erro na thread de leitura: %s", e)
+                    self.errors += 1
+                    self.rx_buffer = b""
+                    time.sleep(1)
+        finally:
+            selector.close()
+    
+    def record_latency(self, arrival_ns):
+        """Registrar a latência de uma sentença enviada"""
+        latency_ns = time.perf_counter_ns() - arrival_ns
+        self.latency_samples.append(latency_ns)
+        self.metrics.latency.observe(latency_ns)
+        if latency_ns > self.latency_max_ns:
+            self.latency_max_ns = latency_ns
+    
+    def latency_summary(self):
+        """Resumo da latência chegada serial -> envio UDP em microssegundos"""
+        if not self.latency_samples:
+            return None
+        
+        samples = sorted(self.latency_samples)
+        count = len(samples)
+        p50 = samples[count // 2]
+        p99 = samples[min(count - 1, (count * 99) // 100)]
+        return p50 / 1000.0, p99 / 1000.0, self.latency_max_ns / 1000.0
+    
     def print_statistics(self):
         """Imprimir estatísticas de funcionamento"""
         if self.start_time:
@@ -207,6 +542,53 @@ class GPSBridge:
             self.logger.info(f"📊 Stats: Recebidas={self.sentences_received}, "
                            f"Enviadas={self.sentences_sent}, Erros={self.errors}, "
                            f"Taxa={rate:.1f}/s, Uptime={uptime:.0f}s")
+            
+            # Só quando houve supressões desde o último resumo
+            suppressed = self.log_pipeline.rate_filter.suppressed
+            if suppressed != self.log_suppressed_reported:
+                self.log_suppressed_reported = suppressed
+                self.logger.info(f"🔇 Log: {suppressed} avisos repetidos suprimidos, "
+                               f"{self.log_pipeline.handler.dropped} descartados (fila cheia)")
+            
+            if self.raw_archive is not None:
+                self.logger.info(f"🗄️  Arquivo bruto: {self.raw_archive.bytes_written / 1e6:.1f} MB "
+                               f"recebidos, {self.raw_archive.dropped} blocos descartados "
+                               f"({self.raw_archive.path or '-'})")
+            
+            if self.receiver_reconfigurations:
+                self.logger.info(f"🔧 Perfil reaplicado {self.receiver_reconfigurations}x "
+                               f"(reinício do receptor)")
+            
+            if self.epoch_assembler is not None:
+                self.logger.info(f"🧩 Épocas: emitidas={self.epoch_assembler.epochs_emitted}, "
+                               f"por tempo limite={self.epoch_assembler.epochs_timed_out}")
+            
+            if self.dual_aligner is not None:
+                aligner = self.dual_aligner
+                length = f", base {aligner.last_length:.3f} m" if aligner.last_length is not None else ""
+                self.logger.info(f"🧭 Antena dupla: com rumo={aligner.aligned}, "
+                               f"sem par={aligner.unpaired}, rejeitadas={aligner.rejected}{length}")
+            
+            utilization = self.metrics.link_utilization()
+            if utilization is not None:
+                capacity = uart_baud.link_capacity(self.metrics.baud_rate)
+                self.logger.info(f"🔌 UART: {utilization * capacity / 1000:.1f} de "
+                               f"{capacity / 1000:.1f} KB/s @ {self.metrics.baud_rate} "
+                               f"({utilization:.0%}, folga {1 - utilization:.0%})")
+            
+            age = self.metrics.correction_age()
+            if age is not None:
+                tx_utilization = self.metrics.link_utilization(transmit=True) or 0.0
+                capacity = uart_baud.link_capacity(self.metrics.baud_rate or self.baud_rate)
+                self.logger.info(f"🛰️  RTCM: idade {age:.1f} s, "
+                               f"{tx_utilization * capacity / 1000:.2f} KB/s na TX "
+                               f"({tx_utilization:.0%}), quadros={sum(self.metrics.rtcm_messages.values())}, "
+                               f"CRC={self.metrics.rtcm_crc_errors}, descartados={self.metrics.rtcm_dropped}")
+            
+            latency = self.latency_summary()
+            if latency:
+                self.logger.info(f"⏱️  Latência serial->UDP: p50={latency[0]:.0f}µs, "
+                               f"p99={latency[1]:.0f}µs, max={latency[2]:.0f}µs")
     
     def signal_handler(self, signum, frame):
         """Handler para sinais de sistema (Ctrl+C)"""
@@ -233,14 +615,19 @@ class GPSBridge:
         # Iniciar operação
         self.running = True
         self.start_time = time.time()
+        self.metrics.serial_fd = self.serial_conn.fileno()
+        self.start_metrics_server()
+        self.start_rtcm_injector(self.serial_conn, self.serial_conn.port)
         
         # Iniciar thread de leitura serial
         serial_thread = threading.Thread(target=self.serial_reader_thread, daemon=True)
         serial_thread.start()
         
         self.logger.info("✅ GPS Bridge iniciado com sucesso!")
-        self.logger.info(f"📡 Serial: {self.serial_conn.port} @ {self.baud_rate}")
+        self.logger.info(f"📡 Serial: {self.serial_conn.port} @ {self.baud_rate} "
+                         f"(leitura: {self.reader_mode}, formato: {self.input_format})")
         self.logger.info(f"🌐 UDP: {self.udp_host}:{self.udp_port}")
+        self.logger.info(f"🧹 Filtro: {self.sentence_filter.describe()}")
         self.logger.info("Pressione Ctrl+C para parar")
         
         # Loop principal
@@ -254,12 +641,158 @@ class GPSBridge:
         self.stop()
         return True
     
+    def replay(self, capture_path, speed=1.0):
+        """Reproduzir uma captura pelo mesmo processamento, enviando ao UDP.
+        speed: 1 = tempo real, N = N vezes mais rápido, 0 = o mais rápido possível"""
+        self.logger.info(f"⏯️  Reproduzindo {capture_path} "
+                         f"({'máxima velocidade' if speed <= 0 else f'{speed:g}x'})")
+        
+        try:
+            reader = capture.CaptureReader(capture_path)
+        except (OSError, ValueError) as e:
+            self.logger.error(f"❌ Erro ao abrir captura: {e}")
+            return False
+        
+        if not self.setup_udp():
+            self.logger.error("❌ Falha ao configurar conexão UDP")
+            reader.close()
+            return False
+        
+        signal.signal(signal.SIGINT, self.signal_handler)
+        signal.signal(signal.SIGTERM, self.signal_handler)
+        
+        if self.input_format == "ubx":
+            self.ubx_decoder = ubx.NavPvtToPanda()
+        
+        self.running = True
+        self.start_time = time.time()
+        records = 0
+        schedule_ns = time.perf_counter_ns()
+        
+        try:
+            for delta_us, chunk in reader:
+                if not self.running:
+                    break
+                
+                if speed > 0:
+                    schedule_ns += int(delta_us * 1000 / speed)
+                    delay = (schedule_ns - time.perf_counter_ns()) / 1e9
+                    if delay > 0:
+                        # Épocas pendentes vencem durante a espera
+                        while delay > 0 and self.epoch_assembler is not None and \
+                              self.epoch_assembler.deadline_ns() is not None:
+                            time.sleep(min(delay, self.select_timeout()))
+                            self.flush_epochs()
+                            delay = (schedule_ns - time.perf_counter_ns()) / 1e9
+                        if delay > 0:
+                            time.sleep(delay)
+                
+                self.handle_chunk(chunk, time.perf_counter_ns())
+                records += 1
+            
+            # Última época pendente
+            if self.epoch_assembler is not None:
+                for data in self.epoch_assembler.poll(float('inf')):
+                    self.forward(data, time.perf_counter_ns())
+        finally:
+            reader.close()
+        
+        self.logger.info(f"⏹️  Reprodução concluída: {records} blocos")
+        self.stop()
+        return True
+    
+    def start_engine(self, input_specs, output_specs, queue_size=256):
+        """Iniciar a ponte no motor asyncio (várias entradas e saídas)"""
+        self.logger.info("🚀 Iniciando GPS Bridge (motor asyncio)...")
+        
+        try:
+            sources = [bridge_engine.parse_source(spec, self.baud_rate, self.input_format)
+                       for spec in input_specs]
+            sinks = [bridge_engine.parse_sink(spec, queue_size) for spec in output_specs]
+        except ValueError as e:
+            self.logger.error(f"❌ {e}")
+            return False
+        
+        # Sem entradas explícitas: detectar a porta serial como no modo normal
+        if not sources:
+            if not self.setup_serial(configure=False):
+                self.logger.error("❌ Falha ao configurar conexão serial")
+                return False
+            device = self.serial_conn.port
+            self.serial_conn.close()
+            self.serial_conn = None
+            source = bridge_engine.SerialSource(device, self.baud_rate)
+            source.input_format = self.input_format
+            sources.append(source)
+        
+        if self.dual_aligner is not None and len(sources) < 2:
+            self.logger.error("❌ Antena dupla precisa de duas entradas "
+                              "(--input do principal e --input do secundário)")
+            return False
+        
+        if not sinks:
+            sinks.append(bridge_engine.UdpSink(self.udp_host, self.udp_port, queue_size))
+        
+        self.running = True
+        self.start_time = time.time()
+        self.start_metrics_server()
+        rtcm_source = next((source for source in sources
+                            if isinstance(source, bridge_engine.SerialSource)), None)
+        if rtcm_source is not None:
+            self.start_rtcm_injector(None, rtcm_source.device)
+        elif self.rtcm_port:
+            self.logger.info("🛰️  Sem entrada serial: correções RTCM3 não são injetadas")
+        engine = bridge_engine.BridgeEngine(self, sources, sinks, rtcm_source)
+        if self.realtime:
+            # O laço asyncio roda nesta thread
+            realtime.apply(self.realtime_cpu, self.realtime_priority, self.logger)
+        asyncio.run(engine.run())
+        self.running = False
+        self.stop_rtcm_injector()
+        self.stop_metrics_server()
+        
+        if self.capture_writer:
+            self.capture_writer.close()
+            self.capture_writer = None
+        self.close_raw_archive()
+        
+        self.print_statistics()
+        engine.print_sink_statistics()
+        self.logger.info("✅ GPS Bridge parado")
+        return True
+    
+    def start_metrics_server(self):
+        """Servir as métricas (Prometheus) em http://127.0.0.1:porta/metrics"""
+        if not self.metrics_port:
+            return
+        try:
+            self.metrics_server = metrics.MetricsServer(self.metrics, port=self.metrics_port)
+        except OSError as e:
+            self.logger.warning(f"⚠️  Métricas indisponíveis na porta {self.metrics_port}: {e}")
+            return
+        self.metrics_server.start()
+        self.logger.info(f"📈 Métricas: http://127.0.0.1:{self.metrics_port}/metrics")
+    
+    def stop_metrics_server(self):
+        if self.metrics_server:
+            self.metrics_server.close()
+            self.metrics_server = None
+    
+    def close_raw_archive(self):
+        """Gravar o que falta do arquivo bruto e fechar o gzip atual"""
+        if self.raw_archive is not None:
+            self.raw_archive.close()
+            self.logger.info(f"🗄️  Arquivo bruto fechado: {self.raw_archive.path or '-'}")
+    
     def stop(self):
         """Parar a ponte GPS"""
         self.logger.info("🛑 Parando GPS Bridge...")
         self.running = False
         
         # Fechar conexões
+        self.stop_rtcm_injector()
+        if self.configurator is not None:
+            self.configurator.detach()
         if self.serial_conn:
             self.serial_conn.close()
             self.logger.info("📱 Conexão serial fechada")
@@ -268,20 +801,178 @@ class GPSBridge:
             self.udp_socket.close()
             self.logger.info("🌐 Socket UDP fechado")
         
+        self.stop_metrics_server()
+        
+        if self.capture_writer:
+            self.capture_writer.close()
+            self.logger.info(f"💾 Captura gravada: {self.capture_writer.path} "
+                             f"({self.capture_writer.bytes_written} bytes)")
+            self.capture_writer = None
+        self.close_raw_archive()
+        
         # Estatísticas finais
         self.print_statistics()
         self.logger.info("✅ GPS Bridge parado")
 
+def parse_arguments():
+    """Ler opções de linha de comando"""
+    parser = argparse.ArgumentParser(description='Ponte serial (GNSS) para UDP (QtAgIO)')
+    parser.add_argument('--device', help='porta serial (padrão: /dev/ttyAMA0, depois /dev/ttyS0)')
+    parser.add_argument('--baud', type=int, default=115200,
+                        help='baud rate testado primeiro (os demais são testados se falhar)')
+    parser.add_argument('--upgrade-baud', nargs='?', const=uart_baud.UPGRADE_BAUD_RATES,
+                        type=uart_baud.upgrade_argument, metavar='BAUD',
+                        help='negociar baud rate maior com o receptor na partida '
+                             '(auto: 921600, 460800, 230400)')
+    parser.add_argument('--configure', nargs='?', const=configure_m10fly.DEFAULT_PROFILE,
+                        choices=sorted(configure_m10fly.PROFILES), metavar='PERFIL',
+                        help='aplicar um perfil do configure_m10fly.py na porta já aberta '
+                             'antes de transmitir, e de novo se o receptor reiniciar '
+                             f'(padrão: {configure_m10fly.DEFAULT_PROFILE})')
+    parser.add_argument('--state-file', default=serial_probe.STATE_FILE,
+                        help='arquivo com a última porta/baud que funcionou')
+    parser.add_argument('--no-state', action='store_true',
+                        help='não usar nem gravar o arquivo de estado da serial')
+    parser.add_argument('--udp-host', default='127.0.0.1', help='destino UDP (QtAgIO)')
+    parser.add_argument('--udp-port', type=int, default=9999, help='porta UDP do QtAgIO')
+    parser.add_argument('--rtcm-port', type=int, default=rtcm_injector.NTRIP_UDP_PORT,
+                        help='porta UDP das correções RTCM3 do NTRIP do QtAgIO, '
+                             'escritas na serial do receptor (0 desativa)')
+    parser.add_argument('--metrics-port', type=int, default=9108,
+                        help='porta HTTP local das métricas Prometheus (0 desativa)')
+    parser.add_argument('--reader', choices=['select', 'poll'], default='select',
+                        help='modo de leitura serial: select (orientado a eventos) ou poll (antigo)')
+    parser.add_argument('--input-format', choices=['nmea', 'ubx'], default='nmea',
+                        help='nmea: repassa sentenças NMEA; ubx: converte UBX-NAV-PVT em $PANDA')
+    parser.add_argument('--filter', action='append', default=[], metavar='REGRAS',
+                        help='regras da tabela de filtro, ex.: "GSA=1,GSV=drop,PSTI=pass,P*=drop" '
+                             '(pass, drop ou Hz; repetível, sobre a tabela padrão)')
+    parser.add_argument('--fuse-epochs', action='store_true',
+                        help='enviar um único $PAOGI/$PANDA por época em vez de GGA/RMC/VTG/HDT/GSA')
+    parser.add_argument('--epoch-timeout-ms', type=float, default=50,
+                        help='tempo máximo de espera pelas sentenças de uma época (fusão)')
+    parser.add_argument('--dual-antenna', action='store_true',
+                        help='dois receptores (1ª --input = principal, 2ª = secundário): '
+                             'rumo e rolagem pela linha de base entre as antenas')
+    parser.add_argument('--dual-mount', choices=sorted(dual_antenna.MOUNT_OFFSETS), default='right',
+                        help='posição da antena secundária em relação à principal')
+    parser.add_argument('--dual-output', choices=['nmea', 'paogi'], default='nmea',
+                        help='nmea: GGA + $GNHDT por época; paogi: um único $PAOGI por época')
+    parser.add_argument('--dual-baseline', type=float, metavar='METROS',
+                        help='distância entre as antenas; épocas com base medida fora '
+                             f'de ±{dual_antenna.BASELINE_TOLERANCE_M:g} m ficam sem rumo')
+    parser.add_argument('--dual-wait-ms', type=float, default=50,
+                        help='espera máxima pelo GGA do secundário antes de enviar só a posição')
+    parser.add_argument('--dual-any-fix', action='store_true',
+                        help='calcular o rumo também sem RTK fixo/flutuante nos dois receptores')
+    parser.add_argument('--realtime', action='store_true',
+                        help='modo tempo real: leitura fixa em um núcleo, SCHED_FIFO (ou nice -10), '
+                             'memória travada e GC desligado')
+    parser.add_argument('--realtime-cpu', type=int, metavar='NÚCLEO',
+                        help='núcleo da thread de leitura no modo tempo real (padrão: o último)')
+    parser.add_argument('--realtime-priority', type=int, default=realtime.DEFAULT_FIFO_PRIORITY,
+                        help='prioridade SCHED_FIFO (1-99; 0 = só nice)')
+    parser.add_argument('--record', metavar='ARQUIVO',
+                        help='gravar o fluxo bruto da serial em um arquivo de captura binário')
+    parser.add_argument('--archive', metavar='DIRETÓRIO',
+                        help='guardar o fluxo bruto da serial em arquivos gzip rotativos (um por hora)')
+    parser.add_argument('--archive-max-mb', type=int, default=raw_archive.MAX_BYTES // (1024 * 1024),
+                        help='tamanho total do arquivo bruto; acima disso apaga os mais antigos')
+    parser.add_argument('--log-file', default=log_pipeline.LOG_FILE,
+                        help='arquivo de log (rotativo)')
+    parser.add_argument('--debug', action='store_true',
+                        help='log detalhado (cada sentença enviada)')
+    parser.add_argument('--replay', metavar='ARQUIVO',
+                        help='reproduzir um arquivo de captura em vez de ler a serial')
+    parser.add_argument('--replay-speed', type=float, default=1.0,
+                        help='velocidade da reprodução: 1 = tempo real, N = Nx, 0 = máxima')
+    parser.add_argument('--engine', choices=['thread', 'asyncio'], default='thread',
+                        help='thread: uma serial -> um destino UDP; asyncio: várias entradas/saídas')
+    parser.add_argument('--input', action='append', default=[], metavar='SPEC',
+                        help='entrada do motor asyncio (repetível): serial:/dev/ttyAMA0[@baud], '
+                             'udp:host:porta, tcp:host:porta, pty[:link]')
+    parser.add_argument('--output', action='append', default=[], metavar='SPEC',
+                        help='saída do motor asyncio (repetível): udp:host:porta, tcp:host:porta, '
+                             'tcp-server:host:porta, file:caminho')
+    parser.add_argument('--queue-size', type=int, default=256,
+                        help='tamanho da fila de cada saída (descarta a mais antiga quando cheia)')
+    return parser.parse_args()
+
 def main():
     """Função principal"""
+    args = parse_arguments()
+    
     print("=== GPS Bridge para QtAgOpenGPS ===")
     print("Conectando módulo GNSS M10Fly ao QtAgIO via UDP")
     print()
     
+    log_pipeline.setup(args.log_file, logging.DEBUG if args.debug else logging.INFO)
     bridge = GPSBridge()
+    if args.device:
+        bridge.serial_device = args.device
+        bridge.serial_device_alt = None
+    bridge.baud_rate = args.baud
+    bridge.serial_state_file = None if args.no_state else args.state_file
+    if args.upgrade_baud and max(args.upgrade_baud) <= args.baud:
+        print(f"❌ --upgrade-baud precisa de um baud rate maior que --baud {args.baud}")
+        sys.exit(2)
+    bridge.baud_upgrade = args.upgrade_baud
+    bridge.udp_host = args.udp_host
+    bridge.udp_port = args.udp_port
+    bridge.metrics_port = args.metrics_port
+    bridge.rtcm_port = args.rtcm_port
+    bridge.reader_mode = args.reader
+    bridge.realtime = args.realtime
+    bridge.realtime_cpu = args.realtime_cpu
+    bridge.realtime_priority = args.realtime_priority
+    bridge.input_format = args.input_format
+    if args.filter:
+        rules = dict(sentence_filter.DEFAULT_RULES)
+        try:
+            for text in args.filter:
+                rules.update(sentence_filter.parse_rules(text))
+        except ValueError as e:
+            print(f"❌ --filter: {e}")
+            sys.exit(2)
+        bridge.sentence_filter = sentence_filter.SentenceFilter(rules)
+    if args.configure:
+        bridge.configurator = configure_m10fly.M10FlyConfigurator(args.configure)
+        bridge.configurator.serial_state_file = bridge.serial_state_file
+        bridge.configurator.logger = bridge.logger
+        # A entrada segue a saída do perfil (NMEA ou UBX-NAV-PVT)
+        bridge.input_format = bridge.configurator.profile['output']
+    if args.fuse_epochs:
+        bridge.epoch_assembler = epoch_fusion.EpochAssembler(args.epoch_timeout_ms)
+    if args.dual_antenna:
+        if args.fuse_epochs:
+            print("❌ --dual-antenna já monta a saída por época; use --dual-output paogi "
+                  "em vez de --fuse-epochs")
+            sys.exit(2)
+        bridge.dual_aligner = dual_antenna.DualAntennaAligner(
+            args.dual_mount, args.dual_output, args.dual_wait_ms,
+            args.dual_baseline, require_rtk=not args.dual_any_fix)
+    
+    use_engine = args.engine == 'asyncio' or args.input or args.output or args.dual_antenna
+    if use_engine and not args.replay:
+        # O motor asyncio reabre a serial e não tem o watchdog do receptor
+        for option, value in (('--configure', args.configure), ('--upgrade-baud', args.upgrade_baud)):
+            if value:
+                print(f"❌ {option} só vale para o motor padrão (--engine thread)")
+                sys.exit(2)
+    
+    if args.record:
+        bridge.capture_writer = capture.CaptureWriter(args.record)
+    if args.archive and not args.replay:
+        bridge.raw_archive = raw_archive.RawArchive(
+            args.archive, max_bytes=args.archive_max_mb * 1024 * 1024, logger=bridge.logger)
     
     try:
-        success = bridge.start()
+        if args.replay:
+            success = bridge.replay(args.replay, args.replay_speed)
+        elif use_engine:
+            success = bridge.start_engine(args.input, args.output, args.queue_size)
+        else:
+            success = bridge.start()
         sys.exit(0 if success else 1)
     except Exception as e:
         print(f"❌ Erro fatal: {e}")
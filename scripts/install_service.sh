@@ -43,6 +43,11 @@ StandardError=journal
 # Variáveis de ambiente
 Environment=PYTHONUNBUFFERED=1
 
+# Limites para o modo tempo real (gps_bridge.py --realtime): SCHED_FIFO
+# sem root e mlockall da memória do processo
+LimitRTPRIO=50
+LimitMEMLOCK=infinity
+
 # Configurações de segurança
 NoNewPrivileges=true
 PrivateTmp=true
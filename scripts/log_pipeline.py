@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Log do GPS Bridge fora do caminho quente
+As threads do bridge só colocam o registro numa fila (QueueHandler); a
+formatação da mensagem e a escrita no arquivo e no stdout ficam numa thread
+própria (QueueListener). Assim um cartão SD lento nunca atrasa a leitura
+serial.
+
+Avisos e erros repetidos (ex.: checksum inválido com o cabo ruidoso) saem
+no máximo uma vez por intervalo para cada ponto do código que os gera; a
+mensagem seguinte informa quantas repetições foram suprimidas. O arquivo
+de log é rotativo e não cresce sem limite no /tmp.
+
+Os argumentos das mensagens são formatados na thread do escritor: passe
+só objetos imutáveis (bytes, números, strings), nunca um buffer reusado.
+
+Autor: Configuração QtAgOpenGPS
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+
+LOG_FILE = '/tmp/gps_bridge.log'
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_MAX_BYTES = 5 * 1024 * 1024  # por arquivo; guarda LOG_BACKUPS anteriores
+LOG_BACKUPS = 3
+QUEUE_SIZE = 10000               # registros na fila; além disso, descartados
+RATE_LIMIT_SECONDS = 10.0        # intervalo mínimo entre avisos iguais
+
+
+class RateLimitFilter(logging.Filter):
+    """Deixa passar um aviso/erro por intervalo para cada ponto de origem
+    (arquivo + linha), contando os suprimidos"""
+
+    def __init__(self, interval=RATE_LIMIT_SECONDS, min_level=logging.WARNING):
+        super().__init__()
+        self.interval_ns = int(interval * 1e9)
+        self.min_level = min_level
+        self.sources = {}  # (arquivo, linha) -> [último envio ns, suprimidos]
+        self.suppressed = 0
+
+    def filter(self, record):
+        if record.levelno < self.min_level:
+            return True
+        now_ns = time.monotonic_ns()
+        key = (record.pathname, record.lineno)
+        state = self.sources.get(key)
+        if state is None:
+            self.sources[key] = [now_ns, 0]
+            return True
+        if now_ns - state[0] < self.interval_ns:
+            state[1] += 1
+            self.suppressed += 1
+            return False
+        if state[1]:
+            record.msg = f"{record.msg} [+{state[1]} repetições suprimidas]"
+        state[0] = now_ns
+        state[1] = 0
+        return True
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que não formata na thread que gera o log e descarta
+    (contando) quando a fila está cheia em vez de bloquear"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """Fila de log + thread escritora (arquivo rotativo e stdout)"""
+
+    def __init__(self, path=LOG_FILE, level=logging.INFO, interval=RATE_LIMIT_SECONDS):
+        formatter = logging.Formatter(LOG_FORMAT)
+        handlers = [logging.StreamHandler(sys.stdout)]
+        try:
+            handlers.append(logging.handlers.RotatingFileHandler(
+                path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS))
+        except OSError as e:
+            print(f"⚠️  Log em arquivo indisponível ({path}): {e}")
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        self.rate_filter = RateLimitFilter(interval)
+        self.handler = DeferredQueueHandler(queue.Queue(QUEUE_SIZE))
+        self.handler.addFilter(self.rate_filter)
+        self.listener = logging.handlers.QueueListener(self.handler.queue, *handlers)
+
+        root = logging.getLogger()
+        root.handlers = [self.handler]
+        root.setLevel(level)
+        self.listener.start()
+        self.running = True
+        atexit.register(self.close)
+
+    def close(self):
+        """Escrever o que ainda está na fila e parar a thread escritora"""
+        if self.running:
+            self.running = False
+            self.listener.stop()
+
+
+_pipeline = None
+
+
+def setup(path=LOG_FILE, level=logging.INFO):
+    """Configurar o log do processo (uma vez) e retornar o LogPipeline"""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = LogPipeline(path, level)
+    return _pipeline
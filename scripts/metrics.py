@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Métricas do GPS Bridge no formato texto do Prometheus
+Contadores por tipo de sentença, taxas na janela dos últimos segundos,
+histogramas de memória fixa (latência leitura -> envio e intervalo entre
+épocas), falhas de checksum, sentenças filtradas e sinais de overrun da
+serial e das correções RTCM injetadas (idade, bytes, ocupação da TX).
+Servidas por HTTP local (GET /metrics).
+
+O intervalo entre épocas mostra o que o gpsHz do FormLoop (limitado a
+3..20 Hz) esconde: um receptor de 10 Hz que na prática entrega 7 Hz em
+rajadas aparece como intervalos de 100 ms misturados com 200 ms ou mais.
+
+Autor: Configuração QtAgOpenGPS
+"""
+
+import bisect
+import fcntl
+import http.server
+import struct
+import threading
+import time
+from collections import deque
+
+# Limites dos baldes em segundos
+LATENCY_BUCKETS = (0.00005, 0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005,
+                   0.01, 0.02, 0.05, 0.1)
+EPOCH_GAP_BUCKETS = (0.01, 0.025, 0.04, 0.05, 0.06, 0.075, 0.1, 0.125, 0.15,
+                     0.2, 0.25, 0.5, 1.0, 2.0)
+
+# Janela das taxas por tipo (instantâneos a cada segundo)
+RATE_WINDOW_SECONDS = 10
+SNAPSHOT_INTERVAL_NS = 1000000000
+
+# Endereços distintos contados; o resto vai para "outro" (lixo com checksum válido)
+MAX_ADDRESSES = 64
+OTHER_ADDRESS = b'outro'
+
+# TIOCGICOUNT: contadores do driver da UART (struct serial_icounter_struct)
+TIOCGICOUNT = 0x545D
+ICOUNT_FORMAT = struct.Struct('20i')
+ICOUNT_OVERRUN = 7
+ICOUNT_BUF_OVERRUN = 10
+
+
+class Histogram:
+    """Histograma de baldes fixos; observações em nanossegundos"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.bounds_ns = [int(bound * 1e9) for bound in buckets]
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum_ns = 0
+        self.count = 0
+
+    def observe(self, value_ns):
+        self.counts[bisect.bisect_left(self.bounds_ns, value_ns)] += 1
+        self.sum_ns += value_ns
+        self.count += 1
+
+    def render(self, name, help_text, lines):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{le="{bound:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum {self.sum_ns / 1e9:.6f}")
+        lines.append(f"{name}_count {self.count}")
+
+
+def serial_icount(fd):
+    """(overrun, buf_overrun) do driver da serial, ou None se não suportado
+    (pty, adaptadores USB sem o ioctl)"""
+    try:
+        data = fcntl.ioctl(fd, TIOCGICOUNT, bytes(ICOUNT_FORMAT.size))
+    except OSError:
+        return None
+    fields = ICOUNT_FORMAT.unpack(data)
+    return fields[ICOUNT_OVERRUN], fields[ICOUNT_BUF_OVERRUN]
+
+
+class BridgeMetrics:
+    """Contadores do caminho quente; só inteiros e dicionários, a formatação
+    fica para a hora da coleta"""
+
+    def __init__(self):
+        self.received = {}
+        self.sent = {}
+        self.checksum_failures = 0
+        self.filtered = 0
+        self.decimated = 0
+        self.not_nmea = 0
+        self.full_reads = 0
+        self.rx_discards = 0
+        self.serial_bytes = 0
+        self.baud_rate = None
+        self.rtcm_messages = {}  # número da mensagem -> quadros
+        self.rtcm_bytes_received = 0
+        self.rtcm_bytes_written = 0
+        self.rtcm_crc_errors = 0
+        self.rtcm_dropped = 0
+        self.rtcm_last_ns = None
+        self.serial_fd = None
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.epoch_gap = Histogram(EPOCH_GAP_BUCKETS)
+        self.last_epoch_utc = None
+        self.last_epoch_ns = None
+        self.snapshots = deque(maxlen=RATE_WINDOW_SECONDS + 1)
+        self.last_snapshot_ns = 0
+
+    def _count(self, counters, address):
+        if address in counters:
+            counters[address] += 1
+        elif len(counters) < MAX_ADDRESSES:
+            counters[address] = 1
+        else:
+            counters[OTHER_ADDRESS] = counters.get(OTHER_ADDRESS, 0) + 1
+
+    def count_received(self, address, arrival_ns):
+        """Sentença válida recebida (endereço ex.: b'GNGGA')"""
+        self._count(self.received, address)
+        if arrival_ns - self.last_snapshot_ns >= SNAPSHOT_INTERVAL_NS:
+            self.snapshots.append((arrival_ns, dict(self.received), self.serial_bytes,
+                                   self.rtcm_bytes_written))
+            self.last_snapshot_ns = arrival_ns
+
+    def count_sent(self, address):
+        self._count(self.sent, address)
+
+    def count_rtcm(self, number, arrival_ns):
+        """Quadro RTCM3 válido recebido (número da mensagem, ex.: 1074)"""
+        if number in self.rtcm_messages or len(self.rtcm_messages) < MAX_ADDRESSES:
+            self.rtcm_messages[number] = self.rtcm_messages.get(number, 0) + 1
+        self.rtcm_last_ns = arrival_ns
+
+    def correction_age(self, now_ns=None):
+        """Segundos desde o último quadro RTCM, ou None se nunca chegou"""
+        if self.rtcm_last_ns is None:
+            return None
+        if now_ns is None:
+            now_ns = time.perf_counter_ns()
+        return (now_ns - self.rtcm_last_ns) / 1e9
+
+    def observe_epoch(self, utc, arrival_ns):
+        """Hora UTC de uma sentença com hora (GGA, RMC, $PANDA...): uma hora
+        nova marca o início de uma época"""
+        if utc == self.last_epoch_utc:
+            return
+        if self.last_epoch_ns is not None:
+            self.epoch_gap.observe(arrival_ns - self.last_epoch_ns)
+        self.last_epoch_utc = utc
+        self.last_epoch_ns = arrival_ns
+
+    def rates(self, now_ns=None):
+        """Sentenças/s por endereço na janela dos últimos segundos"""
+        if not self.snapshots:
+            return {}
+        if now_ns is None:
+            now_ns = time.perf_counter_ns()
+        then_ns, then, _, _ = self.snapshots[0]
+        elapsed = (now_ns - then_ns) / 1e9
+        if elapsed <= 0:
+            return {}
+        current = dict(self.received)
+        return {address: (count - then.get(address, 0)) / elapsed
+                for address, count in current.items()}
+
+    def link_utilization(self, now_ns=None, transmit=False):
+        """Fração da capacidade da UART (8N1) usada na janela, na recepção
+        ou (transmit=True) na transmissão das correções; None sem dados"""
+        if not self.snapshots or not self.baud_rate:
+            return None
+        if now_ns is None:
+            now_ns = time.perf_counter_ns()
+        then_ns, _, then_rx, then_tx = self.snapshots[0]
+        elapsed = (now_ns - then_ns) / 1e9
+        if elapsed <= 0:
+            return None
+        if transmit:
+            return (self.rtcm_bytes_written - then_tx) * 10 / elapsed / self.baud_rate
+        return (self.serial_bytes - then_rx) * 10 / elapsed / self.baud_rate
+
+    def render(self):
+        """Texto no formato de exposição do Prometheus"""
+        lines = []
+
+        def counter_family(name, help_text, counters):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for address, count in sorted(counters.items()):
+                lines.append(f'{name}{{sentence="{address.decode("ascii", "replace")}"}} {count}')
+
+        def single(name, metric_type, help_text, value):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"{name} {value}")
+
+        counter_family("gps_bridge_sentences_received_total",
+                       "Sentencas NMEA validas recebidas da serial e aceitas pela tabela de filtro",
+                       dict(self.received))
+        counter_family("gps_bridge_sentences_sent_total",
+                       "Sentencas enviadas ao QtAgIO por UDP", dict(self.sent))
+
+        name = "gps_bridge_sentence_rate_hz"
+        lines.append(f"# HELP {name} Sentencas/s recebidas nos ultimos {RATE_WINDOW_SECONDS} s")
+        lines.append(f"# TYPE {name} gauge")
+        for address, rate in sorted(self.rates().items()):
+            lines.append(f'{name}{{sentence="{address.decode("ascii", "replace")}"}} {rate:.3f}')
+
+        single("gps_bridge_checksum_failures_total", "counter",
+               "Sentencas descartadas por checksum invalido", self.checksum_failures)
+        single("gps_bridge_filtered_total", "counter",
+               "Sentencas validas descartadas pelo filtro de tipos", self.filtered)
+        single("gps_bridge_decimated_total", "counter",
+               "Sentencas validas nao enviadas pela dizimacao (N Hz)", self.decimated)
+        single("gps_bridge_not_nmea_total", "counter",
+               "Linhas que nao sao NMEA (lixo, binario)", self.not_nmea)
+        single("gps_bridge_serial_full_reads_total", "counter",
+               "Leituras que encheram o buffer de leitura (serial atrasada)", self.full_reads)
+        single("gps_bridge_rx_buffer_discards_total", "counter",
+               "Buffers de remontagem descartados por linha longa demais", self.rx_discards)
+
+        single("gps_bridge_serial_bytes_total", "counter",
+               "Bytes lidos da serial", self.serial_bytes)
+        if self.baud_rate:
+            single("gps_bridge_serial_baud_rate", "gauge",
+                   "Baud rate da UART", self.baud_rate)
+            utilization = self.link_utilization()
+            if utilization is not None:
+                single("gps_bridge_uart_utilization_ratio", "gauge",
+                       f"Fracao da capacidade da UART usada nos ultimos {RATE_WINDOW_SECONDS} s",
+                       f"{utilization:.4f}")
+
+        if self.rtcm_last_ns is not None:
+            name = "gps_bridge_rtcm_frames_total"
+            lines.append(f"# HELP {name} Quadros RTCM3 validos recebidos por UDP")
+            lines.append(f"# TYPE {name} counter")
+            for number, count in sorted(self.rtcm_messages.items()):
+                lines.append(f'{name}{{message="{number}"}} {count}')
+            single("gps_bridge_rtcm_bytes_received_total", "counter",
+                   "Bytes RTCM recebidos por UDP", self.rtcm_bytes_received)
+            single("gps_bridge_rtcm_bytes_written_total", "counter",
+                   "Bytes RTCM escritos na serial", self.rtcm_bytes_written)
+            single("gps_bridge_rtcm_crc_failures_total", "counter",
+                   "Quadros RTCM3 descartados por CRC-24Q invalido", self.rtcm_crc_errors)
+            single("gps_bridge_rtcm_dropped_total", "counter",
+                   "Quadros RTCM3 descartados por fila cheia (UART lenta)", self.rtcm_dropped)
+            single("gps_bridge_rtcm_age_seconds", "gauge",
+                   "Segundos desde o ultimo quadro RTCM3", f"{self.correction_age():.3f}")
+            utilization = self.link_utilization(transmit=True)
+            if utilization is not None:
+                single("gps_bridge_uart_tx_utilization_ratio", "gauge",
+                       f"Fracao da TX da UART usada pelas correcoes nos ultimos "
+                       f"{RATE_WINDOW_SECONDS} s", f"{utilization:.4f}")
+
+        icount = serial_icount(self.serial_fd) if self.serial_fd is not None else None
+        if icount is not None:
+            single("gps_bridge_serial_overrun_total", "counter",
+                   "Overruns da UART informados pelo driver", icount[0])
+            single("gps_bridge_serial_buffer_overrun_total", "counter",
+                   "Overruns do buffer tty informados pelo driver", icount[1])
+
+        self.latency.render("gps_bridge_latency_seconds",
+                            "Latencia chegada na serial -> envio UDP", lines)
+        self.epoch_gap.render("gps_bridge_epoch_gap_seconds",
+                              "Intervalo entre inicios de epoca (hora UTC nova)", lines)
+        lines.append("")
+        return "\n".join(lines)
+
+
+class MetricsServer:
+    """Servidor HTTP local em thread própria; GET /metrics"""
+
+    def __init__(self, metrics, host='127.0.0.1', port=9108):
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(handler):
+                if handler.path not in ('/', '/metrics'):
+                    handler.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                handler.send_response(200)
+                handler.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                handler.send_header('Content-Length', str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, format, *args):
+                pass  # uma linha por coleta só polui o log
+
+        self.server = http.server.ThreadingHTTPServer((host, port), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Caminho rápido NMEA em bytes
+Funções para validar e classificar sentenças NMEA sem decodificar para str.
+Trabalham sobre o bloco lido da serial com índices (início/fim da linha), de
+modo que a sentença só precisa virar um memoryview do próprio bloco na hora
+do sendto, sem cópias intermediárias.
+
+Autor: Configuração QtAgOpenGPS
+"""
+
+DOLLAR = 0x24  # '$'
+CR = 0x0D
+LF = 0x0A
+LINE_TERMINATORS = (CR, LF)
+
+# Tabela de conversão dos dois dígitos hexadecimais do checksum
+# (maiúsculos e minúsculos) para o valor inteiro
+HEX_PAIRS = {}
+for _value in range(256):
+    HEX_PAIRS[b"%02X" % _value] = _value
+    HEX_PAIRS[b"%02x" % _value] = _value
+del _value
+
+# Sentenças proprietárias entendidas pelo FormLoop::ParseNMEA (bytes 1..5)
+PROPRIETARY_TYPES = frozenset([b'PANDA', b'PAOGI'])
+
+# Resultado de check_sentence
+CHECKSUM_OK = 1
+CHECKSUM_ABSENT = 0
+CHECKSUM_BAD = -1
+NOT_NMEA = -2
+
+
+def xor_checksum(data):
+    """XOR de todos os bytes de data (bytes ou memoryview).
+
+    Em vez de um laço por caractere, os bytes viram um único inteiro e são
+    dobrados ao meio sucessivamente até sobrar 1 byte: ao final o byte menos
+    significativo contém o XOR de todos. Até 128 bytes (toda sentença NMEA
+    válida) as dobras são fixas, de 64 bytes a 1; acima disso (linha longa ou
+    lixo) as dobras começam na menor potência de dois que cobre a entrada."""
+    value = int.from_bytes(data, 'little')
+    if len(data) > 128:
+        shift = 1 << (8 * len(data) - 1).bit_length()
+        while shift > 1024:
+            shift >>= 1
+            value ^= value >> shift
+    value ^= value >> 512
+    value ^= value >> 256
+    value ^= value >> 128
+    value ^= value >> 64
+    value ^= value >> 32
+    value ^= value >> 16
+    value ^= value >> 8
+    return value & 0xFF
+
+
+def sentence_end(buf, start=0, end=None):
+    """Índice do fim da sentença em buf[start:end], sem '\\r' e '\\n'"""
+    if end is None:
+        end = len(buf)
+    while end > start and buf[end - 1] in LINE_TERMINATORS:
+        end -= 1
+    return end
+
+
+def check_sentence(buf, start=0, end=None, view=None):
+    """Validar a linha buf[start:end] no formato $...*hh\\r\\n
+
+    view é um memoryview de buf reaproveitado entre as linhas do mesmo bloco.
+    Retorna CHECKSUM_OK, CHECKSUM_ABSENT (sentença sem '*'), CHECKSUM_BAD ou
+    NOT_NMEA (não começa com '$' ou não tem ',')."""
+    if end is None:
+        end = len(buf)
+    if end - start < 7 or buf[start] != DOLLAR or buf.find(b",", start, end) == -1:
+        return NOT_NMEA
+
+    star = buf.rfind(b"*", start, end)
+    if star == -1:
+        return CHECKSUM_ABSENT
+
+    expected = HEX_PAIRS.get(buf[star + 1:star + 3])
+    if expected is None:
+        return CHECKSUM_BAD
+
+    if view is None:
+        view = memoryview(buf)
+    if xor_checksum(view[start + 1:star]) != expected:
+        return CHECKSUM_BAD
+    return CHECKSUM_OK
+
+
+def sentence_type(buf, start=0):
+    """Tipo da sentença (ex.: b'GGA') lido em posição fixa, após o talker"""
+    return buf[start + 3:start + 6]
+
+
+def sentence_address(buf, start=0, end=None):
+    """Talker + tipo (ex.: b'GNGGA'), ou o endereço completo de sentenças
+    proprietárias ($PANDA, $PUBX, ...)"""
+    if end is None:
+        end = len(buf)
+    comma = buf.find(b",", start, end)
+    return buf[start + 1:comma if comma != -1 else end]
+
+
+def build_sentence(body):
+    """Montar $body*hh\\r\\n a partir do corpo (bytes, sem '$')"""
+    return b"$%s*%02X\r\n" % (body, xor_checksum(body))
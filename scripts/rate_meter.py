@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Medição da taxa real de sentenças e do jitter do receptor
+Cada linha NMEA (com checksum válido) e cada quadro UBX recebe a hora de
+chegada; o relatório mostra, por endereço (GNGGA, GPVTG, NAV-PVT...), a taxa
+efetiva em Hz e o jitter entre chegadas (p50/p99), além das rajadas de cada
+época (bytes, duração na chegada e tempo no fio) e da ocupação da UART.
+
+Alguns tipos saem várias vezes por época (NMEA 4.11: um GNGSA por
+constelação), colados um no outro; por isso as chegadas de cada endereço são
+agrupadas por época antes de medir: a taxa conta épocas por segundo, o
+jitter usa o início de cada época e o relatório mostra quantas mensagens do
+tipo vieram por época.
+
+A verificação compara a medição com o perfil aplicado pelo
+configure_m10fly.py: todos os tipos habilitados na taxa do perfil, jitter
+p99 abaixo de uma fração do período e folga na UART. É o que o ajuste do
+piloto automático assume.
+
+Autor: Configuração QtAgOpenGPS
+Compatível com: Quescan M10Fly, u-blox M10
+"""
+
+import time
+
+import nmea_bytes
+import ubx
+import uart_baud
+
+# Intervalo sem dados que separa duas rajadas (épocas); o período esperado
+# dividido por BURST_GAP_DIVISOR, ou BURST_GAP_NS sem perfil
+BURST_GAP_NS = 10000000
+BURST_GAP_DIVISOR = 4
+
+# Limites da verificação
+RATE_TOLERANCE = 0.05    # taxa efetiva dentro de ±5% da do perfil
+JITTER_LIMIT = 0.25      # jitter p99 até 25% do período
+UTILIZATION_LIMIT = 0.8  # UART até 80% ocupada
+
+# Chave CFG-MSGOUT -> tipo da mensagem no relatório
+MSGOUT_TYPES = {
+    'CFG-MSGOUT-NMEA_ID_GGA_UART1': 'GGA',
+    'CFG-MSGOUT-NMEA_ID_RMC_UART1': 'RMC',
+    'CFG-MSGOUT-NMEA_ID_VTG_UART1': 'VTG',
+    'CFG-MSGOUT-NMEA_ID_GSA_UART1': 'GSA',
+    'CFG-MSGOUT-NMEA_ID_GSV_UART1': 'GSV',
+    'CFG-MSGOUT-NMEA_ID_GLL_UART1': 'GLL',
+    'CFG-MSGOUT-UBX_NAV_PVT_UART1': 'NAV-PVT',
+}
+
+UBX_NAMES = {ubx.NAV_PVT: 'NAV-PVT'}
+
+
+def percentile(sorted_values, fraction):
+    """Mesma regra do GPSBridge.latency_summary (sem interpolação)"""
+    count = len(sorted_values)
+    return sorted_values[min(count - 1, int(count * fraction))]
+
+
+def profile_expectations(config):
+    """(taxa em Hz, {tipo: divisor}) a partir das chaves do perfil; o divisor
+    é o valor do CFG-MSGOUT: 1 = em toda época, N = a cada N épocas, 0 = nunca"""
+    values = dict(config)
+    rate_hz = None
+    if values.get('CFG-RATE-MEAS'):
+        rate_hz = 1000.0 / (values['CFG-RATE-MEAS'] * max(1, values.get('CFG-RATE-NAV', 1)))
+    types = {MSGOUT_TYPES[name]: rate for name, rate in values.items() if name in MSGOUT_TYPES}
+    return rate_hz, types
+
+
+class RateMeter:
+    """Recebe os blocos lidos da serial com a hora de chegada e guarda a
+    chegada e o tamanho de cada mensagem"""
+
+    def __init__(self, baud_rate, burst_gap_ns=BURST_GAP_NS):
+        self.baud_rate = baud_rate
+        self.burst_gap_ns = burst_gap_ns
+        self.ubx_parser = ubx.UBXParser()
+        self.buffer = b""
+        self.arrivals = {}  # endereço -> [ns]
+        self.events = []    # (ns, bytes) de cada mensagem, na ordem
+        self.total_bytes = 0
+        self.first_ns = None
+        self.last_ns = None
+        self.checksum_failures = 0
+
+    def record(self, address, size, arrival_ns):
+        self.arrivals.setdefault(address, []).append(arrival_ns)
+        self.events.append((arrival_ns, size))
+
+    def feed(self, chunk, arrival_ns=None):
+        if arrival_ns is None:
+            arrival_ns = time.perf_counter_ns()
+        if self.first_ns is None:
+            self.first_ns = arrival_ns
+        self.last_ns = arrival_ns
+        self.total_bytes += len(chunk)
+
+        for msg_class, msg_id, payload in self.ubx_parser.feed(chunk):
+            name = UBX_NAMES.get((msg_class, msg_id), f"UBX-{msg_class:02X}-{msg_id:02X}")
+            self.record(name, len(payload) + ubx.HEADER_LENGTH + 2, arrival_ns)
+
+        buffer = self.buffer + chunk
+        start = 0
+        end = buffer.find(b"\n")
+        while end != -1:
+            dollar = buffer.find(b"$", start, end)
+            if dollar != -1:
+                status = nmea_bytes.check_sentence(buffer, dollar, end + 1)
+                if status == nmea_bytes.CHECKSUM_OK:
+                    address = nmea_bytes.sentence_address(buffer, dollar, end + 1)
+                    self.record(address.decode('ascii', 'replace'), end + 1 - dollar, arrival_ns)
+                elif status == nmea_bytes.CHECKSUM_BAD:
+                    self.checksum_failures += 1
+            start = end + 1
+            end = buffer.find(b"\n", start)
+        self.buffer = buffer[start:][-512:]
+
+    def epochs(self, arrivals):
+        """Agrupar as chegadas de um endereço por época (separadas por mais
+        de burst_gap_ns). Retorna ([início de cada época em ns], [mensagens
+        em cada época])"""
+        starts, sizes = [], []
+        previous = None
+        for arrival_ns in arrivals:
+            if previous is None or arrival_ns - previous > self.burst_gap_ns:
+                starts.append(arrival_ns)
+                sizes.append(0)
+            sizes[-1] += 1
+            previous = arrival_ns
+        return starts, sizes
+
+    def bursts(self):
+        """Rajadas: mensagens separadas por menos de burst_gap_ns.
+        Retorna [(bytes, duração em ns)]"""
+        bursts = []
+        burst_start = previous = None
+        burst_bytes = 0
+        for arrival_ns, size in self.events:
+            if previous is not None and arrival_ns - previous > self.burst_gap_ns:
+                bursts.append((burst_bytes, previous - burst_start))
+                burst_start, burst_bytes = arrival_ns, 0
+            if burst_start is None:
+                burst_start = arrival_ns
+            burst_bytes += size
+            previous = arrival_ns
+        if previous is not None:
+            bursts.append((burst_bytes, previous - burst_start))
+        return bursts
+
+    def report(self, expected_rate_hz=None):
+        """Resumo da medição (dicionário; tempos em ms)"""
+        duration = (self.last_ns - self.first_ns) / 1e9 if self.events else 0.0
+        report = {'duration': duration, 'bytes': self.total_bytes,
+                  'checksum_failures': self.checksum_failures,
+                  'utilization': None, 'messages': {}, 'bursts': None}
+        if duration > 0:
+            report['utilization'] = self.total_bytes / duration / uart_baud.link_capacity(self.baud_rate)
+
+        for address, arrivals in sorted(self.arrivals.items()):
+            # Taxa e jitter por época: as mensagens de uma mesma época contam uma vez
+            starts, sizes = self.epochs(arrivals)
+            sizes.sort()
+            entry = {'count': len(arrivals), 'epochs': len(starts),
+                     'per_epoch_p50': percentile(sizes, 0.5), 'per_epoch_max': sizes[-1],
+                     'hz': None, 'interval_p50': None, 'jitter_p50': None, 'jitter_p99': None}
+            if len(starts) > 1:
+                span = (starts[-1] - starts[0]) / 1e9
+                intervals = sorted(b - a for a, b in zip(starts, starts[1:]))
+                entry['hz'] = (len(starts) - 1) / span if span > 0 else None
+                entry['interval_p50'] = percentile(intervals, 0.5) / 1e6
+                # Jitter: desvio do período nominal (do perfil) ou da mediana
+                period_ns = 1e9 / expected_rate_hz if expected_rate_hz else percentile(intervals, 0.5)
+                jitter = sorted(abs(interval - period_ns) for interval in intervals)
+                entry['jitter_p50'] = percentile(jitter, 0.5) / 1e6
+                entry['jitter_p99'] = percentile(jitter, 0.99) / 1e6
+            report['messages'][address] = entry
+
+        bursts = self.bursts()
+        if bursts:
+            sizes = sorted(size for size, _ in bursts)
+            spans = sorted(span for _, span in bursts)
+            report['bursts'] = {
+                'count': len(bursts),
+                'bytes_p50': percentile(sizes, 0.5),
+                'bytes_max': sizes[-1],
+                'span_p50': percentile(spans, 0.5) / 1e6,
+                'span_max': spans[-1] / 1e6,
+                'wire_max': sizes[-1] / uart_baud.link_capacity(self.baud_rate) * 1000,
+            }
+        return report
+
+
+def check(report, expected_rate_hz, expected_types):
+    """Comparar a medição com o perfil; retorna a lista de falhas (vazia = passou)"""
+    failures = []
+    by_type = {}
+    for address, entry in report['messages'].items():
+        message_type = address if address.startswith('NAV-') or address.startswith('UBX-') \
+            else address[2:]
+        by_type.setdefault(message_type, []).append((address, entry))
+
+    for message_type, divisor in sorted(expected_types.items()):
+        found = by_type.get(message_type, [])
+        if not divisor:
+            for address, _ in found:
+                failures.append(f"{address} presente, mas desabilitado no perfil")
+            continue
+        if not found:
+            failures.append(f"{message_type} ausente")
+            continue
+        if not expected_rate_hz:
+            continue
+        # 'hz' conta épocas com o tipo, não mensagens: vários GNGSA colados na
+        # mesma época são uma chegada só
+        target_hz = expected_rate_hz / divisor
+        for address, entry in found:
+            if entry['hz'] is None or abs(entry['hz'] - target_hz) > target_hz * RATE_TOLERANCE:
+                measured = "?" if entry['hz'] is None else f"{entry['hz']:.2f}"
+                failures.append(f"{address}: {measured} Hz, esperado {target_hz:g} Hz")
+            elif entry['jitter_p99'] > 1000.0 / target_hz * JITTER_LIMIT:
+                failures.append(f"{address}: jitter p99 {entry['jitter_p99']:.1f} ms "
+                                f"(limite {1000.0 / target_hz * JITTER_LIMIT:.1f} ms)")
+
+    if report['utilization'] is not None and report['utilization'] > UTILIZATION_LIMIT:
+        failures.append(f"UART {report['utilization']:.0%} ocupada "
+                        f"(limite {UTILIZATION_LIMIT:.0%}); suba o baud rate")
+    return failures
+
+
+def log_report(report, baud_rate, logger):
+    logger.info(f"📏 Medição de {report['duration']:.1f} s @ {baud_rate} baud:")
+    for address, entry in report['messages'].items():
+        if entry['hz'] is None:
+            logger.info(f"   {address:8} {entry['count']:5} msgs")
+            continue
+        per_epoch = f"  {entry['per_epoch_p50']}/época (máx. {entry['per_epoch_max']})" \
+            if entry['per_epoch_max'] > 1 else ""
+        logger.info(f"   {address:8} {entry['count']:5} msgs  {entry['hz']:6.2f} Hz  "
+                    f"intervalo p50 {entry['interval_p50']:6.1f} ms  "
+                    f"jitter p50 {entry['jitter_p50']:5.1f} / p99 {entry['jitter_p99']:5.1f} ms"
+                    f"{per_epoch}")
+    bursts = report['bursts']
+    if bursts:
+        logger.info(f"   Rajadas: {bursts['count']}, {bursts['bytes_p50']} bytes (máx. "
+                    f"{bursts['bytes_max']}), chegada em {bursts['span_p50']:.1f} ms "
+                    f"(máx. {bursts['span_max']:.1f}), no fio {bursts['wire_max']:.1f} ms")
+    if report['utilization'] is not None:
+        capacity = uart_baud.link_capacity(baud_rate)
+        logger.info(f"   UART: {report['utilization'] * capacity / 1000:.1f} de "
+                    f"{capacity / 1000:.1f} KB/s ({report['utilization']:.0%})")
+    if report['checksum_failures']:
+        logger.info(f"   Falhas de checksum: {report['checksum_failures']}")
+
+
+def measure(serial_conn, seconds, burst_gap_ns=BURST_GAP_NS):
+    """Ler a serial por seconds segundos e retornar o RateMeter preenchido"""
+    meter = RateMeter(serial_conn.baudrate, burst_gap_ns)
+    saved_timeout = serial_conn.timeout
+    serial_conn.timeout = 0.002
+    serial_conn.reset_input_buffer()
+    try:
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            chunk = serial_conn.read(max(1, serial_conn.in_waiting))
+            if chunk:
+                meter.feed(chunk, time.perf_counter_ns())
+    finally:
+        serial_conn.timeout = saved_timeout
+    return meter
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Arquivo bruto do receptor compactado e rotativo
+Guarda tudo o que chega da serial (NMEA/UBX exatamente como recebido) em
+arquivos gzip por hora, para ter a safra inteira de dados brutos sem
+encher o cartão SD:
+
+    DIRETÓRIO/gps_raw_AAAAMMDD_HHMMSS.nmea.gz
+
+A thread de leitura só coloca o bloco numa fila; a compressão e a escrita
+ficam numa thread própria. Se o cartão não acompanhar, os blocos além da
+fila são descartados (contados em dropped), e a leitura nunca espera.
+
+A cada FLUSH_SECONDS o gzip é descarregado com Z_SYNC_FLUSH: numa queda de
+energia, o arquivo aberto ainda se lê com zcat até o último descarregamento.
+Quando o total passa de max_bytes, os arquivos mais antigos são apagados.
+
+Autor: Configuração QtAgOpenGPS
+"""
+
+import glob
+import gzip
+import logging
+import os
+import queue
+import threading
+import time
+
+FILE_PREFIX = 'gps_raw_'
+FILE_SUFFIX = '.nmea.gz'
+ROTATE_SECONDS = 3600
+MAX_BYTES = 2 * 1024 * 1024 * 1024  # ~1 safra a 10 Hz, algumas h/dia
+FLUSH_SECONDS = 5.0
+COMPRESS_LEVEL = 6
+QUEUE_CHUNKS = 4096  # blocos na fila (alguns segundos mesmo a 921600)
+
+
+class RawArchive:
+    """Gravação compactada e rotativa dos blocos lidos da serial"""
+
+    def __init__(self, directory, rotate_seconds=ROTATE_SECONDS, max_bytes=MAX_BYTES,
+                 logger=None):
+        self.directory = directory
+        self.rotate_seconds = rotate_seconds
+        self.max_bytes = max_bytes
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.queue = queue.Queue(QUEUE_CHUNKS)
+        self.file = None
+        self.path = None
+        self.opened_at = 0.0
+        self.bytes_written = 0
+        self.dropped = 0
+        self.files_removed = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self.thread = threading.Thread(target=self.writer_loop, daemon=True)
+        self.thread.start()
+
+    def write(self, chunk, arrival_ns=None):
+        """Caminho quente: só enfileira (mesma assinatura do CaptureWriter)"""
+        try:
+            self.queue.put_nowait(chunk)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        """Gravar o que falta na fila e fechar o arquivo atual"""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join(timeout=10)
+
+    def writer_loop(self):
+        last_flush = time.monotonic()
+        while True:
+            try:
+                chunk = self.queue.get(timeout=FLUSH_SECONDS)
+            except queue.Empty:
+                chunk = b""
+            if chunk is None:
+                break
+
+            try:
+                if chunk:
+                    if self.file is None or time.time() - self.opened_at >= self.rotate_seconds:
+                        self.rotate()
+                    self.file.write(chunk)
+                    self.bytes_written += len(chunk)
+                if self.file is not None and time.monotonic() - last_flush >= FLUSH_SECONDS:
+                    self.file.flush()
+                    last_flush = time.monotonic()
+            except OSError as e:
+                self.logger.error("Erro ao gravar o arquivo bruto %s: %s", self.path, e)
+                self.close_file()
+                time.sleep(1)
+
+        self.close_file()
+
+    def rotate(self):
+        """Fechar o arquivo atual, abrir o da hora e respeitar o limite total"""
+        self.close_file()
+        self.opened_at = time.time()
+        name = FILE_PREFIX + time.strftime('%Y%m%d_%H%M%S', time.localtime(self.opened_at)) + FILE_SUFFIX
+        self.path = os.path.join(self.directory, name)
+        self.file = gzip.open(self.path, 'ab', compresslevel=COMPRESS_LEVEL)
+        self.enforce_limit()
+
+    def close_file(self):
+        if self.file is not None:
+            try:
+                self.file.close()
+            except OSError:
+                pass
+            self.file = None
+
+    def archive_files(self):
+        """Arquivos do diretório, do mais antigo ao mais novo (nome = data)"""
+        return sorted(glob.glob(os.path.join(self.directory, FILE_PREFIX + '*' + FILE_SUFFIX)))
+
+    def enforce_limit(self):
+        """Apagar os arquivos mais antigos até o total caber em max_bytes"""
+        files = [(path, os.path.getsize(path)) for path in self.archive_files()]
+        total = sum(size for _, size in files)
+        for path, size in files:
+            if total <= self.max_bytes or path == self.path:
+                break
+            os.remove(path)
+            total -= size
+            self.files_removed += 1
+            self.logger.info("🗑️ Arquivo bruto antigo removido: %s", path)
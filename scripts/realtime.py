@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Modo tempo real do GPS Bridge (opcional, --realtime)
+No Raspberry Pi 4 o renderizador OpenGL do QtAgOpenGPS disputa a CPU com o
+bridge, e as coletas do GC do CPython caem no meio das épocas. Este modo,
+aplicado pela thread de leitura antes do laço principal:
+
+    - fixa a thread de leitura em um núcleo (sched_setaffinity)
+    - pede SCHED_FIFO; sem permissão, tenta nice -10; sem isso, segue normal
+    - trava a memória do processo (mlockall), sem falhas de página no laço
+    - congela os objetos da partida no GC e desliga a coleta cíclica
+
+O caminho quente não cria ciclos de referência (as sentenças são bytes e
+memoryviews liberados pela contagem de referências), então o GC desligado
+quase não acumula lixo. O que sobra é coletado à mão, em pedaços: logo
+depois de uma época sair, no intervalo até a próxima (EpochCollector), e por
+inteiro quando a serial fica em silêncio (collect_idle).
+
+Permissões: root, ou no serviço systemd LimitRTPRIO (SCHED_FIFO) e
+LimitMEMLOCK=infinity (mlockall), ver install_service.sh.
+
+Autor: Configuração QtAgOpenGPS
+"""
+
+import ctypes
+import ctypes.util
+import gc
+import os
+import resource
+
+DEFAULT_FIFO_PRIORITY = 20  # acima de todo SCHED_OTHER, abaixo das IRQs (50)
+FALLBACK_NICE = -10
+COLLECT_INTERVAL_SECONDS = 1.0  # coleta entre épocas no máximo uma vez por segundo
+
+# sys/mman.h
+MCL_CURRENT = 1
+MCL_FUTURE = 2
+
+
+def default_cpu():
+    """Último núcleo: no Pi 4 o kernel trata as IRQs no núcleo 0"""
+    cpus = sorted(os.sched_getaffinity(0))
+    return cpus[-1]
+
+
+def pin_cpu(cpu):
+    """Fixar a thread atual no núcleo cpu (no Linux, pid 0 = esta thread)"""
+    os.sched_setaffinity(0, {cpu})
+
+
+def raise_priority(priority=DEFAULT_FIFO_PRIORITY):
+    """SCHED_FIFO para a thread atual; sem permissão, nice negativo.
+    Retorna a descrição do que foi aplicado; OSError se nada foi possível."""
+    if priority > 0:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            return f"SCHED_FIFO {priority}"
+        except PermissionError:
+            pass
+    # No Linux, setpriority(PRIO_PROCESS, 0) vale só para a thread atual
+    os.setpriority(os.PRIO_PROCESS, 0, FALLBACK_NICE)
+    return f"nice {FALLBACK_NICE}"
+
+
+def lock_memory():
+    """mlockall(MCL_CURRENT | MCL_FUTURE); OSError se não for permitido
+
+    Com um limite RLIMIT_MEMLOCK finito e sem CAP_IPC_LOCK, o MCL_FUTURE
+    faria alocações futuras falharem quando o limite fosse atingido; nesse
+    caso a memória não é travada."""
+    soft, _ = resource.getrlimit(resource.RLIMIT_MEMLOCK)
+    if os.geteuid() != 0 and soft != resource.RLIM_INFINITY:
+        raise PermissionError(f"RLIMIT_MEMLOCK de {soft // 1024} KB "
+                              f"(use LimitMEMLOCK=infinity no serviço)")
+    libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+
+
+def freeze_gc():
+    """Coletar uma vez, congelar os objetos da partida e desligar o GC"""
+    gc.collect()
+    gc.freeze()
+    gc.disable()
+    return gc.get_freeze_count()
+
+
+def collect_idle():
+    """Coleta manual quando a serial está em silêncio (GC desligado)"""
+    if not gc.isenabled():
+        gc.collect()
+
+
+class EpochCollector:
+    """Coleta limitada com o GC desligado, chamada logo depois de uma época
+    sair (a próxima só chega daqui a 40-100 ms), em vez de esperar um
+    silêncio que a 10-25 Hz nunca vem. No máximo uma a cada interval
+    segundos; quase sempre só a geração 0 (dezenas de µs), a cada 10 a
+    geração 1 e a cada 100 todas, como os limiares do próprio CPython. Os
+    objetos da partida estão congelados e não entram na conta."""
+
+    def __init__(self, interval=COLLECT_INTERVAL_SECONDS):
+        self.interval_ns = int(interval * 1e9)
+        self.next_ns = 0
+        self.collections = 0
+
+    def after_epoch(self, now_ns):
+        if now_ns < self.next_ns or gc.isenabled():
+            return
+        self.next_ns = now_ns + self.interval_ns
+        self.collections += 1
+        if self.collections % 100 == 0:
+            gc.collect(2)
+        elif self.collections % 10 == 0:
+            gc.collect(1)
+        else:
+            gc.collect(0)
+
+
+def apply(cpu=None, priority=DEFAULT_FIFO_PRIORITY, logger=None):
+    """Aplicar o modo tempo real na thread atual, registrando o que deu
+    certo e o que ficou de fora. Retorna a lista de itens aplicados."""
+    applied = []
+
+    try:
+        cpu = default_cpu() if cpu is None else cpu
+        pin_cpu(cpu)
+        applied.append(f"núcleo {cpu}")
+    except (OSError, ValueError, AttributeError) as e:
+        if logger:
+            logger.warning(f"⚠️ Tempo real: não foi possível fixar o núcleo {cpu}: {e}")
+
+    try:
+        applied.append(raise_priority(priority))
+    except (OSError, AttributeError) as e:
+        if logger:
+            logger.warning(f"⚠️ Tempo real: prioridade normal mantida ({e})")
+
+    try:
+        lock_memory()
+        applied.append("memória travada")
+    except (OSError, AttributeError) as e:
+        if logger:
+            logger.warning(f"⚠️ Tempo real: memória não travada ({e})")
+
+    frozen = freeze_gc()
+    applied.append(f"GC desligado ({frozen} objetos congelados)")
+
+    if logger:
+        logger.info(f"⏱️ Tempo real: {', '.join(applied)}")
+    return applied
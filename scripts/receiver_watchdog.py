@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Detecção de reinício do receptor durante o funcionamento do bridge
+Depois de um desligamento (ou de uma queda de energia no trator), o M10
+volta com o que estiver gravado na BBR/flash, que pode não ser o perfil
+aplicado na partida (ex.: alterações só em RAM). O vigia compara, a cada
+janela, os tipos de sentença recebidos e a taxa de épocas com a primeira
+janela depois da configuração. Um silêncio longo seguido de dados novos,
+uma mudança no conjunto de sentenças ou uma queda forte da taxa indicam
+que o perfil precisa ser reaplicado.
+
+Usa só os contadores de metrics.BridgeMetrics; check() é chamado pela
+thread de leitura, que é a dona da serial.
+
+Autor: Configuração QtAgOpenGPS
+Compatível com: Quescan M10Fly, u-blox M10
+"""
+
+WINDOW_SECONDS = 2.0    # janela de comparação
+SILENCE_SECONDS = 3.0   # sem bytes por mais que isso = receptor desligado
+QUIET_SECONDS = 1.2     # janela que termina sem dados não é comparada
+RATE_DROP = 0.5         # taxa abaixo de 50% da inicial = saída mudou
+RETRY_SECONDS = 10.0    # espera depois de uma reaplicação que falhou
+
+# Marcador das sentenças descartadas pelo filtro (GSV, GLL...) no conjunto
+FILTERED = b'(filtradas)'
+
+
+class ReceiverWatchdog:
+    """Vigia da saída do receptor; check() retorna o motivo para reaplicar
+    o perfil, ou None"""
+
+    def __init__(self, metrics, now, window=WINDOW_SECONDS):
+        self.metrics = metrics
+        self.window = window
+        self.reset(now)
+
+    def reset(self, now):
+        """Recomeçar depois de (re)aplicar o perfil: a próxima janela inteira
+        vira a referência"""
+        self.baseline = None
+        self.hold_until = now
+        self.start_window(now)
+        self.last_bytes = self.metrics.serial_bytes
+        self.last_data = now
+
+    def hold(self, now, seconds=RETRY_SECONDS):
+        """Não acusar nada por um tempo (reaplicação falhou); a referência fica"""
+        self.hold_until = now + seconds
+
+    def start_window(self, now):
+        self.window_start = now
+        self.window_counts = dict(self.metrics.received)
+        self.window_filtered = self.metrics.filtered
+
+    def window_output(self, now):
+        """(endereços recebidos, maior taxa em Hz) na janela que terminou"""
+        elapsed = now - self.window_start
+        current = dict(self.metrics.received)
+        deltas = {address: count - self.window_counts.get(address, 0)
+                  for address, count in current.items()}
+        addresses = {address for address, delta in deltas.items() if delta > 0}
+        if self.metrics.filtered > self.window_filtered:
+            addresses.add(FILTERED)
+        rate = max(deltas.values(), default=0) / elapsed if elapsed > 0 else 0.0
+        return addresses, rate
+
+    def check(self, now):
+        # Silêncio seguido de dados: o receptor foi desligado e voltou
+        if self.metrics.serial_bytes != self.last_bytes:
+            silence = now - self.last_data
+            self.last_bytes = self.metrics.serial_bytes
+            self.last_data = now
+            if silence > SILENCE_SECONDS:
+                return f"receptor voltou depois de {silence:.1f} s sem dados"
+
+        if now < self.hold_until:
+            return None
+        if self.window_start < self.hold_until:
+            self.start_window(now)  # fim da espera: janela nova
+            return None
+        if now - self.window_start < self.window:
+            return None
+
+        addresses, rate = self.window_output(now)
+        self.start_window(now)
+        if not addresses or now - self.last_data > QUIET_SECONDS:
+            return None  # silêncio: decidido quando os dados voltarem
+
+        if self.baseline is None:
+            self.baseline = (addresses, rate)
+            return None
+
+        expected_addresses, expected_rate = self.baseline
+        if addresses != expected_addresses:
+            added = b", ".join(sorted(addresses - expected_addresses)).decode('ascii', 'replace')
+            missing = b", ".join(sorted(expected_addresses - addresses)).decode('ascii', 'replace')
+            return f"saída do receptor mudou (novas: {added or '-'}; ausentes: {missing or '-'})"
+        if rate < expected_rate * RATE_DROP:
+            return f"taxa caiu de {expected_rate:.1f} para {rate:.1f} Hz"
+        return None
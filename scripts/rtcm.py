@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Protocolo RTCM 3 (correções diferenciais / RTK)
+Separação em fluxo dos quadros RTCM3 com validação do CRC-24Q. O QtAgIO
+repassa os dados do caster NTRIP em datagramas de até algumas centenas de
+bytes, sem respeitar o limite dos quadros; aqui só quadros completos e
+íntegros seguem para o receptor.
+
+Quadro RTCM3:
+    0xD3 | 6 bits reservados (0) + tamanho (10 bits) | payload | CRC-24Q (3 bytes)
+
+O número da mensagem (1005, 1074, 1230...) são os 12 primeiros bits do
+payload.
+
+Autor: Configuração QtAgOpenGPS
+Compatível com: Quescan M10Fly, u-blox M10
+"""
+
+PREAMBLE = 0xD3
+HEADER_LENGTH = 3  # preâmbulo + reservado/tamanho
+CRC_LENGTH = 3
+MAX_PAYLOAD = 1023
+
+CRC24Q_POLY = 0x1864CFB
+
+
+def _crc24q_table():
+    table = []
+    for byte in range(256):
+        crc = byte << 16
+        for _ in range(8):
+            crc <<= 1
+            if crc & 0x1000000:
+                crc ^= CRC24Q_POLY
+        table.append(crc & 0xFFFFFF)
+    return table
+
+
+CRC24Q_TABLE = _crc24q_table()
+
+
+def crc24q(data, crc=0):
+    """CRC-24Q (Qualcomm) usado pelo RTCM3 e pelo SBAS"""
+    table = CRC24Q_TABLE
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFFFF) ^ table[(crc >> 16) ^ byte]
+    return crc
+
+
+def message_number(frame):
+    """Número da mensagem de um quadro completo (12 bits após o cabeçalho)"""
+    if len(frame) < HEADER_LENGTH + 2:
+        return None
+    return (frame[3] << 4) | (frame[4] >> 4)
+
+
+def build_frame(payload):
+    """Montar um quadro RTCM3 (cabeçalho e CRC) a partir do payload"""
+    payload = bytes(payload)
+    header = bytes([PREAMBLE, (len(payload) >> 8) & 0x03, len(payload) & 0xFF])
+    crc = crc24q(header + payload)
+    return header + payload + crc.to_bytes(3, 'big')
+
+
+class RTCMFramer:
+    """Separa quadros RTCM3 de um fluxo que chega picado; bytes fora de
+    quadros e quadros com CRC errado são descartados"""
+
+    def __init__(self):
+        self.buffer = b""
+        self.frames = 0
+        self.crc_errors = 0
+        self.discarded_bytes = 0
+
+    def feed(self, chunk):
+        """Adicionar bytes e retornar a lista de quadros completos (bytes)"""
+        buffer = self.buffer + chunk if self.buffer else chunk
+        frames = []
+        pos = 0
+
+        while True:
+            start = buffer.find(PREAMBLE, pos)
+            if start == -1:
+                self.discarded_bytes += len(buffer) - pos
+                pos = len(buffer)
+                break
+            self.discarded_bytes += start - pos
+
+            if len(buffer) - start < HEADER_LENGTH:
+                pos = start
+                break
+
+            if buffer[start + 1] & 0xFC:
+                # Bits reservados diferentes de zero: falso preâmbulo
+                pos = start + 1
+                self.discarded_bytes += 1
+                continue
+
+            length = ((buffer[start + 1] & 0x03) << 8) | buffer[start + 2]
+            frame_end = start + HEADER_LENGTH + length + CRC_LENGTH
+            if len(buffer) < frame_end:
+                pos = start
+                break
+
+            crc = int.from_bytes(buffer[frame_end - CRC_LENGTH:frame_end], 'big')
+            if crc24q(memoryview(buffer)[start:frame_end - CRC_LENGTH]) != crc:
+                # Quadro corrompido ou falso preâmbulo: procurar o próximo
+                self.crc_errors += 1
+                self.discarded_bytes += 1
+                pos = start + 1
+                continue
+
+            frames.append(buffer[start:frame_end])
+            self.frames += 1
+            pos = frame_end
+
+        self.buffer = buffer[pos:]
+        return frames
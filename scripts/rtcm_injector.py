@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Injeção de correções RTCM3 do QtAgIO (NTRIP) no receptor serial
+O FormLoop::SendNTRIP do QtAgIO manda os dados do caster por UDP para a
+porta dos módulos (2233 por padrão). Aqui esses datagramas são recebidos,
+remontados em quadros RTCM3 válidos (CRC-24Q, ver rtcm.py) e escritos na
+UART do receptor por uma thread própria com escrita não bloqueante, para
+que as correções nunca atrasem a leitura do NMEA.
+
+Correções velhas não servem para RTK: se a UART não der conta, os quadros
+mais antigos da fila são descartados.
+
+Autor: Configuração QtAgOpenGPS
+Compatível com: Quescan M10Fly, u-blox M10
+"""
+
+import logging
+import os
+import select
+import socket
+import threading
+import time
+from collections import deque
+
+import rtcm
+
+NTRIP_UDP_PORT = 2233     # sendNtripToModulePort do QtAgIO
+MAX_BACKLOG_BYTES = 8192  # ~0,7 s de UART a 115200; acima disso, descartar
+WRITE_WAIT_SECONDS = 0.1  # espera pela UART (EAGAIN) antes de olhar self.running
+
+
+class RTCMInjector:
+    """Recebe RTCM3 por UDP e escreve os quadros completos na serial"""
+
+    def __init__(self, serial_conn, metrics, port=NTRIP_UDP_PORT, host='0.0.0.0',
+                 logger=None, tx_lock=None, max_backlog=MAX_BACKLOG_BYTES):
+        self.serial_conn = serial_conn
+        self.metrics = metrics
+        self.port = port
+        self.host = host
+        self.logger = logger or logging.getLogger(__name__)
+        # Mesma trava dos outros escritores da serial (comandos UBX), para
+        # que um quadro nunca seja intercalado com outro
+        self.tx_lock = tx_lock or threading.Lock()
+        self.max_backlog = max_backlog
+
+        self.framer = rtcm.RTCMFramer()
+        self.queue = deque()
+        self.backlog = 0
+        self.condition = threading.Condition()
+        self.running = False
+        self.socket = None
+        self.threads = []
+
+    def start(self):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind((self.host, self.port))
+        self.socket.settimeout(0.5)  # para verificar self.running
+        self.running = True
+        self.threads = [threading.Thread(target=self.receive_loop, daemon=True),
+                        threading.Thread(target=self.write_loop, daemon=True)]
+        for thread in self.threads:
+            thread.start()
+
+    def attach(self, serial_conn):
+        """Trocar a serial de destino (None: descartar as correções). Usado
+        pelo motor asyncio, que reabre a porta quando ela cai."""
+        with self.tx_lock:
+            self.serial_conn = serial_conn
+
+    def close(self):
+        self.running = False
+        with self.condition:
+            self.condition.notify()
+        for thread in self.threads:
+            thread.join(timeout=1)
+        if self.socket:
+            self.socket.close()
+            self.socket = None
+
+    def receive_loop(self):
+        """Datagramas UDP -> quadros RTCM3 -> fila de escrita"""
+        while self.running:
+            try:
+                data = self.socket.recv(4096)
+            except socket.timeout:
+                continue
+            except OSError as e:
+                if self.running:
+                    self.logger.error(f"Erro ao receber RTCM: {e}")
+                    time.sleep(1)
+                continue
+
+            self.metrics.rtcm_bytes_received += len(data)
+            frames = self.framer.feed(data)
+            self.metrics.rtcm_crc_errors = self.framer.crc_errors
+            if not frames:
+                continue
+
+            now_ns = time.perf_counter_ns()
+            with self.condition:
+                for frame in frames:
+                    self.metrics.count_rtcm(rtcm.message_number(frame), now_ns)
+                    self.queue.append(frame)
+                    self.backlog += len(frame)
+                # Fila maior que a UART consegue escoar: as mais antigas saem
+                while self.backlog > self.max_backlog and len(self.queue) > 1:
+                    self.backlog -= len(self.queue.popleft())
+                    self.metrics.rtcm_dropped += 1
+                self.condition.notify()
+
+    def write_loop(self):
+        """Escrever os quadros da fila na serial, um de cada vez"""
+        while self.running:
+            with self.condition:
+                while self.running and not self.queue:
+                    self.condition.wait(0.5)
+                if not self.running:
+                    break
+                frame = self.queue.popleft()
+                self.backlog -= len(frame)
+
+            try:
+                with self.tx_lock:
+                    if self.serial_conn is None:
+                        self.metrics.rtcm_dropped += 1  # porta fechada
+                        continue
+                    self.write_frame(self.serial_conn.fileno(), frame)
+            except OSError as e:
+                self.logger.error(f"Erro ao escrever RTCM na serial: {e}")
+                time.sleep(1)
+
+    def write_frame(self, fd, frame):
+        """os.write no descritor não bloqueante; espera a UART se ela encher"""
+        view = memoryview(frame)
+        while view and self.running:
+            try:
+                written = os.write(fd, view)
+            except BlockingIOError:
+                select.select([], [fd], [], WRITE_WAIT_SECONDS)
+                continue
+            view = view[written:]
+            self.metrics.rtcm_bytes_written += written
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tabela de filtro por tipo de sentença
+Cada endereço NMEA (talker + tipo, ex.: GNGGA) recebe uma ação: repassar,
+descartar ou dizimar para N Hz. A tabela é declarativa e compilada uma vez
+na partida. No caminho quente, cada endereço é resolvido uma vez e fica num
+dicionário, sem listas nem varreduras por sentença.
+
+Ordem de busca de uma sentença padrão: endereço completo (GNGGA), tipo
+(GGA), '*'. Proprietárias ($PANDA, $PUBX, $PSTI...): endereço completo,
+'P*'.
+
+O FormLoop::ParseNMEA do QtAgIO não interpreta GSA (cai em "desconhecida"),
+por isso a tabela padrão repassa GSA a só 1 Hz.
+
+Formato texto (--filter): "GSA=1,GSV=drop,PSTI=pass,P*=drop"
+
+Autor: Configuração QtAgOpenGPS
+"""
+
+PASS = 'pass'
+DROP = 'drop'
+
+# Tabela padrão: valores PASS, DROP ou taxa em Hz
+DEFAULT_RULES = {
+    'GGA': PASS,
+    'RMC': PASS,
+    'VTG': PASS,
+    'HDT': PASS,
+    'GSA': 1.0,     # só para o log do QtAgIO
+    'PANDA': PASS,
+    'PAOGI': PASS,
+    '*': DROP,      # demais sentenças padrão (GSV, GLL, TXT...)
+    'P*': DROP,     # proprietárias sem regra ($PUBX, $PSTI, $PTNL...)
+}
+
+# Tolerância da dizimação: chegadas um pouco adiantadas (jitter) ainda
+# contam como o próximo período
+DECIMATE_SLACK = 0.9
+
+# Endereços distintos guardados no cache; os demais usam uma regra
+# compartilhada por chave da tabela (SentenceFilter.overflow)
+MAX_CACHED = 64
+
+
+class SentenceRule:
+    """Ação compilada de um endereço; period_ns: 0 = repassar,
+    -1 = descartar, >0 = intervalo mínimo entre envios"""
+
+    __slots__ = ('period_ns', 'last_ns')
+
+    def __init__(self, period_ns):
+        self.period_ns = period_ns
+        self.last_ns = None
+
+    def due(self, arrival_ns):
+        """Dizimação: True se já passou o período desde o último envio"""
+        if self.last_ns is not None and \
+           arrival_ns - self.last_ns < self.period_ns * DECIMATE_SLACK:
+            return False
+        self.last_ns = arrival_ns
+        return True
+
+
+def rule_period(value):
+    """Valor da tabela (PASS, DROP ou Hz) -> period_ns"""
+    if value == PASS:
+        return 0
+    if value == DROP:
+        return -1
+    rate_hz = float(value)
+    if rate_hz <= 0:
+        return -1
+    return int(1e9 / rate_hz)
+
+
+def parse_rules(text):
+    """"GSA=1,GSV=drop" -> {'GSA': 1.0, 'GSV': 'drop'}; ValueError se inválido"""
+    rules = {}
+    for item in text.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        key, sep, value = item.partition('=')
+        key = key.strip().lstrip('$').upper()
+        value = value.strip().lower()
+        if not sep or not key or not value:
+            raise ValueError(f"regra inválida: '{item}' (use TIPO=pass|drop|Hz)")
+        if value not in (PASS, DROP):
+            try:
+                value = float(value)
+            except ValueError:
+                raise ValueError(f"ação inválida em '{item}' (use pass, drop ou Hz)") from None
+        rules[key] = value
+    return rules
+
+
+class SentenceFilter:
+    """Tabela compilada; rule() devolve a SentenceRule do endereço da linha"""
+
+    def __init__(self, rules=None):
+        self.rules = dict(DEFAULT_RULES if rules is None else rules)
+        self.periods = {key.encode('ascii'): rule_period(value)
+                        for key, value in self.rules.items()}
+        self.cache = {}
+        self.overflow = {}
+
+    def table_key(self, address):
+        """Chave da tabela que vale para um endereço (bytes), segundo a
+        ordem de busca"""
+        periods = self.periods
+        if address in periods:
+            return address
+        if address[:1] == b'P':
+            return b'P*'
+        if address[2:] in periods:
+            return address[2:]
+        return b'*'
+
+    def resolve(self, address):
+        """Regra nova (com estado de dizimação próprio) de um endereço"""
+        return SentenceRule(self.periods.get(self.table_key(address), 0))
+
+    def rule(self, buf, start, end):
+        """Regra da sentença buf[start:end] (já validada)"""
+        stop = buf.find(b",", start, end)
+        if stop < 0:
+            # Sentença sem campos ($GPTXT*hh): o endereço vai até o '*'
+            stop = buf.find(b"*", start, end)
+            if stop < 0:
+                stop = end
+        address = buf[start + 1:stop]
+        rule = self.cache.get(address)
+        if rule is None:
+            address = bytes(address)
+            if len(self.cache) < MAX_CACHED:
+                rule = self.cache[address] = self.resolve(address)
+            else:
+                # Cache cheio: os endereços excedentes dividem uma regra por
+                # chave da tabela, para a dizimação não recomeçar a cada linha
+                key = self.table_key(address)
+                rule = self.overflow.get(key)
+                if rule is None:
+                    rule = self.overflow[key] = SentenceRule(self.periods.get(key, 0))
+        return rule
+
+    def describe(self):
+        """Resumo da tabela para o log"""
+        passed = [key for key, value in self.rules.items() if value == PASS]
+        decimated = [f"{key} a {float(value):g} Hz" for key, value in self.rules.items()
+                     if value not in (PASS, DROP)]
+        dropped = [key for key, value in self.rules.items() if value == DROP]
+        parts = [", ".join(passed) or "-"]
+        if decimated:
+            parts.append(", ".join(decimated))
+        parts.append("descartar " + (", ".join(dropped) or "-"))
+        return "; ".join(parts)
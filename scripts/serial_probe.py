@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Detecção rápida da porta serial e do baud rate do receptor
+Todas as portas candidatas são testadas ao mesmo tempo (uma thread por
+porta, percorrendo os baud rates) e a busca para assim que chega uma
+sentença NMEA com checksum válido (ou um quadro UBX válido). A porta/baud
+vencedora fica gravada num arquivo de estado, e a próxima partida tenta
+essa combinação primeiro; só volta à busca completa se ela falhar.
+
+O mesmo arquivo guarda, por porta, a impressão digital do último perfil
+aplicado pelo configure_m10fly.py.
+
+Autor: Configuração QtAgOpenGPS
+Compatível com: Quescan M10Fly, u-blox M10
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+import serial
+
+import nmea_bytes
+import ubx
+
+# Ordem de teste depois do baud configurado: valores de fábrica dos u-blox
+# (9600/38400) e os usados depois de reconfigurar a UART
+PROBE_BAUD_RATES = (115200, 9600, 38400, 230400, 460800, 921600, 57600, 19200)
+
+# Tempo em cada baud: cobre uma época inteira de um receptor a 1 Hz
+DWELL_SECONDS = 1.2
+
+STATE_FILE = os.path.expanduser("~/.gps_greco_serial.json")
+
+
+def load_state(path):
+    """Última porta/baud que funcionou ({'device', 'baud'}), ou None"""
+    if not path:
+        return None
+    state = _read_state_file(path)
+    try:
+        return {'device': str(state['device']), 'baud': int(state['baud'])}
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _read_state_file(path):
+    try:
+        with open(path) as state_file:
+            state = json.load(state_file)
+        return state if isinstance(state, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_state_file(path, state):
+    """Escrita atômica: um desligamento no meio não corrompe o arquivo"""
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w') as state_file:
+        json.dump(state, state_file, indent=1)
+    os.replace(temp_path, path)
+
+
+def save_state(path, device, baud):
+    """Gravar a porta/baud vencedora (mantendo os perfis aplicados)"""
+    if not path:
+        return
+    state = _read_state_file(path)
+    state.update({'device': device, 'baud': baud,
+                  'updated': time.strftime('%Y-%m-%dT%H:%M:%S')})
+    _write_state_file(path, state)
+
+
+def load_profile_fingerprint(path, device):
+    """Impressão digital do último perfil aplicado na porta, ou None"""
+    if not path:
+        return None
+    profiles = _read_state_file(path).get('profiles')
+    if not isinstance(profiles, dict) or not isinstance(profiles.get(device), dict):
+        return None
+    return profiles[device].get('fingerprint')
+
+
+def save_profile_fingerprint(path, device, profile, fingerprint):
+    """Registrar o perfil aplicado (e confirmado) no receptor da porta"""
+    if not path:
+        return
+    state = _read_state_file(path)
+    profiles = state.get('profiles')
+    if not isinstance(profiles, dict):
+        profiles = state['profiles'] = {}
+    profiles[device] = {'profile': profile, 'fingerprint': fingerprint,
+                        'applied': time.strftime('%Y-%m-%dT%H:%M:%S')}
+    _write_state_file(path, state)
+
+
+class StreamValidator:
+    """Procura no fluxo uma sentença NMEA com checksum válido e/ou um quadro
+    UBX válido; input_format: 'nmea', 'ubx' ou 'any'"""
+
+    def __init__(self, input_format):
+        self.accept_nmea = input_format in ("nmea", "any")
+        self.ubx_parser = ubx.UBXParser() if input_format in ("ubx", "any") else None
+        self.buffer = b""
+        self.sample = None
+
+    def feed(self, chunk):
+        if self.ubx_parser is not None:
+            frames = self.ubx_parser.feed(chunk)
+            if frames:
+                msg_class, msg_id, _ = frames[0]
+                self.sample = f"quadro UBX classe 0x{msg_class:02X}, id 0x{msg_id:02X}"
+                return True
+
+        if not self.accept_nmea:
+            return False
+
+        buffer = self.buffer + chunk
+        start = 0
+        end = buffer.find(b"\n")
+        while end != -1:
+            if nmea_bytes.check_sentence(buffer, start, end + 1) == nmea_bytes.CHECKSUM_OK:
+                self.sample = buffer[start:start + 50].decode('ascii', errors='replace').strip()
+                return True
+            start = end + 1
+            end = buffer.find(b"\n", start)
+        # Só o pedaço depois da última linha; lixo em baud errado não acumula
+        self.buffer = buffer[start:][-512:]
+        return False
+
+
+class SerialProber:
+    """Busca concorrente de porta/baud; find() devolve a porta já aberta"""
+
+    def __init__(self, devices, baud_rates, input_format="nmea",
+                 state_path=STATE_FILE, timeout=1, logger=None):
+        self.devices = list(dict.fromkeys(device for device in devices if device))
+        self.baud_rates = list(dict.fromkeys(baud_rates))
+        self.input_format = input_format
+        self.state_path = state_path
+        self.timeout = timeout
+        self.logger = logger or logging.getLogger(__name__)
+        self.found = threading.Event()
+        self.lock = threading.Lock()
+        self.result = None
+
+    def open_port(self, device, baud):
+        return serial.Serial(port=device, baudrate=baud,
+                             bytesize=serial.EIGHTBITS,
+                             parity=serial.PARITY_NONE,
+                             stopbits=serial.STOPBITS_ONE,
+                             timeout=0.05, xonxoff=False,
+                             rtscts=False, dsrdtr=False)
+
+    def listen(self, serial_conn, dwell):
+        """Ler até achar dados válidos, o tempo acabar ou outra thread vencer"""
+        validator = StreamValidator(self.input_format)
+        deadline = time.monotonic() + dwell
+        while time.monotonic() < deadline and not self.found.is_set():
+            chunk = serial_conn.read(max(1, serial_conn.in_waiting))
+            if chunk and validator.feed(chunk):
+                return validator.sample
+        return None
+
+    def probe_device(self, device, baud_rates, dwell):
+        """Thread de uma porta: percorre os baud rates até achar dados"""
+        try:
+            serial_conn = self.open_port(device, baud_rates[0])
+        except (OSError, serial.SerialException) as e:
+            self.logger.debug(f"{device}: não abriu ({e})")
+            return
+
+        try:
+            for baud in baud_rates:
+                if self.found.is_set():
+                    break
+                if serial_conn.baudrate != baud:
+                    serial_conn.baudrate = baud
+                serial_conn.reset_input_buffer()
+
+                sample = self.listen(serial_conn, dwell)
+                if sample is None:
+                    continue
+
+                with self.lock:
+                    if self.result is None:
+                        self.result = (serial_conn, device, baud)
+                        self.found.set()
+                        self.logger.info(f"✅ Receptor em {device} @ {baud}: {sample}")
+                        serial_conn = None
+                break
+        except (OSError, serial.SerialException) as e:
+            self.logger.debug(f"{device}: erro durante a busca ({e})")
+        finally:
+            if serial_conn is not None:
+                serial_conn.close()
+
+    def probe(self, devices, baud_rates, dwell=DWELL_SECONDS):
+        threads = [threading.Thread(target=self.probe_device, args=(device, baud_rates, dwell),
+                                    daemon=True)
+                   for device in devices]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self.result
+
+    def find(self):
+        """Retorna (serial.Serial aberta, porta, baud) ou None"""
+        state = load_state(self.state_path)
+        if state and (state['device'] in self.devices or not self.devices):
+            self.logger.info(f"Tentando última porta conhecida: {state['device']} @ {state['baud']}...")
+            if self.probe([state['device']], [state['baud']]):
+                return self.finish()
+            self.logger.warning("Última porta conhecida não respondeu, buscando em todas...")
+
+        baud_rates = self.baud_rates
+        if state:
+            baud_rates = list(dict.fromkeys([state['baud']] + baud_rates))
+
+        self.logger.info(f"Buscando receptor em {', '.join(self.devices)} "
+                         f"(portas em paralelo, {len(baud_rates)} baud rates cada)...")
+        if self.probe(self.devices, baud_rates):
+            return self.finish()
+        return None
+
+    def finish(self):
+        serial_conn, device, baud = self.result
+        serial_conn.timeout = self.timeout
+        try:
+            save_state(self.state_path, device, baud)
+        except OSError as e:
+            self.logger.warning(f"⚠️  Não foi possível gravar {self.state_path}: {e}")
+        return self.result
+
+
+def find_receiver(devices, baud_rate, input_format="nmea", state_path=STATE_FILE,
+                  timeout=1, logger=None):
+    """Achar o receptor: baud_rate é testado primeiro, depois PROBE_BAUD_RATES"""
+    prober = SerialProber(devices, [baud_rate] + list(PROBE_BAUD_RATES),
+                          input_format, state_path, timeout, logger)
+    return prober.find()
@@ -134,7 +134,9 @@ start_gps_bridge() {
     
     # Iniciar em background
     cd "$SCRIPT_DIR"
-    python3 gps_bridge.py > /tmp/gps_bridge.log 2>&1 &
+    # O próprio bridge escreve /tmp/gps_bridge.log (rotativo); aqui fica só
+    # a saída do console, para erros antes do log começar
+    python3 gps_bridge.py > /tmp/gps_bridge.console 2>&1 &
     local bridge_pid=$!
     
     # Aguardar inicialização
@@ -147,7 +149,7 @@ start_gps_bridge() {
         return 0
     else
         log_error "GPS Bridge falhou ao iniciar"
-        log_error "Verifique o log: tail -f /tmp/gps_bridge.log"
+        log_error "Verifique o log: tail -f /tmp/gps_bridge.log /tmp/gps_bridge.console"
         return 1
     fi
 }
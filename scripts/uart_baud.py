@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Troca segura do baud rate da UART do receptor
+A 115200 baud (~11,5 KB/s) um fluxo de 10 Hz com GGA+RMC+VTG+GSA+HDT já usa
+cerca de 35% do link; 20 Hz ou sentenças extras estouram. Aqui o receptor é
+passado para um baud rate maior com o protocolo seguinte:
+
+    1. CFG-UART1-BAUDRATE só na RAM (o ACK pode se perder na troca)
+    2. porta local reaberta no baud novo
+    3. verificação: sentença NMEA com checksum válido ou quadro UBX válido
+    4. sucesso: o baud novo é gravado em BBR/flash, já no baud novo
+       falha:   volta ao baud anterior (comando enviado no baud novo, porta
+                local no anterior) e verifica de novo
+
+Como a troca vai primeiro só para a RAM, um receptor que não respondeu a
+nenhuma das tentativas volta ao baud gravado no próximo desligamento.
+
+Autor: Configuração QtAgOpenGPS
+Compatível com: Quescan M10Fly, u-blox M10
+"""
+
+import argparse
+import logging
+import time
+
+import serial_probe
+import ubx
+import ubx_transport
+
+# Tentados do maior para o menor
+UPGRADE_BAUD_RATES = (921600, 460800, 230400)
+
+VERIFY_SECONDS = 1.5  # cobre uma época a 1 Hz mais a troca
+BITS_PER_BYTE = 10    # 8N1: início + 8 dados + parada
+
+
+def link_capacity(baud_rate):
+    """Bytes/s que a UART carrega no baud rate (8N1)"""
+    return baud_rate / BITS_PER_BYTE
+
+
+def set_host_baud(serial_conn, baud_rate):
+    serial_conn.baudrate = baud_rate
+    serial_conn.reset_input_buffer()
+
+
+def verify(serial_conn, seconds=VERIFY_SECONDS):
+    """Esperar dados válidos (NMEA com checksum ou UBX) no baud atual"""
+    validator = serial_probe.StreamValidator("any")
+    saved_timeout = serial_conn.timeout
+    serial_conn.timeout = 0.05
+    try:
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            chunk = serial_conn.read(max(1, serial_conn.in_waiting))
+            if chunk and validator.feed(chunk):
+                return True
+        return False
+    finally:
+        serial_conn.timeout = saved_timeout
+
+
+def send_baud(serial_conn, baud_rate, layers, logger, retries=0):
+    """CFG-VALSET de CFG-UART1-BAUDRATE; retorna o resultado (ACK, NAK...)"""
+    frame, = ubx.valset_frames([('CFG-UART1-BAUDRATE', baud_rate)], layers)
+    transport = ubx_transport.UBXTransport(serial_conn, logger, timeout=0.1, retries=retries)
+    command, = transport.run([(f"baud {baud_rate}", frame)])
+    return command.result
+
+
+def switch_baud(serial_conn, baud_rate, logger=None,
+                persist_layers=ubx.LAYER_BBR | ubx.LAYER_FLASH):
+    """Passar receptor e porta local para baud_rate, com verificação e
+    retorno automático ao baud anterior. True se a troca ficou valendo."""
+    logger = logger or logging.getLogger(__name__)
+    old_baud = serial_conn.baudrate
+    if baud_rate == old_baud:
+        return True
+
+    logger.info(f"🔁 Mudando UART de {old_baud} para {baud_rate} baud...")
+    if send_baud(serial_conn, baud_rate, ubx.LAYER_RAM, logger) == ubx_transport.NAK:
+        logger.warning(f"⚠️  Receptor rejeitou {baud_rate} baud (NAK)")
+        return False
+
+    set_host_baud(serial_conn, baud_rate)
+    if verify(serial_conn):
+        if persist_layers:
+            result = send_baud(serial_conn, baud_rate, persist_layers, logger, retries=2)
+            if result != ubx_transport.ACK:
+                logger.warning(f"⚠️  {baud_rate} baud ativo, mas não gravado ({result})")
+        logger.info(f"✅ UART a {baud_rate} baud "
+                    f"({link_capacity(baud_rate) / 1000:.1f} KB/s)")
+        return True
+
+    # Sem dados válidos: voltar ao baud anterior
+    logger.warning(f"⚠️  Nenhum dado válido a {baud_rate} baud, voltando para {old_baud}...")
+    send_baud(serial_conn, old_baud, ubx.LAYER_RAM, logger)
+    set_host_baud(serial_conn, old_baud)
+    if verify(serial_conn):
+        logger.info(f"↩️  Receptor de volta a {old_baud} baud")
+    else:
+        logger.error(f"❌ Receptor não responde a {old_baud} nem a {baud_rate} baud; "
+                     f"o baud gravado volta no próximo desligamento")
+    return False
+
+
+def upgrade_argument(text):
+    """Tipo do argparse para --upgrade-baud: 'auto' ou um dos
+    UPGRADE_BAUD_RATES -> tupla de candidatos para upgrade()"""
+    if text == 'auto':
+        return UPGRADE_BAUD_RATES
+    try:
+        baud_rate = int(text)
+    except ValueError:
+        baud_rate = None
+    if baud_rate not in UPGRADE_BAUD_RATES:
+        supported = ', '.join(str(rate) for rate in UPGRADE_BAUD_RATES)
+        raise argparse.ArgumentTypeError(f"use auto ou um de {supported} (recebido: {text!r})")
+    return (baud_rate,)
+
+
+def upgrade(serial_conn, logger=None, candidates=UPGRADE_BAUD_RATES,
+            persist_layers=ubx.LAYER_BBR | ubx.LAYER_FLASH):
+    """Tentar os baud rates maiores que o atual, do maior para o menor.
+    Retorna o baud rate final."""
+    for baud_rate in sorted(candidates, reverse=True):
+        if baud_rate <= serial_conn.baudrate:
+            break
+        if switch_baud(serial_conn, baud_rate, logger, persist_layers):
+            break
+    return serial_conn.baudrate
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Protocolo binário UBX (u-blox)
+Leitura em fluxo de quadros UBX (sincronismo, tamanho, checksum Fletcher)
+e conversão de UBX-NAV-PVT em uma sentença $PANDA para o QtAgIO.
+
+Quadro UBX:
+    0xB5 0x62 | classe | id | tamanho (U2, little-endian) | payload | CK_A CK_B
+
+Também monta quadros (campos tipados, checksum calculado) e a configuração
+chave/valor do M10 (UBX-CFG-VALSET), agrupando um perfil inteiro em uma
+transação.
+
+Autor: Configuração QtAgOpenGPS
+Compatível com: Quescan M10Fly, u-blox M10
+"""
+
+import struct
+
+from nmea_bytes import build_sentence
+
+SYNC = b"\xb5\x62"
+HEADER_LENGTH = 6   # sync (2) + classe + id + tamanho (2)
+MAX_PAYLOAD = 4096  # Maior que qualquer mensagem que usamos; evita travar em lixo
+
+# Classes/ids das mensagens usadas
+NAV_PVT = (0x01, 0x07)
+ACK_ACK = (0x05, 0x01)
+ACK_NAK = (0x05, 0x00)
+CFG_VALSET = (0x06, 0x8A)
+CFG_VALGET = (0x06, 0x8B)
+
+# Tipos de campo UBX -> formato struct
+FIELD_TYPES = {
+    'U1': 'B', 'I1': 'b', 'X1': 'B', 'E1': 'B', 'L': 'B',
+    'U2': 'H', 'I2': 'h', 'X2': 'H', 'E2': 'H',
+    'U4': 'I', 'I4': 'i', 'X4': 'I', 'E4': 'I',
+    'R4': 'f', 'R8': 'd', 'U8': 'Q', 'I8': 'q', 'X8': 'Q',
+}
+
+# Camadas de CFG-VALSET
+LAYER_RAM = 0x01
+LAYER_BBR = 0x02
+LAYER_FLASH = 0x04
+
+# Camadas de CFG-VALGET (numeradas, não bits)
+VALGET_LAYER_RAM = 0
+VALGET_LAYER_BBR = 1
+VALGET_LAYER_FLASH = 2
+
+VALSET_MAX_KEYS = 64  # limite do receptor por mensagem
+
+# Chaves de configuração usadas (nome -> (id, tipo)), da descrição de
+# interface do u-blox M10
+CONFIG_KEYS = {
+    'CFG-RATE-MEAS': (0x30210001, 'U2'),
+    'CFG-RATE-NAV': (0x30210002, 'U2'),
+    'CFG-UART1-BAUDRATE': (0x40520001, 'U4'),
+    'CFG-UART1INPROT-UBX': (0x10730001, 'L'),
+    'CFG-UART1INPROT-NMEA': (0x10730002, 'L'),
+    'CFG-UART1INPROT-RTCM3X': (0x10730004, 'L'),
+    'CFG-UART1OUTPROT-UBX': (0x10740001, 'L'),
+    'CFG-UART1OUTPROT-NMEA': (0x10740002, 'L'),
+    'CFG-NMEA-HIGHPREC': (0x10930006, 'L'),
+    'CFG-MSGOUT-NMEA_ID_GGA_UART1': (0x209100BB, 'U1'),
+    'CFG-MSGOUT-NMEA_ID_RMC_UART1': (0x209100AC, 'U1'),
+    'CFG-MSGOUT-NMEA_ID_VTG_UART1': (0x209100B1, 'U1'),
+    'CFG-MSGOUT-NMEA_ID_GSA_UART1': (0x209100C0, 'U1'),
+    'CFG-MSGOUT-NMEA_ID_GSV_UART1': (0x209100C5, 'U1'),
+    'CFG-MSGOUT-NMEA_ID_GLL_UART1': (0x209100CA, 'U1'),
+    'CFG-MSGOUT-UBX_NAV_PVT_UART1': (0x20910007, 'U1'),
+}
+
+# UBX-NAV-PVT (92 bytes)
+NAV_PVT_FORMAT = struct.Struct('<IH6BIi4B4i2I5i2I2H4xihH')
+NAV_PVT_FIELDS = (
+    'iTOW', 'year', 'month', 'day', 'hour', 'min', 'sec', 'valid', 'tAcc',
+    'nano', 'fixType', 'flags', 'flags2', 'numSV', 'lon', 'lat', 'height',
+    'hMSL', 'hAcc', 'vAcc', 'velN', 'velE', 'velD', 'gSpeed', 'headMot',
+    'sAcc', 'headAcc', 'pDOP', 'flags3', 'headVeh', 'magDec', 'magAcc',
+)
+
+# flags3.lastCorrectionAge (bits 1..4) -> limite superior em segundos
+CORRECTION_AGE_SECONDS = (0, 1, 2, 5, 10, 15, 20, 30, 45, 60, 90, 120, 120, 0, 0, 0)
+
+MM_S_TO_KNOTS = 3600.0 / 1852000.0
+MINUTES_PER_DEGREE_1E7 = 60 * 10_000_000  # 60 minutos em unidades de 1e-7
+
+# Valores "sem IMU" usados pelo QtAgIO (glm::USHORT_MAX / glm::SHORT_MAX)
+NO_IMU_HEADING = 65535
+NO_IMU_VALUE = 32767
+
+
+def fletcher8(data):
+    """Checksum Fletcher-8 do UBX sobre classe, id, tamanho e payload"""
+    ck_a = 0
+    ck_b = 0
+    for byte in data:
+        ck_a = (ck_a + byte) & 0xFF
+        ck_b = (ck_b + ck_a) & 0xFF
+    return ck_a, ck_b
+
+
+def build_frame(msg_class, msg_id, payload=b""):
+    """Montar o quadro completo (sincronismo, tamanho e checksum)"""
+    body = struct.pack('<BBH', msg_class, msg_id, len(payload)) + bytes(payload)
+    return SYNC + body + bytes(fletcher8(body))
+
+
+def pack_fields(fields):
+    """Payload a partir de [(tipo, valor), ...], ex.: [('U2', 100), ('U1', 1)]"""
+    return struct.pack('<' + ''.join(FIELD_TYPES[field_type] for field_type, _ in fields),
+                       *(value for _, value in fields))
+
+
+def unpack_fields(field_types, payload, offset=0):
+    """Valores dos campos ['U2', 'U1', ...] a partir de payload[offset:]"""
+    return struct.unpack_from('<' + ''.join(FIELD_TYPES[t] for t in field_types),
+                              payload, offset)
+
+
+def config_key(name):
+    """(id, tipo) de uma chave de configuração pelo nome ou id numérico"""
+    if isinstance(name, int):
+        # Sem tipo conhecido: o tamanho vem dos bits 28..30 do id
+        size = (name >> 28) & 0x07
+        return name, {1: 'L', 2: 'U1', 3: 'U2', 4: 'U4', 5: 'U8'}[size]
+    return CONFIG_KEYS[name]
+
+
+def pack_config(items):
+    """Pares chave/valor de CFG-VALSET a partir de [(chave, valor), ...]"""
+    data = []
+    for name, value in items:
+        key_id, field_type = config_key(name)
+        data.append(struct.pack('<I' + FIELD_TYPES[field_type], key_id, value))
+    return b"".join(data)
+
+
+def unpack_config(payload, offset=0):
+    """Dicionário {id: valor} a partir dos pares chave/valor (CFG-VALGET)"""
+    names = {key_id: field_type for key_id, field_type in CONFIG_KEYS.values()}
+    values = {}
+    while offset + 4 <= len(payload):
+        key_id, = struct.unpack_from('<I', payload, offset)
+        field_type = names.get(key_id) or config_key(key_id)[1]
+        value_format = '<' + FIELD_TYPES[field_type]
+        offset += 4
+        if offset + struct.calcsize(value_format) > len(payload):
+            break
+        values[key_id], = struct.unpack_from(value_format, payload, offset)
+        offset += struct.calcsize(value_format)
+    return values
+
+
+def valset_frames(items, layers=LAYER_RAM):
+    """Quadros CFG-VALSET para a lista [(chave, valor), ...]
+
+    Até VALSET_MAX_KEYS chaves vão em uma mensagem só (aplicada de uma vez);
+    acima disso as mensagens formam uma transação (início, continuação,
+    aplicar) e o receptor só aplica tudo na última."""
+    items = list(items)
+    chunks = [items[i:i + VALSET_MAX_KEYS] for i in range(0, len(items), VALSET_MAX_KEYS)]
+    if len(chunks) == 1:
+        return [build_frame(*CFG_VALSET, pack_fields([('U1', 0), ('X1', layers), ('U2', 0)]) +
+                            pack_config(chunks[0]))]
+
+    frames = []
+    for index, chunk in enumerate(chunks):
+        if index == 0:
+            transaction = 1  # início
+        elif index == len(chunks) - 1:
+            transaction = 3  # aplicar
+        else:
+            transaction = 2  # continuação
+        header = pack_fields([('U1', 1), ('X1', layers), ('X1', transaction), ('U1', 0)])
+        frames.append(build_frame(*CFG_VALSET, header + pack_config(chunk)))
+    return frames
+
+
+def valget_frame(keys, layer=VALGET_LAYER_RAM, position=0):
+    """Quadro CFG-VALGET pedindo as chaves (nomes ou ids) de uma camada"""
+    key_ids = [config_key(name)[0] for name in keys]
+    return build_frame(*CFG_VALGET, pack_fields([('U1', 0), ('U1', layer), ('U2', position)]) +
+                       struct.pack('<%dI' % len(key_ids), *key_ids))
+
+
+def parse_valget(payload):
+    """Resposta de CFG-VALGET -> (camada, {id: valor})"""
+    if len(payload) < 4:
+        return None, {}
+    return payload[1], unpack_config(payload, 4)
+
+
+class UBXParser:
+    """Separa quadros UBX de um fluxo de bytes que pode chegar picado e
+    misturado com outros protocolos (NMEA); bytes fora de quadros são
+    ignorados"""
+
+    def __init__(self):
+        self.buffer = b""
+        self.frames = 0
+        self.checksum_errors = 0
+
+    def feed(self, chunk):
+        """Adicionar bytes e retornar a lista de (classe, id, payload)"""
+        buffer = self.buffer + chunk if self.buffer else chunk
+        frames = []
+        pos = 0
+
+        while True:
+            sync = buffer.find(SYNC, pos)
+            if sync == -1:
+                # Guardar um possível 0xB5 no fim, à espera do 0x62
+                pos = len(buffer) - 1 if buffer.endswith(SYNC[:1]) else len(buffer)
+                break
+
+            if len(buffer) - sync < HEADER_LENGTH:
+                pos = sync
+                break
+
+            length = buffer[sync + 4] | (buffer[sync + 5] << 8)
+            if length > MAX_PAYLOAD:
+                # Falso sincronismo no meio de dados
+                pos = sync + 1
+                continue
+
+            frame_end = sync + HEADER_LENGTH + length + 2
+            if len(buffer) < frame_end:
+                pos = sync
+                break
+
+            ck_a, ck_b = fletcher8(memoryview(buffer)[sync + 2:frame_end - 2])
+            if ck_a != buffer[frame_end - 2] or ck_b != buffer[frame_end - 1]:
+                self.checksum_errors += 1
+                pos = sync + 1
+                continue
+
+            self.frames += 1
+            frames.append((buffer[sync + 2], buffer[sync + 3],
+                           buffer[sync + HEADER_LENGTH:frame_end - 2]))
+            pos = frame_end
+
+        self.buffer = buffer[pos:]
+        return frames
+
+
+def decode_nav_pvt(payload):
+    """Decodificar o payload de UBX-NAV-PVT em um dicionário"""
+    if len(payload) < NAV_PVT_FORMAT.size:
+        return None
+    return dict(zip(NAV_PVT_FIELDS, NAV_PVT_FORMAT.unpack_from(payload)))
+
+
+def fix_quality(pvt):
+    """Qualidade do fix no padrão GGA a partir de fixType/flags"""
+    flags = pvt['flags']
+    if not flags & 0x01 or pvt['fixType'] not in (2, 3, 4):
+        return 0
+    carrier_solution = (flags >> 6) & 0x03
+    if carrier_solution == 2:
+        return 4  # RTK fixo
+    if carrier_solution == 1:
+        return 5  # RTK flutuante
+    if flags & 0x02:
+        return 2  # DGPS
+    return 1
+
+
+def _nmea_coordinate(value_1e7, degree_digits):
+    """Graus * 1e7 -> (dddmm.mmmmmmm, hemisfério positivo?)"""
+    degrees, rest = divmod(abs(value_1e7), 10_000_000)
+    # minutos em unidades de 1e-7, arredondados antes de formatar; se o
+    # arredondamento chegar a 60 minutos, leva o excesso para os graus
+    minutes = round(rest * 60)
+    if minutes >= MINUTES_PER_DEGREE_1E7:
+        degrees += 1
+        minutes -= MINUTES_PER_DEGREE_1E7
+    whole, fraction = divmod(minutes, 10_000_000)
+    return "%0*d%02d.%07d" % (degree_digits, degrees, whole, fraction), value_1e7 >= 0
+
+
+def panda_from_nav_pvt(pvt):
+    """Montar a sentença $PANDA (bytes, com \\r\\n) de uma época NAV-PVT,
+    no formato lido por FormLoop::ParsePANDA"""
+    seconds = pvt['sec'] + max(pvt['nano'], 0) / 1e9
+    utc = "%02d%02d%05.2f" % (pvt['hour'], pvt['min'], min(seconds, 59.99))
+
+    latitude, north = _nmea_coordinate(pvt['lat'], 2)
+    longitude, east = _nmea_coordinate(pvt['lon'], 3)
+
+    quality = fix_quality(pvt)
+    age = 0
+    if quality in (2, 4, 5):
+        age = CORRECTION_AGE_SECONDS[(pvt['flags3'] >> 1) & 0x0F]
+
+    body = "PANDA,%s,%s,%s,%s,%s,%d,%d,%.2f,%.2f,%.1f,%.3f,%d,%d,%d,%d" % (
+        utc,
+        latitude, 'N' if north else 'S',
+        longitude, 'E' if east else 'W',
+        quality,
+        pvt['numSV'],
+        pvt['pDOP'] * 0.01,      # NAV-PVT só traz PDOP; usado no lugar do HDOP
+        pvt['hMSL'] / 1000.0,
+        age,
+        pvt['gSpeed'] * MM_S_TO_KNOTS,
+        NO_IMU_HEADING, NO_IMU_VALUE, NO_IMU_VALUE, NO_IMU_VALUE,
+    )
+    return build_sentence(body.encode('ascii'))
+
+
+class NavPvtToPanda:
+    """Decodificador em fluxo: bytes UBX entram, sentenças $PANDA saem.
+    Mesma interface do LineAssembler (feed devolve linhas completas)."""
+
+    def __init__(self):
+        self.parser = UBXParser()
+
+    def feed(self, chunk):
+        sentences = []
+        for msg_class, msg_id, payload in self.parser.feed(chunk):
+            if (msg_class, msg_id) != NAV_PVT:
+                continue
+            pvt = decode_nav_pvt(payload)
+            if pvt is not None:
+                sentences.append(panda_from_nav_pvt(pvt))
+        return sentences
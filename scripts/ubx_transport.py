@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Transações UBX com confirmação (ACK/NAK)
+Envia comandos UBX-CFG e espera o UBX-ACK-ACK/ACK-NAK correspondente
+(mesma classe/id), com tempo limite curto e novas tentativas, em vez de
+pausas fixas. Comandos de classe/id diferentes seguem em pipeline: vários
+ficam em trânsito ao mesmo tempo e cada confirmação é casada pela classe/id.
+O ACK não identifica qual quadro confirma, então fica no máximo um comando
+em trânsito por classe/id: com dois, uma confirmação perdida ou atrasada (e
+o reenvio que ela provoca) casaria o ACK/NAK com o comando errado.
+
+Autor: Configuração QtAgOpenGPS
+Compatível com: Quescan M10Fly, u-blox M10
+"""
+
+import logging
+import time
+from collections import deque
+
+import ubx
+
+# Resultado de cada comando
+ACK = "ack"
+NAK = "nak"
+TIMEOUT = "timeout"
+SEND_ERROR = "erro de envio"
+
+ACK_TIMEOUT = 0.25  # o M10 responde em poucos ms; folga para a fila da UART
+RETRIES = 2
+WINDOW = 4          # comandos em trânsito ao mesmo tempo
+
+
+class UBXCommand:
+    """Um comando na transação; barrier=True espera os anteriores terminarem
+    (ex.: salvar na flash só depois de tudo aplicado)"""
+
+    __slots__ = ('name', 'frame', 'key', 'barrier', 'attempts', 'sent_at', 'result')
+
+    def __init__(self, name, frame, barrier=False):
+        self.name = name
+        self.frame = bytes(frame)
+        self.key = (self.frame[2], self.frame[3])
+        self.barrier = barrier
+        self.attempts = 0
+        self.sent_at = None
+        self.result = None
+
+
+class UBXTransport:
+    """Camada de transação sobre uma serial aberta (pyserial)"""
+
+    def __init__(self, serial_conn, logger=None, timeout=ACK_TIMEOUT,
+                 retries=RETRIES, window=WINDOW):
+        self.serial_conn = serial_conn
+        self.logger = logger or logging.getLogger(__name__)
+        self.timeout = timeout
+        self.retries = retries
+        self.window = window
+        self.parser = ubx.UBXParser()
+
+    def send(self, command):
+        command.attempts += 1
+        command.sent_at = time.monotonic()
+        self.serial_conn.write(command.frame)
+
+    def read_frames(self):
+        """Ler o que chegou (espera no máximo alguns ms) e separar os quadros"""
+        chunk = self.serial_conn.read(max(1, self.serial_conn.in_waiting))
+        if not chunk:
+            return ()
+        return self.parser.feed(chunk)
+
+    def run(self, commands):
+        """Executar os comandos [(nome, quadro) ou UBXCommand] e retornar a
+        lista de UBXCommand com result = ACK, NAK, TIMEOUT ou SEND_ERROR"""
+        commands = [command if isinstance(command, UBXCommand) else UBXCommand(*command)
+                    for command in commands]
+        queue = deque(commands)
+        in_flight = []
+        pending = {}  # (classe, id) -> o comando em trânsito com essa classe/id
+
+        saved_timeout = self.serial_conn.timeout
+        self.serial_conn.timeout = 0.005
+        try:
+            while queue or in_flight:
+                # Enviar enquanto houver espaço na janela, na ordem da fila
+                sent = False
+                while queue and len(in_flight) < self.window and \
+                      not (queue[0].barrier and in_flight) and \
+                      queue[0].key not in pending:
+                    command = queue.popleft()
+                    try:
+                        self.send(command)
+                    except (OSError, ValueError) as e:
+                        self.logger.error(f"Erro ao enviar {command.name}: {e}")
+                        command.result = SEND_ERROR
+                        continue
+                    sent = True
+                    in_flight.append(command)
+                    pending[command.key] = command
+                    if command.barrier:
+                        break
+                if sent:
+                    self.serial_conn.flush()
+
+                for msg_class, msg_id, payload in self.read_frames():
+                    if (msg_class, msg_id) not in (ubx.ACK_ACK, ubx.ACK_NAK) or len(payload) < 2:
+                        continue
+                    command = pending.pop((payload[0], payload[1]), None)
+                    if command is None:
+                        continue  # confirmação atrasada de uma tentativa já encerrada
+                    command.result = ACK if (msg_class, msg_id) == ubx.ACK_ACK else NAK
+                    in_flight.remove(command)
+
+                # Tempo limite: reenviar ou desistir
+                now = time.monotonic()
+                for command in list(in_flight):
+                    if now - command.sent_at < self.timeout:
+                        continue
+                    if command.attempts <= self.retries:
+                        self.logger.debug(f"Sem resposta para {command.name}, reenviando...")
+                        try:
+                            self.send(command)
+                            continue
+                        except (OSError, ValueError) as e:
+                            self.logger.error(f"Erro ao reenviar {command.name}: {e}")
+                            command.result = SEND_ERROR
+                    else:
+                        command.result = TIMEOUT
+                    in_flight.remove(command)
+                    del pending[command.key]
+        finally:
+            self.serial_conn.timeout = saved_timeout
+
+        return commands
+
+    def poll(self, name, frame, response):
+        """Enviar um pedido e esperar a mensagem de resposta (classe, id).
+
+        Retorna o payload da resposta, ou None se o receptor respondeu NAK
+        ou não respondeu depois das novas tentativas."""
+        command = UBXCommand(name, frame)
+        saved_timeout = self.serial_conn.timeout
+        self.serial_conn.timeout = 0.005
+        try:
+            while command.attempts <= self.retries:
+                self.send(command)
+                self.serial_conn.flush()
+                while time.monotonic() - command.sent_at < self.timeout:
+                    for msg_class, msg_id, payload in self.read_frames():
+                        if (msg_class, msg_id) == response:
+                            command.result = ACK
+                            return payload
+                        if (msg_class, msg_id) == ubx.ACK_NAK and \
+                           tuple(payload[:2]) == command.key:
+                            command.result = NAK
+                            return None
+                self.logger.debug(f"Sem resposta para {name}, reenviando...")
+            command.result = TIMEOUT
+            return None
+        finally:
+            self.serial_conn.timeout = saved_timeout
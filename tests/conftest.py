@@ -0,0 +1,10 @@
+# The bridge modules in scripts/ import each other as flat siblings
+# (import ubx, import nmea_bytes, ...), the same way gps_bridge.py runs them,
+# so put that directory on sys.path for the tests that exercise them.
+
+import os
+import sys
+
+SCRIPTS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts')
+if SCRIPTS not in sys.path:
+    sys.path.insert(0, SCRIPTS)
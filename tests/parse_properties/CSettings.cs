@@ -0,0 +1,8 @@
+namespace AgOpenGPS
+{
+    public class CFeatureSettings
+    {
+        public bool isHeadlandOn = true;
+        public bool isTramOn = true;
+    }
+}
@@ -0,0 +1,27 @@
+#include "aogproperty.h"
+
+//Generated by parse_properties.py
+
+QVector<int> default_zones = { 2,10,20,0,0,0,0,0,0 };
+QVector<int> default_relay_pinConfig = { 1,2,3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 };
+AOGProperty property_setMenu_isMetric("display/isMetric",true);
+AOGProperty property_setAS_uTurnSmoothing("autosteer/uTurnSmoothing",14);
+AOGProperty property_setVehicle_toolWidth("tool/width",4);
+AOGProperty property_setVehicle_tankTrailingHitchLength("tool/tankTrailingHitchLength",-3);
+AOGProperty property_setF_culture("display/culture","en");
+AOGProperty property_setBrand_TBrand("display/TBrand","AGOpenGPS");
+AOGProperty property_setTool_zones("tool/zones",default_zones);
+AOGProperty property_setRelay_pinConfig("todo/relayPinConfig",default_relay_pinConfig);
+AOGProperty property_setDisplay_colorDayFrame("display/colorDayFrame",QColor(210, 210, 230));
+AOGProperty property_setDisplay_panelSimLocation("display/simLocation",QPoint(97, 600));
+AOGProperty property_setFeatures("display/features","");
+AOGProperty property_setFeature_isHeadlandOn("displayFeatures/isHeadlandOn",true);
+AOGProperty property_setFeature_isTramOn("displayFeatures/isTramOn",true);
+AOGProperty property_displayShowBack("display/showBack",false);
+AOGProperty property_displayAntiAliasSamples("display/antiAliasSamples",false);
+AOGProperty property_setDisplay_useTrackZero("display/useTrackZero",false);
+AOGProperty property_setDisplay_topTrackNum("display/topTrackNum",false);
+AOGProperty property_setDisplay_colorDayBackground("display/colorDayBackground",false);
+AOGProperty property_setDisplay_colorNightBackground("display/colorNightBackground",false);
+AOGProperty property_setDisplay_colorDayBorder("display/colorDayBorder",false);
+AOGProperty property_setDisplay_colorNightBorder("display/colorNightBorder",false);
@@ -0,0 +1,137 @@
+#include "aogsettingsstore.h"
+#include "aogsettings.h"
+
+//Generated by parse_properties.py
+
+const char *const AOGSettingsStore::keys[AOGSettingCount] = {
+    "display/isMetric",
+    "autosteer/uTurnSmoothing",
+    "tool/width",
+    "tool/tankTrailingHitchLength",
+    "display/culture",
+    "display/TBrand",
+    "tool/zones",
+    "todo/relayPinConfig",
+    "display/colorDayFrame",
+    "display/simLocation",
+    "display/features",
+    "displayFeatures/isHeadlandOn",
+    "displayFeatures/isTramOn",
+    "display/showBack",
+    "display/antiAliasSamples",
+    "display/useTrackZero",
+    "display/topTrackNum",
+    "display/colorDayBackground",
+    "display/colorNightBackground",
+    "display/colorDayBorder",
+    "display/colorNightBorder",
+};
+
+void AOGSettingsStore::assign(AOGSetting id, const QVariant &value)
+{
+    switch (id) {
+    case AOGSetting::setMenu_isMetric: v.setMenu_isMetric = value.toBool(); break;
+    case AOGSetting::setAS_uTurnSmoothing: v.setAS_uTurnSmoothing = value.toInt(); break;
+    case AOGSetting::setVehicle_toolWidth: v.setVehicle_toolWidth = value.toDouble(); break;
+    case AOGSetting::setVehicle_tankTrailingHitchLength: v.setVehicle_tankTrailingHitchLength = value.toDouble(); break;
+    case AOGSetting::setF_culture: v.setF_culture = value.toString(); break;
+    case AOGSetting::setBrand_TBrand: v.setBrand_TBrand = value.toString(); break;
+    case AOGSetting::setTool_zones: v.setTool_zones = toVector<int>(value); break;
+    case AOGSetting::setRelay_pinConfig: v.setRelay_pinConfig = toVector<int>(value); break;
+    case AOGSetting::setDisplay_colorDayFrame: v.setDisplay_colorDayFrame = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_panelSimLocation: v.setDisplay_panelSimLocation = value.toPoint(); break;
+    case AOGSetting::setFeatures: v.setFeatures = value.toString(); break;
+    case AOGSetting::setFeature_isHeadlandOn: v.setFeature_isHeadlandOn = value.toBool(); break;
+    case AOGSetting::setFeature_isTramOn: v.setFeature_isTramOn = value.toBool(); break;
+    case AOGSetting::displayShowBack: v.displayShowBack = value.toBool(); break;
+    case AOGSetting::displayAntiAliasSamples: v.displayAntiAliasSamples = value.toBool(); break;
+    case AOGSetting::setDisplay_useTrackZero: v.setDisplay_useTrackZero = value.toBool(); break;
+    case AOGSetting::setDisplay_topTrackNum: v.setDisplay_topTrackNum = value.toBool(); break;
+    case AOGSetting::setDisplay_colorDayBackground: v.setDisplay_colorDayBackground = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_colorNightBackground: v.setDisplay_colorNightBackground = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_colorDayBorder: v.setDisplay_colorDayBorder = value.value<QColor>(); break;
+    case AOGSetting::setDisplay_colorNightBorder: v.setDisplay_colorNightBorder = value.value<QColor>(); break;
+    }
+}
+
+QVariant AOGSettingsStore::variant(AOGSetting id) const
+{
+    switch (id) {
+    case AOGSetting::setMenu_isMetric: return QVariant::fromValue(v.setMenu_isMetric);
+    case AOGSetting::setAS_uTurnSmoothing: return QVariant::fromValue(v.setAS_uTurnSmoothing);
+    case AOGSetting::setVehicle_toolWidth: return QVariant::fromValue(v.setVehicle_toolWidth);
+    case AOGSetting::setVehicle_tankTrailingHitchLength: return QVariant::fromValue(v.setVehicle_tankTrailingHitchLength);
+    case AOGSetting::setF_culture: return QVariant::fromValue(v.setF_culture);
+    case AOGSetting::setBrand_TBrand: return QVariant::fromValue(v.setBrand_TBrand);
+    case AOGSetting::setTool_zones: return toVariant(v.setTool_zones);
+    case AOGSetting::setRelay_pinConfig: return toVariant(v.setRelay_pinConfig);
+    case AOGSetting::setDisplay_colorDayFrame: return QVariant::fromValue(v.setDisplay_colorDayFrame);
+    case AOGSetting::setDisplay_panelSimLocation: return QVariant::fromValue(v.setDisplay_panelSimLocation);
+    case AOGSetting::setFeatures: return QVariant::fromValue(v.setFeatures);
+    case AOGSetting::setFeature_isHeadlandOn: return QVariant::fromValue(v.setFeature_isHeadlandOn);
+    case AOGSetting::setFeature_isTramOn: return QVariant::fromValue(v.setFeature_isTramOn);
+    case AOGSetting::displayShowBack: return QVariant::fromValue(v.displayShowBack);
+    case AOGSetting::displayAntiAliasSamples: return QVariant::fromValue(v.displayAntiAliasSamples);
+    case AOGSetting::setDisplay_useTrackZero: return QVariant::fromValue(v.setDisplay_useTrackZero);
+    case AOGSetting::setDisplay_topTrackNum: return QVariant::fromValue(v.setDisplay_topTrackNum);
+    case AOGSetting::setDisplay_colorDayBackground: return QVariant::fromValue(v.setDisplay_colorDayBackground);
+    case AOGSetting::setDisplay_colorNightBackground: return QVariant::fromValue(v.setDisplay_colorNightBackground);
+    case AOGSetting::setDisplay_colorDayBorder: return QVariant::fromValue(v.setDisplay_colorDayBorder);
+    case AOGSetting::setDisplay_colorNightBorder: return QVariant::fromValue(v.setDisplay_colorNightBorder);
+    }
+    return QVariant();
+}
+
+double AOGSettingsStore::toDouble(AOGSetting id) const
+{
+    QReadLocker locker(&lock);
+    switch (id) {
+    case AOGSetting::setMenu_isMetric: return v.setMenu_isMetric;
+    case AOGSetting::setAS_uTurnSmoothing: return v.setAS_uTurnSmoothing;
+    case AOGSetting::setVehicle_toolWidth: return v.setVehicle_toolWidth;
+    case AOGSetting::setVehicle_tankTrailingHitchLength: return v.setVehicle_tankTrailingHitchLength;
+    case AOGSetting::setFeature_isHeadlandOn: return v.setFeature_isHeadlandOn;
+    case AOGSetting::setFeature_isTramOn: return v.setFeature_isTramOn;
+    case AOGSetting::displayShowBack: return v.displayShowBack;
+    case AOGSetting::displayAntiAliasSamples: return v.displayAntiAliasSamples;
+    case AOGSetting::setDisplay_useTrackZero: return v.setDisplay_useTrackZero;
+    case AOGSetting::setDisplay_topTrackNum: return v.setDisplay_topTrackNum;
+    default: return variant(id).toDouble();
+    }
+}
+
+int AOGSettingsStore::toInt(AOGSetting id) const
+{
+    QReadLocker locker(&lock);
+    switch (id) {
+    case AOGSetting::setMenu_isMetric: return v.setMenu_isMetric;
+    case AOGSetting::setAS_uTurnSmoothing: return v.setAS_uTurnSmoothing;
+    case AOGSetting::setVehicle_toolWidth: return qRound(v.setVehicle_toolWidth);
+    case AOGSetting::setVehicle_tankTrailingHitchLength: return qRound(v.setVehicle_tankTrailingHitchLength);
+    case AOGSetting::setFeature_isHeadlandOn: return v.setFeature_isHeadlandOn;
+    case AOGSetting::setFeature_isTramOn: return v.setFeature_isTramOn;
+    case AOGSetting::displayShowBack: return v.displayShowBack;
+    case AOGSetting::displayAntiAliasSamples: return v.displayAntiAliasSamples;
+    case AOGSetting::setDisplay_useTrackZero: return v.setDisplay_useTrackZero;
+    case AOGSetting::setDisplay_topTrackNum: return v.setDisplay_topTrackNum;
+    default: return variant(id).toInt();
+    }
+}
+
+bool AOGSettingsStore::toBool(AOGSetting id) const
+{
+    QReadLocker locker(&lock);
+    switch (id) {
+    case AOGSetting::setMenu_isMetric: return v.setMenu_isMetric;
+    case AOGSetting::setAS_uTurnSmoothing: return v.setAS_uTurnSmoothing != 0;
+    case AOGSetting::setVehicle_toolWidth: return v.setVehicle_toolWidth != 0;
+    case AOGSetting::setVehicle_tankTrailingHitchLength: return v.setVehicle_tankTrailingHitchLength != 0;
+    case AOGSetting::setFeature_isHeadlandOn: return v.setFeature_isHeadlandOn;
+    case AOGSetting::setFeature_isTramOn: return v.setFeature_isTramOn;
+    case AOGSetting::displayShowBack: return v.displayShowBack;
+    case AOGSetting::displayAntiAliasSamples: return v.displayAntiAliasSamples;
+    case AOGSetting::setDisplay_useTrackZero: return v.setDisplay_useTrackZero;
+    case AOGSetting::setDisplay_topTrackNum: return v.setDisplay_topTrackNum;
+    default: return variant(id).toBool();
+    }
+}
@@ -0,0 +1,61 @@
+#ifndef AOGSETTINGSVALUES_H
+#define AOGSETTINGSVALUES_H
+
+//Generated by parse_properties.py
+
+#include <QString>
+#include <QPoint>
+#include <QColor>
+#include <QVector>
+
+enum class AOGSetting {
+    setMenu_isMetric,
+    setAS_uTurnSmoothing,
+    setVehicle_toolWidth,
+    setVehicle_tankTrailingHitchLength,
+    setF_culture,
+    setBrand_TBrand,
+    setTool_zones,
+    setRelay_pinConfig,
+    setDisplay_colorDayFrame,
+    setDisplay_panelSimLocation,
+    setFeatures,
+    setFeature_isHeadlandOn,
+    setFeature_isTramOn,
+    displayShowBack,
+    displayAntiAliasSamples,
+    setDisplay_useTrackZero,
+    setDisplay_topTrackNum,
+    setDisplay_colorDayBackground,
+    setDisplay_colorNightBackground,
+    setDisplay_colorDayBorder,
+    setDisplay_colorNightBorder,
+};
+
+constexpr int AOGSettingCount = 21;
+
+struct AOGSettingsValues {
+    bool setMenu_isMetric = false;
+    int setAS_uTurnSmoothing = 0;
+    double setVehicle_toolWidth = 0;
+    double setVehicle_tankTrailingHitchLength = 0;
+    QString setF_culture;
+    QString setBrand_TBrand;
+    QVector<int> setTool_zones;
+    QVector<int> setRelay_pinConfig;
+    QColor setDisplay_colorDayFrame;
+    QPoint setDisplay_panelSimLocation;
+    QString setFeatures;
+    bool setFeature_isHeadlandOn = false;
+    bool setFeature_isTramOn = false;
+    bool displayShowBack = false;
+    bool displayAntiAliasSamples = false;
+    bool setDisplay_useTrackZero = false;
+    bool setDisplay_topTrackNum = false;
+    QColor setDisplay_colorDayBackground;
+    QColor setDisplay_colorNightBackground;
+    QColor setDisplay_colorDayBorder;
+    QColor setDisplay_colorNightBorder;
+};
+
+#endif // AOGSETTINGSVALUES_H
@@ -0,0 +1,14 @@
+#ifndef PROPERTIES_H
+#define PROPERTIES_H
+
+//Generated by parse_properties.py
+//Includes every settings group. New code should include only the
+//properties_<group>.h headers it uses (see parse_properties.py --report).
+
+#include "properties_autosteer.h"
+#include "properties_display.h"
+#include "properties_displayfeatures.h"
+#include "properties_todo.h"
+#include "properties_tool.h"
+
+#endif // PROPERTIES_H
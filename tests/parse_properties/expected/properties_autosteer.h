@@ -0,0 +1,10 @@
+#ifndef PROPERTIES_AUTOSTEER_H
+#define PROPERTIES_AUTOSTEER_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setAS_uTurnSmoothing;
+
+#endif // PROPERTIES_AUTOSTEER_H
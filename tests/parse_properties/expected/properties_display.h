@@ -0,0 +1,23 @@
+#ifndef PROPERTIES_DISPLAY_H
+#define PROPERTIES_DISPLAY_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setMenu_isMetric;
+extern AOGProperty property_setF_culture;
+extern AOGProperty property_setBrand_TBrand;
+extern AOGProperty property_setDisplay_colorDayFrame;
+extern AOGProperty property_setDisplay_panelSimLocation;
+extern AOGProperty property_setFeatures;
+extern AOGProperty property_displayShowBack;
+extern AOGProperty property_displayAntiAliasSamples;
+extern AOGProperty property_setDisplay_useTrackZero;
+extern AOGProperty property_setDisplay_topTrackNum;
+extern AOGProperty property_setDisplay_colorDayBackground;
+extern AOGProperty property_setDisplay_colorNightBackground;
+extern AOGProperty property_setDisplay_colorDayBorder;
+extern AOGProperty property_setDisplay_colorNightBorder;
+
+#endif // PROPERTIES_DISPLAY_H
@@ -0,0 +1,11 @@
+#ifndef PROPERTIES_DISPLAYFEATURES_H
+#define PROPERTIES_DISPLAYFEATURES_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setFeature_isHeadlandOn;
+extern AOGProperty property_setFeature_isTramOn;
+
+#endif // PROPERTIES_DISPLAYFEATURES_H
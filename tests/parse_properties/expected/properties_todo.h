@@ -0,0 +1,10 @@
+#ifndef PROPERTIES_TODO_H
+#define PROPERTIES_TODO_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setRelay_pinConfig;
+
+#endif // PROPERTIES_TODO_H
@@ -0,0 +1,12 @@
+#ifndef PROPERTIES_TOOL_H
+#define PROPERTIES_TOOL_H
+
+//Generated by parse_properties.py
+
+#include "aogproperty.h"
+
+extern AOGProperty property_setVehicle_toolWidth;
+extern AOGProperty property_setVehicle_tankTrailingHitchLength;
+extern AOGProperty property_setTool_zones;
+
+#endif // PROPERTIES_TOOL_H
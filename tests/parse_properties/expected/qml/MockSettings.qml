@@ -0,0 +1,26 @@
+// Copyright (C) 2024 Michael Torrie and the QtAgOpenGPS Dev Team
+// SPDX-License-Identifier: GNU General Public License v3.0 or later
+//
+// For when we use qmlscene
+import QtQuick 2.15
+
+//generated by parse_properties.py -m
+
+Item {
+    id: mockSettings
+    property bool setMenu_isMetric: true
+    property int setAS_uTurnSmoothing: 14
+    property double setVehicle_toolWidth: 4
+    property double setVehicle_tankTrailingHitchLength: -3
+    property string setF_culture: "en"
+    property string setBrand_TBrand: "AGOpenGPS"
+    property var setTool_zones: [ 2,10,20,0,0,0,0,0,0 ]
+    property var setRelay_pinConfig: [ 1,2,3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0 ]
+    property string setDisplay_colorDayFrame: "#d2d2e6"
+    property point setDisplay_panelSimLocation: "97, 600"
+    property string setFeatures: ""
+    property bool setFeature_isHeadlandOn: true
+    property bool setFeature_isTramOn: true
+    property bool setDisplay_useTrackZero: false
+    property bool setDisplay_topTrackNum: false
+}
@@ -0,0 +1,52 @@
+// Copyright (C) 2024 Michael Torrie and the QtAgOpenGPS Dev Team
+// SPDX-License-Identifier: GNU General Public License v3.0 or later
+//
+// 
+#include "qmlsettings.h"
+#include "aogsettingsvalues.h"
+
+//Generated by parse_properties.py
+
+const QMLSettings::Key QMLSettings::keys[] = {
+    { "setAS_uTurnSmoothing", "autosteer/uTurnSmoothing", QMetaType::Int, int(AOGSetting::setAS_uTurnSmoothing) },
+    { "setBrand_TBrand", "display/TBrand", QMetaType::QString, int(AOGSetting::setBrand_TBrand) },
+    { "setDisplay_colorDayFrame", "display/colorDayFrame", QMetaType::QColor, int(AOGSetting::setDisplay_colorDayFrame) },
+    { "setDisplay_panelSimLocation", "display/simLocation", QMetaType::QPoint, int(AOGSetting::setDisplay_panelSimLocation) },
+    { "setDisplay_topTrackNum", "display/topTrackNum", QMetaType::Bool, int(AOGSetting::setDisplay_topTrackNum) },
+    { "setDisplay_useTrackZero", "display/useTrackZero", QMetaType::Bool, int(AOGSetting::setDisplay_useTrackZero) },
+    { "setF_culture", "display/culture", QMetaType::QString, int(AOGSetting::setF_culture) },
+    { "setFeature_isHeadlandOn", "displayFeatures/isHeadlandOn", QMetaType::Bool, int(AOGSetting::setFeature_isHeadlandOn) },
+    { "setFeature_isTramOn", "displayFeatures/isTramOn", QMetaType::Bool, int(AOGSetting::setFeature_isTramOn) },
+    { "setFeatures", "display/features", QMetaType::QString, int(AOGSetting::setFeatures) },
+    { "setMenu_isMetric", "display/isMetric", QMetaType::Bool, int(AOGSetting::setMenu_isMetric) },
+    { "setRelay_pinConfig", "todo/relayPinConfig", QMetaType::QVariantList, int(AOGSetting::setRelay_pinConfig) },
+    { "setTool_zones", "tool/zones", QMetaType::QVariantList, int(AOGSetting::setTool_zones) },
+    { "setVehicle_tankTrailingHitchLength", "tool/tankTrailingHitchLength", QMetaType::Double, int(AOGSetting::setVehicle_tankTrailingHitchLength) },
+    { "setVehicle_toolWidth", "tool/width", QMetaType::Double, int(AOGSetting::setVehicle_toolWidth) },
+};
+
+const int QMLSettings::key_count = 15;
+
+const int QMLSettings::key_of_setting[AOGSettingCount] = {
+    10, // setMenu_isMetric
+    0, // setAS_uTurnSmoothing
+    14, // setVehicle_toolWidth
+    13, // setVehicle_tankTrailingHitchLength
+    6, // setF_culture
+    1, // setBrand_TBrand
+    12, // setTool_zones
+    11, // setRelay_pinConfig
+    2, // setDisplay_colorDayFrame
+    3, // setDisplay_panelSimLocation
+    9, // setFeatures
+    7, // setFeature_isHeadlandOn
+    8, // setFeature_isTramOn
+    -1, // displayShowBack
+    -1, // displayAntiAliasSamples
+    5, // setDisplay_useTrackZero
+    4, // setDisplay_topTrackNum
+    -1, // setDisplay_colorDayBackground
+    -1, // setDisplay_colorNightBackground
+    -1, // setDisplay_colorDayBorder
+    -1, // setDisplay_colorNightBorder
+};
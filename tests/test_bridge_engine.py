@@ -0,0 +1,49 @@
+"""Testes das saídas do motor asyncio (python3 -m pytest tests)"""
+
+import asyncio
+import logging
+import threading
+import time
+
+import bridge_engine
+
+
+def test_file_sink_writes_off_the_loop(tmp_path):
+    path = tmp_path / 'log.nmea'
+    sink = bridge_engine.FileSink(str(path), queue_size=4)
+    stall = threading.Event()
+    write_blocking = sink.write_blocking
+
+    def slow_write(data, flush):
+        stall.wait(1)  # disco travado até o teste liberar
+        write_blocking(data, flush)
+
+    sink.write_blocking = slow_write
+
+    async def scenario():
+        task = asyncio.create_task(sink.run(logging.getLogger(__name__)))
+        sink.put(b"$A\r\n", 0)
+        await asyncio.sleep(0.05)
+
+        # Com a escrita parada, o laço continua girando e a fila descarta
+        # as mais antigas
+        ticks = 0
+        started = time.monotonic()
+        while time.monotonic() - started < 0.2:
+            await asyncio.sleep(0.01)
+            ticks += 1
+        assert ticks >= 10
+        for i in range(10):
+            sink.put(b"$%d\r\n" % i, 0)
+        assert sink.dropped == 6
+
+        stall.set()
+        while sink.sent < 5:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(scenario())
+    sink.executor.shutdown(wait=True)
+    assert path.read_bytes() == b"$A\r\n$6\r\n$7\r\n$8\r\n$9\r\n"
+    assert sink.file is None
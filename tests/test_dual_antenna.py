@@ -0,0 +1,106 @@
+"""Testes do rumo/rolagem de antena dupla (python3 -m pytest tests)"""
+
+import math
+
+import pytest
+
+import dual_antenna
+import nmea_bytes
+
+MS = 1_000_000
+LATITUDE = 48.1173
+LONGITUDE = 11.5167
+
+
+def nmea_coordinate(value, digits):
+    degrees = int(abs(value))
+    minutes = (abs(value) - degrees) * 60
+    return b"%0*d%011.8f" % (digits, degrees, minutes)
+
+
+def gga(utc, latitude, longitude, altitude, quality=b"4"):
+    body = b"GNGGA,%s,%s,%s,%s,%s,%s,12,0.9,%.3f,M,46.9,M,1.0,0000" % (
+        utc, nmea_coordinate(latitude, 2), b"N" if latitude >= 0 else b"S",
+        nmea_coordinate(longitude, 3), b"E" if longitude >= 0 else b"W", quality, altitude)
+    return nmea_bytes.build_sentence(body)
+
+
+def antennas(heading, roll=0.0, length=1.0, utc=b"120000.00", quality=b"4"):
+    """GGA do principal e do secundário (montado à direita) para um rumo e
+    rolagem do trator; usa os mesmos raios de curvatura do módulo"""
+    bearing = math.radians(heading + 90.0)
+    drop = length * math.sin(math.radians(roll))  # lado direito para baixo
+    horizontal = math.sqrt(length * length - drop * drop)
+    east = horizontal * math.sin(bearing)
+    north = horizontal * math.cos(bearing)
+
+    latitude = math.radians(LATITUDE)
+    w = math.sqrt(1.0 - dual_antenna.WGS84_E2 * math.sin(latitude) ** 2)
+    meridian_radius = dual_antenna.WGS84_A * (1.0 - dual_antenna.WGS84_E2) / w ** 3
+    normal_radius = dual_antenna.WGS84_A / w
+    secondary_latitude = LATITUDE + math.degrees(north / meridian_radius)
+    secondary_longitude = LONGITUDE + math.degrees(east / (normal_radius * math.cos(latitude)))
+    return (gga(utc, LATITUDE, LONGITUDE, 500.0, quality),
+            gga(utc, secondary_latitude, secondary_longitude, 500.0 - drop, quality))
+
+
+def fields(sentence):
+    assert nmea_bytes.check_sentence(sentence) == nmea_bytes.CHECKSUM_OK
+    return sentence[1:sentence.index(b"*")].split(b",")
+
+
+@pytest.mark.parametrize('heading', [0.0, 30.0, 179.5, 271.25])
+def test_heading_nmea_output(heading):
+    aligner = dual_antenna.DualAntennaAligner('right', 'nmea')
+    primary, secondary = antennas(heading)
+    assert aligner.feed_primary(primary, 0) == []
+    output = aligner.feed_secondary(secondary, 5 * MS)
+    assert output[0] == primary
+    hdt = fields(output[1])
+    assert hdt[0] == b"GNHDT"
+    assert abs((float(hdt[1]) - heading + 180) % 360 - 180) < 0.05
+    assert aligner.aligned == 1
+    assert aligner.last_length == pytest.approx(1.0, abs=1e-3)
+
+
+def test_paogi_heading_and_roll_with_secondary_first():
+    aligner = dual_antenna.DualAntennaAligner('right', 'paogi', baseline_m=1.2)
+    aligner.feed_speed(nmea_bytes.build_sentence(b"GNVTG,84.4,T,,M,4.97,N,9.20,K,R"))
+    primary, secondary = antennas(45.0, roll=5.0, length=1.2)
+    assert aligner.feed_secondary(secondary, 0) == []
+    output = aligner.feed_primary(primary, 3 * MS)
+    paogi = fields(output[0])
+    assert paogi[0] == b"PAOGI"
+    assert paogi[1] == b"120000.00" and paogi[6] == b"4" and paogi[11] == b"4.97"
+    assert float(paogi[12]) == pytest.approx(45.0, abs=0.05)
+    assert float(paogi[13]) == pytest.approx(5.0, abs=0.05)   # rolagem
+    assert paogi[14:] == [b"", b""]
+
+
+def test_without_rtk_or_wrong_baseline_no_heading():
+    aligner = dual_antenna.DualAntennaAligner('right', 'paogi', baseline_m=1.0)
+    primary, secondary = antennas(10.0, quality=b"1")
+    aligner.feed_primary(primary, 0)
+    assert fields(aligner.feed_secondary(secondary, 0)[0])[0] == b"PANDA"
+
+    primary, secondary = antennas(10.0, length=1.5, utc=b"120000.10")
+    aligner.feed_primary(primary, 0)
+    assert fields(aligner.feed_secondary(secondary, 0)[0])[0] == b"PANDA"
+    assert aligner.rejected == 2
+
+    aligner.require_rtk = False
+    primary, secondary = antennas(10.0, quality=b"1", utc=b"120000.20")
+    aligner.feed_primary(primary, 0)
+    assert fields(aligner.feed_secondary(secondary, 0)[0])[0] == b"PAOGI"
+
+
+def test_late_secondary_does_not_hold_the_epoch():
+    aligner = dual_antenna.DualAntennaAligner('right', 'nmea', wait_ms=50)
+    primary, secondary = antennas(90.0)
+    aligner.feed_primary(primary, 0)
+    assert aligner.deadline_ns() == 50 * MS
+    assert aligner.poll(49 * MS) == []
+    assert aligner.poll(50 * MS) == [primary]
+    assert aligner.unpaired == 1
+    # O GGA atrasado fica guardado e não gera saída sozinho
+    assert aligner.feed_secondary(secondary, 60 * MS) == []
@@ -0,0 +1,91 @@
+"""Testes da fusão de épocas -> $PAOGI/$PANDA (python3 -m pytest tests)"""
+
+import epoch_fusion
+import nmea_bytes
+
+MS = 1_000_000
+
+GGA = b"GNGGA,{utc},4807.0380000,N,01131.0000000,E,4,12,0.9,545.4,M,46.9,M,1.2,0000"
+RMC = b"GNRMC,{utc},A,4807.0380000,N,01131.0000000,E,5.10,84.4,230394,,,R"
+VTG = b"GNVTG,84.4,T,,M,4.97,N,9.20,K,R"
+HDT = b"GNHDT,123.45,T"
+GSA = b"GNGSA,A,3,01,02,03,04,05,06,07,08,09,10,11,12,1.5,0.8,1.2"
+
+
+def feed(assembler, template, utc=b"123519.00", arrival_ns=0):
+    line = nmea_bytes.build_sentence(template.replace(b"{utc}", utc))
+    return assembler.feed(line, 0, len(line), arrival_ns)
+
+
+def fields(sentence):
+    assert nmea_bytes.check_sentence(sentence) == nmea_bytes.CHECKSUM_OK
+    return sentence[1:sentence.index(b"*")].split(b",")
+
+
+def test_paogi_field_mapping():
+    assembler = epoch_fusion.EpochAssembler()
+    for template in (GGA, RMC, VTG, HDT):
+        assert feed(assembler, template) == []
+    # Primeira época: os tipos ainda não são conhecidos, sai no tempo limite
+    output = assembler.poll(51 * MS)
+    assert len(output) == 1
+    assert fields(output[0]) == [
+        b"PAOGI", b"123519.00", b"4807.0380000", b"N", b"01131.0000000", b"E",
+        b"4", b"12", b"0.9", b"545.4", b"1.2",
+        b"4.97",     # nós do VTG no lugar dos do RMC
+        b"123.45",   # rumo do HDT
+        b"", b"", b""]
+
+
+def test_panda_without_heading_uses_gsa_hdop_and_rmc_speed():
+    assembler = epoch_fusion.EpochAssembler()
+    gga_without_hdop = GGA.replace(b",0.9,", b",,")
+    feed(assembler, gga_without_hdop)
+    feed(assembler, RMC)
+    feed(assembler, GSA)
+    output = assembler.poll(51 * MS)
+    assert fields(output[0]) == [
+        b"PANDA", b"123519.00", b"4807.0380000", b"N", b"01131.0000000", b"E",
+        b"4", b"12", b"0.8", b"545.4", b"1.2", b"5.10",
+        b"65535", b"32767", b"32767", b"32767"]
+
+
+def test_rmc_only_epoch():
+    assembler = epoch_fusion.EpochAssembler()
+    feed(assembler, RMC)
+    output = assembler.poll(51 * MS)
+    assert fields(output[0])[:13] == [
+        b"PANDA", b"123519.00", b"4807.0380000", b"N", b"01131.0000000", b"E",
+        b"1", b"", b"", b"", b"0", b"5.10", b"65535"]
+
+
+def test_epoch_boundaries():
+    assembler = epoch_fusion.EpochAssembler(timeout_ms=50)
+    feed(assembler, GGA, b"000000.00", 0)
+    feed(assembler, VTG, arrival_ns=1 * MS)
+    assert assembler.deadline_ns() == 50 * MS
+    assert assembler.poll(49 * MS) == []
+
+    # Hora nova fecha a época anterior
+    output = feed(assembler, GGA, b"000000.10", 100 * MS)
+    assert [fields(s)[1] for s in output] == [b"000000.00"]
+
+    # GGA + VTG agora são esperados: a época sai assim que o VTG chega
+    output = feed(assembler, VTG, arrival_ns=101 * MS)
+    assert [fields(s)[1] for s in output] == [b"000000.10"]
+    assert assembler.deadline_ns() is None
+    assert assembler.epochs_emitted == 2
+    assert assembler.epochs_timed_out == 0
+
+
+def test_missing_type_stops_being_expected():
+    assembler = epoch_fusion.EpochAssembler()
+    feed(assembler, GGA, b"000000.00")
+    feed(assembler, HDT)
+    assembler.poll(51 * MS)
+    # O HDT some: por algumas épocas cada uma espera o tempo limite
+    for epoch in range(1, epoch_fusion.MISSING_EPOCHS_LIMIT + 1):
+        assert feed(assembler, GGA, b"%06d.00" % epoch) == []
+        assert len(assembler.poll(float('inf'))) == 1
+    # depois o GGA sozinho já fecha a época
+    assert len(feed(assembler, GGA, b"000099.00")) == 1
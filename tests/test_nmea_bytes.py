@@ -0,0 +1,30 @@
+"""Testes do caminho rápido NMEA em bytes (python3 -m pytest tests)"""
+
+import os
+from functools import reduce
+
+import pytest
+
+import nmea_bytes
+
+
+def plain_xor(data):
+    return reduce(lambda a, b: a ^ b, data, 0)
+
+
+@pytest.mark.parametrize('length', [1, 128, 129, 512, 513, 4096])
+def test_xor_checksum_matches_plain_xor(length):
+    for data in (os.urandom(length), bytes(range(256)) * (length // 256) + bytes(range(length % 256))):
+        assert nmea_bytes.xor_checksum(data) == plain_xor(data)
+        assert nmea_bytes.xor_checksum(memoryview(data)) == plain_xor(data)
+
+
+def test_xor_checksum_empty():
+    assert nmea_bytes.xor_checksum(b"") == 0
+
+
+def test_check_sentence_long_line():
+    body = b"GNTXT," + b"A" * 600
+    line = nmea_bytes.build_sentence(body)
+    assert line.endswith(b"*%02X\r\n" % plain_xor(body))
+    assert nmea_bytes.check_sentence(line) == nmea_bytes.CHECKSUM_OK
@@ -0,0 +1,75 @@
+# Runs parse_properties.py on the small Settings.settings/CSettings.cs in
+# tests/parse_properties and diffs every generated file against the copies
+# in tests/parse_properties/expected.  After an intended change to the
+# generated code, refresh them with:
+#
+#   python3 parse_properties.py --no-cache -a -o tests/parse_properties/expected \
+#       tests/parse_properties/Settings.settings tests/parse_properties/CSettings.cs
+
+import difflib
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE = os.path.join(ROOT, 'tests', 'parse_properties')
+EXPECTED = os.path.join(FIXTURE, 'expected')
+
+
+def generate(*args):
+    command = [sys.executable, os.path.join(ROOT, 'parse_properties.py')]
+    command += list(args)
+    command += [os.path.join(FIXTURE, 'Settings.settings'), os.path.join(FIXTURE, 'CSettings.cs')]
+    return subprocess.run(command, capture_output=True, text=True)
+
+
+def tree(path):
+    files = {}
+    for directory, _, names in os.walk(path):
+        for name in names:
+            full = os.path.join(directory, name)
+            with open(full) as f:
+                files[os.path.relpath(full, path)] = f.read()
+    return files
+
+
+@pytest.mark.parametrize('cached', [False, True])
+def test_generated_files_match_expected(tmp_path, cached):
+    out = tmp_path / 'out'
+    (out / 'qml').mkdir(parents=True)
+    cache = ['--cache', str(tmp_path / 'cache.json')] if cached else ['--no-cache']
+    if cached:
+        # the second run renders from the cache written by the first
+        (tmp_path / 'first' / 'qml').mkdir(parents=True)
+        assert generate('-a', '-o', str(tmp_path / 'first'), *cache).returncode == 0
+        assert (tmp_path / 'cache.json').exists()
+    result = generate('-a', '-o', str(out), *cache)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    expected = tree(EXPECTED)
+    generated = tree(str(out))
+    assert sorted(generated) == sorted(expected)
+    for name in expected:
+        diff = ''.join(difflib.unified_diff(expected[name].splitlines(True),
+                                            generated[name].splitlines(True),
+                                            'expected/' + name, name))
+        assert not diff, diff
+
+
+def test_golden(tmp_path):
+    result = generate('--no-cache', '--golden', EXPECTED)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    golden = tmp_path / 'golden'
+    shutil.copytree(EXPECTED, str(golden))
+    with open(str(golden / 'qmlsettings_addkeys.cpp'), 'a') as f:
+        f.write('// edited by hand\n')
+    os.remove(str(golden / 'properties_tool.h'))
+
+    result = generate('--no-cache', '--golden', str(golden))
+    assert result.returncode == 1
+    assert 'qmlsettings_addkeys.cpp' in result.stdout
+    assert 'properties_tool.h: missing' in result.stdout
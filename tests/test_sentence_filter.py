@@ -0,0 +1,86 @@
+"""Testes da tabela de filtro e da dizimação (python3 -m pytest tests)"""
+
+import pytest
+
+import nmea_bytes
+import sentence_filter
+
+MS = 1_000_000
+
+
+def line(body):
+    return nmea_bytes.build_sentence(body)
+
+
+def period(table, body):
+    data = line(body)
+    return table.rule(data, 0, len(data)).period_ns
+
+
+def passed(table, data, arrival_ns):
+    rule = table.rule(data, 0, len(data))
+    return rule.period_ns == 0 or (rule.period_ns > 0 and rule.due(arrival_ns))
+
+
+def test_default_table():
+    table = sentence_filter.SentenceFilter()
+    assert period(table, b"GNGGA,1") == 0
+    assert period(table, b"GPGSV,1") == -1
+    assert period(table, b"PUBX,00") == -1
+    assert period(table, b"PANDA,1") == 0
+    assert period(table, b"GNGSA,1") == 1000 * MS
+
+
+def test_lookup_order():
+    table = sentence_filter.SentenceFilter(sentence_filter.parse_rules(
+        "GPGSA=drop,GSA=2,*=pass,P*=drop,PSTI=pass"))
+    assert period(table, b"GPGSA,1") == -1
+    assert period(table, b"GNGSA,1") == 500 * MS
+    assert period(table, b"GNGSV,1") == 0
+    assert period(table, b"PSTI,030") == 0
+    assert period(table, b"PTNL,VHD") == -1
+
+
+def test_decimation_10hz_to_2hz_with_jitter():
+    table = sentence_filter.SentenceFilter({'GSA': 2.0})
+    data = line(b"GNGSA,A,3")
+    # 10 Hz com até 5 ms de jitter: passa 1 em cada 5
+    arrivals = [i * 100 * MS + (5 * MS if i % 2 else -5 * MS) for i in range(1, 51)]
+    sent = [t for t in arrivals if passed(table, data, t)]
+    assert len(sent) == 10
+    assert all(450 * MS <= b - a <= 550 * MS for a, b in zip(sent, sent[1:]))
+
+
+def test_decimation_is_per_address():
+    table = sentence_filter.SentenceFilter({'GSA': 1.0})
+    gp, gn = line(b"GPGSA,A,3"), line(b"GNGSA,A,3")
+    assert passed(table, gp, 0) and passed(table, gn, 10 * MS)
+    assert not passed(table, gp, 500 * MS) and not passed(table, gn, 500 * MS)
+    assert passed(table, gp, 1000 * MS) and passed(table, gn, 1010 * MS)
+
+
+def test_full_cache_keeps_decimation_state(monkeypatch):
+    monkeypatch.setattr(sentence_filter, 'MAX_CACHED', 2)
+    table = sentence_filter.SentenceFilter({'GSA': 1.0, '*': sentence_filter.PASS})
+    period(table, b"GPGGA,1")
+    period(table, b"GPRMC,1")
+    assert len(table.cache) == 2
+
+    # Endereço fora do cache continua dizimado a 1 Hz (com a folga de
+    # DECIMATE_SLACK, a chegada de 900 ms já conta como o próximo período)
+    data = line(b"GNGSA,A,3")
+    sent = [t for t in range(0, 3000 * MS, 100 * MS) if passed(table, data, t)]
+    assert sent == [0, 900 * MS, 1800 * MS, 2700 * MS]
+    assert len(table.cache) == 2
+
+
+@pytest.mark.parametrize('body, expected', [
+    (b"GPTXT", b"GPTXT"),       # sem vírgula: endereço até o '*'
+    (b"PUBX", b"PUBX"),
+])
+def test_address_without_fields(body, expected):
+    table = sentence_filter.SentenceFilter({'GPTXT': 'pass', 'P*': 'drop', '*': 'drop'})
+    data = line(body)
+    rule = table.rule(data, 0, len(data))
+    assert list(table.cache) == [expected]
+    assert rule.period_ns == (0 if expected == b"GPTXT" else -1)
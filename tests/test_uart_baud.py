@@ -0,0 +1,28 @@
+"""Testes da opção --upgrade-baud (python3 -m pytest tests)"""
+
+import sys
+
+import pytest
+
+import gps_bridge
+import uart_baud
+
+
+def parse(monkeypatch, *argv):
+    monkeypatch.setattr(sys, 'argv', ['gps_bridge.py'] + list(argv))
+    return gps_bridge.parse_arguments()
+
+
+def test_upgrade_baud_values(monkeypatch):
+    assert parse(monkeypatch).upgrade_baud is None
+    assert parse(monkeypatch, '--upgrade-baud').upgrade_baud == uart_baud.UPGRADE_BAUD_RATES
+    assert parse(monkeypatch, '--upgrade-baud', 'auto').upgrade_baud == uart_baud.UPGRADE_BAUD_RATES
+    assert parse(monkeypatch, '--upgrade-baud', '460800').upgrade_baud == (460800,)
+
+
+@pytest.mark.parametrize('value', ['fast', '12345', '115200', ''])
+def test_upgrade_baud_rejects_bad_input(monkeypatch, capsys, value):
+    with pytest.raises(SystemExit) as exit_info:
+        parse(monkeypatch, '--upgrade-baud', value)
+    assert exit_info.value.code == 2
+    assert 'argument --upgrade-baud' in capsys.readouterr().err
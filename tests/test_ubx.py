@@ -0,0 +1,98 @@
+"""Testes dos quadros UBX: NAV-PVT -> $PANDA e CFG-VALSET/VALGET (python3 -m pytest tests)"""
+
+import pytest
+
+import nmea_bytes
+import ubx
+
+
+def nav_pvt_frame(**fields):
+    pvt = dict.fromkeys(ubx.NAV_PVT_FIELDS, 0)
+    pvt.update(fields)
+    payload = ubx.NAV_PVT_FORMAT.pack(*(pvt[name] for name in ubx.NAV_PVT_FIELDS))
+    return ubx.build_frame(*ubx.NAV_PVT, payload)
+
+
+def test_nav_pvt_to_panda():
+    frame = nav_pvt_frame(hour=12, min=34, sec=56, nano=700_000_000,
+                          fixType=3, flags=0x81,     # gnssFixOK + RTK fixo
+                          flags3=2 << 1,              # correção com até 2 s
+                          numSV=14, lat=-351234567, lon=1499999999,
+                          hMSL=123456, pDOP=123, gSpeed=2500)
+    converter = ubx.NavPvtToPanda()
+
+    # Quadro picado e precedido de NMEA: nada sai até o quadro completar
+    assert converter.feed(b"$GPGGA,lixo\r\n" + frame[:10]) == []
+    sentences = converter.feed(frame[10:])
+
+    assert len(sentences) == 1
+    line = sentences[0]
+    assert nmea_bytes.check_sentence(line) == nmea_bytes.CHECKSUM_OK
+    assert line.split(b"*")[0] == (b"$PANDA,123456.70,3507.4074020,S,14959.9999940,E,"
+                                   b"4,14,1.23,123.46,2.0,4.860,65535,32767,32767,32767")
+
+
+def test_nav_pvt_bad_checksum_is_dropped():
+    frame = bytearray(nav_pvt_frame(fixType=3, flags=0x01))
+    frame[-1] ^= 0xFF
+    converter = ubx.NavPvtToPanda()
+    assert converter.feed(bytes(frame)) == []
+    assert converter.parser.checksum_errors == 1
+
+
+@pytest.mark.parametrize('value, digits, expected', [
+    (0, 2, ('0000.0000000', True)),
+    (-359999999, 2, ('3559.9999940', False)),
+    (1234567890, 3, ('12327.4073400', True)),
+    # 59.99999999 minutos arredondam para 60: vira 1 grau a mais
+    (359999999.9999, 2, ('3600.0000000', True)),
+    (-1799999999.99999, 3, ('18000.0000000', False)),
+])
+def test_nmea_coordinate(value, digits, expected):
+    assert ubx._nmea_coordinate(value, digits) == expected
+
+
+def test_valset_single_message_bytes():
+    frames = ubx.valset_frames([('CFG-RATE-MEAS', 100), ('CFG-UART1INPROT-RTCM3X', 1),
+                                ('CFG-UART1-BAUDRATE', 460800)],
+                               ubx.LAYER_RAM | ubx.LAYER_BBR)
+    assert len(frames) == 1
+    payload = bytes.fromhex(
+        "00 03 0000"                  # versão 0, RAM+BBR, reservado
+        "01002130 6400"               # CFG-RATE-MEAS (U2) = 100
+        "04007310 01"                 # CFG-UART1INPROT-RTCM3X (L) = 1
+        "01005240 00080700")          # CFG-UART1-BAUDRATE (U4) = 460800
+    body = bytes([0x06, 0x8A, len(payload), 0]) + payload
+    ck_a = ck_b = 0
+    for byte in body:
+        ck_a = (ck_a + byte) % 256
+        ck_b = (ck_b + ck_a) % 256
+    assert frames[0] == b"\xb5\x62" + body + bytes([ck_a, ck_b])
+
+
+def test_valset_transaction_above_max_keys():
+    items = [(0x20910000 + i, i & 0xFF) for i in range(ubx.VALSET_MAX_KEYS * 2 + 1)]
+    frames = ubx.valset_frames(items)
+    assert len(frames) == 3
+
+    parser = ubx.UBXParser()
+    decoded = parser.feed(b"".join(frames))
+    assert [(c, i) for c, i, _ in decoded] == [ubx.CFG_VALSET] * 3
+    # versão 1, camada RAM, transação início / continuação / aplicar
+    assert [payload[:4] for _, _, payload in decoded] == [
+        b"\x01\x01\x01\x00", b"\x01\x01\x02\x00", b"\x01\x01\x03\x00"]
+    values = {}
+    for _, _, payload in decoded:
+        values.update(ubx.unpack_config(payload, 4))
+    assert values == dict(items)
+
+
+def test_valget_round_trip():
+    frame = ubx.valget_frame(['CFG-RATE-MEAS', 'CFG-UART1-BAUDRATE'], ubx.VALGET_LAYER_FLASH)
+    (_, _, request), = ubx.UBXParser().feed(frame)
+    assert request == bytes.fromhex("00 02 0000 01002130 01005240")
+
+    response = bytes.fromhex("01 02 0000") + ubx.pack_config([('CFG-RATE-MEAS', 50),
+                                                              ('CFG-UART1-BAUDRATE', 921600)])
+    assert ubx.parse_valget(response) == (ubx.VALGET_LAYER_FLASH,
+                                          {0x30210001: 50, 0x40520001: 921600})
@@ -0,0 +1,122 @@
+"""Testes das transações UBX com ACK/NAK (python3 -m pytest tests)"""
+
+import ubx
+import ubx_transport
+
+
+class FakeReceiver:
+    """Serial falsa: responde a cada quadro escrito com ACK-ACK ou ACK-NAK
+    (classe/id do comando no payload), ou não responde.
+
+    answer(número da escrita, quadro) -> ubx.ACK_ACK, ubx.ACK_NAK ou None"""
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.timeout = 1
+        self.in_waiting = 0
+        self.written = []
+        self.pending = b""
+
+    def write(self, frame):
+        self.written.append(frame)
+        response = self.answer(len(self.written), frame)
+        if response is not None:
+            self.pending += ubx.build_frame(*response, frame[2:4])
+
+    def flush(self):
+        pass
+
+    def read(self, size):
+        data, self.pending = self.pending, b""
+        return data
+
+
+def command(tag, msg=ubx.CFG_VALSET):
+    """Comando identificável pelo primeiro byte do payload"""
+    return (f"cmd{tag}", ubx.build_frame(*msg, bytes([tag, 0, 0, 0])))
+
+
+def tag(frame):
+    return frame[6]
+
+
+def run(receiver, commands, **options):
+    transport = ubx_transport.UBXTransport(receiver, timeout=0.02, **options)
+    return [(c.name, c.result, c.attempts) for c in transport.run(commands)]
+
+
+def test_all_acked():
+    receiver = FakeReceiver(lambda n, frame: ubx.ACK_ACK)
+    assert run(receiver, [command(1), command(2)]) == [
+        ('cmd1', ubx_transport.ACK, 1), ('cmd2', ubx_transport.ACK, 1)]
+    assert receiver.timeout == 1  # restaurado
+
+
+def test_nak_goes_to_the_right_command():
+    receiver = FakeReceiver(lambda n, frame: ubx.ACK_NAK if tag(frame) == 2 else ubx.ACK_ACK)
+    assert run(receiver, [command(1), command(2), command(3)]) == [
+        ('cmd1', ubx_transport.ACK, 1), ('cmd2', ubx_transport.NAK, 1),
+        ('cmd3', ubx_transport.ACK, 1)]
+
+
+def test_lost_ack_retries_same_command():
+    # A primeira escrita não recebe resposta: o reenvio do cmd1 é confirmado
+    # e o NAK do cmd2 não é atribuído ao cmd1
+    receiver = FakeReceiver(lambda n, frame: None if n == 1 else
+                            ubx.ACK_NAK if tag(frame) == 2 else ubx.ACK_ACK)
+    assert run(receiver, [command(1), command(2)]) == [
+        ('cmd1', ubx_transport.ACK, 2), ('cmd2', ubx_transport.NAK, 1)]
+    assert [tag(frame) for frame in receiver.written] == [1, 1, 2]
+
+
+class DeferredReceiver(FakeReceiver):
+    """Só confirma na próxima leitura, para ver o que fica em trânsito junto"""
+
+    def __init__(self):
+        super().__init__(lambda n, frame: None)
+        self.unanswered = []
+        self.together = []  # tags em trânsito a cada escrita
+
+    def write(self, frame):
+        super().write(frame)
+        self.unanswered.append(frame)
+        self.together.append([tag(f) for f in self.unanswered])
+
+    def read(self, size):
+        for frame in self.unanswered:
+            self.pending += ubx.build_frame(*ubx.ACK_ACK, frame[2:4])
+        self.unanswered = []
+        return super().read(size)
+
+
+def test_pipeline_across_class_id_one_in_flight_per_class_id():
+    receiver = DeferredReceiver()
+    results = run(receiver, [command(1, ubx.CFG_VALGET), command(2), command(3)])
+    assert [result for _, result, _ in results] == [ubx_transport.ACK] * 3
+    # VALGET e VALSET viajam juntos; o segundo VALSET espera o primeiro
+    assert receiver.together == [[1], [1, 2], [3]]
+
+
+def test_timeout_after_retries():
+    receiver = FakeReceiver(lambda n, frame: None)
+    assert run(receiver, [command(1)], retries=2) == [('cmd1', ubx_transport.TIMEOUT, 3)]
+
+
+def test_barrier_waits_for_previous_commands():
+    receiver = DeferredReceiver()
+    transport = ubx_transport.UBXTransport(receiver, timeout=0.02)
+    save = ubx_transport.UBXCommand('save', ubx.build_frame(0x06, 0x09, bytes([9, 0, 0, 0])),
+                                    barrier=True)
+    results = transport.run([command(1, ubx.CFG_VALGET), command(2), save])
+    assert [c.result for c in results] == [ubx_transport.ACK] * 3
+    assert receiver.together == [[1], [1, 2], [9]]
+
+
+def test_poll_returns_response_payload():
+    def answer(n, frame):
+        receiver.pending += ubx.build_frame(*ubx.CFG_VALGET, b"\x01\x00\x00\x00payload")
+
+    receiver = FakeReceiver(answer)
+    transport = ubx_transport.UBXTransport(receiver, timeout=0.02)
+    payload = transport.poll('valget', ubx.valget_frame(['CFG-RATE-MEAS']), ubx.CFG_VALGET)
+    assert payload == b"\x01\x00\x00\x00payload"
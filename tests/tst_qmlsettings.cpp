@@ -0,0 +1,172 @@
+// Copyright (C) 2024 Michael Torrie and the QtAgOpenGPS Dev Team
+// SPDX-License-Identifier: GNU General Public License v3.0 or later
+//
+// QMLSettings round trips for an int list key (tool/zones) and a plain
+// string key (display/HBrand): written from QML and from C++, they must
+// reach AOGSettings, settings_store and the ini file, and come back.
+//
+// Build with cmake -DSETTINGS_TESTS=ON and run ctest (or tst_qmlsettings).
+#include <QtTest>
+#include <QQmlEngine>
+#include <QQmlContext>
+#include <QQmlExpression>
+#include <QTemporaryDir>
+#include "aogproperty.h"
+#include "aogsettingsstore.h"
+#include "qmlsettings.h"
+#include "properties_display.h"
+#include "properties_tool.h"
+
+extern QMLSettings qml_settings;
+
+class TestQMLSettings : public QObject
+{
+    Q_OBJECT
+
+    QTemporaryDir dir;
+    QQmlEngine engine;
+
+    //run a JavaScript expression with qml_settings as "settings", the way
+    //the QML pages see it
+    QVariant evaluate(const QString &js)
+    {
+        QQmlExpression expression(engine.rootContext(), nullptr, js);
+        QVariant result = expression.evaluate();
+        if (expression.hasError())
+            qWarning() << expression.error();
+        return result;
+    }
+
+    //QML needs a list of ints; QVariant compares "3" equal to 3, so check
+    //the element types too
+    static QVariantList intList(const QVariant &value)
+    {
+        if (value.userType() != QMetaType::QVariantList)
+            return QVariantList({"not a QVariantList"});
+        for (const QVariant &v : value.toList()) {
+            if (v.userType() != QMetaType::Int)
+                return QVariantList({"not a list of ints"});
+        }
+        return value.toList();
+    }
+
+    //the ini file as written to disk
+    QString ini()
+    {
+        settings->sync();
+        QFile file(settings->fileName());
+        if (!file.open(QIODevice::ReadOnly))
+            return QString();
+        return QString::fromUtf8(file.readAll());
+    }
+
+private slots:
+    void initTestCase()
+    {
+        QVERIFY(dir.isValid());
+        QCoreApplication::setOrganizationName("QtAgOpenGPS");
+        QCoreApplication::setApplicationName("TestQMLSettings");
+        QSettings::setDefaultFormat(QSettings::IniFormat);
+        QSettings::setPath(QSettings::IniFormat, QSettings::UserScope, dir.path());
+
+        //an ini file left by an earlier run
+        QSettings ini_path(QSettings::IniFormat, QSettings::UserScope,
+                           QCoreApplication::organizationName(),
+                           QCoreApplication::applicationName());
+        QVERIFY(QDir().mkpath(QFileInfo(ini_path.fileName()).path()));
+        QFile file(ini_path.fileName());
+        QVERIFY(file.open(QIODevice::WriteOnly));
+        file.write("[tool]\nzones=3, 5\n");
+        file.close();
+
+        settings = new AOGSettings();
+        AOGProperty::init_defaults();
+        engine.rootContext()->setContextProperty("settings", &qml_settings);
+    }
+
+    void intListFromIniBeforeLoad()
+    {
+        //before settings_store is loaded QMLSettings reads QSettings, which
+        //gives the list as strings
+        QCOMPARE(settings->QSettings::value("tool/zones").userType(), QMetaType::QStringList);
+        qml_settings.loadSettings();
+        QCOMPARE(intList(qml_settings.value("setTool_zones")), QVariantList({3, 5}));
+
+        settings_store.load();
+        qml_settings.loadSettings();
+        QCOMPARE(intList(qml_settings.value("setTool_zones")), QVariantList({3, 5}));
+        QCOMPARE((QVector<int>)property_setTool_zones, QVector<int>({3, 5}));
+    }
+
+    void intListFromQml()
+    {
+        evaluate("settings.setTool_zones = [2, 0, 4]");
+
+        QCOMPARE((QVector<int>)property_setTool_zones, QVector<int>({2, 0, 4}));
+        QCOMPARE(settings_store.values().setTool_zones, QVector<int>({2, 0, 4}));
+        QVERIFY(ini().contains("zones=2, 0, 4\n"));
+    }
+
+    void intListFromCpp()
+    {
+        property_setTool_zones = QVector<int>({1, 1, 2, 3});
+
+        QCOMPARE(intList(qml_settings.value("setTool_zones")), QVariantList({1, 1, 2, 3}));
+        QCOMPARE(evaluate("settings.setTool_zones.length").toInt(), 4);
+        QCOMPARE(evaluate("settings.setTool_zones[3] + 1").toInt(), 4);
+    }
+
+    void intListFromIni()
+    {
+        //at the next start the list is read back from the ini file as
+        //strings; QMLSettings must hand QML ints again.  QSettings keeps
+        //the files it parsed cached per process, so reopen a copy under
+        //another path to really read it from disk.
+        property_setTool_zones = QVector<int>({8, 9});
+        QString name = QDir(dir.path()).relativeFilePath(settings->fileName());
+        QString copy = dir.path() + "/copy/";
+        settings->sync();
+        QVERIFY(QDir().mkpath(QFileInfo(copy + name).path()));
+        QVERIFY(QFile::copy(settings->fileName(), copy + name));
+
+        delete settings;
+        QSettings::setPath(QSettings::IniFormat, QSettings::UserScope, copy);
+        settings = new AOGSettings();
+        QCOMPARE(settings->fileName(), copy + name);
+        settings_store.load();
+        qml_settings.loadSettings();
+
+        QCOMPARE(settings->QSettings::value("tool/zones").userType(), QMetaType::QStringList);
+        QCOMPARE(intList(qml_settings.value("setTool_zones")), QVariantList({8, 9}));
+        QCOMPARE((QVector<int>)property_setTool_zones, QVector<int>({8, 9}));
+    }
+
+    void stringFromQml()
+    {
+        evaluate("settings.setBrand_HBrand = 'Case'");
+
+        QCOMPARE((QString)property_setBrand_HBrand, QString("Case"));
+        QCOMPARE(settings_store.values().setBrand_HBrand, QString("Case"));
+        QVERIFY(ini().contains("HBrand=Case\n"));
+    }
+
+    void stringFromCpp()
+    {
+        property_setBrand_HBrand = QString("Deutz");
+
+        QVariant value = qml_settings.value("setBrand_HBrand");
+        QCOMPARE(value.userType(), QMetaType::QString);
+        QCOMPARE(value.toString(), QString("Deutz"));
+        QCOMPARE(evaluate("settings.setBrand_HBrand"), QVariant("Deutz"));
+        QVERIFY(ini().contains("HBrand=Deutz\n"));
+    }
+
+    void cleanupTestCase()
+    {
+        delete settings;
+        settings = nullptr;
+    }
+};
+
+QTEST_GUILESS_MAIN(TestQMLSettings)
+#include "tst_qmlsettings.moc"